@@ -8,6 +8,46 @@ class Settings(BaseSettings):
     ETHEREUM_RPC_URL: str
     PRIVATE_KEY: str
     
+    # Directory holding trained scoring model artifacts
+    MODEL_DIR: str = "models"
+    # How often each worker checks for newly published model/config versions
+    MODEL_RELOAD_SECONDS: float = 30.0
+    # How long a tender's cached component matrix serves what-if simulations
+    SIMULATION_CACHE_SECONDS: float = 300.0
+    # Directory holding the bid-set snapshots written when tenders close
+    SNAPSHOT_DIR: str = "snapshots"
+    # Running recommendation jobs older than this are assumed dead and retried
+    RECOMMENDATION_JOB_TIMEOUT_SECONDS: float = 1800.0
+    # Claimed rescoring requests older than this are assumed dead and retried
+    RESCORE_CLAIM_TIMEOUT_SECONDS: float = 600.0
+    # Serialize live scoring of a tender across worker processes (Postgres advisory lock)
+    RECOMMENDATION_ADVISORY_LOCK: bool = False
+    
+    # POST /public/ratings only appends; app.scripts.rating_aggregator applies ratings in batches
+    RATING_WRITE_BEHIND: bool = False
+    
+    # How long an authenticated account lookup is reused for the same token subject
+    PRINCIPAL_CACHE_SECONDS: float = 60.0
+    
+    # Public listings: server-side cache lifetime, client max-age, and how often
+    # each process checks cache_versions for changes made by other processes
+    RESPONSE_CACHE_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_AGE: int = 5
+    CACHE_VERSION_POLL_SECONDS: float = 1.0
+    
+    # bcrypt worker processes (0 = one per core) and the queue bound beyond which logins get 503
+    BCRYPT_WORKERS: int = 0
+    BCRYPT_MAX_PENDING: int = 256
+    
+    # Connections per process, split between the async engine (routes) and
+    # the sync engine (blocking work, workers and scripts)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # Share of those connections given to the sync engine
+    DB_SYNC_POOL_SHARE: float = 0.5
+    # Threads for blocking route work (0 = the sync pool's size + overflow, so no thread waits for a connection)
+    THREADPOOL_SIZE: int = 0
+    
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,111 @@
+"""
+Helpers for the Alembic migrations in backend/migrations.
+
+Databases created before migrations existed were built by create_all, so the
+early revisions only create what is missing; index revisions build online
+with CREATE INDEX CONCURRENTLY, which Postgres cannot run inside a
+transaction.
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import sqlalchemy as sa
+from alembic import op
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent.parent / "alembic.ini"
+
+
+# =========================
+# Inside migrations
+# =========================
+
+def is_offline() -> bool:
+    """True when emitting SQL (--sql) rather than running against a database."""
+    return op.get_context().as_sql
+
+
+def table_exists(name: str) -> bool:
+    # Offline output assumes an empty database
+    if is_offline():
+        return False
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def column_exists(table: str, column: str) -> bool:
+    if is_offline():
+        return False
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def create_index_concurrently(
+    name: str, table: str, columns: List[str], unique: bool = False, where: Optional[str] = None
+):
+    """
+    Build an index without blocking writes to the table.
+
+    A failed CONCURRENTLY build leaves an INVALID index behind that IF NOT
+    EXISTS would skip, so one is dropped first and the build retried. `where`
+    makes it a partial index (SQL predicate on the table's columns).
+    """
+    predicate = {} if where is None else {
+        "postgresql_where": sa.text(where), "sqlite_where": sa.text(where)
+    }
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        if bind.dialect.name == "postgresql" and not is_offline():
+            invalid = bind.execute(sa.text(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ), {"name": name}).first()
+            if invalid:
+                logger.warning(f"Dropping invalid index {name} left by an interrupted build")
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        op.create_index(
+            name, table, columns, unique=unique,
+            postgresql_concurrently=True, if_not_exists=True, **predicate
+        )
+
+
+def drop_index_concurrently(name: str, table: str):
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+# =========================
+# Outside migrations
+# =========================
+
+def alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    return config
+
+
+def schema_revisions(engine: Engine) -> Tuple[Optional[str], str]:
+    """(revision the database is at, head revision of the migration scripts)."""
+    head = ScriptDirectory.from_config(alembic_config()).get_current_head()
+    with engine.connect() as conn:
+        current = MigrationContext.configure(conn).get_current_revision()
+    return current, head
+
+
+def warn_if_schema_outdated(engine: Engine):
+    """Log a warning when the database is not at the latest migration."""
+    try:
+        current, head = schema_revisions(engine)
+    except Exception as e:
+        logger.warning(f"Could not read schema revision: {e}")
+        return
+    if current != head:
+        logger.warning(
+            f"Database schema is at revision {current}, latest is {head}; "
+            f"run 'alembic upgrade head' from backend/"
+        )
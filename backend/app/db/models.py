@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Enum, JSON, Index, false, text
+from sqlalchemy.orm import relationship, synonym
 from datetime import datetime
 import enum
 from app.db.session import Base
@@ -34,11 +34,19 @@ class Tender(Base):
     award_hash = Column(String(66), nullable=True)
     award_tx_hash = Column(String(66), nullable=True)
     
+    # Content hash of the bid-set snapshot frozen at close (app.services.bid_snapshot)
+    snapshot_hash = Column(String(66), nullable=True)
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     bids = relationship("Bid", back_populates="tender", cascade="all, delete-orphan")
     award = relationship("Award", back_populates="tender", uselist=False)
+    
+    __table_args__ = (
+        # Open-tender listing filters on status and deadline
+        Index("ix_tenders_status_deadline", "status", "deadline"),
+    )
 
 class GovernmentAccount(Base):
     __tablename__ = "government_accounts"
@@ -67,11 +75,53 @@ class Vendor(Base):
     completed_projects = Column(Integer, default=0)
     total_wins = Column(Integer, default=0)
     average_rating = Column(Float, default=0.0)
+    # Running sum behind average_rating (= rating_sum / completed_projects)
+    rating_sum = Column(Float, nullable=False, default=0.0, server_default="0")
     
     created_at = Column(DateTime, default=datetime.utcnow)
     last_login = Column(DateTime, nullable=True)
     
     bids = relationship("Bid", back_populates="vendor")
+    features = relationship("VendorFeatures", back_populates="vendor", uselist=False)
+
+class VendorFeatures(Base):
+    """
+    Precomputed vendor scoring features.
+    
+    Refreshed in the same transaction as the award/rating that changes the
+    vendor's stats, so scoring reads one row per vendor in a single bulk query
+    instead of recomputing from Vendor on every request. Carries the vendor
+    fields the engines read, so it can be passed to them in place of Vendor.
+    """
+    __tablename__ = "vendor_features"
+    
+    vendor_id = Column(Integer, ForeignKey("vendors.id"), primary_key=True)
+    id = synonym("vendor_id")
+    name = Column(String(300), nullable=False)
+    
+    # Snapshot of reputation metrics
+    reputation_score = Column(Float, default=0.0)
+    completed_projects = Column(Integer, default=0)
+    total_wins = Column(Integer, default=0)
+    average_rating = Column(Float, default=0.0)
+    
+    # Derived scores
+    rules_vendor_score = Column(Float, nullable=False)      # AIEngine
+    enhanced_vendor_score = Column(Float, nullable=False)   # EnhancedAIEngine
+    reputation_points = Column(Float, default=0.0)
+    track_record_points = Column(Float, default=0.0)
+    rating_points = Column(Float, default=0.0)
+    experience_level = Column(String(50), nullable=False)
+    
+    # Risk flags
+    good_reputation = Column(Boolean, default=False)
+    no_track_record = Column(Boolean, default=False)
+    limited_experience = Column(Boolean, default=False)
+    
+    features_version = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    vendor = relationship("Vendor", back_populates="features")
 
 class Bid(Base):
     __tablename__ = "bids"
@@ -93,6 +143,7 @@ class Bid(Base):
     technical_score = Column(Float, nullable=True)
     anomaly_flag = Column(Boolean, default=False)
     anomaly_reason = Column(Text, nullable=True)
+    score_version = Column(String(100), nullable=True)  # Engine/config/model version that produced the scores
     
     # Blockchain
     submission_hash = Column(String(66), nullable=True)
@@ -102,6 +153,58 @@ class Bid(Base):
     
     tender = relationship("Tender", back_populates="bids")
     vendor = relationship("Vendor", back_populates="bids")
+    
+    __table_args__ = (
+        # One bid per vendor per tender; also serves lookups by tender_id
+        Index("uq_bids_tender_id_vendor_id", "tender_id", "vendor_id", unique=True),
+        # Keyset order of a vendor's bid history; also serves lookups by vendor_id
+        Index("ix_bids_vendor_id_created_at", "vendor_id", "created_at"),
+    )
+
+class VendorTenderDependency(Base):
+    """
+    Index of vendor -> tenders still under evaluation that the vendor bid on.
+    
+    Added on bid submission, re-synced when a tender closes and dropped on
+    award, so a change to a vendor's stats can find exactly the tenders whose
+    stored scores it invalidates.
+    """
+    __tablename__ = "vendor_tender_deps"
+    
+    vendor_id = Column(Integer, ForeignKey("vendors.id"), primary_key=True)
+    tender_id = Column(Integer, ForeignKey("tenders.id"), primary_key=True, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class RescoreRequest(Base):
+    """Pending background rescoring of a tender (one row per tender, deduplicated)."""
+    __tablename__ = "rescore_queue"
+    
+    tender_id = Column(Integer, ForeignKey("tenders.id"), primary_key=True)
+    reason = Column(String(200), nullable=True)
+    requested_at = Column(DateTime, default=datetime.utcnow)
+    # Set while a worker rescores the tender; a newer request clears it
+    claimed_at = Column(DateTime, nullable=True)
+
+class RecommendationJob(Base):
+    """
+    Background-computed recommendations of a tender (one row per tender).
+    
+    Enqueued when a tender closes and re-queued when its stored scores go
+    stale; app.scripts.recommendation_worker computes the full ranking and
+    stores it here with the scoring version that produced it.
+    """
+    __tablename__ = "recommendation_jobs"
+    
+    tender_id = Column(Integer, ForeignKey("tenders.id"), primary_key=True)
+    status = Column(String(20), nullable=False, index=True)  # pending, running, done, failed
+    score_version = Column(String(100), nullable=True)
+    result = Column(JSON, nullable=True)  # full ranking, best first
+    total = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, default=0)
+    requested_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
 
 class Award(Base):
     __tablename__ = "awards"
@@ -118,23 +221,51 @@ class Award(Base):
     # Public feedback
     public_rating = Column(Float, nullable=True)
     public_feedback_count = Column(Integer, default=0)
+    # Running sum behind public_rating (= public_rating_sum / public_feedback_count)
+    public_rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
     tender = relationship("Tender", back_populates="award")
     winning_bid = relationship("Bid")
     ratings = relationship("PublicRating", back_populates="award")
+    
+    __table_args__ = (
+        # Keyset order of the public awarded feed
+        Index("ix_awards_created_at_id", "created_at", "id"),
+    )
 
 class PublicRating(Base):
     __tablename__ = "public_ratings"
     
     id = Column(Integer, primary_key=True, index=True)
-    award_id = Column(Integer, ForeignKey("awards.id"), nullable=False)
+    award_id = Column(Integer, ForeignKey("awards.id"), nullable=False, index=True)
     
     rating = Column(Integer, nullable=False)  # 1-5
     feedback = Column(Text, nullable=True)
     citizen_name = Column(String(200), nullable=True)
     
+    # Not yet added to the award/vendor aggregates (write-behind ingestion)
+    pending = Column(Boolean, nullable=False, default=False, server_default=false())
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     
     award = relationship("Award", back_populates="ratings")
+    
+    __table_args__ = (
+        # Only the small backlog of pending ratings is indexed
+        Index("ix_public_ratings_pending", "id", postgresql_where=text("pending"), sqlite_where=text("pending")),
+    )
+
+class CacheVersion(Base):
+    """
+    Version counter of a cached public resource (one row per cache key).
+    
+    Bumped in the transaction that changes the resource; API workers compare
+    it with the version their cached responses were built from.
+    """
+    __tablename__ = "cache_versions"
+    
+    key = Column(String(200), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
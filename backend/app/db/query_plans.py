@@ -0,0 +1,154 @@
+"""
+EXPLAIN check for the queries behind the API routes.
+
+Each probe runs a route's queries (through the same service functions where
+the route has one) against the live database with representative keys, the
+statements are captured as executed and re-run under EXPLAIN, and every
+sequential scan on a large table is reported. Postgres only; it reads the
+planner's statistics, so run ANALYZE first on a freshly loaded database.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from sqlalchemy import event, func, text
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    Award, Bid, PublicRating, Tender, TenderStatus, Vendor, VendorTenderDependency
+)
+from app.services.bid_batch import BidBatch
+from app.services.bid_listing import list_tender_bids
+from app.services.pagination import encode_cursor
+from app.services.public_feed import awarded_feed
+from app.services.vendor_history import vendor_bid_history, vendor_bid_summary
+from app.services.vendor_stats import add_award_ratings, add_vendor_ratings, winning_vendor_id
+
+# Tables with fewer planner-estimated rows than this may be scanned
+DEFAULT_MIN_ROWS = 10_000
+
+
+class PlanCheck(NamedTuple):
+    probe: str
+    statement: str
+    seq_scans: List[str]  # large tables read with a Seq Scan
+
+
+def _open_tenders(db: Session, keys: Dict):
+    return db.query(Tender).filter(
+        Tender.status == TenderStatus.OPEN,
+        Tender.deadline > datetime.utcnow()
+    ).all()
+
+
+def _duplicate_bid(db: Session, keys: Dict):
+    return db.query(Bid).filter(
+        Bid.tender_id == keys["tender_id"],
+        Bid.vendor_id == keys["vendor_id"]
+    ).first()
+
+
+# (route, queries it runs)
+PROBES: List[Tuple[str, Callable[[Session, Dict], object]]] = [
+    ("GET /gov/tenders/{id}/bids", lambda db, k: list_tender_bids(db, k["tender_id"], sort="ai_score")),
+    ("GET /gov/tenders/{id}/recommendations", lambda db, k: BidBatch.load(db, k["tender_id"])),
+    ("GET /vendor/tenders/open", _open_tenders),
+    ("POST /vendor/bids (duplicate check)", _duplicate_bid),
+    ("GET /vendor/bids/{vendor_id}", lambda db, k: (
+        vendor_bid_history(db, k["vendor_id"]), vendor_bid_summary(db, k["vendor_id"])
+    )),
+    ("GET /public/tenders/awarded", lambda db, k: awarded_feed(db)),
+    ("GET /public/tenders/awarded (deep page)", lambda db, k: awarded_feed(db, cursor=k["award_cursor"])),
+    ("GET /public/tenders/{id}/transparency", lambda db, k: (
+        list_tender_bids(db, k["tender_id"]),
+        db.query(Award).filter(Award.tender_id == k["tender_id"]).first()
+    )),
+    ("POST /public/ratings", lambda db, k: (
+        add_award_ratings(db, k["award_id"], 1, 5),
+        add_vendor_ratings(db, winning_vendor_id(k["winning_bid_id"]), 1, 5),
+        db.query(VendorTenderDependency.tender_id).filter(
+            VendorTenderDependency.vendor_id == k["vendor_id"]
+        ).all()
+    )),
+]
+
+
+def sample_keys(db: Session) -> Dict:
+    """Busiest tender, vendor and award, so probes see the largest ranges."""
+    tender_id = db.query(Bid.tender_id).group_by(Bid.tender_id).order_by(func.count().desc()).limit(1).scalar()
+    vendor_id = db.query(Bid.vendor_id).group_by(Bid.vendor_id).order_by(func.count().desc()).limit(1).scalar()
+    award_id = db.query(PublicRating.award_id).group_by(
+        PublicRating.award_id
+    ).order_by(func.count().desc()).limit(1).scalar()
+    middle = db.query(Award.created_at, Award.id).order_by(
+        Award.created_at.desc(), Award.id.desc()
+    ).offset(db.query(func.count(Award.id)).scalar() // 2).first()
+    return {
+        "tender_id": tender_id or 0,
+        "vendor_id": vendor_id or 0,
+        "award_id": award_id or 0,
+        "winning_bid_id": db.query(Award.winning_bid_id).filter(Award.id == award_id).scalar() or 0,
+        "award_cursor": encode_cursor(list(middle) if middle else [datetime.utcnow(), 0])
+    }
+
+
+def large_tables(db: Session, min_rows: int) -> Dict[str, float]:
+    """Application tables whose planner row estimate is at least min_rows."""
+    rows = db.execute(text(
+        "SELECT relname, reltuples FROM pg_class "
+        "WHERE relkind = 'r' AND relname = ANY(:tables) AND reltuples >= :min_rows"
+    ), {"tables": list(Vendor.metadata.tables), "min_rows": min_rows})
+    return {name: estimate for name, estimate in rows}
+
+
+def seq_scans(plan: Dict, tables) -> List[str]:
+    """Relations in tables read by a Seq Scan anywhere in an EXPLAIN (FORMAT JSON) plan."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in tables:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child, tables))
+    return found
+
+
+def _capture(db: Session, fn: Callable[[], object]) -> List[Tuple[str, object]]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def check_query_plans(db: Session, min_rows: int = DEFAULT_MIN_ROWS) -> List[PlanCheck]:
+    """
+    EXPLAIN every statement the probes execute.
+
+    Runs inside the session's transaction and rolls it back; nothing is written.
+
+    Returns:
+        One PlanCheck per executed statement
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        raise RuntimeError("Query plan check needs Postgres")
+
+    keys = sample_keys(db)
+    tables = large_tables(db, min_rows)
+    connection = db.connection()
+    checks = []
+    try:
+        for probe, run in PROBES:
+            for statement, parameters in _capture(db, lambda: run(db, keys)):
+                plan = connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                ).scalar()[0]["Plan"]
+                checks.append(PlanCheck(probe, statement, seq_scans(plan, tables)))
+    finally:
+        db.rollback()
+    return checks
@@ -1,24 +1,68 @@
+from typing import Any, Callable, Tuple
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
-)
+# Async drivers for the sync DATABASE_URL schemes
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def async_database_url(url: str) -> str:
+    """DATABASE_URL with its driver swapped for the async one (asyncpg for Postgres)."""
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+def split_pool(total: int, share: float, minimum: int = 0) -> Tuple[int, int]:
+    """(sync, async) split of a per-process connection count, each at least minimum."""
+    sync = min(max(minimum, round(total * share)), max(minimum, total - minimum))
+    return sync, max(minimum, total - sync)
+
+# DB_POOL_SIZE + DB_MAX_OVERFLOW is the whole process's budget, not each engine's
+SYNC_POOL_SIZE, ASYNC_POOL_SIZE = split_pool(settings.DB_POOL_SIZE, settings.DB_SYNC_POOL_SHARE, minimum=1)
+SYNC_MAX_OVERFLOW, ASYNC_MAX_OVERFLOW = split_pool(settings.DB_MAX_OVERFLOW, settings.DB_SYNC_POOL_SHARE)
+
+# SQLite (local runs) keeps its drivers' default pools
+SQLITE = settings.DATABASE_URL.startswith("sqlite")
+SYNC_POOL = {} if SQLITE else {"pool_size": SYNC_POOL_SIZE, "max_overflow": SYNC_MAX_OVERFLOW}
+ASYNC_POOL = {} if SQLITE else {"pool_size": ASYNC_POOL_SIZE, "max_overflow": ASYNC_MAX_OVERFLOW}
+
+# Sync engine: scripts, workers and blocking work run off the event loop
+engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True, **SYNC_POOL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine: route handlers
+async_engine = create_async_engine(async_database_url(settings.DATABASE_URL), pool_pre_ping=True, **ASYNC_POOL)
+
+# Objects stay loaded after commit: lazy refreshes are not possible under asyncio
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+async def run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run fn(db, *args, **kwargs) in the threadpool with its own sync Session.
+
+    For CPU-bound or blocking work (scoring, snapshot files) that must not
+    run on the event loop; the session is closed afterwards, fn commits.
+    """
+    def call():
+        db: Session = SessionLocal()
+        try:
+            return fn(db, *args, **kwargs)
+        finally:
+            db.close()
+    return await run_in_threadpool(call)
@@ -1,15 +1,37 @@
+import asyncio
+from contextlib import asynccontextmanager
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.db.session import engine, Base
+from app.config import get_settings
+from app.db.session import engine, async_engine, SYNC_POOL_SIZE, SYNC_MAX_OVERFLOW
+from app.db.migration_utils import warn_if_schema_outdated
 from app.routes import gov, vendor, public, auth
+from app.services.password_hashing import password_hasher
+from app.services.response_cache import response_cache, poll_versions
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Schema is managed by Alembic migrations (backend/migrations)
+warn_if_schema_outdated(engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Threads only run blocking work (scoring, snapshots, web3; bcrypt has
+    # its own processes); one per sync-pool connection so none waits for one
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        get_settings().THREADPOOL_SIZE or SYNC_POOL_SIZE + SYNC_MAX_OVERFLOW
+    )
+    # Picks up cache version bumps made by other workers and the aggregator
+    poller = asyncio.create_task(poll_versions(get_settings().CACHE_VERSION_POLL_SECONDS))
+    yield
+    poller.cancel()
+    password_hasher.shutdown()
+    await async_engine.dispose()
 
 app = FastAPI(
     title="Procurement Transparency Platform",
     description="AI-assisted, blockchain-enabled public procurement system",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS - Allow frontend to access API
@@ -29,7 +51,7 @@ app.include_router(vendor.router)
 app.include_router(public.router)
 
 @app.get("/")
-def root():
+async def root():
     return {
         "message": "Procurement Transparency Platform API",
         "version": "1.0.0",
@@ -41,5 +63,9 @@ def root():
     }
 
 @app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+async def health_check():
+    return {
+        "status": "healthy",
+        "password_hashing": password_hasher.stats(),
+        "response_cache": response_cache.stats()
+    }
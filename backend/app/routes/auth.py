@@ -1,14 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from app.db.session import get_db
 from app.db.models import GovernmentAccount, Vendor
-from app.services.auth import (
-    verify_password,
-    get_password_hash,
-    create_access_token,
-    get_current_user
-)
+from app.services.vendor_features import refresh_vendor_features
+from app.services.auth import create_access_token, get_current_user
+from app.services.password_hashing import HashingOverloaded, password_hasher
 from datetime import datetime
 import secrets
 
@@ -31,6 +29,13 @@ class VendorRegisterRequest(BaseModel):
     phone: str = None
     address: str = None
 
+def _hashing_unavailable(e: HashingOverloaded) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "1"}
+    )
+
 class LoginResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
@@ -40,14 +45,14 @@ class LoginResponse(BaseModel):
     name: str = None
 
 @router.post("/government/login", response_model=LoginResponse)
-def government_login(
+async def government_login(
     request: GovernmentLoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Government login with access code"""
     
     # Get the government account (there should only be one)
-    gov_account = db.query(GovernmentAccount).first()
+    gov_account = await db.scalar(select(GovernmentAccount).limit(1))
     
     if not gov_account:
         raise HTTPException(
@@ -55,8 +60,12 @@ def government_login(
             detail="Government account not configured"
         )
     
-    # Verify access code
-    if not verify_password(request.access_code, gov_account.access_code_hash):
+    # Verify access code (bcrypt runs on the hashing process pool)
+    try:
+        valid = await password_hasher.verify(request.access_code, gov_account.access_code_hash)
+    except HashingOverloaded as e:
+        raise _hashing_unavailable(e)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid access code"
@@ -64,7 +73,7 @@ def government_login(
     
     # Update last login
     gov_account.last_login = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     # Create token
     access_token = create_access_token(
@@ -78,14 +87,14 @@ def government_login(
     )
 
 @router.post("/vendor/login", response_model=LoginResponse)
-def vendor_login(
+async def vendor_login(
     request: VendorLoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Vendor login with vendor ID and password"""
     
     # Find vendor by vendor_id
-    vendor = db.query(Vendor).filter(Vendor.vendor_id == request.vendor_id).first()
+    vendor = await db.scalar(select(Vendor).where(Vendor.vendor_id == request.vendor_id))
     
     if not vendor:
         raise HTTPException(
@@ -100,7 +109,11 @@ def vendor_login(
         )
     
     # Verify password
-    if not verify_password(request.password, vendor.password_hash):
+    try:
+        valid = await password_hasher.verify(request.password, vendor.password_hash)
+    except HashingOverloaded as e:
+        raise _hashing_unavailable(e)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid password"
@@ -108,7 +121,7 @@ def vendor_login(
     
     # Update last login
     vendor.last_login = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     # Create token
     access_token = create_access_token(
@@ -124,14 +137,14 @@ def vendor_login(
     )
 
 @router.post("/vendor/register", response_model=LoginResponse)
-def vendor_register(
+async def vendor_register(
     request: VendorRegisterRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Register a new vendor with authentication"""
     
     # Check if vendor_id already exists
-    existing_vendor_id = db.query(Vendor).filter(Vendor.vendor_id == request.vendor_id).first()
+    existing_vendor_id = await db.scalar(select(Vendor.id).where(Vendor.vendor_id == request.vendor_id))
     if existing_vendor_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -139,7 +152,7 @@ def vendor_register(
         )
     
     # Check if email already exists
-    existing_email = db.query(Vendor).filter(Vendor.email == request.email).first()
+    existing_email = await db.scalar(select(Vendor.id).where(Vendor.email == request.email))
     if existing_email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -147,7 +160,10 @@ def vendor_register(
         )
     
     # Hash password
-    password_hash = get_password_hash(request.password)
+    try:
+        password_hash = await password_hasher.hash(request.password)
+    except HashingOverloaded as e:
+        raise _hashing_unavailable(e)
     
     # Create vendor
     vendor = Vendor(
@@ -161,8 +177,9 @@ def vendor_register(
         reputation_score=3.0
     )
     db.add(vendor)
-    db.commit()
-    db.refresh(vendor)
+    await db.run_sync(refresh_vendor_features, [vendor])
+    await db.commit()
+    await db.refresh(vendor)
     
     # Create token for immediate login
     access_token = create_access_token(
@@ -178,12 +195,12 @@ def vendor_register(
     )
 
 @router.get("/me")
-def get_current_user_info(current_user: dict = Depends(get_current_user)):
+async def get_current_user_info(current_user: dict = Depends(get_current_user)):
     """Get current authenticated user information"""
     return current_user
 
 @router.post("/logout")
-def logout():
+async def logout():
     """Logout endpoint (client should discard token)"""
     return {"message": "Logged out successfully"}
 
@@ -1,13 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from app.db.session import get_db
+from starlette.concurrency import run_in_threadpool
+from typing import List, Literal, Optional
+from app.db.session import get_db, run_blocking
 from app.db.models import Tender, Bid, Award, Vendor, TenderStatus, BidStatus
 from app.schemas.tender import TenderCreate, TenderResponse
 from app.schemas.award import AwardCreate, AwardResponse
 from app.services.hash_utils import generate_tender_hash, generate_award_hash
 from app.services.blockchain import BlockchainService
+from app.services.model_registry import get_scoring_bundle
 from app.services.ai_engine import AIEngine
+from app.services.vendor_features import refresh_vendor_features
+from app.services.bid_snapshot import write_snapshot, load_bid_batch
+from app.services.tender_scoring import score_tender_shared, explain_bid
+from app.services.bid_listing import list_tender_bids
+from app.services.simulation import (
+    get_component_matrix, simulate, baseline_weights,
+    normalize_weights, grid_weights, sweep_weights
+)
+from app.schemas.simulation import SimulationRequest
+from app.schemas.vendor import VendorOnboardRequest, VendorOnboardResponse
+from app.services.password_hashing import password_hasher
+from app.services.vendor_onboarding import screen_vendors, insert_vendors
+from app.services.vendor_stats import add_vendor_win
+from app.services.response_cache import AWARDED_FEED, OPEN_TENDERS, bump_versions, tender_key
+from app.services.recommendation_jobs import (
+    get_job, job_stalled, stored_page, enqueue_recommendations, requeue_recommendations, cancel_recommendations,
+    PENDING as JOB_PENDING, RUNNING as JOB_RUNNING, DONE as JOB_DONE
+)
+from app.services.rescoring import (
+    drop_tender_dependencies,
+    enqueue_vendor_rescore,
+    sync_tender_dependencies
+)
 from app.services.auth import require_government
 from datetime import datetime
 
@@ -16,9 +44,9 @@ router = APIRouter(prefix="/gov", tags=["Government"])
 blockchain_service = BlockchainService()
 
 @router.post("/tenders", response_model=TenderResponse)
-def create_tender(
+async def create_tender(
     tender: TenderCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_government)
 ):
     """Government creates a new tender"""
@@ -33,86 +61,111 @@ def create_tender(
         creation_hash=tender_hash
     )
     db.add(db_tender)
-    db.commit()
-    db.refresh(db_tender)
+    await db.run_sync(bump_versions, [OPEN_TENDERS])
+    await db.commit()
+    await db.refresh(db_tender)
+    
+    # Warm this worker's description-vector cache for relevance scoring
+    relevance_model = (await run_in_threadpool(get_scoring_bundle)).relevance_model
+    if relevance_model:
+        try:
+            await run_in_threadpool(relevance_model.tender_vector, db_tender)
+        except Exception as e:
+            print(f"Relevance vector caching failed: {e}")
     
-    # Log on blockchain
+    # Log on blockchain (web3 blocks until the receipt: run it in the threadpool)
     try:
-        tx_hash = blockchain_service.log_tender_creation(db_tender.id, tender_hash)
+        tx_hash = await run_in_threadpool(blockchain_service.log_tender_creation, db_tender.id, tender_hash)
         if tx_hash:
             db_tender.creation_tx_hash = tx_hash
-            db.commit()
+            await db.commit()
     except Exception as e:
         print(f"Blockchain logging failed: {e}")
     
     return db_tender
 
 @router.get("/tenders", response_model=List[TenderResponse])
-def list_tenders(
-    db: Session = Depends(get_db),
+async def list_tenders(
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_government)
 ):
     """List all tenders"""
-    return db.query(Tender).all()
+    return (await db.scalars(select(Tender))).all()
 
 @router.get("/tenders/{tender_id}/bids")
-def get_tender_bids(
+async def get_tender_bids(
     tender_id: int,
-    db: Session = Depends(get_db),
+    sort: Literal["price", "ai_score", "timeline"] = "price",
+    order: Optional[Literal["asc", "desc"]] = None,
+    anomaly: Optional[bool] = None,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_government)
 ):
-    """Get all bids for a tender with details"""
-    tender = db.query(Tender).filter(Tender.id == tender_id).first()
-    if not tender:
-        raise HTTPException(status_code=404, detail="Tender not found")
+    """
+    Get a page of bids for a tender with vendor details.
     
-    bids = db.query(Bid).filter(Bid.tender_id == tender_id).all()
+    Sorted server-side by price, ai_score or timeline; anomaly=true/false
+    filters on the anomaly flag. Pass next_cursor from a response as cursor
+    (with the same sort and order) to get the following page.
+    """
+    tender_exists = await db.scalar(select(Tender.id).where(Tender.id == tender_id))
+    if not tender_exists:
+        raise HTTPException(status_code=404, detail="Tender not found")
     
-    results = []
-    for bid in bids:
-        vendor = db.query(Vendor).filter(Vendor.id == bid.vendor_id).first()
-        results.append({
-            "id": bid.id,
-            "vendor_name": vendor.name if vendor else "Unknown",
-            "vendor_reputation": vendor.reputation_score if vendor else 0,
-            "proposed_price": bid.proposed_price,
-            "delivery_timeline": bid.delivery_timeline,
-            "ai_score": bid.ai_score,
-            "anomaly_flag": bid.anomaly_flag,
-            "status": bid.status
-        })
+    try:
+        items, next_cursor = await db.run_sync(list_tender_bids, tender_id, sort, order, anomaly, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return results
+    return {"items": items, "next_cursor": next_cursor, "limit": limit}
 
-@router.post("/tenders/{tender_id}/close")
-def close_tender(
-    tender_id: int,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(require_government)
-):
-    """Close bidding for a tender"""
+def _close_tender(db: Session, tender_id: int):
     tender = db.query(Tender).filter(Tender.id == tender_id).first()
     if not tender:
         raise HTTPException(status_code=404, detail="Tender not found")
     
     tender.status = TenderStatus.CLOSED
+    sync_tender_dependencies(db, tender.id)
+    # Score in the background so the ranking is ready when reviewers open it
+    enqueue_recommendations(db, tender.id)
+    
+    # The bid set is final now: freeze it for scoring, transparency and exports
+    try:
+        write_snapshot(db, tender)
+    except OSError as e:
+        print(f"Snapshot error: {e}")
+    bump_versions(db, [OPEN_TENDERS])
     db.commit()
     
-    return {"message": "Tender closed successfully"}
+    return {"message": "Tender closed successfully", "snapshot_hash": tender.snapshot_hash}
 
-@router.get("/tenders/{tender_id}/recommendations")
-def get_ai_recommendations(
+@router.post("/tenders/{tender_id}/close")
+async def close_tender(
     tender_id: int,
-    db: Session = Depends(get_db),
     current_user: dict = Depends(require_government)
 ):
-    """Get AI-powered bid recommendations"""
+    """Close bidding for a tender"""
+    # Writing the snapshot reads every bid and hashes them: off the event loop
+    return await run_blocking(_close_tender, tender_id)
+
+def _recommendations(
+    db: Session,
+    tender_id: int,
+    detail: str,
+    offset: int,
+    limit: Optional[int],
+    top_k: Optional[int]
+):
     try:
         tender = db.query(Tender).filter(Tender.id == tender_id).first()
         if not tender:
             raise HTTPException(status_code=404, detail="Tender not found")
         
-        bids = db.query(Bid).filter(Bid.tender_id == tender_id).all()
+        # Frozen snapshot once closed, else a lean column-only load; proposal
+        # texts are read only if a scorer needs them
+        bids = load_bid_batch(db, tender)
         if not bids:
             return {
                 "recommendations": [], 
@@ -120,46 +173,53 @@ def get_ai_recommendations(
                 "total_bids": 0
             }
         
-        # Get vendors
-        vendor_ids = [bid.vendor_id for bid in bids]
-        vendors = db.query(Vendor).filter(Vendor.id.in_(vendor_ids)).all()
-        vendor_dict = {v.id: v for v in vendors}
-        
-        # Validate all bids have corresponding vendors
-        missing_vendors = [bid.vendor_id for bid in bids if bid.vendor_id not in vendor_dict]
-        if missing_vendors:
-            print(f"Warning: Missing vendors for IDs: {missing_vendors}")
-        
-        # Get AI recommendations
-        recommendations = AIEngine.get_recommendations(tender_id, bids, vendor_dict, tender)
+        job = get_job(db, tender_id)
+        score_version = AIEngine.score_version(get_scoring_bundle())
+        # While a job is queued or running, the previous ranking (or a live
+        # one) is served marked with the job's status; a job nobody picked up
+        # (or whose worker died) is ignored
+        queued = job is not None and job.status in (JOB_PENDING, JOB_RUNNING) and not job_stalled(job)
+        stored = (
+            job is not None and job.result is not None and job.score_version == score_version
+            and (job.status == JOB_DONE or queued)
+        )
+        if stored:
+            # Precomputed by the recommendation worker
+            status = job.status if queued else JOB_DONE
+            result = stored_page(job, detail, offset, limit, top_k)
+        else:
+            status = job.status if queued else "live"
+            # A ranking stored under an older scoring version is refreshed in the background
+            if job is not None and job.status == JOB_DONE and tender.status == TenderStatus.CLOSED:
+                requeue_recommendations(db, tender_id)
+                db.commit()
+                status = JOB_PENDING
+            # Get AI recommendations (vendor features loaded in one bulk query).
+            # Concurrent requests for this tender share one scoring pass, which
+            # persists only the scores that changed (single bulk UPDATE). An
+            # awarded tender's stored scores are final and are not written
+            result = score_tender_shared(
+                db, tender, bids, detail, offset, limit, top_k,
+                persist=tender.status != TenderStatus.AWARDED
+            )
         
-        if not recommendations:
+        if not result.total:
             return {
                 "recommendations": [],
                 "message": "Unable to generate recommendations. Please check bid data.",
                 "total_bids": len(bids)
             }
         
-        # Update bid scores in database
-        for rec in recommendations:
-            try:
-                bid = next((b for b in bids if b.id == rec["bid_id"]), None)
-                if bid:
-                    bid.ai_score = rec["ai_score"]
-                    bid.price_score = rec["price_score"]
-                    bid.vendor_score = rec["vendor_score"]
-                    bid.technical_score = rec["technical_score"]
-                    bid.anomaly_flag = rec["anomaly_flag"]
-                    bid.anomaly_reason = rec["anomaly_reason"]
-            except Exception as e:
-                print(f"Error updating bid {rec.get('bid_id')}: {e}")
-                continue
-        
-        db.commit()
-        
         return {
-            "recommendations": recommendations, 
+            "recommendations": result.recommendations, 
+            "status": status,
+            "score_version": score_version,
+            "computed_at": job.finished_at if stored else datetime.utcnow(),
             "total_bids": len(bids),
+            "total": result.total if top_k is None else min(result.total, top_k),
+            "offset": offset,
+            "limit": limit,
+            "top_k": top_k,
             "message": "Recommendations generated successfully"
         }
         
@@ -174,20 +234,164 @@ def get_ai_recommendations(
             detail=f"Failed to generate recommendations: {str(e)}"
         )
 
+@router.get("/tenders/{tender_id}/recommendations")
+async def get_ai_recommendations(
+    tender_id: int,
+    detail: Literal["lean", "full"] = "full",
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=0),
+    top_k: Optional[int] = Query(None, ge=1),
+    current_user: dict = Depends(require_government)
+):
+    """
+    Get AI-powered bid recommendations.
+    
+    detail=lean returns only ids, scores, anomaly columns and rank per bid;
+    use /tenders/{tender_id}/bids/{bid_id}/explanation for one bid's details.
+    top_k ranks only the best k bids and offset/limit page through the
+    ranking; ranks and total always refer to the full ranking.
+    
+    Closed tenders are scored in the background: status is "done" when the
+    precomputed ranking is served and "live" when the ranking was computed
+    for this request. While a job is queued or running, status is
+    "pending"/"running" and the recommendations are the previous precomputed
+    ranking (computed_at tells its age) or, without one, a live ranking. A
+    job waiting longer than RECOMMENDATION_JOB_TIMEOUT_SECONDS is ignored.
+    Awarded tenders are ranked live without rewriting their final scores.
+    """
+    # Live scoring is CPU-bound and may wait on a concurrent pass: off the event loop
+    return await run_blocking(_recommendations, tender_id, detail, offset, limit, top_k)
+
+def _bid_explanation(db: Session, tender_id: int, bid_id: int):
+    tender = db.query(Tender).filter(Tender.id == tender_id).first()
+    if not tender:
+        raise HTTPException(status_code=404, detail="Tender not found")
+    
+    bid = db.query(Bid).filter(Bid.id == bid_id, Bid.tender_id == tender_id).first()
+    if not bid:
+        raise HTTPException(status_code=404, detail="Bid not found")
+    
+    explanation = explain_bid(db, tender, bid)
+    if explanation is None:
+        raise HTTPException(status_code=404, detail="Vendor not found")
+    return explanation
+
+@router.get("/tenders/{tender_id}/bids/{bid_id}/explanation")
+async def get_bid_explanation(
+    tender_id: int,
+    bid_id: int,
+    current_user: dict = Depends(require_government)
+):
+    """Full scoring explanation for a single bid (computed on demand)"""
+    return await run_blocking(_bid_explanation, tender_id, bid_id)
+
+def _simulate(db: Session, tender_id: int, request: SimulationRequest):
+    tender = db.query(Tender).filter(Tender.id == tender_id).first()
+    if not tender:
+        raise HTTPException(status_code=404, detail="Tender not found")
+    
+    bundle = get_scoring_bundle()
+    baseline, penalty = baseline_weights(bundle)
+    
+    scenarios = [np.array([[w.price, w.vendor, w.technical] for w in request.weights]).reshape(-1, 3)]
+    if request.grid:
+        scenarios.append(grid_weights(request.grid.model_dump()))
+    try:
+        weights = np.vstack(scenarios)
+        if request.normalize:
+            weights = normalize_weights(weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if request.sweep:
+        sweep = request.sweep
+        weights = np.vstack([
+            weights, sweep_weights(baseline, sweep.component, sweep.start, sweep.stop, sweep.steps)
+        ])
+    
+    matrix = get_component_matrix(db, tender, bundle)
+    if not len(matrix):
+        return {"scenarios": [], "message": "No bids submitted yet", "total_bids": 0}
+    
+    penalty = penalty if request.anomaly_penalty is None else request.anomaly_penalty
+    result = simulate(matrix, weights, baseline, penalty, request.top_k)
+    return {
+        "score_version": matrix.version,
+        "total_bids": len(matrix),
+        "anomaly_penalty": penalty,
+        "baseline": result.baseline,
+        "scenarios": result.scenarios,
+        "summary": result.summary,
+        "winners": result.winners
+    }
+
+@router.post("/tenders/{tender_id}/simulate")
+async def simulate_weights(
+    tender_id: int,
+    request: SimulationRequest,
+    current_user: dict = Depends(require_government)
+):
+    """
+    What-if ranking of a tender's bids under other scoring weights.
+    
+    Scenarios come from explicit weight vectors, a grid (every combination
+    of the listed values) and/or a sweep of one component with the other two
+    keeping their configured proportions. Nothing is stored.
+    """
+    return await run_blocking(_simulate, tender_id, request)
+
+@router.get("/scoring/version")
+async def get_scoring_version(current_user: dict = Depends(require_government)):
+    """Show the scoring config and model versions this worker is serving"""
+    bundle = await run_in_threadpool(get_scoring_bundle)
+    return {
+        "score_version": bundle.version,
+        "config_version": bundle.config_version,
+        "price_model_version": bundle.price_model.version if bundle.price_model else None,
+        "relevance_model_version": bundle.relevance_model.version if bundle.relevance_model else None
+    }
+
+@router.post("/vendors/bulk", response_model=VendorOnboardResponse)
+async def onboard_vendors(
+    request: VendorOnboardRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_government)
+):
+    """
+    Register many vendors with login credentials in one call.
+    
+    Records whose vendor_id, email or company registration is taken (or
+    repeated in the list) are skipped and reported; the rest are created
+    with passwords hashed in parallel and inserted in batches.
+    """
+    records = request.vendors
+    accepted, skipped = await db.run_sync(screen_vendors, records)
+    # Don't hold a connection while hashing
+    await db.rollback()
+    
+    hashes = await password_hasher.hash_many([records[i].password for i in accepted])
+    created, late = await db.run_sync(
+        insert_vendors, [(i, records[i], h) for i, h in zip(accepted, hashes)]
+    )
+    
+    return {
+        "created": created,
+        "skipped": sorted(skipped + late, key=lambda entry: entry["row"])
+    }
+
 @router.post("/awards", response_model=AwardResponse)
-def create_award(
+async def create_award(
     award: AwardCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_government)
 ):
     """Award tender to winning bid"""
     
     # Validate tender and bid
-    tender = db.query(Tender).filter(Tender.id == award.tender_id).first()
+    tender = await db.get(Tender, award.tender_id)
     if not tender:
         raise HTTPException(status_code=404, detail="Tender not found")
     
-    winning_bid = db.query(Bid).filter(Bid.id == award.winning_bid_id).first()
+    winning_bid = await db.get(Bid, award.winning_bid_id)
     if not winning_bid:
         raise HTTPException(status_code=404, detail="Bid not found")
     
@@ -211,24 +415,33 @@ def create_award(
     # Update bid status
     winning_bid.status = BidStatus.ACCEPTED
     
-    # Update vendor stats
-    vendor = db.query(Vendor).filter(Vendor.id == winning_bid.vendor_id).first()
+    # Update vendor stats (atomic increment)
+    vendor = await db.run_sync(add_vendor_win, winning_bid.vendor_id)
     if vendor:
-        vendor.total_wins += 1
+        await db.run_sync(refresh_vendor_features, [vendor])
     
-    db.commit()
-    db.refresh(db_award)
+    # This tender's scores are final; the winner's other open tenders are now stale
+    await db.run_sync(drop_tender_dependencies, tender.id)
+    await db.run_sync(cancel_recommendations, tender.id)
+    if vendor:
+        await db.run_sync(enqueue_vendor_rescore, [vendor.id], f"award on tender {tender.id}")
+    
+    await db.run_sync(bump_versions, [AWARDED_FEED, OPEN_TENDERS, tender_key(tender.id)])
+    await db.commit()
+    await db.refresh(db_award)
     
-    # Log on blockchain
+    # Log on blockchain (web3 blocks until the receipt: run it in the threadpool)
     try:
-        tx_hash = blockchain_service.log_award_decision(
+        tx_hash = await run_in_threadpool(
+            blockchain_service.log_award_decision,
             tender.id,
             winning_bid.id,
             award_hash
         )
         if tx_hash:
             tender.award_tx_hash = tx_hash
-            db.commit()
+            await db.run_sync(bump_versions, [AWARDED_FEED, tender_key(tender.id)])
+            await db.commit()
     except Exception as e:
         print(f"Blockchain logging failed: {e}")
     
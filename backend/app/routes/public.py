@@ -1,123 +1,177 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from typing import List, Literal, Optional
+from app.config import get_settings
 from app.db.session import get_db
 from app.db.models import Tender, Award, Bid, Vendor, PublicRating, TenderStatus
 from app.schemas.award import PublicRatingCreate
 from app.services.blockchain import BlockchainService
+from app.services.vendor_features import refresh_vendor_features
+from app.services.rescoring import enqueue_vendor_rescore
+from app.services.response_cache import AWARDED_FEED, bump_versions, cached_json, tender_key
+from app.services.vendor_stats import add_award_ratings, add_vendor_ratings, winning_vendor_id
+from app.services.bid_snapshot import load_snapshot
+from app.services.public_feed import awarded_feed
+from app.services.bid_listing import list_tender_bids, count_tender_bids
 
 router = APIRouter(prefix="/public", tags=["Public Transparency"])
 
+settings = get_settings()
+
 blockchain_service = BlockchainService()
 
+# Page size when a client pages with a cursor but no limit
+DEFAULT_PAGE_SIZE = 50
+
 @router.get("/tenders/awarded")
-def get_awarded_tenders(db: Session = Depends(get_db)):
-    """Get all awarded tenders for public viewing"""
-    tenders = db.query(Tender).filter(Tender.status == TenderStatus.AWARDED).all()
-    
-    results = []
-    for tender in tenders:
-        award = db.query(Award).filter(Award.tender_id == tender.id).first()
-        if award:
-            winning_bid = db.query(Bid).filter(Bid.id == award.winning_bid_id).first()
-            vendor = db.query(Vendor).filter(Vendor.id == winning_bid.vendor_id).first() if winning_bid else None
-            
-            results.append({
-                "tender_id": tender.id,
-                "award_id": award.id,
-                "title": tender.title,
-                "category": tender.category,
-                "budget": tender.budget,
-                "department": tender.department,
-                "winner": vendor.name if vendor else "Unknown",
-                "award_amount": award.award_amount,
-                "contract_start": award.contract_start,
-                "contract_end": award.contract_end,
-                "justification": award.justification,
-                "public_rating": award.public_rating,
-                "feedback_count": award.public_feedback_count,
-                "creation_tx": tender.creation_tx_hash,
-                "award_tx": tender.award_tx_hash
-            })
-    
-    return results
+async def get_awarded_tenders(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
+    category: Optional[str] = None,
+    department: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get awarded tenders for public viewing, newest award first.
+    
+    Without limit or cursor the response is the plain list of all awarded
+    tenders, as before paging was added. With either, it is one page:
+    {items, next_cursor, limit}; pass next_cursor as cursor to get the
+    following page.
+    """
+    paged = limit is not None or cursor is not None
+    if paged:
+        limit = limit or DEFAULT_PAGE_SIZE
+    
+    async def build():
+        try:
+            items, next_cursor = await db.run_sync(awarded_feed, limit, cursor, category, department)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not paged:
+            return items, None
+        return {"items": items, "next_cursor": next_cursor, "limit": limit}, None
+    
+    # Ratings don't bump the feed: their counts catch up within RESPONSE_CACHE_SECONDS
+    return await cached_json(request, db, AWARDED_FEED, (limit, cursor, category, department), build)
 
 @router.get("/tenders/{tender_id}/transparency")
-def get_tender_transparency(tender_id: int, db: Session = Depends(get_db)):
-    """Get complete transparency view for a tender"""
-    tender = db.query(Tender).filter(Tender.id == tender_id).first()
-    if not tender:
-        raise HTTPException(status_code=404, detail="Tender not found")
-    
-    if tender.status != TenderStatus.AWARDED:
-        raise HTTPException(status_code=400, detail="Tender not yet awarded - transparency not available")
-    
-    # Get all bids
-    bids = db.query(Bid).filter(Bid.tender_id == tender_id).all()
-    
-    bid_details = []
-    for bid in bids:
-        vendor = db.query(Vendor).filter(Vendor.id == bid.vendor_id).first()
-        bid_details.append({
-            "vendor_name": vendor.name if vendor else "Unknown",
-            "proposed_price": bid.proposed_price,
-            "delivery_timeline": bid.delivery_timeline,
-            "ai_score": bid.ai_score,
-            "anomaly_flag": bid.anomaly_flag,
-            "status": bid.status
-        })
-    
-    # Get award
-    award = db.query(Award).filter(Award.tender_id == tender_id).first()
-    
-    # Verify blockchain
-    blockchain_verification = blockchain_service.verify_audit_trail(tender_id)
-    
-    return {
-        "tender": {
-            "id": tender.id,
-            "title": tender.title,
-            "budget": tender.budget,
-            "department": tender.department
-        },
-        "all_bids": bid_details,
-        "award": {
-            "winning_amount": award.award_amount if award else None,
-            "justification": award.justification if award else None
-        },
-        "blockchain_proof": blockchain_verification,
-        "public_rating": award.public_rating if award else None
-    }
+async def get_tender_transparency(
+    request: Request,
+    tender_id: int,
+    sort: Literal["price", "ai_score", "timeline"] = "price",
+    order: Optional[Literal["asc", "desc"]] = None,
+    anomaly: Optional[bool] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get complete transparency view for a tender.
+    
+    all_bids holds every bid unless limit or cursor is given; then it is one
+    page of the bid list (same sort, filter and cursor parameters as the
+    government bid listing) and next_cursor fetches the next.
+    """
+    if cursor is not None:
+        limit = limit or DEFAULT_PAGE_SIZE
+    
+    async def build():
+        tender = await db.get(Tender, tender_id)
+        if not tender:
+            raise HTTPException(status_code=404, detail="Tender not found")
+    
+        if tender.status != TenderStatus.AWARDED:
+            raise HTTPException(status_code=400, detail="Tender not yet awarded - transparency not available")
+    
+        try:
+            bids, next_cursor = await db.run_sync(list_tender_bids, tender_id, sort, order, anomaly, limit, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+        bid_details = [{
+            "vendor_name": bid["vendor_name"],
+            "proposed_price": bid["proposed_price"],
+            "delivery_timeline": bid["delivery_timeline"],
+            "ai_score": bid["ai_score"],
+            "anomaly_flag": bid["anomaly_flag"],
+            "status": bid["status"]
+        } for bid in bids]
+    
+        # Size of the frozen close-time bid set when there is one
+        snapshot = await run_in_threadpool(load_snapshot, tender)
+        bid_count = len(snapshot) if snapshot is not None else await db.run_sync(count_tender_bids, tender_id)
+    
+        # Get award
+        award = await db.scalar(select(Award).where(Award.tender_id == tender_id))
+    
+        # Verify blockchain
+        blockchain_verification = await run_in_threadpool(blockchain_service.verify_audit_trail, tender_id)
+    
+        # Frozen bid set vs. the bid submissions logged on chain
+        bid_set = {"snapshot_hash": tender.snapshot_hash, "bid_count": bid_count}
+        if blockchain_verification:
+            bid_set["matches_chain_bid_count"] = blockchain_verification["total_bids"] == bid_count
+    
+        payload = {
+            "tender": {
+                "id": tender.id,
+                "title": tender.title,
+                "budget": tender.budget,
+                "department": tender.department
+            },
+            "all_bids": bid_details,
+            "next_cursor": next_cursor,
+            "award": {
+                "winning_amount": award.award_amount if award else None,
+                "justification": award.justification if award else None
+            },
+            "blockchain_proof": blockchain_verification,
+            "bid_set": bid_set,
+            "public_rating": award.public_rating if award else None
+        }
+        # Not cached while the chain can't be reached, so the proof shows up once it can
+        return payload, None if blockchain_verification else 0
+    
+    return await cached_json(
+        request, db, tender_key(tender_id), (sort, order, anomaly, limit, cursor), build
+    )
 
 @router.post("/ratings")
-def submit_public_rating(rating: PublicRatingCreate, db: Session = Depends(get_db)):
+async def submit_public_rating(rating: PublicRatingCreate, db: AsyncSession = Depends(get_db)):
     """Public submits rating for completed project"""
     
-    award = db.query(Award).filter(Award.id == rating.award_id).first()
-    if not award:
+    if settings.RATING_WRITE_BEHIND:
+        # Append only; the rating aggregator updates the averages shortly after
+        db.add(PublicRating(**rating.dict(), pending=True))
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Foreign key: no such award
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Award not found")
+        return {"message": "Rating submitted successfully"}
+    
+    # Update award average rating (one atomic UPDATE on the running sum)
+    award = await db.run_sync(add_award_ratings, rating.award_id, 1, rating.rating)
+    if award is None:
         raise HTTPException(status_code=404, detail="Award not found")
     
     # Create rating
     db_rating = PublicRating(**rating.dict())
     db.add(db_rating)
     
-    # Update award average rating
-    all_ratings = db.query(PublicRating).filter(PublicRating.award_id == rating.award_id).all()
-    total_ratings = len(all_ratings) + 1
-    new_avg = (sum(r.rating for r in all_ratings) + rating.rating) / total_ratings
-    
-    award.public_rating = round(new_avg, 2)
-    award.public_feedback_count = total_ratings
-    
     # Update vendor reputation
-    winning_bid = db.query(Bid).filter(Bid.id == award.winning_bid_id).first()
-    if winning_bid:
-        vendor = db.query(Vendor).filter(Vendor.id == winning_bid.vendor_id).first()
-        if vendor:
-            vendor.completed_projects += 1
-            vendor.average_rating = ((vendor.average_rating * (vendor.completed_projects - 1)) + rating.rating) / vendor.completed_projects
-            vendor.reputation_score = vendor.average_rating
-    
-    db.commit()
+    vendor = await db.run_sync(add_vendor_ratings, winning_vendor_id(award.winning_bid_id), 1, rating.rating)
+    if vendor:
+        await db.run_sync(refresh_vendor_features, [vendor])
+        await db.run_sync(enqueue_vendor_rescore, [vendor.id], f"rating on award {rating.award_id}")
+    await db.run_sync(bump_versions, [tender_key(award.tender_id)])
+    
+    await db.commit()
     
     return {"message": "Rating submitted successfully"}
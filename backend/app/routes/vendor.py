@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
 from datetime import datetime
 from app.db.session import get_db
 from app.db.models import Tender, Bid, Vendor, TenderStatus
@@ -9,24 +12,28 @@ from app.schemas.tender import TenderResponse
 from app.services.hash_utils import generate_bid_hash
 from app.services.blockchain import BlockchainService
 from app.services.auth import require_vendor, get_password_hash
+from app.services.vendor_features import refresh_vendor_features
+from app.services.rescoring import record_bid_dependency
+from app.services.vendor_history import vendor_bid_history, vendor_bid_summary, vendor_open_tender_ids
+from app.services.response_cache import OPEN_TENDERS, cached_json
 
 router = APIRouter(prefix="/vendor", tags=["Vendor"])
 
 blockchain_service = BlockchainService()
 
 @router.post("/register")
-def register_vendor(
+async def register_vendor(
     name: str,
     email: str,
     company_registration: str,
     phone: str = None,
     address: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Register a new vendor (legacy endpoint - use /auth/vendor/register for new registrations)"""
     
     # Check if vendor exists
-    existing = db.query(Vendor).filter(Vendor.email == email).first()
+    existing = await db.scalar(select(Vendor.id).where(Vendor.email == email))
     if existing:
         raise HTTPException(status_code=400, detail="Vendor with this email already exists")
     
@@ -39,32 +46,44 @@ def register_vendor(
         reputation_score=3.0  # Starting reputation
     )
     db.add(vendor)
-    db.commit()
-    db.refresh(vendor)
+    await db.run_sync(refresh_vendor_features, [vendor])
+    await db.commit()
+    await db.refresh(vendor)
     
     return {"id": vendor.id, "name": vendor.name, "message": "Vendor registered successfully. Please set up authentication via /auth/vendor/register"}
 
 @router.get("/tenders/open", response_model=List[TenderResponse])
-def get_open_tenders(
-    db: Session = Depends(get_db),
+async def get_open_tenders(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_vendor)
 ):
     """Get all open tenders"""
-    return db.query(Tender).filter(
-        Tender.status == TenderStatus.OPEN,
-        Tender.deadline > datetime.utcnow()
-    ).all()
+    async def build():
+        now = datetime.utcnow()
+        result = await db.scalars(select(Tender).where(
+            Tender.status == TenderStatus.OPEN,
+            Tender.deadline > now
+        ))
+        tenders = result.all()
+        payload = [TenderResponse.model_validate(t).model_dump(mode="json") for t in tenders]
+        # Valid until the first of these deadlines passes and the tender drops out
+        first_deadline = min((t.deadline for t in tenders), default=None)
+        return payload, (first_deadline - now).total_seconds() if first_deadline else None
+    
+    # Same list for every vendor; private so shared caches only keep it per login
+    return await cached_json(request, db, OPEN_TENDERS, (), build, private=True)
 
 @router.post("/bids", response_model=BidResponse)
-def submit_bid(
+async def submit_bid(
     bid: BidCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_vendor)
 ):
     """Submit a bid for a tender"""
     
     # Validate tender
-    tender = db.query(Tender).filter(Tender.id == bid.tender_id).first()
+    tender = await db.get(Tender, bid.tender_id)
     if not tender:
         raise HTTPException(status_code=404, detail="Tender not found")
     
@@ -75,7 +94,7 @@ def submit_bid(
         raise HTTPException(status_code=400, detail="Tender deadline has passed")
     
     # Validate vendor and ensure they match the authenticated user
-    vendor = db.query(Vendor).filter(Vendor.id == bid.vendor_id).first()
+    vendor = await db.get(Vendor, bid.vendor_id)
     if not vendor:
         raise HTTPException(status_code=404, detail="Vendor not found")
     
@@ -84,10 +103,10 @@ def submit_bid(
         raise HTTPException(status_code=403, detail="You can only submit bids for your own account")
     
     # Check for duplicate bid
-    existing_bid = db.query(Bid).filter(
+    existing_bid = await db.scalar(select(Bid.id).where(
         Bid.tender_id == bid.tender_id,
         Bid.vendor_id == bid.vendor_id
-    ).first()
+    ))
     if existing_bid:
         raise HTTPException(status_code=400, detail="Vendor has already submitted a bid for this tender")
     
@@ -100,47 +119,74 @@ def submit_bid(
         submission_hash=bid_hash
     )
     db.add(db_bid)
-    db.commit()
-    db.refresh(db_bid)
+    await db.run_sync(record_bid_dependency, bid.vendor_id, bid.tender_id)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent submission won the race past the check above
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Vendor has already submitted a bid for this tender")
+    await db.refresh(db_bid)
     
-    # Log on blockchain
+    # Log on blockchain (web3 blocks until the receipt: run it in the threadpool)
     try:
-        tx_hash = blockchain_service.log_bid_submission(
+        tx_hash = await run_in_threadpool(
+            blockchain_service.log_bid_submission,
             db_bid.id,
             tender.id,
             bid_hash
         )
         if tx_hash:
             db_bid.submission_tx_hash = tx_hash
-            db.commit()
+            await db.commit()
     except Exception as e:
         print(f"Blockchain logging failed: {e}")
     
     return db_bid
 
 @router.get("/bids/{vendor_id}")
-def get_vendor_bids(
+async def get_vendor_bids(
     vendor_id: int,
-    db: Session = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_vendor)
 ):
-    """Get all bids submitted by a vendor"""
+    """
+    Get a vendor's bid history, newest first.
+    
+    The first page (no cursor) also carries summary aggregates over the whole
+    history; pass next_cursor from a response as cursor to get the following page.
+    """
     # Ensure vendor can only see their own bids
     if current_user["id"] != vendor_id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    bids = db.query(Bid).filter(Bid.vendor_id == vendor_id).all()
-    
-    results = []
-    for bid in bids:
-        tender = db.query(Tender).filter(Tender.id == bid.tender_id).first()
-        results.append({
-            "bid_id": bid.id,
-            "tender_title": tender.title if tender else "Unknown",
-            "proposed_price": bid.proposed_price,
-            "status": bid.status,
-            "ai_score": bid.ai_score,
-            "submitted_at": bid.created_at
-        })
-    
-    return results
+    try:
+        items, next_cursor = await db.run_sync(vendor_bid_history, vendor_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "limit": limit,
+        "summary": await db.run_sync(vendor_bid_summary, vendor_id) if cursor is None else None
+    }
+
+@router.get("/bids/{vendor_id}/open-tenders")
+async def get_vendor_open_tender_ids(
+    vendor_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_vendor)
+):
+    """
+    Ids of the open tenders this vendor has already bid on.
+    
+    Independent of the paged bid history, so the dashboard can mark every
+    tender that already has the vendor's bid.
+    """
+    if current_user["id"] != vendor_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    return {"tender_ids": await db.run_sync(vendor_open_tender_ids, vendor_id)}
@@ -0,0 +1,42 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Literal, Optional
+
+# Upper bound on weight vectors evaluated in one request
+MAX_SCENARIOS = 2000
+
+class WeightVector(BaseModel):
+    price: float = Field(..., ge=0)
+    vendor: float = Field(..., ge=0)
+    technical: float = Field(..., ge=0)
+
+class WeightGrid(BaseModel):
+    price: List[float] = Field(..., min_length=1)
+    vendor: List[float] = Field(..., min_length=1)
+    technical: List[float] = Field(..., min_length=1)
+
+class WeightSweep(BaseModel):
+    component: Literal["price", "vendor", "technical"]
+    start: float = Field(0.0, ge=0, le=1)
+    stop: float = Field(1.0, ge=0, le=1)
+    steps: int = Field(11, ge=2, le=MAX_SCENARIOS)
+
+class SimulationRequest(BaseModel):
+    weights: List[WeightVector] = []
+    grid: Optional[WeightGrid] = None
+    sweep: Optional[WeightSweep] = None
+    normalize: bool = True
+    anomaly_penalty: Optional[float] = Field(None, ge=0)
+    top_k: int = Field(5, ge=1, le=100)
+
+    @model_validator(mode="after")
+    def check_scenarios(self):
+        count = len(self.weights)
+        if self.grid:
+            count += len(self.grid.price) * len(self.grid.vendor) * len(self.grid.technical)
+        if self.sweep:
+            count += self.sweep.steps
+        if count == 0:
+            raise ValueError("Provide weights, a grid or a sweep")
+        if count > MAX_SCENARIOS:
+            raise ValueError(f"At most {MAX_SCENARIOS} scenarios per request, got {count}")
+        return self
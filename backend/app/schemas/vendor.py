@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+# Upper bound on vendors onboarded in one request (larger imports: app.scripts.onboard_vendors)
+MAX_ONBOARD_VENDORS = 5000
+
+class VendorOnboardRecord(BaseModel):
+    vendor_id: str = Field(..., min_length=1, max_length=100)
+    password: str = Field(..., min_length=1)
+    name: str = Field(..., min_length=1, max_length=300)
+    email: str = Field(..., min_length=3, max_length=200)
+    company_registration: str = Field(..., min_length=1, max_length=100)
+    phone: Optional[str] = Field(None, max_length=20)
+    address: Optional[str] = None
+
+class VendorOnboardRequest(BaseModel):
+    vendors: List[VendorOnboardRecord] = Field(..., min_length=1, max_length=MAX_ONBOARD_VENDORS)
+
+class SkippedVendor(BaseModel):
+    row: int
+    vendor_id: str
+    reason: str
+
+class VendorOnboardResponse(BaseModel):
+    created: int
+    skipped: List[SkippedVendor]
@@ -0,0 +1,62 @@
+"""
+Script to check that the API routes' queries use indexes on large tables.
+
+Runs each route's queries against the configured database, EXPLAINs every
+statement and exits non-zero if any of them plans a sequential scan on a
+table with at least --min-rows rows (planner estimate). Read-only.
+
+Usage:
+    python -m app.scripts.check_query_plans
+    python -m app.scripts.check_query_plans --analyze --min-rows 5000 --verbose
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import text
+
+from app.db.session import SessionLocal, engine
+from app.db.query_plans import DEFAULT_MIN_ROWS, check_query_plans
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail on sequential scans of large tables in route queries")
+    parser.add_argument("--min-rows", type=int, default=DEFAULT_MIN_ROWS,
+                        help="Tables estimated at fewer rows may be scanned")
+    parser.add_argument("--analyze", action="store_true", help="Refresh planner statistics first")
+    parser.add_argument("--verbose", action="store_true", help="Print every checked statement")
+    args = parser.parse_args()
+
+    if args.analyze:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ANALYZE"))
+        print("📊 Planner statistics refreshed")
+
+    db = SessionLocal()
+    try:
+        checks = check_query_plans(db, args.min_rows)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    failures = [check for check in checks if check.seq_scans]
+    for check in checks:
+        if check.seq_scans:
+            print(f"❌ {check.probe}: Seq Scan on {', '.join(sorted(set(check.seq_scans)))}")
+            print(f"   {' '.join(check.statement.split())}")
+        elif args.verbose:
+            print(f"✅ {check.probe}: {' '.join(check.statement.split())[:120]}")
+
+    if failures:
+        print(f"❌ {len(failures)} of {len(checks)} statement(s) scan a large table")
+        sys.exit(1)
+    print(f"✅ {len(checks)} statement(s) checked, no sequential scans on large tables")
+
+
+if __name__ == "__main__":
+    main()
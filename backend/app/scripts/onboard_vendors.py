@@ -0,0 +1,88 @@
+"""
+Script to register many vendors with login credentials from a CSV file.
+Replaces one /auth/vendor/register call per vendor: passwords are hashed in
+parallel on every core and vendors are inserted in batches. Rows that are
+invalid, or whose vendor_id, email or company registration is already taken
+(or repeated in the file), are skipped and listed.
+
+CSV columns: vendor_id,password,name,email,company_registration[,phone,address]
+
+Usage:
+    python -m app.scripts.onboard_vendors vendors.csv
+    python -m app.scripts.onboard_vendors vendors.csv --workers 8 --batch-size 1000
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from pydantic import ValidationError
+
+from app.db.session import SessionLocal
+from app.schemas.vendor import VendorOnboardRecord
+from app.services.password_hashing import BULK_CHUNK_SIZE, hash_passwords
+from app.services.vendor_onboarding import insert_vendors, screen_vendors
+
+
+def read_records(path: str):
+    """Valid records and (line, vendor_id, reason) for rows that failed validation."""
+    records, invalid = [], []
+    with open(path, newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            row = {key: (value or None) for key, value in row.items()}
+            try:
+                records.append((line, VendorOnboardRecord(**row)))
+            except ValidationError as e:
+                reason = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+                invalid.append((line, row.get("vendor_id") or "", reason))
+    return records, invalid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-register vendors from a CSV file")
+    parser.add_argument("csv_path")
+    parser.add_argument("--workers", type=int, default=None, help="Hashing processes (default: number of cores)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Vendors per INSERT / commit")
+    args = parser.parse_args()
+
+    rows, invalid = read_records(args.csv_path)
+    lines = [line for line, _ in rows]
+    records = [record for _, record in rows]
+    print(f"📄 {len(records)} valid row(s), {len(invalid)} invalid")
+
+    db = SessionLocal()
+    try:
+        accepted, skipped = screen_vendors(db, records)
+        db.rollback()
+
+        started = time.perf_counter()
+        passwords = [records[i].password for i in accepted]
+        chunks = [passwords[i:i + BULK_CHUNK_SIZE] for i in range(0, len(passwords), BULK_CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count() or 1) as pool:
+            hashes = [hashed for chunk in pool.map(hash_passwords, chunks) for hashed in chunk]
+        print(f"🔐 Hashed {len(hashes)} password(s) in {time.perf_counter() - started:.1f}s")
+
+        created, late = insert_vendors(
+            db, [(i, records[i], h) for i, h in zip(accepted, hashes)], args.batch_size
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    rejected = invalid + [(lines[entry["row"]], entry["vendor_id"], entry["reason"]) for entry in skipped + late]
+    for line, vendor_id, reason in sorted(rejected):
+        print(f"⚠️  Line {line} ({vendor_id}): {reason}")
+    print(f"✅ Registered {created} vendor(s), skipped {len(rejected)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Background worker that applies write-behind public ratings.
+With RATING_WRITE_BEHIND on, POST /public/ratings only appends the rating;
+this worker folds pending ratings into the award and vendor aggregates in
+batches, every --poll-interval seconds while idle and back to back while a
+backlog remains. Several workers can run side by side.
+
+Usage:
+    python -m app.scripts.rating_aggregator
+    python -m app.scripts.rating_aggregator --once      # drain and exit
+    python -m app.scripts.rating_aggregator --status    # print the backlog and exit
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.db.session import SessionLocal
+from app.services.rating_ingestion import apply_pending_ratings, pending_ratings
+
+
+def run(batch_size: int, poll_interval: float, once: bool):
+    db = SessionLocal()
+    try:
+        while True:
+            applied = apply_pending_ratings(db, batch_size)
+            if applied:
+                print(f"✅ Applied {applied} rating(s)")
+            if applied < batch_size:
+                if once:
+                    return
+                time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        print("⏹️  Stopping rating aggregator")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply write-behind public ratings to the aggregates")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--poll-interval", type=float, default=0.3, help="Seconds to wait when the backlog is drained")
+    parser.add_argument("--once", action="store_true", help="Exit when no ratings are pending")
+    parser.add_argument("--status", action="store_true", help="Print the pending backlog and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.status:
+        db = SessionLocal()
+        try:
+            count, age = pending_ratings(db)
+            print(f"📊 {count} pending rating(s), oldest {age:.1f}s old")
+        finally:
+            db.close()
+    else:
+        run(args.batch_size, args.poll_interval, args.once)
@@ -0,0 +1,72 @@
+"""
+Background worker that precomputes recommendations of closed tenders.
+Closing a tender queues a job; this worker scores the tender and stores the
+full ranking, which the recommendations endpoint then serves directly. Runs
+outside the API; several workers (or --processes) can drain the queue side
+by side.
+
+Usage:
+    python -m app.scripts.recommendation_worker
+    python -m app.scripts.recommendation_worker --processes 4
+    python -m app.scripts.recommendation_worker --once     # drain and exit
+"""
+import argparse
+import logging
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.db.session import SessionLocal
+from app.services.model_registry import get_scoring_bundle
+from app.services.recommendation_jobs import process_recommendation_jobs
+
+
+def run(batch_size: int, poll_interval: float, once: bool):
+    logging.basicConfig(level=logging.INFO)
+    # Load models before claiming the first job
+    get_scoring_bundle()
+    db = SessionLocal()
+    try:
+        while True:
+            done = process_recommendation_jobs(db, batch_size)
+            if done:
+                print(f"✅ Computed recommendations for tenders: {done}")
+            elif once:
+                return
+            else:
+                time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        print("⏹️  Stopping recommendation worker")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute queued tender recommendations")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes to run")
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Seconds to wait when idle")
+    parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        run(args.batch_size, args.poll_interval, args.once)
+    else:
+        # Fresh interpreters: no database connections inherited from the parent
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=run, args=(args.batch_size, args.poll_interval, args.once))
+            for _ in range(args.processes)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            for worker in workers:
+                worker.join()
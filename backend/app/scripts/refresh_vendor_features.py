@@ -0,0 +1,34 @@
+"""
+Script to rebuild the vendor_features table from current vendor stats.
+Run after deploying a change to a vendor scoring formula (and bumping
+FEATURES_VERSION), or to backfill vendors created before the table existed.
+Normal operation keeps the table current on every award and rating.
+
+Usage:
+    python -m app.scripts.refresh_vendor_features
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.db.session import SessionLocal
+from app.services.vendor_features import rebuild_all_vendor_features
+
+
+def main():
+    db = SessionLocal()
+    try:
+        total = rebuild_all_vendor_features(db)
+        print(f"✅ Refreshed features for {total} vendor(s)")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Script to rescore every tender after a scoring change.
+Tenders and bids are streamed in chunks and scored on a process pool sized
+to the machine's cores; changed scores are written back with one bulk UPDATE
+per chunk. Progress is checkpointed, so an interrupted run resumes where it
+stopped.
+
+Usage:
+    python -m app.scripts.rescore_all
+    python -m app.scripts.rescore_all --dry-run               # diff against stored ai_score, no writes
+    python -m app.scripts.rescore_all --status open closed    # only tenders in these states
+    python -m app.scripts.rescore_all --restart               # ignore the checkpoint
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.db.models import TenderStatus
+from app.db.session import SessionLocal
+from app.services.bulk_rescoring import rescore_all
+
+
+def report_progress(stats: dict):
+    print(f"   … {stats['tenders']} tenders / {stats['bids']} bids "
+          f"({stats['tenders_per_s']} tenders/s, {stats['bids_per_s']} bids/s), "
+          f"last tender id {stats['last_tender_id']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rescore all tenders on a process pool")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=200, help="Tenders per chunk")
+    parser.add_argument("--status", nargs="+", choices=[s.value for s in TenderStatus],
+                        help="Only rescore tenders in these states")
+    parser.add_argument("--dry-run", action="store_true", help="Diff new scores against stored ai_score without writing")
+    parser.add_argument("--checkpoint", default="rescore_all.checkpoint.json", help="Checkpoint file")
+    parser.add_argument("--restart", action="store_true", help="Discard the checkpoint and start from the first tender")
+    parser.add_argument("--report", default=None, help="Write the final statistics as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.restart and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    statuses = [TenderStatus(s) for s in args.status] if args.status else None
+    workers = args.workers or os.cpu_count()
+    mode = "dry run" if args.dry_run else "writing"
+    print(f"🔄 Rescoring tenders on {workers} worker(s), {args.chunk_size} tenders per chunk ({mode})")
+
+    db = SessionLocal()
+    try:
+        stats = rescore_all(
+            db,
+            workers=workers,
+            chunk_size=args.chunk_size,
+            dry_run=args.dry_run,
+            checkpoint_path=args.checkpoint,
+            statuses=statuses,
+            progress=report_progress
+        )
+    except KeyboardInterrupt:
+        db.rollback()
+        print("⏹️  Interrupted; rerun to resume from the last checkpoint")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    if stats["resumed_from"]:
+        print(f"ℹ️  Resumed after tender id {stats['resumed_from']}")
+    print(f"✅ Scored {stats['tenders']} tenders / {stats['bids']} bids "
+          f"in {stats.get('elapsed_s', 0)}s "
+          f"({stats.get('tenders_per_s', 0)} tenders/s, {stats.get('bids_per_s', 0)} bids/s)")
+
+    if args.dry_run:
+        diff = stats["diff"]
+        print(f"📊 {diff['changed']} of {diff['compared']} bids would change "
+              f"(mean |Δ| {diff['mean_abs_delta']}), {diff['previously_unscored']} previously unscored")
+        for change in diff["largest_changes"]:
+            print(f"   bid {change['bid_id']}: {change['stored']} → {change['new']} ({change['delta']:+})")
+    else:
+        print(f"💾 Updated {stats['written']} bid(s)")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(stats, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
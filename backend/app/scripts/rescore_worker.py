@@ -0,0 +1,62 @@
+"""
+Background worker that rescores tenders queued by vendor stats changes.
+Awards and public ratings enqueue only the tenders under evaluation that the
+affected vendor bid on; this worker drains that queue. Several workers can
+run side by side.
+
+Usage:
+    python -m app.scripts.rescore_worker
+    python -m app.scripts.rescore_worker --once            # drain and exit
+    python -m app.scripts.rescore_worker --rebuild-index   # backfill vendor->tender index first
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.db.session import SessionLocal
+from app.services.rescoring import process_rescore_queue, rebuild_dependency_index
+
+
+def run(batch_size: int, poll_interval: float, once: bool):
+    db = SessionLocal()
+    try:
+        while True:
+            done = process_rescore_queue(db, batch_size)
+            if done:
+                print(f"✅ Rescored tenders: {done}")
+            elif once:
+                return
+            else:
+                time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        print("⏹️  Stopping rescore worker")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drain the tender rescoring queue")
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Seconds to wait when idle")
+    parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+    parser.add_argument("--rebuild-index", action="store_true",
+                        help="Backfill the vendor->tender dependency index before starting")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.rebuild_index:
+        db = SessionLocal()
+        try:
+            rebuild_dependency_index(db)
+            db.commit()
+            print("✅ Dependency index rebuilt")
+        finally:
+            db.close()
+
+    run(args.batch_size, args.poll_interval, args.once)
@@ -0,0 +1,99 @@
+"""
+Script to manage versioned scoring configs and model artifacts.
+API workers pick up a newly activated version within MODEL_RELOAD_SECONDS;
+no redeploy or restart is needed.
+
+Usage:
+    python -m app.scripts.scoring_registry list
+    python -m app.scripts.scoring_registry publish-config weights.json
+    python -m app.scripts.scoring_registry activate price_model <version>
+
+Example weights.json (any omitted setting keeps the engine default):
+    {
+        "ai_engine": {"PRICE_WEIGHT": 0.5, "VENDOR_WEIGHT": 0.3, "TECHNICAL_WEIGHT": 0.2},
+        "enhanced": {"WEIGHTS": {"price": 0.4, "risk": 0.05}}
+    }
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.config import get_settings
+from app.services.ai_engine import AIEngine
+from app.services.ai_engine_enhanced import EnhancedAIEngine
+from app.services.model_registry import (
+    PRICE_MODEL,
+    RELEVANCE_MODEL,
+    SCORING_CONFIG,
+    list_versions,
+    publish_scoring_config,
+    read_latest,
+    write_latest
+)
+
+KNOWN_SECTIONS = {
+    "ai_engine": AIEngine.TUNABLES,
+    "enhanced": EnhancedAIEngine.TUNABLES
+}
+
+
+def validate_config(config: dict):
+    """Reject unknown sections or settings before anything is published."""
+    for section, values in config.items():
+        if section not in KNOWN_SECTIONS:
+            raise ValueError(f"Unknown config section '{section}'")
+        unknown = set(values) - set(KNOWN_SECTIONS[section])
+        if unknown:
+            raise ValueError(f"Unknown settings in '{section}': {sorted(unknown)}")
+
+
+def list_artifacts(root: str):
+    for name in (SCORING_CONFIG, PRICE_MODEL, RELEVANCE_MODEL):
+        active = read_latest(root, name)
+        versions = list_versions(root, name)
+        print(f"📦 {name} ({len(versions)} versions)")
+        for version in versions:
+            marker = "  ← active" if version == active else ""
+            print(f"   - {version}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage scoring configs and model artifacts")
+    parser.add_argument("--root", default=None, help="Model directory (default: MODEL_DIR)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="List versions and show which are active")
+
+    publish = sub.add_parser("publish-config", help="Publish a scoring config JSON file")
+    publish.add_argument("file")
+
+    activate = sub.add_parser("activate", help="Activate (or roll back to) an existing version")
+    activate.add_argument("name", choices=[SCORING_CONFIG, PRICE_MODEL, RELEVANCE_MODEL])
+    activate.add_argument("version")
+
+    args = parser.parse_args()
+    root = args.root or get_settings().MODEL_DIR
+
+    try:
+        if args.command == "list":
+            list_artifacts(root)
+        elif args.command == "publish-config":
+            with open(args.file) as f:
+                config = json.load(f)
+            validate_config(config)
+            version = publish_scoring_config(config, root)
+            print(f"✅ Published scoring config {version}")
+        elif args.command == "activate":
+            write_latest(root, args.name, args.version)
+            print(f"✅ {args.name} now at {args.version}")
+    except (ValueError, OSError, json.JSONDecodeError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Script to manage the bid-set snapshots frozen when tenders close.
+
+backfill writes snapshots for closed/awarded tenders that predate them,
+verify re-hashes a tender's snapshot and cross-checks it against the bids
+table and the chain, and export writes a snapshot's bids to CSV without
+touching the bids table.
+
+Usage:
+    python -m app.scripts.tender_snapshots backfill
+    python -m app.scripts.tender_snapshots verify 42 [--chain]
+    python -m app.scripts.tender_snapshots export 42 --out tender-42.csv [--proposals]
+"""
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.db.session import SessionLocal
+from app.db.models import Tender, TenderStatus
+from app.services.bid_snapshot import load_snapshot, verify_snapshot, write_snapshot
+from app.services.response_cache import bump_versions, tender_key
+
+
+def backfill(db):
+    tenders = db.query(Tender).filter(
+        Tender.status.in_([TenderStatus.CLOSED, TenderStatus.AWARDED]),
+        Tender.snapshot_hash.is_(None)
+    ).order_by(Tender.id).all()
+    for tender in tenders:
+        snapshot = write_snapshot(db, tender)
+        # The transparency view reports the snapshot's bid count
+        bump_versions(db, [tender_key(tender.id)])
+        db.commit()
+        print(f"💾 Tender {tender.id}: {len(snapshot)} bid(s) -> {snapshot.content_hash}")
+    print(f"✅ Backfilled {len(tenders)} snapshot(s)")
+
+
+def verify(db, tender, chain: bool):
+    chain_bid_count = None
+    if chain:
+        from app.services.blockchain import BlockchainService
+        trail = BlockchainService().verify_audit_trail(tender.id)
+        chain_bid_count = trail["total_bids"] if trail else None
+
+    checks = verify_snapshot(db, tender, chain_bid_count)
+    for name, value in checks.items():
+        print(f"   {name}: {value}")
+    failed = [name for name, value in checks.items() if value is False]
+    if failed:
+        print(f"❌ Snapshot check failed: {', '.join(failed)}")
+        sys.exit(1)
+    print("✅ Snapshot verified")
+
+
+def export(tender, out: str, proposals: bool):
+    snapshot = load_snapshot(tender)
+    if snapshot is None:
+        print(f"❌ Tender {tender.id} has no readable snapshot")
+        sys.exit(1)
+
+    rows = snapshot.rows(proposals=proposals)
+    first = next(rows, None)
+    with open(out, "w", newline="") as f:
+        if first is not None:
+            writer = csv.DictWriter(f, fieldnames=list(first))
+            writer.writeheader()
+            writer.writerow(first)
+            writer.writerows(rows)
+    print(f"✅ Exported {len(snapshot)} bid(s) of tender {tender.id} to {out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage tender bid-set snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("backfill", help="Snapshot closed tenders that have none")
+    verify_parser = commands.add_parser("verify", help="Verify a tender's snapshot")
+    verify_parser.add_argument("tender_id", type=int)
+    verify_parser.add_argument("--chain", action="store_true", help="Also compare with the on-chain bid count")
+    export_parser = commands.add_parser("export", help="Export a tender's snapshot to CSV")
+    export_parser.add_argument("tender_id", type=int)
+    export_parser.add_argument("--out", required=True, help="CSV file to write")
+    export_parser.add_argument("--proposals", action="store_true", help="Include proposal texts")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "backfill":
+            backfill(db)
+            return
+        tender = db.query(Tender).filter(Tender.id == args.tender_id).first()
+        if not tender:
+            print(f"❌ Tender {args.tender_id} not found")
+            sys.exit(1)
+        if args.command == "verify":
+            verify(db, tender, args.chain)
+        else:
+            export(tender, args.out, args.proposals)
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Script to (re)train the fair-price regression model on awarded contracts.
+Each run publishes a new versioned artifact to the model registry; running
+API workers hot-reload it within MODEL_RELOAD_SECONDS.
+
+Usage:
+    python -m app.scripts.train_price_model
+    python -m app.scripts.train_price_model --min-samples 5 --alpha 0.5
+    python -m app.scripts.train_price_model --out /path/to/models --dry-run
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.config import get_settings
+from app.db.session import SessionLocal
+from app.db.models import Award, Bid, Tender
+from app.services.price_model import fit_price_model
+from app.services.model_registry import publish_price_model
+
+
+def load_training_rows(db):
+    """Project (category, department, budget, timeline, award_amount) for every award."""
+    return db.query(
+        Tender.category,
+        Tender.department,
+        Tender.budget,
+        Bid.delivery_timeline,
+        Award.award_amount
+    ).join(
+        Award, Award.tender_id == Tender.id
+    ).join(
+        Bid, Bid.id == Award.winning_bid_id
+    ).all()
+
+
+def train_price_model(out_dir: str, alpha: float, min_samples: int, dry_run: bool = False):
+    """Fit the model on all awarded contracts and save it as a new version."""
+    db = SessionLocal()
+    try:
+        rows = load_training_rows(db)
+        print(f"📊 Loaded {len(rows)} awarded contracts")
+
+        model = fit_price_model(rows, alpha=alpha, min_samples=min_samples)
+        print(f"✅ Trained price model {model.version}")
+        print(f"   - Category models: {len(model.categories)} "
+              f"(+ global fallback on {int(model.counts[-1])} awards)")
+        for category, count, sigma in zip(model.categories, model.counts, model.sigma):
+            print(f"   - {category}: {int(count)} awards, band ±{sigma:.3f} log-price")
+
+        if dry_run:
+            print("ℹ️  Dry run - artifact not written")
+            return
+
+        path = publish_price_model(model, out_dir)
+        print(f"✅ Published artifact {path}")
+
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the fair-price regression model")
+    parser.add_argument("--out", default=None, help="Model directory (default: MODEL_DIR)")
+    parser.add_argument("--alpha", type=float, default=1.0, help="Ridge regularisation strength")
+    parser.add_argument("--min-samples", type=int, default=8,
+                        help="Minimum awards for a category to get its own model")
+    parser.add_argument("--dry-run", action="store_true", help="Train and report without saving")
+    args = parser.parse_args()
+
+    train_price_model(
+        args.out or get_settings().MODEL_DIR,
+        alpha=args.alpha,
+        min_samples=args.min_samples,
+        dry_run=args.dry_run
+    )
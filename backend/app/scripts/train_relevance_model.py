@@ -0,0 +1,76 @@
+"""
+Script to (re)fit the TF-IDF relevance model used in technical scoring.
+Learns per-category IDF weights from past tender descriptions and technical
+proposals and publishes them as a new version; running API workers hot-reload
+it within MODEL_RELOAD_SECONDS. Runs fully offline.
+
+Usage:
+    python -m app.scripts.train_relevance_model
+    python -m app.scripts.train_relevance_model --min-documents 50
+    python -m app.scripts.train_relevance_model --out /path/to/models --dry-run
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.config import get_settings
+from app.db.session import SessionLocal
+from app.db.models import Bid, Tender
+from app.services.relevance import fit_relevance_model
+from app.services.model_registry import publish_relevance_model
+
+
+def iter_documents(db, chunk_size: int = 1000):
+    """Stream (category, text) pairs for tender descriptions and proposals."""
+    for category, description in db.query(
+        Tender.category, Tender.description
+    ).yield_per(chunk_size):
+        yield category, description
+
+    for category, proposal in db.query(
+        Tender.category, Bid.technical_proposal
+    ).join(Bid, Bid.tender_id == Tender.id).yield_per(chunk_size):
+        yield category, proposal
+
+
+def train_relevance_model(out_dir: str, min_documents: int, dry_run: bool = False):
+    """Fit IDF weights on the whole corpus and publish them as a new version."""
+    db = SessionLocal()
+    try:
+        model = fit_relevance_model(iter_documents(db), min_documents=min_documents)
+        print(f"✅ Fitted relevance model {model.version}")
+        print(f"   - Category models: {len(model.categories)} "
+              f"(+ global fallback on {int(model.counts[-1])} documents)")
+        for category, count in zip(model.categories, model.counts):
+            print(f"   - {category}: {int(count)} documents")
+
+        if dry_run:
+            print("ℹ️  Dry run - artifact not written")
+            return
+
+        path = publish_relevance_model(model, out_dir)
+        print(f"✅ Published artifact {path}")
+
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fit the TF-IDF proposal relevance model")
+    parser.add_argument("--out", default=None, help="Model directory (default: MODEL_DIR)")
+    parser.add_argument("--min-documents", type=int, default=20,
+                        help="Minimum documents for a category to get its own IDF weights")
+    parser.add_argument("--dry-run", action="store_true", help="Fit and report without saving")
+    args = parser.parse_args()
+
+    train_relevance_model(
+        args.out or get_settings().MODEL_DIR,
+        min_documents=args.min_documents,
+        dry_run=args.dry_run
+    )
@@ -1,6 +1,10 @@
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from app.db.models import Bid, Vendor, Tender
+from typing import Dict, List, Optional, Tuple, Union
+from app.db.models import Bid, Vendor, VendorFeatures, Tender
+from app.services.bid_batch import BidBatch, PriceStats, proposal_length
+from app.services.price_model import PriceModel
+from app.services.ranking import select_ranked
+from app.services.model_registry import ScoringBundle, get_scoring_bundle
 import logging
 import re
 
@@ -14,7 +18,8 @@ class AIEngine:
     Scoring Logic:
     - Price Score (40%): Based on competitiveness relative to budget and other bids
     - Vendor Score (35%): Based on vendor reputation, completed projects, and ratings
-    - Technical Score (25%): Based on proposal quality and delivery timeline
+    - Technical Score (25%): Based on proposal quality, relevance to the tender
+      description (when a relevance model is published) and delivery timeline
     
     Final AI Score Ranges:
     - 85-100: Excellent (All 3 key conditions met)
@@ -23,6 +28,9 @@ class AIEngine:
     - 0-45:   Poor (No conditions met)
     
     Anomalies detected: Suspiciously low prices, collusion indicators, unrealistic timelines
+    
+    The constants below are defaults; the published scoring config in the model
+    registry can override any name listed in TUNABLES without a redeploy.
     """
 
     # Configuration constants
@@ -34,6 +42,37 @@ class AIEngine:
     MIN_REASONABLE_TIMELINE = 7  # days
     OPTIMAL_PRICE_RATIO = 0.8    # 80% of budget is considered optimal
     
+    # Fair-price model blending (used when few bids are available for comparison)
+    FAIR_PRICE_MIN_BIDS = 5
+    FAIR_PRICE_WEIGHT = 0.5
+    
+    # Proposal/description relevance (TF-IDF cosine similarity)
+    RELEVANCE_MAX_POINTS = 15
+    RELEVANCE_FULL_CREDIT = 0.30  # similarity at which full points are awarded
+    
+    # Settings overridable from the "ai_engine" section of the scoring config
+    TUNABLES = (
+        "PRICE_WEIGHT", "VENDOR_WEIGHT", "TECHNICAL_WEIGHT",
+        "ANOMALY_PENALTY", "FAIR_PRICE_MIN_BIDS", "FAIR_PRICE_WEIGHT",
+        "RELEVANCE_MAX_POINTS", "RELEVANCE_FULL_CREDIT"
+    )
+    
+    # Final score range per number of success conditions met
+    SCORE_RANGES = {
+        3: (85, 100),  # Excellent: all conditions met
+        2: (60, 85),   # Good
+        1: (45, 70),   # Fair
+        0: (0, 45)     # Poor: no conditions met
+    }
+    
+    # Output detail: "lean" returns only the stored score columns per bid,
+    # "full" adds vendor details, labels and the fair-price band
+    DETAIL_LEAN = "lean"
+    DETAIL_FULL = "full"
+    LEAN_SCORE_KEYS = (
+        "ai_score", "price_score", "vendor_score", "technical_score", "anomaly_flag", "anomaly_reason"
+    )
+    
     @staticmethod
     def _safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
         """Safely divide two numbers, returning default if denominator is zero."""
@@ -43,91 +82,75 @@ class AIEngine:
             return default
 
     @staticmethod
-    def score_bid(bid: Bid, tender: Tender, vendor: Vendor, all_bids: List[Bid]) -> Dict:
+    def _params(bundle: ScoringBundle) -> Dict:
+        """Resolve tunable settings for this engine from a scoring bundle."""
+        return bundle.resolve("ai_engine", AIEngine, AIEngine.TUNABLES)
+
+    @staticmethod
+    def score_bid(
+        bid: Bid,
+        tender: Tender,
+        vendor: Vendor,
+        all_bids: Union[List[Bid], BidBatch],
+        bundle: Optional[ScoringBundle] = None,
+        detail: str = DETAIL_FULL,
+        explain: bool = False,
+        relevance: Optional[float] = None
+    ) -> Dict:
         """
         Calculate comprehensive AI score for a bid.
         
         Args:
-            bid: The bid to score
+            bid: The bid to score (Bid or a row of all_bids)
             tender: The tender being bid on
             vendor: The vendor submitting the bid
-            all_bids: All bids for this tender (for comparative analysis)
+            all_bids: All bids for this tender (for comparative analysis), as a
+                list of Bid objects or a BidBatch
+            bundle: Scoring config/model snapshot (defaults to the active one)
+            detail: DETAIL_LEAN skips the fair-price band
+            explain: Add a "breakdown" of how the score was derived
+            relevance: The proposal's similarity to the tender description;
+                score_bids computes it for all bids at once, if omitted it is
+                computed for this bid alone (if a relevance model is published)
             
         Returns:
             Dictionary containing ai_score, component scores, and anomaly information
         """
         try:
-            # Extract bid prices for comparative analysis
-            bid_prices = [b.proposed_price for b in all_bids if b.proposed_price > 0]
-            
-            if not bid_prices:
-                logger.warning(f"No valid bid prices found for tender {tender.id}")
-                bid_prices = [bid.proposed_price]
-
-            # =========================
-            # 1. PRICE SCORE (40%)
-            # =========================
-            price_score = AIEngine._calculate_price_score(
-                bid.proposed_price, 
-                bid_prices, 
-                tender.budget
-            )
-
-            # =========================
-            # 2. VENDOR SCORE (35%)
-            # =========================
-            vendor_score = AIEngine._calculate_vendor_score(vendor)
-
-            # =========================
-            # 3. TECHNICAL SCORE (25%)
-            # =========================
-            technical_score = AIEngine._calculate_technical_score(
-                bid.technical_proposal,
-                bid.delivery_timeline
-            )
-
-            # =========================
-            # 4. ANOMALY DETECTION
-            # =========================
-            anomaly_flag, anomaly_reasons, price_deviation = AIEngine._detect_anomalies(
-                bid, 
-                bid_prices, 
-                all_bids
-            )
-
-            # =========================
-            # 5. CONDITION CHECKS (CORE LOGIC)
-            # =========================
-            avg_price = np.mean(bid_prices)
-            
-            # Define success conditions
-            low_cost = bid.proposed_price <= avg_price * 0.9  # 10% below average
-            reasonable_timeline = bid.delivery_timeline <= 90  # <= 90 days
-            good_reputation = vendor.reputation_score >= 3.5 or vendor.total_wins >= 3
+            bundle = bundle or get_scoring_bundle()
+            params = AIEngine._params(bundle)
             
-            conditions_met = sum([low_cost, reasonable_timeline, good_reputation])
+            c = AIEngine._score_components(bid, tender, vendor, all_bids, bundle, params, relevance)
+            price_score = c["price_score"]
+            vendor_score = c["vendor_score"]
+            technical_score = c["technical_score"]
+            anomaly_flag = c["anomaly_flag"]
+            anomaly_reasons = c["anomaly_reasons"]
+            fair_price = c["fair_price"]
+            conditions_met = c["conditions_met"]
 
             # =========================
             # 6. BASE SCORE CALCULATION
             # =========================
             base_score = (
-                price_score * AIEngine.PRICE_WEIGHT +
-                vendor_score * AIEngine.VENDOR_WEIGHT +
-                technical_score * AIEngine.TECHNICAL_WEIGHT
+                price_score * params["PRICE_WEIGHT"] +
+                vendor_score * params["VENDOR_WEIGHT"] +
+                technical_score * params["TECHNICAL_WEIGHT"]
             )
 
             # =========================
             # 7. APPLY SCORE RANGES BASED ON CONDITIONS
             # =========================
-            ai_score = AIEngine._apply_score_range(base_score, conditions_met)
+            ranged_score = AIEngine._apply_score_range(base_score, conditions_met)
 
             # =========================
             # 8. APPLY ANOMALY PENALTY
             # =========================
+            ai_score = ranged_score
             if anomaly_flag:
-                ai_score = max(0, ai_score - AIEngine.ANOMALY_PENALTY)
+                ai_score = max(0, ai_score - params["ANOMALY_PENALTY"])
 
-            return {
+            result = {
                 "ai_score": round(ai_score, 2),
                 "price_score": round(price_score, 2),
                 "vendor_score": round(vendor_score, 2),
@@ -135,6 +158,42 @@ class AIEngine:
                 "anomaly_flag": anomaly_flag,
                 "anomaly_reason": "; ".join(anomaly_reasons) if anomaly_reasons else None
             }
+            if detail == AIEngine.DETAIL_LEAN:
+                return result
+
+            result["fair_price"] = AIEngine._fair_band(bid, tender, bundle.price_model, all_bids)
+            if explain:
+                result["breakdown"] = {
+                    "weights": {
+                        "price": params["PRICE_WEIGHT"],
+                        "vendor": params["VENDOR_WEIGHT"],
+                        "technical": params["TECHNICAL_WEIGHT"]
+                    },
+                    "weighted": {
+                        "price": round(price_score * params["PRICE_WEIGHT"], 2),
+                        "vendor": round(vendor_score * params["VENDOR_WEIGHT"], 2),
+                        "technical": round(technical_score * params["TECHNICAL_WEIGHT"], 2)
+                    },
+                    "base_score": round(float(base_score), 2),
+                    "conditions": {
+                        "low_cost": bool(c["low_cost"]),
+                        "reasonable_timeline": bool(c["reasonable_timeline"]),
+                        "good_reputation": bool(c["good_reputation"])
+                    },
+                    "conditions_met": int(conditions_met),
+                    "score_after_range": round(float(ranged_score), 2),
+                    "anomaly_penalty": params["ANOMALY_PENALTY"] if anomaly_flag else 0,
+                    "price_deviation": (
+                        round(float(c["price_deviation"]), 3) if c["price_deviation"] is not None else None
+                    ),
+                    "average_price": round(float(c["avg_price"]), 2),
+                    "bids_compared": len(c["bid_prices"]),
+                    "relevance": round(float(c["relevance"]), 3) if c["relevance"] is not None else None,
+                    "fair_price_blended": (
+                        fair_price is not None and len(c["bid_prices"]) < params["FAIR_PRICE_MIN_BIDS"]
+                    )
+                }
+            return result
             
         except Exception as e:
             logger.error(f"Error scoring bid {bid.id}: {str(e)}")
@@ -149,17 +208,171 @@ class AIEngine:
             }
 
     @staticmethod
-    def _calculate_price_score(proposed_price: float, all_prices: List[float], budget: float) -> float:
+    def _score_components(
+        bid: Bid,
+        tender: Tender,
+        vendor: Vendor,
+        all_bids: Union[List[Bid], BidBatch],
+        bundle: ScoringBundle,
+        params: Dict,
+        relevance: Optional[float] = None
+    ) -> Dict:
+        """
+        Weight-independent parts of a bid's score (unrounded).
+        
+        score_bid combines them with the configured weights; the what-if
+        simulation caches them per tender and recombines them with any weights.
+        """
+        if relevance is None:
+            relevance = AIEngine._score_relevance(tender, [bid], bundle).get(bid.id)
+
+        # Bid prices and their statistics, computed once per batch
+        batch = BidBatch.coerce(all_bids)
+        bid_prices = batch.valid_prices
+        price_stats = batch.price_stats
+
+        if not len(bid_prices):
+            logger.warning(f"No valid bid prices found for tender {tender.id}")
+            bid_prices = [bid.proposed_price]
+            price_stats = PriceStats(bid.proposed_price, bid.proposed_price, 0.0)
+
+        # =========================
+        # 1. PRICE SCORE (40%)
+        # =========================
+        # Only blended into the price score when there are few bids to compare
+        fair_price = (
+            AIEngine._estimate_fair_price(bid, tender, bundle.price_model, batch)
+            if len(bid_prices) < params["FAIR_PRICE_MIN_BIDS"] else None
+        )
+        price_score = AIEngine._calculate_price_score(
+            bid.proposed_price, 
+            bid_prices, 
+            tender.budget,
+            fair_price,
+            params,
+            price_stats
+        )
+
+        # =========================
+        # 2. VENDOR SCORE (35%)
+        # =========================
+        # Precomputed when scoring from the vendor_features table
+        if isinstance(vendor, VendorFeatures):
+            vendor_score = vendor.rules_vendor_score
+        else:
+            vendor_score = AIEngine._calculate_vendor_score(vendor)
+
+        # =========================
+        # 3. TECHNICAL SCORE (25%)
+        # =========================
+        technical_score = AIEngine._calculate_technical_score(
+            bid.technical_proposal,
+            bid.delivery_timeline,
+            relevance,
+            params
+        )
+
+        # =========================
+        # 4. ANOMALY DETECTION
+        # =========================
+        anomaly_flag, anomaly_reasons, price_deviation = AIEngine._detect_anomalies(
+            bid, 
+            bid_prices, 
+            batch,
+            price_stats
+        )
+
+        # =========================
+        # 5. CONDITION CHECKS (CORE LOGIC)
+        # =========================
+        avg_price = price_stats.mean
+
+        # Define success conditions
+        low_cost = bid.proposed_price <= avg_price * 0.9  # 10% below average
+        reasonable_timeline = bid.delivery_timeline <= 90  # <= 90 days
+        good_reputation = vendor.reputation_score >= 3.5 or vendor.total_wins >= 3
+
+        conditions_met = sum([low_cost, reasonable_timeline, good_reputation])
+
+        return {
+            "price_score": price_score,
+            "vendor_score": vendor_score,
+            "technical_score": technical_score,
+            "anomaly_flag": anomaly_flag,
+            "anomaly_reasons": anomaly_reasons,
+            "price_deviation": price_deviation,
+            "relevance": relevance,
+            "fair_price": fair_price,
+            "bid_prices": bid_prices,
+            "avg_price": avg_price,
+            "low_cost": low_cost,
+            "reasonable_timeline": reasonable_timeline,
+            "good_reputation": good_reputation,
+            "conditions_met": conditions_met
+        }
+
+    @staticmethod
+    def _estimate_fair_price(
+        bid: Bid, tender: Tender, model: Optional[PriceModel], batch: Optional[BidBatch] = None
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Predict the fair log-price (mu, sigma) for a bid from the offline price model.
+        
+        With the bid's batch, the whole tender is predicted once and this bid's
+        value is looked up. Returns None when no model has been published yet.
+        """
+        if model is None:
+            return None
+        try:
+            if batch is not None:
+                mus, sigma = batch.fair_prices(model, tender.category, tender.department, tender.budget)
+                return mus[batch.index_of(bid)], sigma
+            return model.predict_log(
+                tender.category, tender.department, tender.budget, bid.delivery_timeline
+            )
+        except Exception as e:
+            logger.warning(f"Fair-price estimate failed for bid {bid.id}: {e}")
+            return None
+
+    @staticmethod
+    def _fair_band(
+        bid: Bid, tender: Tender, model: Optional[PriceModel], all_bids: Union[List[Bid], BidBatch]
+    ) -> Optional[Dict]:
+        """Fair-price band of a bid (computed for the whole tender at once), or None without a model."""
+        if model is None:
+            return None
+        try:
+            batch = BidBatch.coerce(all_bids)
+            bands = batch.fair_bands(model, tender.category, tender.department, tender.budget)
+            return bands[batch.index_of(bid)]
+        except Exception as e:
+            logger.warning(f"Fair-price band failed for bid {bid.id}: {e}")
+            return None
+
+    @staticmethod
+    def _calculate_price_score(
+        proposed_price: float,
+        all_prices: List[float],
+        budget: float,
+        fair_price: Optional[Tuple[float, float]] = None,
+        params: Optional[Dict] = None,
+        price_stats: Optional[PriceStats] = None
+    ) -> float:
         """
         Calculate price competitiveness score.
         
         Logic:
         - If multiple bids exist, use statistical deviation from mean
         - Otherwise, compare against budget ratio
+        - With fewer than FAIR_PRICE_MIN_BIDS bids, blend in the fair-price
+          model score so the comparison is not based on two or three prices alone
         """
         if len(all_prices) > 1:
-            mean_price = np.mean(all_prices)
-            std_price = np.std(all_prices)
+            if price_stats is not None:
+                mean_price, std_price = price_stats.mean, price_stats.std
+            else:
+                mean_price = np.mean(all_prices)
+                std_price = np.std(all_prices)
             
             if std_price > 0:
                 # Z-score approach: penalize prices far from mean
@@ -183,7 +396,15 @@ class AIEngine:
                 # Over budget - penalize heavily
                 price_score = max(0, 60 - ((price_ratio - 1.0) * 100))
         
-        return max(0, min(100, price_score))
+        price_score = max(0, min(100, price_score))
+        
+        min_bids = params["FAIR_PRICE_MIN_BIDS"] if params else AIEngine.FAIR_PRICE_MIN_BIDS
+        weight = params["FAIR_PRICE_WEIGHT"] if params else AIEngine.FAIR_PRICE_WEIGHT
+        if fair_price is not None and len(all_prices) < min_bids:
+            model_score = PriceModel.fair_price_score(proposed_price, *fair_price)
+            price_score = price_score * (1 - weight) + model_score * weight
+        
+        return price_score
 
     @staticmethod
     def _calculate_vendor_score(vendor: Vendor) -> float:
@@ -219,13 +440,29 @@ class AIEngine:
         return max(0, min(100, vendor_score))
 
     @staticmethod
-    def _calculate_technical_score(proposal: str, timeline: int) -> float:
+    def _score_relevance(
+        tender: Tender, bids: Union[List[Bid], BidBatch], bundle: ScoringBundle
+    ) -> Dict[int, float]:
+        """Proposal-to-description similarity per bid id ({} without a relevance model)."""
+        if bundle.relevance_model is None or not tender.description:
+            return {}
+        try:
+            return bundle.relevance_model.score_bids(tender, bids)
+        except Exception as e:
+            logger.warning(f"Relevance scoring failed for tender {tender.id}: {e}")
+            return {}
+
+    @staticmethod
+    def _calculate_technical_score(
+        proposal: str, timeline: int, relevance: Optional[float] = None, params: Optional[Dict] = None
+    ) -> float:
         """
         Calculate technical merit score with NLP-enhanced analysis.
         
         Factors:
         - Proposal completeness and quality
         - Keyword presence (methodology, quality, experience)
+        - Relevance to the tender description (TF-IDF similarity, if available)
         - Timeline reasonableness (faster is better, but not unrealistic)
         """
         proposal_text = (proposal or "").lower()
@@ -264,9 +501,17 @@ class AIEngine:
         tech_depth = sum(1 for term in technical_terms if term in proposal_text)
         tech_bonus = min(15, tech_depth * 2)
         
-        proposal_score = min(100, length_score + keyword_bonus + tech_bonus)
+        # 4. Relevance to the tender description
+        relevance_points = 0
+        if relevance is not None:
+            params = params or {}
+            max_points = params.get("RELEVANCE_MAX_POINTS", AIEngine.RELEVANCE_MAX_POINTS)
+            full_credit = params.get("RELEVANCE_FULL_CREDIT", AIEngine.RELEVANCE_FULL_CREDIT)
+            relevance_points = max_points * min(1.0, AIEngine._safe_divide(relevance, full_credit))
+        
+        proposal_score = min(100, length_score + keyword_bonus + tech_bonus + relevance_points)
         
-        # 4. Timeline score (optimal is 30-90 days)
+        # 5. Timeline score (optimal is 30-90 days)
         if timeline <= 0:
             timeline_score = 0
         elif timeline < AIEngine.MIN_REASONABLE_TIMELINE:
@@ -297,7 +542,8 @@ class AIEngine:
     def _detect_anomalies(
         bid: Bid, 
         all_prices: List[float], 
-        all_bids: List[Bid]
+        all_bids: Union[List[Bid], BidBatch],
+        price_stats: Optional[PriceStats] = None
     ) -> tuple[bool, List[str], Optional[float]]:
         """
         Detect potential bid anomalies indicating fraud or collusion.
@@ -311,8 +557,11 @@ class AIEngine:
         
         # Calculate price deviation if possible
         if len(all_prices) > 1:
-            mean_price = np.mean(all_prices)
-            std_price = np.std(all_prices)
+            if price_stats is not None:
+                mean_price, std_price = price_stats.mean, price_stats.std
+            else:
+                mean_price = np.mean(all_prices)
+                std_price = np.std(all_prices)
             
             if std_price > 0:
                 price_deviation = (bid.proposed_price - mean_price) / std_price
@@ -328,10 +577,8 @@ class AIEngine:
                     anomaly_reasons.append("Unusually high bid price")
         
         # Anomaly 3: Exact price matching (collusion indicator)
-        exact_matches = sum(
-            1 for b in all_bids
-            if b.id != bid.id and abs(b.proposed_price - bid.proposed_price) < 0.01
-        )
+        batch = BidBatch.coerce(all_bids)
+        exact_matches = int(batch.price_matches(0.01)[batch.index_of(bid)])
         if exact_matches > 0:
             anomaly_flag = True
             anomaly_reasons.append(f"Exact price match with {exact_matches} other bid(s) - possible collusion")
@@ -347,7 +594,7 @@ class AIEngine:
             anomaly_reasons.append(f"Excessively long delivery timeline ({bid.delivery_timeline} days)")
         
         # Anomaly 6: Very short proposal (possible lack of effort)
-        if len(bid.technical_proposal or "") < 50:
+        if proposal_length(bid) < 50:
             anomaly_flag = True
             anomaly_reasons.append("Insufficient technical proposal detail")
         
@@ -358,35 +605,162 @@ class AIEngine:
         """
         Apply score ranges based on how many success conditions were met.
         """
-        if conditions_met == 3:
-            # All conditions met: Force into 85-100 range
-            return max(85, min(100, base_score))
-        elif conditions_met == 2:
-            # Two conditions met: Force into 60-85 range
-            return max(60, min(85, base_score))
-        elif conditions_met == 1:
-            # One condition met: Force into 45-70 range
-            return max(45, min(70, base_score))
-        else:
-            # No conditions met: Force into 0-45 range
-            return max(0, min(45, base_score))
+        low, high = AIEngine.SCORE_RANGES[min(int(conditions_met), 3)]
+        return max(low, min(high, base_score))
+
+    @staticmethod
+    def score_version(bundle: ScoringBundle) -> str:
+        """Version string stored with scores produced by this engine."""
+        return f"rules+{bundle.version}"
+
+    @staticmethod
+    def score_bids(
+        tender: Tender,
+        bids: Union[List[Bid], BidBatch],
+        vendors: Dict[int, Vendor],
+        bundle: Optional[ScoringBundle] = None,
+        detail: str = DETAIL_LEAN
+    ) -> List[Tuple[Bid, Vendor, Dict]]:
+        """
+        Score every bid of a tender, without ranking or building response rows.
+        
+        Bids whose vendor is missing are skipped.
+        
+        Returns:
+            (bid, vendor, scores) per scored bid, in input order
+        """
+        bundle = bundle or get_scoring_bundle()
+        # Columnar view: per-tender statistics are computed once, not per bid
+        batch = BidBatch.coerce(bids)
+        # All proposals scored against the description in one sparse product
+        relevance = AIEngine._score_relevance(tender, batch, bundle)
+        scored = []
+        for bid in batch:
+            vendor = vendors.get(bid.vendor_id)
+            if not vendor:
+                logger.warning(f"Vendor {bid.vendor_id} not found for bid {bid.id}")
+                continue
+            scores = AIEngine.score_bid(
+                bid, tender, vendor, batch, bundle, detail, relevance=relevance.get(bid.id)
+            )
+            scored.append((bid, vendor, scores))
+        return scored
+
+    @staticmethod
+    def scoring_detail(detail: str, limit: Optional[int] = None, top_k: Optional[int] = None) -> str:
+        """
+        Detail level for the scoring pass over all bids.
+        
+        When only a page is returned, every bid is scored lean and the full
+        detail is computed afterwards for the returned rows only.
+        """
+        return detail if limit is None and top_k is None else AIEngine.DETAIL_LEAN
 
+    @staticmethod
+    def rank_recommendations(
+        tender: Tender,
+        bids: Union[List[Bid], BidBatch],
+        scored: List[Tuple[Bid, Vendor, Dict]],
+        bundle: ScoringBundle,
+        detail: str = DETAIL_FULL,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        top_k: Optional[int] = None,
+        scored_detail: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Build the requested page of ranked recommendations from scored bids.
+        
+        Only the selected rows get response dicts; ranks are positions in the
+        full ranking (ties keep input order). Full scores serve a lean page by
+        dropping the extra keys; only a full page of lean scores is rescored.
+        
+        Args:
+            scored: Output of score_bids
+            scored_detail: Detail level scored was computed with (defaults to detail)
+        """
+        score_version = AIEngine.score_version(bundle)
+        ai_scores = np.fromiter((scores["ai_score"] for _, _, scores in scored), dtype=np.float64, count=len(scored))
+        indices, start = select_ranked(ai_scores, offset, limit, top_k)
+        rescore = detail == AIEngine.DETAIL_FULL and (scored_detail or detail) == AIEngine.DETAIL_LEAN
+        batch = BidBatch.coerce(bids) if rescore else None
+        relevance = AIEngine._score_relevance(tender, batch, bundle) if rescore else {}
+
+        recommendations = []
+        for position, index in enumerate(indices.tolist(), start + 1):
+            bid, vendor, scores = scored[index]
+            if rescore:
+                scores = AIEngine.score_bid(
+                    bid, tender, vendor, batch, bundle, detail, relevance=relevance.get(bid.id)
+                )
+
+            if detail == AIEngine.DETAIL_LEAN:
+                recommendations.append({
+                    "bid_id": bid.id,
+                    "vendor_id": bid.vendor_id,
+                    **{key: scores[key] for key in AIEngine.LEAN_SCORE_KEYS if key in scores},
+                    "score_version": score_version,
+                    "rank": position
+                })
+                continue
+
+            # Determine recommendation level
+            ai_score = scores["ai_score"]
+            if ai_score >= 85:
+                recommendation = "Highly Recommended"
+                rank_color = "green"
+            elif ai_score >= 70:
+                recommendation = "Recommended"
+                rank_color = "blue"
+            elif ai_score >= 50:
+                recommendation = "Consider"
+                rank_color = "yellow"
+            else:
+                recommendation = "Not Recommended"
+                rank_color = "red"
+
+            recommendations.append({
+                "bid_id": bid.id,
+                "vendor_id": vendor.id,
+                "vendor_name": vendor.name,
+                "proposed_price": bid.proposed_price,
+                "delivery_timeline": bid.delivery_timeline,
+                "vendor_reputation": vendor.reputation_score,
+                "vendor_total_wins": vendor.total_wins,
+                "vendor_completed_projects": vendor.completed_projects,
+                **scores,
+                "recommendation": recommendation,
+                "rank_color": rank_color,
+                "price_to_budget_ratio": round(
+                    AIEngine._safe_divide(bid.proposed_price, tender.budget, 0) * 100, 2
+                ),
+                "score_version": score_version,
+                "rank": position
+            })
+        return recommendations
 
     @staticmethod
     def get_recommendations(
         tender_id: int,
-        bids: List[Bid],
+        bids: Union[List[Bid], BidBatch],
         vendors: Dict[int, Vendor],
-        tender: Tender
+        tender: Tender,
+        detail: str = DETAIL_FULL,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        top_k: Optional[int] = None
     ) -> List[Dict]:
         """
         Generate ranked bid recommendations with comprehensive scoring.
         
         Args:
             tender_id: ID of the tender
-            bids: List of all bids for this tender
-            vendors: Dictionary mapping vendor_id to Vendor objects
+            bids: All bids for this tender (list of Bid objects or a BidBatch)
+            vendors: Dictionary mapping vendor_id to Vendor or VendorFeatures objects
             tender: The tender object
+            detail: DETAIL_LEAN returns ids, scores, anomaly columns and rank only
+            offset, limit: Page of the ranking to return (default: all)
+            top_k: Only rank the best k bids
             
         Returns:
             List of bid recommendations sorted by AI score (highest first)
@@ -395,56 +769,17 @@ class AIEngine:
             logger.warning(f"No bids provided for tender {tender_id}")
             return []
         
-        recommendations = []
+        # One snapshot for the whole tender, even if a new version is published mid-request
+        bundle = get_scoring_bundle()
+        # Columnar view: per-tender statistics are computed once, not per bid
+        batch = BidBatch.coerce(bids)
 
         try:
-            for bid in bids:
-                vendor = vendors.get(bid.vendor_id)
-                if not vendor:
-                    logger.warning(f"Vendor {bid.vendor_id} not found for bid {bid.id}")
-                    continue
-
-                # Calculate scores
-                scores = AIEngine.score_bid(bid, tender, vendor, bids)
-
-                # Determine recommendation level
-                ai_score = scores["ai_score"]
-                if ai_score >= 85:
-                    recommendation = "Highly Recommended"
-                    rank_color = "green"
-                elif ai_score >= 70:
-                    recommendation = "Recommended"
-                    rank_color = "blue"
-                elif ai_score >= 50:
-                    recommendation = "Consider"
-                    rank_color = "yellow"
-                else:
-                    recommendation = "Not Recommended"
-                    rank_color = "red"
-
-                recommendations.append({
-                    "bid_id": bid.id,
-                    "vendor_id": vendor.id,
-                    "vendor_name": vendor.name,
-                    "proposed_price": bid.proposed_price,
-                    "delivery_timeline": bid.delivery_timeline,
-                    "vendor_reputation": vendor.reputation_score,
-                    "vendor_total_wins": vendor.total_wins,
-                    "vendor_completed_projects": vendor.completed_projects,
-                    **scores,
-                    "recommendation": recommendation,
-                    "rank_color": rank_color,
-                    "price_to_budget_ratio": round(
-                        AIEngine._safe_divide(bid.proposed_price, tender.budget, 0) * 100, 2
-                    )
-                })
-
-            # Sort by AI score descending (best first)
-            recommendations.sort(key=lambda x: x["ai_score"], reverse=True)
-            
-            # Add ranking position
-            for idx, rec in enumerate(recommendations, 1):
-                rec["rank"] = idx
+            scored_detail = AIEngine.scoring_detail(detail, limit, top_k)
+            scored = AIEngine.score_bids(tender, batch, vendors, bundle, scored_detail)
+            recommendations = AIEngine.rank_recommendations(
+                tender, batch, scored, bundle, detail, offset, limit, top_k, scored_detail
+            )
             
             logger.info(f"Generated {len(recommendations)} recommendations for tender {tender_id}")
             return recommendations
@@ -12,8 +12,12 @@ Configuration via environment variables:
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from app.db.models import Bid, Vendor, Tender
+from typing import Dict, List, Optional, Tuple, Union
+from app.db.models import Bid, Vendor, VendorFeatures, Tender
+from app.services.bid_batch import BidBatch, PriceStats, proposal_length
+from app.services.price_model import PriceModel
+from app.services.ranking import select_ranked
+from app.services.model_registry import ScoringBundle, get_scoring_bundle
 import logging
 import os
 import re
@@ -38,6 +42,9 @@ class EnhancedAIEngine:
     - Risk scoring
     - Semantic similarity detection
     - Optional LLM integration for deep proposal analysis
+    
+    WEIGHTS and the thresholds in TUNABLES are defaults; the "enhanced" section
+    of the published scoring config overrides them without a redeploy.
     """
 
     # Weights for different scoring components
@@ -55,6 +62,25 @@ class EnhancedAIEngine:
     OPTIMAL_PRICE_RATIO = 0.80  # 80% of budget
     COLLUSION_SIMILARITY_THRESHOLD = 0.85
     
+    # Fair-price model blending (used when few bids are available for comparison)
+    FAIR_PRICE_MIN_BIDS = 5
+    FAIR_PRICE_WEIGHT = 0.5
+    
+    # Proposal/description relevance (TF-IDF cosine similarity)
+    RELEVANCE_MAX_POINTS = 20
+    RELEVANCE_FULL_CREDIT = 0.30  # similarity at which full points are awarded
+    
+    # Settings overridable from the "enhanced" section of the scoring config
+    TUNABLES = (
+        "WEIGHTS", "ANOMALY_PENALTY", "FAIR_PRICE_MIN_BIDS", "FAIR_PRICE_WEIGHT",
+        "RELEVANCE_MAX_POINTS", "RELEVANCE_FULL_CREDIT"
+    )
+    
+    # Output detail: "lean" skips the insights text and the per-component
+    # breakdown, "full" includes both
+    DETAIL_LEAN = "lean"
+    DETAIL_FULL = "full"
+    
     def __init__(self, mode: str = None):
         """
         Initialize AI Engine with specified mode.
@@ -99,97 +125,190 @@ class EnhancedAIEngine:
         except (TypeError, ZeroDivisionError):
             return default
 
-    def score_bid(self, bid: Bid, tender: Tender, vendor: Vendor, all_bids: List[Bid]) -> Dict:
+    def _params(self, bundle: ScoringBundle) -> Dict:
+        """Resolve tunable settings for this engine from a scoring bundle."""
+        return bundle.resolve("enhanced", type(self), self.TUNABLES)
+
+    def score_bid(
+        self, bid: Bid, tender: Tender, vendor: Vendor, all_bids: Union[List[Bid], BidBatch],
+        bundle: Optional[ScoringBundle] = None, relevance: Optional[float] = None,
+        detail: str = DETAIL_FULL, technical: Optional[Tuple[float, Dict]] = None
+    ) -> Dict:
         """
         Calculate comprehensive AI score for a bid.
         
-        Returns detailed scoring breakdown with explanations.
+        `relevance` is the proposal's similarity to the tender description;
+        get_recommendations computes it for all bids at once. When omitted it
+        is computed for this bid alone (if a relevance model is published).
+        `technical` reuses an earlier (score, insights) of the technical scorer.
+        
+        Returns detailed scoring breakdown with explanations, or only the
+        numeric scores and anomaly columns when detail is DETAIL_LEAN.
         """
         try:
-            bid_prices = [b.proposed_price for b in all_bids if b.proposed_price > 0]
-            
-            if not bid_prices:
-                logger.warning(f"No valid bid prices for tender {tender.id}")
-                bid_prices = [bid.proposed_price]
-
-            # 1. Price Score (35%)
-            price_score, price_insights = self._calculate_price_score_v2(
-                bid.proposed_price, bid_prices, tender.budget
-            )
-
-            # 2. Vendor Score (30%)
-            vendor_score, vendor_insights = self._calculate_vendor_score_v2(vendor)
-
-            # 3. Technical Score (25%)
-            if self.mode == "llm_enhanced" and self.llm_client:
-                technical_score, tech_insights = self._calculate_technical_score_llm(
-                    bid.technical_proposal, bid.delivery_timeline, tender
-                )
-            else:
-                technical_score, tech_insights = self._calculate_technical_score_v2(
-                    bid.technical_proposal, bid.delivery_timeline, tender
-                )
-
-            # 4. Risk Score (10%)
-            risk_score, risk_insights = self._calculate_risk_score(
-                bid, vendor, bid_prices, all_bids
-            )
-
-            # 5. Anomaly Detection
-            anomaly_flag, anomaly_reasons = self._detect_anomalies_v2(
-                bid, bid_prices, all_bids, tender
-            )
+            bundle = bundle or get_scoring_bundle()
+            params = self._params(bundle)
+            weights = params["WEIGHTS"]
+            batch = BidBatch.coerce(all_bids)
+            c = self._score_components(bid, tender, vendor, batch, bundle, params, relevance, technical)
 
             # 6. Calculate Base Score
             base_score = (
-                price_score * self.WEIGHTS["price"] +
-                vendor_score * self.WEIGHTS["vendor"] +
-                technical_score * self.WEIGHTS["technical"] +
-                risk_score * self.WEIGHTS["risk"]
+                c["price_score"] * weights["price"] +
+                c["vendor_score"] * weights["vendor"] +
+                c["technical_score"] * weights["technical"] +
+                c["risk_score"] * weights["risk"]
             )
 
             # 7. Apply Intelligent Adjustments
             final_score = self._apply_intelligent_adjustments(
-                base_score, bid, vendor, tender, bid_prices, anomaly_flag
-            )
-
-            # 8. Generate Insights
-            insights = self._generate_insights(
-                final_score, price_insights, vendor_insights, 
-                tech_insights, risk_insights, anomaly_reasons
+                base_score, bid, vendor, tender, c["bid_prices"], c["anomaly_flag"],
+                params["ANOMALY_PENALTY"], c["price_stats"]
             )
 
-            return {
+            result = {
                 "ai_score": round(final_score, 2),
-                "price_score": round(price_score, 2),
-                "vendor_score": round(vendor_score, 2),
-                "technical_score": round(technical_score, 2),
-                "risk_score": round(risk_score, 2),
-                "anomaly_flag": anomaly_flag,
-                "anomaly_reason": "; ".join(anomaly_reasons) if anomaly_reasons else None,
-                "insights": insights,
-                "breakdown": {
-                    "price": price_insights,
-                    "vendor": vendor_insights,
-                    "technical": tech_insights,
-                    "risk": risk_insights
-                }
+                "price_score": round(c["price_score"], 2),
+                "vendor_score": round(c["vendor_score"], 2),
+                "technical_score": round(c["technical_score"], 2),
+                "risk_score": round(c["risk_score"], 2),
+                "anomaly_flag": c["anomaly_flag"],
+                "anomaly_reason": "; ".join(c["anomaly_reasons"]) if c["anomaly_reasons"] else None
             }
+            if detail == self.DETAIL_LEAN:
+                return result
+
+            # 8. Generate Insights
+            result.update(self._explain(final_score, c))
+            return result
             
         except Exception as e:
             logger.error(f"Error scoring bid {bid.id}: {str(e)}", exc_info=True)
             return self._get_fallback_score(str(e))
 
+    def _technical_component(
+        self, bid: Bid, tender: Tender, relevance: Optional[float], params: Dict
+    ) -> Tuple[float, Dict]:
+        """Technical score and insights (an LLM call in llm_enhanced mode)."""
+        if self.mode == "llm_enhanced" and self.llm_client:
+            return self._calculate_technical_score_llm(
+                bid.technical_proposal, bid.delivery_timeline, tender, relevance, params
+            )
+        return self._calculate_technical_score_v2(
+            bid.technical_proposal, bid.delivery_timeline, tender, relevance, params
+        )
+
+    def _score_components(
+        self, bid: Bid, tender: Tender, vendor: Vendor, batch: BidBatch,
+        bundle: ScoringBundle, params: Dict, relevance: Optional[float] = None,
+        technical: Optional[Tuple[float, Dict]] = None
+    ) -> Dict:
+        """
+        Component scores with their insights, before weighting.
+
+        technical reuses an earlier (score, insights) of the technical scorer
+        instead of running it again.
+        """
+        if relevance is None and technical is None:
+            relevance = self._score_relevance(tender, [bid], bundle).get(bid.id)
+
+        # Bid prices and their statistics, computed once per batch
+        bid_prices = batch.valid_prices
+        price_stats = batch.price_stats
+        
+        if not len(bid_prices):
+            logger.warning(f"No valid bid prices for tender {tender.id}")
+            bid_prices = [bid.proposed_price]
+            price_stats = PriceStats(bid.proposed_price, bid.proposed_price, 0.0)
+
+        # 1. Price Score (35%)
+        fair_price = self._estimate_fair_price(bid, tender, bundle.price_model, batch)
+        price_score, price_insights = self._calculate_price_score_v2(
+            bid.proposed_price, bid_prices, tender.budget, fair_price, params, price_stats
+        )
+
+        # 2. Vendor Score (30%)
+        if isinstance(vendor, VendorFeatures):
+            vendor_score, vendor_insights = self._vendor_score_from_features(vendor)
+        else:
+            vendor_score, vendor_insights = self._calculate_vendor_score_v2(vendor)
+
+        # 3. Technical Score (25%)
+        technical_score, tech_insights = technical or self._technical_component(bid, tender, relevance, params)
+
+        # 4. Risk Score (10%)
+        risk_score, risk_insights = self._calculate_risk_score(
+            bid, vendor, bid_prices, batch, price_stats
+        )
+
+        # 5. Anomaly Detection
+        anomaly_flag, anomaly_reasons = self._detect_anomalies_v2(
+            bid, bid_prices, batch, tender, price_stats
+        )
+
+        return {
+            "bid_prices": bid_prices,
+            "price_stats": price_stats,
+            "price_score": price_score,
+            "price_insights": price_insights,
+            "vendor_score": vendor_score,
+            "vendor_insights": vendor_insights,
+            "technical_score": technical_score,
+            "tech_insights": tech_insights,
+            "risk_score": risk_score,
+            "risk_insights": risk_insights,
+            "anomaly_flag": anomaly_flag,
+            "anomaly_reasons": anomaly_reasons
+        }
+
+    def _explain(self, final_score: float, c: Dict) -> Dict:
+        """Insights text and per-component breakdown of a scored bid."""
+        return {
+            "insights": self._generate_insights(
+                final_score, c["price_insights"], c["vendor_insights"],
+                c["tech_insights"], c["risk_insights"], c["anomaly_reasons"]
+            ),
+            "breakdown": {
+                "price": c["price_insights"],
+                "vendor": c["vendor_insights"],
+                "technical": c["tech_insights"],
+                "risk": c["risk_insights"]
+            }
+        }
+
+    def _estimate_fair_price(
+        self, bid: Bid, tender: Tender, model: Optional[PriceModel], batch: Optional[BidBatch] = None
+    ) -> Optional[Tuple[float, float]]:
+        """Predict the fair log-price (mu, sigma) for a bid, or None if no model is published."""
+        if model is None:
+            return None
+        try:
+            if batch is not None:
+                mus, sigma = batch.fair_prices(model, tender.category, tender.department, tender.budget)
+                return mus[batch.index_of(bid)], sigma
+            return model.predict_log(
+                tender.category, tender.department, tender.budget, bid.delivery_timeline
+            )
+        except Exception as e:
+            logger.warning(f"Fair-price estimate failed for bid {bid.id}: {e}")
+            return None
+
     def _calculate_price_score_v2(
-        self, proposed_price: float, all_prices: List[float], budget: float
+        self, proposed_price: float, all_prices: List[float], budget: float,
+        fair_price: Optional[Tuple[float, float]] = None, params: Optional[Dict] = None,
+        price_stats: Optional[PriceStats] = None
     ) -> Tuple[float, Dict]:
         """Enhanced price scoring with detailed insights."""
+        params = params or {}
         insights = {}
         
-        # Calculate statistics
-        mean_price = np.mean(all_prices)
-        median_price = np.median(all_prices)
-        std_price = np.std(all_prices) if len(all_prices) > 1 else 0
+        # Calculate statistics (precomputed per batch when available)
+        if price_stats is not None:
+            mean_price, median_price, std_price = price_stats
+        else:
+            mean_price = np.mean(all_prices)
+            median_price = np.median(all_prices)
+            std_price = np.std(all_prices) if len(all_prices) > 1 else 0
         
         price_ratio = self._safe_divide(proposed_price, budget, 1.0)
         insights["price_ratio"] = round(price_ratio, 3)
@@ -244,7 +363,18 @@ class EnhancedAIEngine:
             price_score = min(100, price_score + 5)
             insights["bonus"] = "optimal value range"
         
-        return max(0, min(100, price_score)), insights
+        price_score = max(0, min(100, price_score))
+        
+        # Fair-price model: always reported, blended in when competition is thin
+        if fair_price is not None:
+            model_score = PriceModel.fair_price_score(proposed_price, *fair_price)
+            insights["fair_price_band"] = PriceModel.band_from_log(*fair_price)
+            insights["fair_price_score"] = round(model_score, 1)
+            weight = params.get("FAIR_PRICE_WEIGHT", self.FAIR_PRICE_WEIGHT)
+            if len(all_prices) < params.get("FAIR_PRICE_MIN_BIDS", self.FAIR_PRICE_MIN_BIDS):
+                price_score = price_score * (1 - weight) + model_score * weight
+        
+        return price_score, insights
 
     def _calculate_vendor_score_v2(self, vendor: Vendor) -> Tuple[float, Dict]:
         """Enhanced vendor credibility scoring."""
@@ -285,11 +415,38 @@ class EnhancedAIEngine:
         
         return max(0, min(100, vendor_score)), insights
 
+    def _score_relevance(
+        self, tender: Tender, bids: Union[List[Bid], BidBatch], bundle: ScoringBundle
+    ) -> Dict[int, float]:
+        """Proposal-to-description similarity per bid id ({} without a relevance model)."""
+        if bundle.relevance_model is None or not tender.description:
+            return {}
+        try:
+            return bundle.relevance_model.score_bids(tender, bids)
+        except Exception as e:
+            logger.warning(f"Relevance scoring failed for tender {tender.id}: {e}")
+            return {}
+
+    def _vendor_score_from_features(self, features: VendorFeatures) -> Tuple[float, Dict]:
+        """Vendor score and insights from a precomputed vendor_features row."""
+        return features.enhanced_vendor_score, {
+            "reputation": features.reputation_score,
+            "reputation_points": features.reputation_points,
+            "total_wins": features.total_wins,
+            "completed_projects": features.completed_projects,
+            "track_record_points": features.track_record_points,
+            "average_rating": features.average_rating,
+            "rating_points": features.rating_points,
+            "experience_level": features.experience_level
+        }
+
     def _calculate_technical_score_v2(
-        self, proposal: str, timeline: int, tender: Tender
+        self, proposal: str, timeline: int, tender: Tender,
+        relevance: Optional[float] = None, params: Optional[Dict] = None
     ) -> Tuple[float, Dict]:
         """Advanced rule-based technical scoring with NLP features."""
         insights = {}
+        params = params or {}
         proposal_text = (proposal or "").lower()
         
         # 1. Proposal Quality Analysis (0-50 points)
@@ -361,8 +518,17 @@ class EnhancedAIEngine:
             timeline_score = max(15, 40 - ((timeline - 365) / 365 * 20))
             insights["timeline_assessment"] = "very long"
         
+        # 5. Relevance to the tender description (0-20 points)
+        relevance_points = 0
+        if relevance is not None:
+            max_points = params.get("RELEVANCE_MAX_POINTS", self.RELEVANCE_MAX_POINTS)
+            full_credit = params.get("RELEVANCE_FULL_CREDIT", self.RELEVANCE_FULL_CREDIT)
+            relevance_points = max_points * min(1.0, self._safe_divide(relevance, full_credit))
+            insights["relevance"] = round(relevance, 3)
+            insights["relevance_points"] = round(relevance_points, 1)
+        
         # Combine scores
-        proposal_score = length_score + content_quality * 0.5
+        proposal_score = length_score + content_quality * 0.5 + relevance_points
         technical_score = (proposal_score * 0.6) + (timeline_score * 0.4)
         
         insights["proposal_component"] = round(proposal_score, 1)
@@ -371,7 +537,8 @@ class EnhancedAIEngine:
         return max(0, min(100, technical_score)), insights
 
     def _calculate_technical_score_llm(
-        self, proposal: str, timeline: int, tender: Tender
+        self, proposal: str, timeline: int, tender: Tender,
+        relevance: Optional[float] = None, params: Optional[Dict] = None
     ) -> Tuple[float, Dict]:
         """LLM-powered technical proposal analysis."""
         insights = {}
@@ -379,7 +546,7 @@ class EnhancedAIEngine:
         try:
             # Get rule-based baseline
             baseline_score, baseline_insights = self._calculate_technical_score_v2(
-                proposal, timeline, tender
+                proposal, timeline, tender, relevance, params
             )
             insights.update(baseline_insights)
             
@@ -465,7 +632,8 @@ Respond in JSON format:
             return baseline_score, insights
 
     def _calculate_risk_score(
-        self, bid: Bid, vendor: Vendor, all_prices: List[float], all_bids: List[Bid]
+        self, bid: Bid, vendor: Vendor, all_prices: List[float],
+        all_bids: Union[List[Bid], BidBatch], price_stats: Optional[PriceStats] = None
     ) -> Tuple[float, Dict]:
         """Calculate risk score (higher score = lower risk)."""
         insights = {}
@@ -474,8 +642,11 @@ Respond in JSON format:
         
         # Risk 1: Price volatility
         if len(all_prices) > 1:
-            mean_price = np.mean(all_prices)
-            std_price = np.std(all_prices)
+            if price_stats is not None:
+                mean_price, std_price = price_stats.mean, price_stats.std
+            else:
+                mean_price = np.mean(all_prices)
+                std_price = np.std(all_prices)
             if std_price > 0:
                 z_score = (bid.proposed_price - mean_price) / std_price
                 if abs(z_score) > 2:
@@ -499,7 +670,7 @@ Respond in JSON format:
             risk_factors.append("extended_timeline")
         
         # Risk 4: Proposal quality risk
-        if len(bid.technical_proposal or "") < 200:
+        if proposal_length(bid) < 200:
             risk_score -= 15
             risk_factors.append("thin_proposal")
         
@@ -514,15 +685,19 @@ Respond in JSON format:
         return max(0, min(100, risk_score)), insights
 
     def _detect_anomalies_v2(
-        self, bid: Bid, all_prices: List[float], all_bids: List[Bid], tender: Tender
+        self, bid: Bid, all_prices: List[float], all_bids: Union[List[Bid], BidBatch],
+        tender: Tender, price_stats: Optional[PriceStats] = None
     ) -> Tuple[bool, List[str]]:
         """Enhanced anomaly detection."""
         anomalies = []
         
         # Statistical price anomalies
         if len(all_prices) > 1:
-            mean_price = np.mean(all_prices)
-            std_price = np.std(all_prices)
+            if price_stats is not None:
+                mean_price, std_price = price_stats.mean, price_stats.std
+            else:
+                mean_price = np.mean(all_prices)
+                std_price = np.std(all_prices)
             if std_price > 0:
                 z_score = (bid.proposed_price - mean_price) / std_price
                 if z_score < -3:
@@ -531,10 +706,8 @@ Respond in JSON format:
                     anomalies.append("Unusually high price (>2.5σ above mean)")
         
         # Collusion detection - exact matches
-        exact_matches = sum(
-            1 for b in all_bids 
-            if b.id != bid.id and abs(b.proposed_price - bid.proposed_price) < 1
-        )
+        batch = BidBatch.coerce(all_bids)
+        exact_matches = int(batch.price_matches(1)[batch.index_of(bid)])
         if exact_matches > 0:
             anomalies.append(f"Exact price match with {exact_matches} bid(s) - possible collusion")
         
@@ -545,7 +718,7 @@ Respond in JSON format:
             anomalies.append(f"Excessive timeline ({bid.delivery_timeline} days)")
         
         # Proposal quality anomalies
-        proposal_len = len(bid.technical_proposal or "")
+        proposal_len = proposal_length(bid)
         if proposal_len < 100:
             anomalies.append("Insufficient technical proposal (<100 chars)")
         
@@ -559,17 +732,18 @@ Respond in JSON format:
 
     def _apply_intelligent_adjustments(
         self, base_score: float, bid: Bid, vendor: Vendor, 
-        tender: Tender, all_prices: List[float], has_anomaly: bool
+        tender: Tender, all_prices: List[float], has_anomaly: bool,
+        anomaly_penalty: Optional[float] = None, price_stats: Optional[PriceStats] = None
     ) -> float:
         """Apply intelligent score adjustments based on context."""
         score = base_score
         
         # Anomaly penalty
         if has_anomaly:
-            score -= self.ANOMALY_PENALTY
+            score -= self.ANOMALY_PENALTY if anomaly_penalty is None else anomaly_penalty
         
         # Bonus for optimal conditions
-        avg_price = np.mean(all_prices)
+        avg_price = price_stats.mean if price_stats is not None else np.mean(all_prices)
         conditions_met = 0
         
         if bid.proposed_price <= avg_price * 0.9:
@@ -636,21 +810,71 @@ Respond in JSON format:
         }
 
     def get_recommendations(
-        self, tender_id: int, bids: List[Bid], 
-        vendors: Dict[int, Vendor], tender: Tender
+        self, tender_id: int, bids: Union[List[Bid], BidBatch], 
+        vendors: Dict[int, Vendor], tender: Tender, detail: str = DETAIL_FULL,
+        offset: int = 0, limit: Optional[int] = None, top_k: Optional[int] = None
     ) -> List[Dict]:
-        """Generate comprehensive ranked recommendations."""
+        """
+        Generate comprehensive ranked recommendations (bids as a list or a BidBatch).
+        
+        With detail=DETAIL_LEAN each entry holds only ids, numeric scores,
+        anomaly columns and rank. offset/limit return one page of the ranking
+        and top_k caps it; ranks are always positions in the full ranking.
+        """
         if not bids:
             return []
         
-        recommendations = []
-        
-        for bid in bids:
+        # One snapshot for the whole tender, even if a new version is published mid-request
+        bundle = get_scoring_bundle()
+        score_version = f"enhanced:{self.mode}+{bundle.version}"
+        # Columnar view: per-tender statistics are computed once, not per bid
+        batch = BidBatch.coerce(bids)
+        # All proposals scored against the description in one sparse product
+        relevance = self._score_relevance(tender, batch, bundle)
+        
+        # When only a page is returned, score everything lean and build the
+        # explanations for the returned rows only. LLM technical assessments
+        # are kept from the lean pass so no bid is sent to the LLM twice
+        scored_detail = detail if limit is None and top_k is None else self.DETAIL_LEAN
+        params = self._params(bundle)
+        keep_technical = detail != scored_detail and self.mode == "llm_enhanced" and self.llm_client is not None
+        scored, technicals = [], {}
+        for bid in batch:
             vendor = vendors.get(bid.vendor_id)
             if not vendor:
                 continue
+            if keep_technical:
+                technicals[bid.id] = self._technical_component(bid, tender, relevance.get(bid.id), params)
+            scores = self.score_bid(
+                bid, tender, vendor, batch, bundle, relevance.get(bid.id), scored_detail,
+                technical=technicals.get(bid.id)
+            )
+            scored.append((bid, vendor, scores))
+        
+        # Select the requested ranks without sorting every bid
+        ai_scores = np.fromiter((scores["ai_score"] for _, _, scores in scored), dtype=np.float64, count=len(scored))
+        indices, start = select_ranked(ai_scores, offset, limit, top_k)
+        
+        recommendations = []
+        for position, index in enumerate(indices.tolist(), start + 1):
+            bid, vendor, scores = scored[index]
+            if detail != scored_detail:
+                # Scores stay those of the lean pass; only the explanation is built
+                components = self._score_components(
+                    bid, tender, vendor, batch, bundle, params, relevance.get(bid.id),
+                    technical=technicals.get(bid.id)
+                )
+                scores = {**scores, **self._explain(scores["ai_score"], components)}
             
-            scores = self.score_bid(bid, tender, vendor, bids)
+            if detail == self.DETAIL_LEAN:
+                recommendations.append({
+                    "bid_id": bid.id,
+                    "vendor_id": bid.vendor_id,
+                    **scores,
+                    "score_version": score_version,
+                    "rank": position
+                })
+                continue
             
             # Determine recommendation
             ai_score = scores["ai_score"]
@@ -675,14 +899,9 @@ Respond in JSON format:
                 "delivery_timeline": bid.delivery_timeline,
                 **scores,
                 "recommendation": recommendation,
-                "rank_color": rank_color
+                "rank_color": rank_color,
+                "score_version": score_version,
+                "rank": position
             })
         
-        # Sort by AI score
-        recommendations.sort(key=lambda x: x["ai_score"], reverse=True)
-        
-        # Add rankings
-        for idx, rec in enumerate(recommendations, 1):
-            rec["rank"] = idx
-        
         return recommendations
@@ -1,12 +1,13 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from sqlalchemy import select
+from app.db.session import AsyncSessionLocal
 from app.db.models import GovernmentAccount, Vendor
+from app.services.password_hashing import check_password, hash_password
+from app.services.principal_cache import principal_cache
 from app.config import get_settings
 
 settings = get_settings()
@@ -18,13 +19,12 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    """Verify a password against its hash (blocking; routes use password_hasher)"""
+    return check_password(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    """Hash a password (blocking; routes use password_hasher)"""
+    return hash_password(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token"""
@@ -45,11 +45,40 @@ def verify_token(token: str) -> Optional[dict]:
     except JWTError:
         return None
 
+async def _load_principal(role: str, user_id: int) -> Optional[dict]:
+    """Principal for an account id from the database, or None if the account is gone."""
+    async with AsyncSessionLocal() as db:
+        if role == "government":
+            gov_account_id = await db.scalar(
+                select(GovernmentAccount.id).where(GovernmentAccount.id == user_id)
+            )
+            if gov_account_id is None:
+                return None
+            return {"role": "government", "user_id": user_id, "id": user_id}
+
+        vendor = (await db.execute(
+            select(Vendor.vendor_id, Vendor.name).where(Vendor.id == user_id)
+        )).first()
+        if vendor is None:
+            return None
+        return {
+            "role": "vendor",
+            "user_id": user_id,
+            "id": user_id,
+            "vendor_id": vendor.vendor_id,
+            "name": vendor.name
+        }
+
 async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> dict:
-    """Get current authenticated user from token"""
+    """
+    Get current authenticated user from token.
+
+    Government and vendor accounts are checked to still exist; the result is
+    cached per (role, user_id) for PRINCIPAL_CACHE_SECONDS, so repeat requests
+    make no database query.
+    """
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -70,43 +99,32 @@ async def get_current_user(
     role = payload.get("role")
     user_id = payload.get("user_id")
     
-    if role == "government":
-        # Verify government account still exists
-        gov_account = db.query(GovernmentAccount).filter(GovernmentAccount.id == user_id).first()
-        if not gov_account:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Government account not found"
-            )
-        return {"role": "government", "user_id": user_id, "id": user_id}
+    if role == "public":
+        return {"role": "public"}
     
-    elif role == "vendor":
-        # Verify vendor still exists
-        vendor = db.query(Vendor).filter(Vendor.id == user_id).first()
-        if not vendor:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Vendor account not found"
-            )
-        return {
-            "role": "vendor",
-            "user_id": user_id,
-            "id": user_id,
-            "vendor_id": vendor.vendor_id,
-            "name": vendor.name
-        }
+    if role not in ("government", "vendor"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid role"
+        )
     
-    elif role == "public":
-        return {"role": "public"}
+    principal = principal_cache.get(role, user_id)
+    if principal is not None:
+        return principal
     
-    raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid role"
-    )
+    generation = principal_cache.generation
+    principal = await _load_principal(role, user_id)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Government account not found" if role == "government" else "Vendor account not found"
+        )
+    principal_cache.put(role, user_id, principal, generation)
+    return principal
 
 def require_role(allowed_roles: list[str]):
     """Dependency to require specific roles"""
-    def role_checker(current_user: dict = Depends(get_current_user)):
+    async def role_checker(current_user: dict = Depends(get_current_user)):
         if current_user.get("role") not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -116,7 +134,7 @@ def require_role(allowed_roles: list[str]):
     return role_checker
 
 # Role-specific dependencies
-def require_government(current_user: dict = Depends(get_current_user)):
+async def require_government(current_user: dict = Depends(get_current_user)):
     if current_user.get("role") != "government":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -124,7 +142,7 @@ def require_government(current_user: dict = Depends(get_current_user)):
         )
     return current_user
 
-def require_vendor(current_user: dict = Depends(get_current_user)):
+async def require_vendor(current_user: dict = Depends(get_current_user)):
     if current_user.get("role") != "vendor":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -132,6 +150,6 @@ def require_vendor(current_user: dict = Depends(get_current_user)):
         )
     return current_user
 
-def require_public(current_user: dict = Depends(get_current_user)):
+async def require_public(current_user: dict = Depends(get_current_user)):
     return current_user
 
@@ -0,0 +1,278 @@
+"""
+Compact, array-backed representation of a tender's bids for scoring.
+
+The engines only need a handful of numeric fields per bid plus the proposal
+text for keyword/relevance scoring. BidBatch keeps the numeric fields as typed
+NumPy columns, filled from a lean column-only query (no ORM hydration, no
+technical_proposal blobs), and loads the proposal texts lazily with a single
+query the first time something needs them. Per-tender statistics (price mean,
+median, std, near-identical price counts) are computed once per batch instead
+of once per bid.
+
+Iterating a batch yields BidRow views, which expose the same attributes the
+engines read from Bid objects, so AIEngine and EnhancedAIEngine accept either.
+"""
+
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.db.models import Bid
+from app.services.price_model import PriceModel
+
+
+class PriceStats(NamedTuple):
+    mean: float
+    median: float
+    std: float
+
+
+class BidRow:
+    """Read-only view of one bid in a BidBatch (duck-types the Bid attributes the engines use)."""
+
+    __slots__ = ("batch", "index", "id", "tender_id", "vendor_id",
+                 "proposed_price", "delivery_timeline", "proposal_length")
+
+    def __init__(self, batch: "BidBatch", index: int, bid_id: int, vendor_id: int,
+                 price: float, timeline: int, proposal_length: int):
+        self.batch = batch
+        self.index = index
+        self.id = bid_id
+        self.tender_id = batch.tender_id
+        self.vendor_id = vendor_id
+        self.proposed_price = price
+        self.delivery_timeline = timeline
+        self.proposal_length = proposal_length
+
+    @property
+    def technical_proposal(self) -> str:
+        return self.batch.proposal(self.index)
+
+    def __repr__(self):
+        return f"BidRow(id={self.id}, vendor_id={self.vendor_id}, price={self.proposed_price})"
+
+
+class BidBatch:
+    """
+    Columnar bids of one tender.
+
+    Columns:
+        ids, vendor_ids: int64
+        prices: float64
+        timelines, proposal_lengths: int32
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[int],
+        vendor_ids: Sequence[int],
+        prices: Sequence[float],
+        timelines: Sequence[int],
+        proposal_lengths: Sequence[int],
+        tender_id: Optional[int] = None,
+        proposals: Optional[List[str]] = None,
+        proposal_loader: Optional[Callable[[], Dict[int, str]]] = None
+    ):
+        self.tender_id = tender_id
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.vendor_ids = np.asarray(vendor_ids, dtype=np.int64)
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.timelines = np.asarray(timelines, dtype=np.int32)
+        self.proposal_lengths = np.asarray(proposal_lengths, dtype=np.int32)
+        self._proposals = proposals
+        self._proposal_loader = proposal_loader
+        self._rows: Optional[List[BidRow]] = None
+        self._index: Optional[Dict[int, int]] = None
+        self._valid_prices: Optional[np.ndarray] = None
+        self._price_stats: Optional[PriceStats] = None
+        self._price_matches: Dict[float, np.ndarray] = {}
+        self._fair_prices: Optional[Tuple[Tuple, List[float], float]] = None
+        self._fair_bands: Optional[Tuple[Tuple, List[Dict]]] = None
+
+    # =========================
+    # Construction
+    # =========================
+
+    @classmethod
+    def from_bids(cls, bids: Iterable[Bid]) -> "BidBatch":
+        """Build a batch from already-loaded Bid objects (texts are kept, not reloaded)."""
+        bids = list(bids)
+        proposals = [b.technical_proposal or "" for b in bids]
+        return cls(
+            ids=[b.id for b in bids],
+            vendor_ids=[b.vendor_id for b in bids],
+            prices=[b.proposed_price for b in bids],
+            timelines=[b.delivery_timeline for b in bids],
+            proposal_lengths=[len(p) for p in proposals],
+            tender_id=bids[0].tender_id if bids else None,
+            proposals=proposals
+        )
+
+    @classmethod
+    def load(cls, db: Session, tender_id: int) -> "BidBatch":
+        """
+        Load a tender's bids with a column-only query.
+
+        Proposal lengths are computed in the database; the texts themselves are
+        fetched with one more query only if a scorer asks for them.
+        """
+        rows = db.query(
+            Bid.id,
+            Bid.vendor_id,
+            Bid.proposed_price,
+            Bid.delivery_timeline,
+            func.coalesce(func.length(Bid.technical_proposal), 0)
+        ).filter(Bid.tender_id == tender_id).order_by(Bid.id).all()
+
+        def load_proposals() -> Dict[int, str]:
+            return dict(
+                db.query(Bid.id, Bid.technical_proposal).filter(Bid.tender_id == tender_id)
+            )
+
+        columns = list(zip(*rows)) if rows else [()] * 5
+        return cls(*columns, tender_id=tender_id, proposal_loader=load_proposals)
+
+    @classmethod
+    def coerce(cls, bids) -> "BidBatch":
+        """Return bids unchanged if already a batch, else build one."""
+        return bids if isinstance(bids, cls) else cls.from_bids(bids)
+
+    # =========================
+    # Access
+    # =========================
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __bool__(self) -> bool:
+        return len(self.ids) > 0
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index: int) -> BidRow:
+        return self.rows[index]
+
+    @property
+    def rows(self) -> List[BidRow]:
+        if self._rows is None:
+            self._rows = [
+                BidRow(self, i, bid_id, vendor_id, price, timeline, length)
+                for i, (bid_id, vendor_id, price, timeline, length) in enumerate(zip(
+                    self.ids.tolist(), self.vendor_ids.tolist(), self.prices.tolist(),
+                    self.timelines.tolist(), self.proposal_lengths.tolist()
+                ))
+            ]
+        return self._rows
+
+    def index_of(self, bid) -> int:
+        """Position of a bid (BidRow or Bid) in this batch."""
+        if isinstance(bid, BidRow) and bid.batch is self:
+            return bid.index
+        if self._index is None:
+            self._index = {bid_id: i for i, bid_id in enumerate(self.ids.tolist())}
+        return self._index[bid.id]
+
+    @property
+    def proposals(self) -> List[str]:
+        """Proposal texts in batch order (loaded on first access)."""
+        if self._proposals is None:
+            texts = self._proposal_loader() if self._proposal_loader else {}
+            self._proposals = [texts.get(bid_id) or "" for bid_id in self.ids.tolist()]
+        return self._proposals
+
+    def proposal(self, index: int) -> str:
+        return self.proposals[index]
+
+    @property
+    def proposals_loaded(self) -> bool:
+        return self._proposals is not None
+
+    # =========================
+    # Per-tender statistics (computed once)
+    # =========================
+
+    @property
+    def valid_prices(self) -> np.ndarray:
+        """Prices of bids with a positive price."""
+        if self._valid_prices is None:
+            self._valid_prices = self.prices[self.prices > 0]
+        return self._valid_prices
+
+    @property
+    def price_stats(self) -> PriceStats:
+        """Mean, median and standard deviation of the valid prices."""
+        if self._price_stats is None:
+            prices = self.valid_prices
+            if len(prices):
+                # NumPy scalars on purpose: scores stay bit-identical to the per-bid path
+                self._price_stats = PriceStats(np.mean(prices), np.median(prices), np.std(prices))
+            else:
+                self._price_stats = PriceStats(0.0, 0.0, 0.0)
+        return self._price_stats
+
+    def price_matches(self, tolerance: float) -> np.ndarray:
+        """
+        For every bid, the number of other bids priced within `tolerance` of it.
+
+        Sort + binary search instead of comparing every pair; candidates in the
+        (slightly widened) window are re-checked with the exact comparison the
+        engines use.
+        """
+        counts = self._price_matches.get(tolerance)
+        if counts is not None:
+            return counts
+
+        order = np.argsort(self.prices, kind="stable")
+        ordered = self.prices[order]
+        lo = np.searchsorted(ordered, self.prices - 2 * tolerance, side="left")
+        hi = np.searchsorted(ordered, self.prices + 2 * tolerance, side="right")
+
+        counts = np.zeros(len(self.prices), dtype=np.int32)
+        for i in np.nonzero(hi - lo > 1)[0]:
+            window = ordered[lo[i]:hi[i]]
+            counts[i] = int(np.count_nonzero(np.abs(window - self.prices[i]) < tolerance)) - 1
+        self._price_matches[tolerance] = counts
+        return counts
+
+    def fair_prices(
+        self, model: PriceModel, category: str, department: str, budget: float
+    ) -> Tuple[List[float], float]:
+        """
+        Fair log-price mean of every bid (batch order) and the model's spread.
+
+        Predicted with one vectorised call per model version, since the
+        timeline is the only per-bid input.
+        """
+        key = (model.version, category, department, budget)
+        if self._fair_prices is None or self._fair_prices[0] != key:
+            mus, sigma = model.predict_log_many(category, department, budget, self.timelines)
+            self._fair_prices = (key, mus.tolist(), sigma)
+        return self._fair_prices[1], self._fair_prices[2]
+
+    def fair_bands(
+        self, model: PriceModel, category: str, department: str, budget: float
+    ) -> List[Dict]:
+        """Fair-price band ({expected, low, high}) of every bid, in batch order."""
+        key = (model.version, category, department, budget)
+        if self._fair_bands is None or self._fair_bands[0] != key:
+            mus, sigma = self.fair_prices(model, category, department, budget)
+            self._fair_bands = (key, PriceModel.bands_from_log(mus, sigma))
+        return self._fair_bands[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the numeric columns."""
+        return sum(a.nbytes for a in (
+            self.ids, self.vendor_ids, self.prices, self.timelines, self.proposal_lengths
+        ))
+
+
+def proposal_length(bid) -> int:
+    """Length of a bid's proposal without loading the text when it is already known."""
+    length = getattr(bid, "proposal_length", None)
+    if length is not None:
+        return length
+    return len(bid.technical_proposal or "")
@@ -0,0 +1,123 @@
+"""
+Bid listing for a tender, shared by the government bid review screen and the
+public transparency view.
+
+One projected query joins bids to their vendors (technical_proposal and the
+other wide columns are never loaded), sorts server-side and pages with a
+keyset on (sort key, bid id), so a page costs one round trip however many
+bids the tender has.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, or_, tuple_
+from sqlalchemy.orm import Session
+
+from app.db.models import Bid, Vendor
+from app.services.pagination import decode_cursor, encode_cursor
+
+# Unscored bids sort as the lowest score
+UNSCORED = -1.0
+
+SORT_KEYS = {
+    "price": Bid.proposed_price,
+    "ai_score": func.coalesce(Bid.ai_score, UNSCORED),
+    "timeline": Bid.delivery_timeline
+}
+
+# Direction used when the caller does not pass one
+DEFAULT_ORDER = {"price": "asc", "ai_score": "desc", "timeline": "asc"}
+
+
+def list_tender_bids(
+    db: Session,
+    tender_id: int,
+    sort: str = "price",
+    order: Optional[str] = None,
+    anomaly: Optional[bool] = None,
+    limit: Optional[int] = 50,
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of a tender's bids with vendor name and reputation.
+
+    Args:
+        sort: "price", "ai_score" or "timeline"; ties break on bid id
+        order: "asc" or "desc" (defaults per sort key, see DEFAULT_ORDER)
+        anomaly: Only flagged bids if True, only unflagged if False
+        limit: Page size (None: all remaining bids on one page)
+        cursor: next_cursor of the previous page (same sort and order)
+
+    Returns:
+        (items, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If sort/order is unknown or the cursor is invalid
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key: {sort}")
+    order = order or DEFAULT_ORDER[sort]
+    if order not in ("asc", "desc"):
+        raise ValueError(f"Unknown sort order: {order}")
+    key = SORT_KEYS[sort]
+
+    query = db.query(
+        Bid.id,
+        Bid.vendor_id,
+        Vendor.name,
+        Vendor.reputation_score,
+        Bid.proposed_price,
+        Bid.delivery_timeline,
+        Bid.ai_score,
+        Bid.anomaly_flag,
+        Bid.status,
+        key
+    ).outerjoin(
+        Vendor, Vendor.id == Bid.vendor_id
+    ).filter(Bid.tender_id == tender_id)
+
+    if anomaly is True:
+        query = query.filter(Bid.anomaly_flag.is_(True))
+    elif anomaly is False:
+        query = query.filter(or_(Bid.anomaly_flag.is_(False), Bid.anomaly_flag.is_(None)))
+
+    if cursor:
+        cursor_sort, cursor_order, value, bid_id = decode_cursor(cursor, 4)
+        if (cursor_sort, cursor_order) != (sort, order):
+            raise ValueError("Cursor belongs to a different sort order")
+        if order == "asc":
+            query = query.filter(tuple_(key, Bid.id) > tuple_(value, bid_id))
+        else:
+            query = query.filter(tuple_(key, Bid.id) < tuple_(value, bid_id))
+
+    if order == "asc":
+        query = query.order_by(key.asc(), Bid.id.asc())
+    else:
+        query = query.order_by(key.desc(), Bid.id.desc())
+
+    if limit is None:
+        rows, more = query.all(), False
+    else:
+        # One extra row tells whether another page follows
+        rows = query.limit(limit + 1).all()
+        more = len(rows) > limit
+        rows = rows[:limit]
+
+    items = [{
+        "id": row[0],
+        "vendor_id": row[1],
+        "vendor_name": row[2] if row[2] is not None else "Unknown",
+        "vendor_reputation": row[3] if row[2] is not None else 0,
+        "proposed_price": row[4],
+        "delivery_timeline": row[5],
+        "ai_score": row[6],
+        "anomaly_flag": row[7],
+        "status": row[8]
+    } for row in rows]
+    next_cursor = encode_cursor([sort, order, rows[-1][9], rows[-1][0]]) if more else None
+    return items, next_cursor
+
+
+def count_tender_bids(db: Session, tender_id: int) -> int:
+    """Number of bids on a tender (one COUNT, no rows loaded)."""
+    return db.query(func.count(Bid.id)).filter(Bid.tender_id == tender_id).scalar()
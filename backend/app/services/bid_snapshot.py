@@ -0,0 +1,264 @@
+"""
+Immutable snapshot of a tender's bid set, written when bidding closes.
+
+After close_tender the bids of a tender never change again (only their scores
+and statuses do), so the fields scoring, transparency and exports read are
+frozen once into a compact on-disk snapshot instead of being re-queried and
+re-hydrated from the bids table every time:
+
+    SNAPSHOT_DIR/<tender_id>/<content_hash>/
+        ids.npy, vendor_ids.npy, prices.npy,      numeric columns, memory-mapped
+        timelines.npy, proposal_lengths.npy       on load (no copy, no parsing)
+        submission_hashes.npy                     per-bid hashes anchored on chain
+        proposal_offsets.npy, proposals.zlib      all proposal texts, one
+                                                  compressed UTF-8 stream
+        manifest.json
+
+The content hash (0x-prefixed SHA-256, bytes32 like the other audit hashes)
+covers every column, the submission hashes and the uncompressed proposals, so
+a snapshot can be verified on its own and cross-checked against the bid
+submissions logged on chain. The tender row records which snapshot is current
+in tenders.snapshot_hash.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import zlib
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.models import Bid, Tender
+from app.services.bid_batch import BidBatch
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+# Numeric columns in hash order, with the dtypes BidBatch uses (so loading is zero-copy)
+COLUMNS = (
+    ("ids", "<i8"),
+    ("vendor_ids", "<i8"),
+    ("prices", "<f8"),
+    ("timelines", "<i4"),
+    ("proposal_lengths", "<i4")
+)
+HASH_DTYPE = "S66"
+
+
+def compute_content_hash(
+    tender_id: int,
+    columns: Dict[str, np.ndarray],
+    submission_hashes: np.ndarray,
+    proposals: bytes
+) -> str:
+    """SHA-256 over the snapshot's canonical bytes (little-endian columns, raw UTF-8 proposals)."""
+    digest = hashlib.sha256(f"tender:{tender_id};format:{SNAPSHOT_FORMAT}".encode())
+    for name, dtype in COLUMNS:
+        digest.update(name.encode())
+        digest.update(np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+    digest.update(np.ascontiguousarray(submission_hashes, dtype=HASH_DTYPE).tobytes())
+    digest.update(proposals)
+    return "0x" + digest.hexdigest()
+
+
+def snapshot_path(tender_id: int, content_hash: str) -> str:
+    return os.path.join(get_settings().SNAPSHOT_DIR, str(tender_id), content_hash)
+
+
+class BidSnapshot:
+    """A loaded snapshot; numeric columns are read-only memory maps."""
+
+    def __init__(self, path: str, mmap: bool = True):
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(path, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        self.path = path
+        self.tender_id = self.manifest["tender_id"]
+        self.content_hash = self.manifest["content_hash"]
+        self.columns = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name, _ in COLUMNS
+        }
+        self.submission_hashes = np.load(os.path.join(path, "submission_hashes.npy"), mmap_mode=mmap_mode)
+        self.proposal_offsets = np.load(os.path.join(path, "proposal_offsets.npy"), mmap_mode=mmap_mode)
+        self._proposals: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.columns["ids"])
+
+    def _proposal_bytes(self) -> bytes:
+        with open(os.path.join(self.path, "proposals.zlib"), "rb") as f:
+            return zlib.decompress(f.read())
+
+    @property
+    def proposals(self) -> List[str]:
+        """Proposal texts in bid order (decompressed on first access)."""
+        if self._proposals is None:
+            data = self._proposal_bytes()
+            bounds = self.proposal_offsets.tolist()
+            self._proposals = [
+                data[start:end].decode("utf-8") for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+        return self._proposals
+
+    def to_batch(self) -> BidBatch:
+        """BidBatch over the mapped columns; proposals are decompressed only if a scorer reads them."""
+        ids = self.columns["ids"]
+        return BidBatch(
+            ids=ids,
+            vendor_ids=self.columns["vendor_ids"],
+            prices=self.columns["prices"],
+            timelines=self.columns["timelines"],
+            proposal_lengths=self.columns["proposal_lengths"],
+            tender_id=self.tender_id,
+            proposal_loader=lambda: dict(zip(ids.tolist(), self.proposals))
+        )
+
+    def rows(self, proposals: bool = False) -> Iterator[Dict]:
+        """Bids as plain dicts (for exports)."""
+        texts = self.proposals if proposals else None
+        for i, (bid_id, vendor_id, price, timeline, length, submission_hash) in enumerate(zip(
+            *(self.columns[name].tolist() for name, _ in COLUMNS), self.submission_hashes.tolist()
+        )):
+            row = {
+                "bid_id": bid_id,
+                "vendor_id": vendor_id,
+                "proposed_price": price,
+                "delivery_timeline": timeline,
+                "proposal_length": length,
+                "submission_hash": submission_hash.decode() or None
+            }
+            if texts is not None:
+                row["technical_proposal"] = texts[i]
+            yield row
+
+    def verify(self) -> bool:
+        """Recompute the content hash from the files on disk."""
+        return compute_content_hash(
+            self.tender_id, self.columns, self.submission_hashes, self._proposal_bytes()
+        ) == self.content_hash
+
+
+def write_snapshot(db: Session, tender: Tender) -> BidSnapshot:
+    """
+    Freeze a tender's current bid set and record it on the tender (caller commits).
+
+    Snapshots are content-addressed, so writing the same bid set twice reuses
+    the existing directory.
+    """
+    rows = db.query(
+        Bid.id,
+        Bid.vendor_id,
+        Bid.proposed_price,
+        Bid.delivery_timeline,
+        Bid.technical_proposal,
+        Bid.submission_hash
+    ).filter(Bid.tender_id == tender.id).order_by(Bid.id).all()
+
+    texts = [(row[4] or "").encode("utf-8") for row in rows]
+    columns = {
+        "ids": np.array([row[0] for row in rows], dtype="<i8"),
+        "vendor_ids": np.array([row[1] for row in rows], dtype="<i8"),
+        "prices": np.array([row[2] for row in rows], dtype="<f8"),
+        "timelines": np.array([row[3] for row in rows], dtype="<i4"),
+        "proposal_lengths": np.array([len(row[4] or "") for row in rows], dtype="<i4")
+    }
+    submission_hashes = np.array([row[5] or "" for row in rows], dtype=HASH_DTYPE)
+    offsets = np.zeros(len(texts) + 1, dtype="<i8")
+    np.cumsum(np.array([len(t) for t in texts], dtype="<i8"), out=offsets[1:])
+    proposals = b"".join(texts)
+
+    content_hash = compute_content_hash(tender.id, columns, submission_hashes, proposals)
+    path = snapshot_path(tender.id, content_hash)
+    if not os.path.exists(os.path.join(path, "manifest.json")):
+        parent = os.path.dirname(path)
+        os.makedirs(parent, exist_ok=True)
+        # Written to a temporary directory and renamed, so readers never see a partial snapshot
+        tmp = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+        try:
+            for name, _ in COLUMNS:
+                np.save(os.path.join(tmp, f"{name}.npy"), columns[name])
+            np.save(os.path.join(tmp, "submission_hashes.npy"), submission_hashes)
+            np.save(os.path.join(tmp, "proposal_offsets.npy"), offsets)
+            with open(os.path.join(tmp, "proposals.zlib"), "wb") as f:
+                f.write(zlib.compress(proposals, 6))
+            with open(os.path.join(tmp, "manifest.json"), "w") as f:
+                json.dump({
+                    "format": SNAPSHOT_FORMAT,
+                    "tender_id": tender.id,
+                    "content_hash": content_hash,
+                    "bid_count": len(rows),
+                    "proposal_bytes": len(proposals),
+                    "created_at": datetime.utcnow().isoformat()
+                }, f, indent=2)
+            os.replace(tmp, path)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.exists(os.path.join(path, "manifest.json")):
+                raise
+
+    tender.snapshot_hash = content_hash
+    logger.info(f"Snapshot {content_hash} written for tender {tender.id} ({len(rows)} bids)")
+    return BidSnapshot(path)
+
+
+def load_snapshot(tender: Tender) -> Optional[BidSnapshot]:
+    """The tender's current snapshot, or None if it has none or it is unreadable here."""
+    if not tender.snapshot_hash:
+        return None
+    try:
+        snapshot = BidSnapshot(snapshot_path(tender.id, tender.snapshot_hash))
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Snapshot {tender.snapshot_hash} of tender {tender.id} not loadable: {str(e)}")
+        return None
+    if snapshot.content_hash != tender.snapshot_hash or snapshot.tender_id != tender.id:
+        logger.warning(f"Snapshot manifest mismatch for tender {tender.id}")
+        return None
+    return snapshot
+
+
+def load_bid_batch(db: Session, tender: Tender) -> BidBatch:
+    """Bids of a tender for scoring: from its snapshot once closed, else a lean query."""
+    snapshot = load_snapshot(tender)
+    if snapshot is not None:
+        return snapshot.to_batch()
+    return BidBatch.load(db, tender.id)
+
+
+def verify_snapshot(db: Session, tender: Tender, chain_bid_count: Optional[int] = None) -> Dict:
+    """
+    Check a tender's snapshot against its files, the bids table and the chain.
+
+    Args:
+        chain_bid_count: Bid submissions logged on chain for the tender, if known
+
+    Returns:
+        Dictionary of individual checks (None where a check could not run)
+    """
+    snapshot = load_snapshot(tender)
+    if snapshot is None:
+        return {"snapshot_hash": tender.snapshot_hash, "available": False}
+
+    stored = db.query(Bid.id, Bid.submission_hash).filter(
+        Bid.tender_id == tender.id
+    ).order_by(Bid.id).all()
+    matches_bids = (
+        [row[0] for row in stored] == snapshot.columns["ids"].tolist()
+        and [row[1] or "" for row in stored] == [h.decode() for h in snapshot.submission_hashes.tolist()]
+    )
+    return {
+        "snapshot_hash": snapshot.content_hash,
+        "available": True,
+        "bid_count": len(snapshot),
+        "files_intact": snapshot.verify(),
+        "matches_bids": matches_bids,
+        "matches_chain_bid_count": None if chain_bid_count is None else chain_bid_count == len(snapshot)
+    }
@@ -0,0 +1,259 @@
+"""
+Bulk rescoring of the historical corpus across a process pool.
+
+The parent process streams tenders in id order, chunk by chunk, with
+column-only queries (no ORM hydration of bids), and ships plain tuples to a
+pool of worker processes. Each worker rebuilds a BidBatch plus transient
+tender and vendor-feature objects, scores the tender with AIEngine and
+returns only the score columns. The parent writes changed rows back with one bulk UPDATE per chunk and records a
+checkpoint, so an interrupted run can resume where it stopped.
+
+Used by app.scripts.rescore_all.
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.db.models import Bid, Tender, VendorFeatures
+from app.services.ai_engine import AIEngine
+from app.services.bid_batch import BidBatch
+from app.services.model_registry import get_scoring_bundle
+from app.services.tender_scoring import SCORE_COLUMNS, score_values, scores_changed
+from app.services.vendor_features import load_vendor_features
+
+logger = logging.getLogger(__name__)
+
+TENDER_COLUMNS = ("id", "title", "description", "category", "budget", "department")
+BID_COLUMNS = ("id", "tender_id", "vendor_id", "proposed_price", "technical_proposal", "delivery_timeline")
+FEATURE_COLUMNS = tuple(c.key for c in VendorFeatures.__table__.columns)
+
+
+# =========================
+# Worker side
+# =========================
+
+def _init_worker():
+    # Load (memory-mapped) scoring artifacts once per worker process
+    get_scoring_bundle()
+
+
+def score_payload(payload: Tuple) -> Tuple[int, List[Tuple[int, Dict]]]:
+    """
+    Score one tender inside a worker process.
+
+    Args:
+        payload: (tender_values, [bid_values], {vendor_id: feature_values})
+
+    Returns:
+        (tender_id, [(bid_id, score_columns)])
+    """
+    tender_values, bid_rows, feature_rows = payload
+    tender = Tender(**dict(zip(TENDER_COLUMNS, tender_values)))
+    ids, _, vendor_ids, prices, proposals, timelines = zip(*bid_rows)
+    proposals = [p or "" for p in proposals]
+    bids = BidBatch(
+        ids, vendor_ids, prices, timelines, [len(p) for p in proposals],
+        tender_id=tender.id, proposals=proposals
+    )
+    vendors = {
+        vendor_id: VendorFeatures(**dict(zip(FEATURE_COLUMNS, row)))
+        for vendor_id, row in feature_rows.items()
+    }
+
+    # Lean scoring pass only: no ranking or response rows are needed here
+    bundle = get_scoring_bundle()
+    score_version = AIEngine.score_version(bundle)
+    scored = AIEngine.score_bids(tender, bids, vendors, bundle)
+    return tender.id, [
+        (bid.id, score_values({**scores, "score_version": score_version}))
+        for bid, _, scores in scored
+    ]
+
+
+# =========================
+# Parent side
+# =========================
+
+class Checkpoint:
+    """Last fully written tender id, persisted as JSON after every chunk."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.last_tender_id = 0
+        self.processed = 0
+        if path and os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            self.last_tender_id = state.get("last_tender_id", 0)
+            self.processed = state.get("processed", 0)
+
+    def save(self, last_tender_id: int, processed: int):
+        self.last_tender_id = last_tender_id
+        self.processed = processed
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"last_tender_id": last_tender_id, "processed": processed}, f)
+        os.replace(tmp, self.path)
+
+
+def iter_chunks(
+    db: Session, start_after: int, chunk_size: int, statuses: Optional[List] = None
+) -> Iterator[Tuple[List[Tuple], Dict[int, Dict], int]]:
+    """
+    Stream tenders (keyset on id) with their bids and stored scores.
+
+    Yields:
+        (payloads, stored, last_tender_id) where stored maps bid id -> current
+        score columns
+    """
+    last_id = start_after
+    while True:
+        query = db.query(*[getattr(Tender, c) for c in TENDER_COLUMNS]).filter(Tender.id > last_id)
+        if statuses:
+            query = query.filter(Tender.status.in_(statuses))
+        tenders = query.order_by(Tender.id).limit(chunk_size).all()
+        if not tenders:
+            return
+        last_id = tenders[-1][0]
+        tender_ids = [t[0] for t in tenders]
+
+        bids_by_tender: Dict[int, List[Tuple]] = {tid: [] for tid in tender_ids}
+        stored: Dict[int, Dict] = {}
+        rows = db.query(
+            *[getattr(Bid, c) for c in BID_COLUMNS],
+            *[getattr(Bid, c) for c in SCORE_COLUMNS]
+        ).filter(Bid.tender_id.in_(tender_ids)).all()
+        n = len(BID_COLUMNS)
+        for row in rows:
+            bids_by_tender[row[1]].append(tuple(row[:n]))
+            stored[row[0]] = dict(zip(SCORE_COLUMNS, row[n:]))
+
+        features = load_vendor_features(db, {row[2] for row in rows})
+        feature_rows = {
+            vid: tuple(getattr(f, c) for c in FEATURE_COLUMNS) for vid, f in features.items()
+        }
+
+        payloads = []
+        for tender in tenders:
+            bid_rows = bids_by_tender[tender[0]]
+            if not bid_rows:
+                continue
+            vendor_ids = {b[2] for b in bid_rows}
+            payloads.append((
+                tuple(tender),
+                bid_rows,
+                {vid: feature_rows[vid] for vid in vendor_ids if vid in feature_rows}
+            ))
+        yield payloads, stored, last_id
+
+
+class DiffReport:
+    """Aggregates differences between new and stored ai_score (dry runs)."""
+
+    def __init__(self, top: int = 20):
+        self.top = top
+        self.compared = 0
+        self.changed = 0
+        self.previously_unscored = 0
+        self.total_abs_delta = 0.0
+        self.largest: List[Tuple[float, int, Optional[float], float]] = []
+
+    def add(self, bid_id: int, old: Optional[float], new: float):
+        self.compared += 1
+        if old is None:
+            self.previously_unscored += 1
+            return
+        delta = new - old
+        if abs(delta) >= 0.01:
+            self.changed += 1
+            self.total_abs_delta += abs(delta)
+            self.largest.append((abs(delta), bid_id, old, new))
+            if len(self.largest) > self.top * 4:
+                self.largest = sorted(self.largest, reverse=True)[:self.top]
+
+    def summary(self) -> Dict:
+        return {
+            "compared": self.compared,
+            "changed": self.changed,
+            "previously_unscored": self.previously_unscored,
+            "mean_abs_delta": round(self.total_abs_delta / self.changed, 3) if self.changed else 0.0,
+            "largest_changes": [
+                {"bid_id": bid_id, "stored": old, "new": new, "delta": round(new - old, 2)}
+                for _, bid_id, old, new in sorted(self.largest, reverse=True)[:self.top]
+            ]
+        }
+
+
+def rescore_all(
+    db: Session,
+    workers: Optional[int] = None,
+    chunk_size: int = 200,
+    dry_run: bool = False,
+    checkpoint_path: Optional[str] = None,
+    statuses: Optional[List] = None,
+    progress=None
+) -> Dict:
+    """
+    Rescore every tender (optionally filtered by status).
+
+    Args:
+        workers: Pool size (default: number of cores)
+        chunk_size: Tenders per streamed chunk / bulk UPDATE
+        dry_run: Score and diff against stored ai_score without writing
+        checkpoint_path: JSON file to resume from and update after each chunk
+        statuses: Only rescore tenders in these states
+        progress: Optional callback(stats) invoked after every chunk
+
+    Returns:
+        Run statistics (and the diff report for dry runs)
+    """
+    workers = workers or os.cpu_count() or 1
+    checkpoint = Checkpoint(None if dry_run else checkpoint_path)
+    diff = DiffReport() if dry_run else None
+    stats = {"tenders": 0, "bids": 0, "written": 0, "resumed_from": checkpoint.last_tender_id}
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for payloads, stored, last_id in iter_chunks(db, checkpoint.last_tender_id, chunk_size, statuses):
+            updates = []
+            for tender_id, results in pool.map(score_payload, payloads, chunksize=max(1, len(payloads) // (workers * 4))):
+                stats["tenders"] += 1
+                for bid_id, scores in results:
+                    stats["bids"] += 1
+                    old = stored.get(bid_id, {})
+                    if diff is not None:
+                        diff.add(bid_id, old.get("ai_score"), scores["ai_score"])
+                    elif scores_changed(old, scores):
+                        updates.append({"id": bid_id, **scores})
+
+            if updates:
+                # ORM bulk UPDATE by primary key: one executemany per chunk
+                db.execute(update(Bid), updates)
+                stats["written"] += len(updates)
+            if not dry_run:
+                db.commit()
+                checkpoint.save(last_id, checkpoint.processed + len(payloads))
+            else:
+                # Discard any vendor feature backfill done while loading
+                db.rollback()
+
+            elapsed = time.perf_counter() - started
+            stats["elapsed_s"] = round(elapsed, 2)
+            stats["tenders_per_s"] = round(stats["tenders"] / elapsed, 1) if elapsed else 0.0
+            stats["bids_per_s"] = round(stats["bids"] / elapsed, 1) if elapsed else 0.0
+            stats["last_tender_id"] = last_id
+            if progress:
+                progress(stats)
+
+    if diff is not None:
+        stats["diff"] = diff.summary()
+    return stats
@@ -0,0 +1,278 @@
+"""
+Registry of versioned scoring configs and model artifacts with hot reload.
+
+Artifacts live under MODEL_DIR:
+
+    MODEL_DIR/
+        scoring_config/<version>/config.json   # engine weights and thresholds
+        scoring_config/LATEST
+        price_model/<version>/*.npy            # fair-price regression model
+        price_model/LATEST
+        relevance_model/<version>/*.npy        # per-category TF-IDF weights
+        relevance_model/LATEST
+
+Publishing writes a new version directory and then atomically replaces
+LATEST. Each worker process polls the LATEST files (at most every
+MODEL_RELOAD_SECONDS) and, when a version changes, loads a new ScoringBundle
+and swaps a single reference. Requests capture the bundle once at the start,
+so in-flight requests finish on the version they started with.
+
+Model arrays are memory-mapped read-only, so workers serving the same version
+share the same page-cache pages instead of each holding a private copy.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from app.config import get_settings
+from app.services.price_model import ARTIFACT_NAME as PRICE_MODEL, PriceModel
+from app.services.relevance import ARTIFACT_NAME as RELEVANCE_MODEL, RelevanceModel
+
+logger = logging.getLogger(__name__)
+
+SCORING_CONFIG = "scoring_config"
+DEFAULT_CONFIG_VERSION = "default"
+
+
+# =========================
+# Artifact storage
+# =========================
+
+def read_latest(root: str, name: str) -> Optional[str]:
+    """Return the version LATEST points at, or None if nothing is published."""
+    try:
+        with open(os.path.join(root, name, "LATEST")) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def write_latest(root: str, name: str, version: str):
+    """Atomically point LATEST at an existing version."""
+    base = os.path.join(root, name)
+    if not os.path.isdir(os.path.join(base, version)):
+        raise ValueError(f"{name} version {version} does not exist")
+    tmp = os.path.join(base, f".LATEST.{os.getpid()}")
+    with open(tmp, "w") as f:
+        f.write(version)
+    os.replace(tmp, os.path.join(base, "LATEST"))
+
+
+def list_versions(root: str, name: str) -> List[str]:
+    """List published versions of an artifact, oldest first."""
+    base = os.path.join(root, name)
+    if not os.path.isdir(base):
+        return []
+    return sorted(
+        v for v in os.listdir(base)
+        if not v.startswith(".") and os.path.isdir(os.path.join(base, v))
+    )
+
+
+def publish_price_model(model: PriceModel, root: Optional[str] = None) -> str:
+    """Save a trained price model and make it the active version."""
+    root = root or get_settings().MODEL_DIR
+    path = model.save(root)
+    write_latest(root, PRICE_MODEL, model.version)
+    return path
+
+
+def publish_relevance_model(model: RelevanceModel, root: Optional[str] = None) -> str:
+    """Save a fitted relevance model and make it the active version."""
+    root = root or get_settings().MODEL_DIR
+    path = model.save(root)
+    write_latest(root, RELEVANCE_MODEL, model.version)
+    return path
+
+
+def publish_scoring_config(config: Dict[str, Dict], root: Optional[str] = None) -> str:
+    """
+    Save a scoring config as a new version and make it active.
+
+    Args:
+        config: Overrides per engine section, e.g.
+            {"ai_engine": {"PRICE_WEIGHT": 0.5}, "enhanced": {"WEIGHTS": {...}}}
+
+    Returns:
+        The new config version
+    """
+    root = root or get_settings().MODEL_DIR
+    body = json.dumps(config, sort_keys=True)
+    digest = hashlib.sha256(body.encode()).hexdigest()[:8]
+    version = f"{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{digest}"
+
+    path = os.path.join(root, SCORING_CONFIG, version)
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "config.json"), "w") as f:
+        json.dump({"version": version, "sections": config}, f, indent=2, sort_keys=True)
+
+    write_latest(root, SCORING_CONFIG, version)
+    return version
+
+
+def load_scoring_config(root: str, version: str) -> Dict[str, Dict]:
+    with open(os.path.join(root, SCORING_CONFIG, version, "config.json")) as f:
+        return json.load(f)["sections"]
+
+
+# =========================
+# Bundles
+# =========================
+
+class ScoringBundle:
+    """
+    Immutable snapshot of everything the engines need to score a tender.
+
+    A request should fetch the bundle once and pass it down, so every bid in
+    the request is scored against the same config and model version.
+    """
+
+    def __init__(
+        self,
+        config_version: str = DEFAULT_CONFIG_VERSION,
+        config: Optional[Dict[str, Dict]] = None,
+        price_model: Optional[PriceModel] = None,
+        relevance_model: Optional[RelevanceModel] = None
+    ):
+        self.config_version = config_version
+        self.config = config or {}
+        self.price_model = price_model
+        self.relevance_model = relevance_model
+        self._resolved: Dict[tuple, Dict] = {}
+
+    @property
+    def version(self) -> str:
+        """Version string persisted alongside every score."""
+        price_version = self.price_model.version if self.price_model else "none"
+        relevance_version = self.relevance_model.version if self.relevance_model else "none"
+        return f"cfg:{self.config_version}+price:{price_version}+rel:{relevance_version}"
+
+    def resolve(self, section: str, owner: type, names: Iterable[str]) -> Dict:
+        """
+        Merge config overrides for a section over an engine's class defaults.
+
+        The result is cached on the bundle, so it is computed once per version
+        rather than once per bid.
+        """
+        names = tuple(names)
+        params = self._resolved.get((section, names))
+        if params is None:
+            overrides = self.config.get(section, {})
+            params = {}
+            for name in names:
+                default = getattr(owner, name)
+                value = overrides.get(name, default)
+                # Dict-valued settings (e.g. WEIGHTS) may override a subset of keys
+                if isinstance(default, dict) and isinstance(value, dict):
+                    value = {**default, **value}
+                params[name] = value
+            self._resolved[(section, names)] = params
+        return params
+
+
+class ModelRegistry:
+    """Per-process holder of the active ScoringBundle."""
+
+    def __init__(self, root: str, reload_interval: float = 30.0):
+        self.root = root
+        self.reload_interval = reload_interval
+        self._bundle = ScoringBundle()
+        self._versions = (None, None, None)
+        self._checked_at = 0.0
+        self._pinned = False
+        self._lock = threading.Lock()
+
+    def current(self) -> ScoringBundle:
+        """Return the active bundle, picking up newly published versions."""
+        if not self._pinned and time.monotonic() - self._checked_at >= self.reload_interval:
+            self._maybe_reload()
+        return self._bundle
+
+    def reload(self) -> ScoringBundle:
+        """Force a check for new versions now."""
+        self._checked_at = 0.0
+        self._maybe_reload()
+        return self._bundle
+
+    def pin(self, bundle: ScoringBundle):
+        """Use a fixed bundle and stop polling (benchmarks and offline tooling)."""
+        self._bundle = bundle
+        self._pinned = True
+
+    def unpin(self):
+        """Resume polling and reload the published versions."""
+        self._pinned = False
+        self._versions = (None, None, None)
+        self.reload()
+
+    def _maybe_reload(self):
+        # Only one thread per process does the filesystem check and load
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._checked_at = time.monotonic()
+            versions = (
+                read_latest(self.root, SCORING_CONFIG),
+                read_latest(self.root, PRICE_MODEL),
+                read_latest(self.root, RELEVANCE_MODEL)
+            )
+            if versions == self._versions:
+                return
+
+            config_version, price_version, relevance_version = versions
+            current = self._bundle
+            config = load_scoring_config(self.root, config_version) if config_version else {}
+
+            # Reuse already-loaded models whose version did not change
+            price_model = None
+            if price_version:
+                price_model = (
+                    current.price_model
+                    if current.price_model and current.price_model.version == price_version
+                    else PriceModel.load(
+                        os.path.join(self.root, PRICE_MODEL, price_version), mmap=True
+                    )
+                )
+            relevance_model = None
+            if relevance_version:
+                relevance_model = (
+                    current.relevance_model
+                    if current.relevance_model and current.relevance_model.version == relevance_version
+                    else RelevanceModel.load(
+                        os.path.join(self.root, RELEVANCE_MODEL, relevance_version), mmap=True
+                    )
+                )
+
+            bundle = ScoringBundle(
+                config_version=config_version or DEFAULT_CONFIG_VERSION,
+                config=config,
+                price_model=price_model,
+                relevance_model=relevance_model
+            )
+            # Single reference swap; requests holding the old bundle are unaffected
+            self._bundle = bundle
+            self._versions = versions
+            logger.info(f"Scoring bundle now {bundle.version}")
+        except Exception as e:
+            # Keep serving the previous version if the new one cannot be loaded
+            logger.error(f"Failed to load scoring artifacts from {self.root}: {e}")
+        finally:
+            self._lock.release()
+
+
+@lru_cache()
+def get_registry() -> ModelRegistry:
+    settings = get_settings()
+    return ModelRegistry(settings.MODEL_DIR, settings.MODEL_RELOAD_SECONDS)
+
+
+def get_scoring_bundle() -> ScoringBundle:
+    """Return the active scoring bundle for this process."""
+    return get_registry().current()
@@ -0,0 +1,45 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor holds the sort-key values of the last row of a page; the next page
+continues strictly after them (WHERE (key...) < (cursor...)), so a page costs
+one index range scan no matter how deep it is, and rows inserted meanwhile do
+not shift later pages. Cursors are URL-safe base64 JSON; datetimes are
+round-tripped as ISO strings.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Sequence
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of a page's last row."""
+    payload = [
+        {"dt": v.isoformat()} if isinstance(v, datetime) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or has the wrong number of values
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [
+            datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v
+            for v in payload
+        ]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if len(values) != length:
+        raise ValueError("Invalid cursor")
+    return values
@@ -0,0 +1,150 @@
+"""
+bcrypt hashing on a bounded process pool.
+
+bcrypt is deliberately slow (~0.25 s of CPU per hash at the default cost).
+On the API's shared threadpool, a burst of logins or registrations takes
+every thread and stalls the other blocking work (scoring, snapshots, web3).
+Route handlers await password_hasher instead: work runs in BCRYPT_WORKERS spawned processes, and
+when BCRYPT_MAX_PENDING calls are already queued or running, new ones fail
+fast with HashingOverloaded (503) instead of piling up.
+
+Bulk hashing (vendor onboarding) waits instead of failing and keeps at most
+half of the workers busy, so logins still get through during an import.
+
+hash_password/check_password are also the synchronous primitives behind
+app.services.auth and the scripts.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence
+
+import bcrypt
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Passwords per pool task when hashing in bulk
+BULK_CHUNK_SIZE = 8
+
+
+# =========================
+# Worker side
+# =========================
+
+def hash_password(password: str) -> str:
+    """bcrypt hash of a password with a fresh salt."""
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+
+def check_password(plain_password: str, hashed_password: str) -> bool:
+    """Whether a password matches a bcrypt hash."""
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def hash_passwords(passwords: Sequence[str]) -> List[str]:
+    return [hash_password(p) for p in passwords]
+
+
+# =========================
+# Pool
+# =========================
+
+class HashingOverloaded(RuntimeError):
+    """The hashing queue is full; the caller should retry later."""
+
+
+class PasswordHasher:
+    """
+    Async front end to a lazily started bcrypt process pool.
+
+    Only used from the event loop thread, so the counters need no lock.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.pending = 0  # submitted and not yet finished (queued + running)
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_seconds = 0.0
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Fresh interpreters: nothing inherited from the API process
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    async def _run(self, fn: Callable, *args, bulk: bool = False):
+        if not bulk and self.pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f"Password hashing queue full ({self.pending} pending), rejecting request")
+            raise HashingOverloaded("Too many authentication requests in progress, retry shortly")
+
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        started = time.monotonic()
+        try:
+            return await asyncio.wrap_future(self._executor().submit(fn, *args))
+        except BrokenProcessPool:
+            # A worker died; start a new pool for the next call
+            self._pool = None
+            raise
+        finally:
+            self.pending -= 1
+            self.completed += 1
+            self._total_seconds += time.monotonic() - started
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(check_password, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        """
+        Hash many passwords in parallel, in input order.
+
+        Never rejected; keeps at most half of the workers (at least one) busy
+        so single logins and registrations keep their share of the pool.
+        """
+        slots = asyncio.Semaphore(max(1, self.workers // 2))
+
+        async def run_chunk(chunk):
+            async with slots:
+                return await self._run(hash_passwords, chunk, bulk=True)
+
+        chunks = [passwords[i:i + BULK_CHUNK_SIZE] for i in range(0, len(passwords), BULK_CHUNK_SIZE)]
+        results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+        return [hashed for chunk in results for hashed in chunk]
+
+    def stats(self) -> Dict:
+        """Queue depth and throughput counters (avg_ms includes time queued)."""
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_ms": round(self._total_seconds / self.completed * 1000, 1) if self.completed else 0.0
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+settings = get_settings()
+password_hasher = PasswordHasher(settings.BCRYPT_WORKERS or os.cpu_count() or 1, settings.BCRYPT_MAX_PENDING)
@@ -0,0 +1,294 @@
+"""
+Fair-price regression model for bid price scoring.
+
+Comparing a bid only against the other bids in its tender says little when a
+tender receives two or three bids. This model is trained offline on awarded
+contracts (see app.scripts.train_price_model) and predicts a fair-price band
+from the tender category, department, budget and delivery timeline.
+
+Model layout:
+- One ridge regression per category on log(award_amount), plus a global model
+  used for categories with too little history
+- Features: [1, log(budget), log1p(timeline), department one-hot]
+- The residual standard deviation of each model gives the band width
+
+Artifacts are versioned directories under MODEL_DIR/price_model/<version>/
+holding plain .npy arrays and a manifest.json. Publishing, hot reload and the
+in-memory active version are handled by app.services.model_registry.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_NAME = "price_model"
+BASE_FEATURES = 3  # intercept, log(budget), log1p(timeline)
+
+
+class PriceModel:
+    """
+    In-memory fair-price model.
+
+    Coefficients are kept as one row per category (the last row is the global
+    fallback), so predicting for a bid is a handful of scalar operations and
+    predicting for a whole tender is a single vectorised expression.
+    """
+
+    # Width of the fair-price band in residual standard deviations
+    BAND_Z = 1.0
+    # Floor on the residual spread so tiny categories do not give razor-thin bands
+    MIN_SIGMA = 0.05
+
+    def __init__(
+        self,
+        version: str,
+        categories: List[str],
+        departments: List[str],
+        coef: np.ndarray,
+        sigma: np.ndarray,
+        counts: np.ndarray,
+        trained_at: Optional[str] = None
+    ):
+        self.version = version
+        self.categories = list(categories)
+        self.departments = list(departments)
+        self.coef = coef
+        self.sigma = sigma
+        self.counts = counts
+        self.trained_at = trained_at
+        self._category_index = {c: i for i, c in enumerate(self.categories)}
+        self._department_index = {d: i for i, d in enumerate(self.departments)}
+        self._global_row = len(self.categories)
+        # Plain-float copies for the per-bid path; numpy scalar indexing is ~5x slower
+        self._coef_rows = np.asarray(coef, dtype=np.float64).tolist()
+        self._sigma_rows = np.asarray(sigma, dtype=np.float64).tolist()
+
+    def _row(self, category: Optional[str]) -> int:
+        return self._category_index.get(category, self._global_row)
+
+    def predict_log(
+        self, category: str, department: str, budget: float, timeline: float
+    ) -> Tuple[float, float]:
+        """
+        Predict (mu, sigma) of log(price) for a single bid.
+
+        Returns:
+            Mean and spread of the expected log price
+        """
+        row = self._row(category)
+        coef = self._coef_rows[row]
+        mu = (
+            coef[0]
+            + coef[1] * math.log(max(budget, 1.0))
+            + coef[2] * math.log1p(max(timeline, 0))
+        )
+        dept = self._department_index.get(department)
+        if dept is not None:
+            mu += coef[BASE_FEATURES + dept]
+        return mu, self._sigma_rows[row]
+
+    def predict_log_many(
+        self, category: str, department: str, budget: float, timelines: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Predict log-price means for every bid of a tender at once.
+
+        All bids share the tender's category, department and budget, so only
+        the timeline term varies.
+        """
+        row = self._row(category)
+        coef = self.coef[row]
+        base = coef[0] + coef[1] * math.log(max(budget, 1.0))
+        dept = self._department_index.get(department)
+        if dept is not None:
+            base += coef[BASE_FEATURES + dept]
+        timelines = np.maximum(np.asarray(timelines, dtype=np.float64), 0)
+        return base + coef[2] * np.log1p(timelines), float(self.sigma[row])
+
+    def predict_band(
+        self, category: str, department: str, budget: float, timeline: float
+    ) -> Dict:
+        """Predict the fair-price band for a bid in currency units."""
+        mu, sigma = self.predict_log(category, department, budget, timeline)
+        return self.band_from_log(mu, sigma)
+
+    @classmethod
+    def band_from_log(cls, mu: float, sigma: float) -> Dict:
+        """Convert a log-price prediction into a {expected, low, high} band."""
+        return {
+            "expected": round(math.exp(mu), 2),
+            "low": round(math.exp(mu - cls.BAND_Z * sigma), 2),
+            "high": round(math.exp(mu + cls.BAND_Z * sigma), 2)
+        }
+
+    @classmethod
+    def bands_from_log(cls, mus: np.ndarray, sigma: float) -> List[Dict]:
+        """band_from_log for many means sharing one spread (vectorised)."""
+        mus = np.asarray(mus, dtype=np.float64)
+        expected = np.round(np.exp(mus), 2).tolist()
+        low = np.round(np.exp(mus - cls.BAND_Z * sigma), 2).tolist()
+        high = np.round(np.exp(mus + cls.BAND_Z * sigma), 2).tolist()
+        return [{"expected": e, "low": lo, "high": hi} for e, lo, hi in zip(expected, low, high)]
+
+    @staticmethod
+    def fair_price_score(price: float, mu: float, sigma: float) -> float:
+        """
+        Score a price (0-100) against a predicted log-price distribution.
+
+        Prices inside the band score 90-100; outside it the score falls off
+        quickly in either direction, so lowball bids are not rewarded.
+        """
+        if price <= 0 or sigma <= 0:
+            return 0.0
+        z = abs((math.log(price) - mu) / sigma)
+        if z <= 1:
+            score = 100 - z * 10
+        else:
+            score = 90 - (z - 1) * 30
+        return max(0.0, min(100.0, score))
+
+    # =========================
+    # Persistence
+    # =========================
+
+    def save(self, root: str) -> str:
+        """
+        Write the model as a new versioned artifact directory.
+
+        The artifact is not active until it is published through the model
+        registry.
+
+        Returns:
+            Path of the artifact directory
+        """
+        base = os.path.join(root, ARTIFACT_NAME)
+        path = os.path.join(base, self.version)
+        os.makedirs(path, exist_ok=True)
+
+        np.save(os.path.join(path, "coef.npy"), self.coef)
+        np.save(os.path.join(path, "sigma.npy"), self.sigma)
+        np.save(os.path.join(path, "counts.npy"), self.counts)
+        with open(os.path.join(path, "manifest.json"), "w") as f:
+            json.dump({
+                "name": ARTIFACT_NAME,
+                "version": self.version,
+                "trained_at": self.trained_at,
+                "categories": self.categories,
+                "departments": self.departments,
+                "features": ["intercept", "log_budget", "log1p_timeline"] +
+                            [f"department={d}" for d in self.departments]
+            }, f, indent=2)
+
+        return path
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = False) -> "PriceModel":
+        """
+        Load a model artifact directory.
+
+        With mmap=True the arrays are memory-mapped read-only, so every worker
+        process serving the same version shares the same physical pages.
+        """
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(path, "manifest.json")) as f:
+            manifest = json.load(f)
+        return cls(
+            version=manifest["version"],
+            categories=manifest["categories"],
+            departments=manifest["departments"],
+            coef=np.load(os.path.join(path, "coef.npy"), mmap_mode=mmap_mode),
+            sigma=np.load(os.path.join(path, "sigma.npy"), mmap_mode=mmap_mode),
+            counts=np.load(os.path.join(path, "counts.npy"), mmap_mode=mmap_mode),
+            trained_at=manifest.get("trained_at")
+        )
+
+
+def _ridge(X: np.ndarray, y: np.ndarray, alpha: float) -> np.ndarray:
+    """Closed-form ridge regression that leaves the intercept unpenalised."""
+    penalty = np.eye(X.shape[1]) * alpha
+    penalty[0, 0] = 0.0
+    return np.linalg.solve(X.T @ X + penalty, X.T @ y)
+
+
+def fit_price_model(
+    samples: Iterable[Tuple[str, str, float, float, float]],
+    alpha: float = 1.0,
+    min_samples: int = 8
+) -> PriceModel:
+    """
+    Fit a fair-price model on awarded contracts.
+
+    Args:
+        samples: (category, department, budget, timeline_days, award_amount) rows
+        alpha: Ridge regularisation strength
+        min_samples: Minimum awards a category needs for its own model
+
+    Returns:
+        A fitted PriceModel (not yet saved)
+    """
+    rows = [
+        (c, d, float(b), float(t or 0), float(a))
+        for c, d, b, t, a in samples
+        if b and a and b > 0 and a > 0
+    ]
+    if not rows:
+        raise ValueError("No awarded contracts available to train on")
+
+    departments = sorted({r[1] for r in rows})
+    dept_index = {d: i for i, d in enumerate(departments)}
+    n_features = BASE_FEATURES + len(departments)
+
+    X = np.zeros((len(rows), n_features))
+    X[:, 0] = 1.0
+    X[:, 1] = np.log(np.maximum([r[2] for r in rows], 1.0))
+    X[:, 2] = np.log1p([r[3] for r in rows])
+    X[np.arange(len(rows)), [BASE_FEATURES + dept_index[r[1]] for r in rows]] = 1.0
+    y = np.log([r[4] for r in rows])
+    row_categories = np.array([r[0] for r in rows], dtype=object)
+
+    def fit(mask: np.ndarray) -> Tuple[np.ndarray, float, int]:
+        Xs, ys = X[mask], y[mask]
+        w = _ridge(Xs, ys, alpha)
+        residuals = ys - Xs @ w
+        dof = max(1, len(ys) - 1)
+        sigma = math.sqrt(float(residuals @ residuals) / dof)
+        return w, max(PriceModel.MIN_SIGMA, sigma), int(mask.sum())
+
+    categories = []
+    coef_rows, sigma_rows, count_rows = [], [], []
+    for category in sorted(set(row_categories)):
+        mask = row_categories == category
+        if mask.sum() < min_samples:
+            continue
+        w, sigma, count = fit(mask)
+        categories.append(category)
+        coef_rows.append(w)
+        sigma_rows.append(sigma)
+        count_rows.append(count)
+
+    w, sigma, count = fit(np.ones(len(rows), dtype=bool))
+    coef_rows.append(w)
+    sigma_rows.append(sigma)
+    count_rows.append(count)
+
+    coef = np.vstack(coef_rows)
+    digest = hashlib.sha256(coef.tobytes()).hexdigest()[:8]
+    trained_at = datetime.utcnow()
+
+    return PriceModel(
+        version=f"{trained_at.strftime('%Y%m%d%H%M%S')}-{digest}",
+        categories=categories,
+        departments=departments,
+        coef=coef,
+        sigma=np.array(sigma_rows),
+        counts=np.array(count_rows, dtype=np.int64),
+        trained_at=trained_at.isoformat()
+    )
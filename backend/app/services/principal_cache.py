@@ -0,0 +1,130 @@
+"""
+Per-process cache of authenticated principals.
+
+get_current_user resolves a token's (role, user_id) to the principal dict the
+routes receive. Entries live for PRINCIPAL_CACHE_SECONDS, so repeated requests
+with the same token skip the account lookup.
+
+Deleting a GovernmentAccount or Vendor through the ORM, or changing a vendor
+field the principal carries, drops its entry once the transaction commits.
+Bulk UPDATE/DELETE statements bypass the ORM events and must call
+invalidate_principal() themselves. Writes from other processes (scripts,
+other API workers) are picked up when the entry expires.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.models import GovernmentAccount, Vendor
+
+# Vendor columns copied into the principal; changing one invalidates it
+VENDOR_PRINCIPAL_FIELDS = ("vendor_id", "name")
+
+_CACHE_SIZE = 10_000
+
+
+class PrincipalCache:
+    """TTL + LRU map of (role, user_id) -> principal dict (thread-safe)."""
+
+    def __init__(self, ttl: float, size: int = _CACHE_SIZE):
+        self.ttl = ttl
+        self.size = size
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; see put()
+        self.generation = 0
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Dict]]" = OrderedDict()
+
+    def get(self, role: str, user_id: Hashable) -> Optional[Dict]:
+        """A copy of the cached principal, or None if missing or expired."""
+        key = (role, user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+    def put(self, role: str, user_id: Hashable, principal: Dict, generation: Optional[int] = None):
+        """
+        Cache a principal loaded from the database.
+
+        Pass the generation read before the lookup: if an invalidation ran
+        since, the loaded row may predate that write and is not cached.
+        """
+        key = (role, user_id)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic(), dict(principal))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, role: str, user_id: Hashable):
+        with self._lock:
+            self.generation += 1
+            self._entries.pop((role, user_id), None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache(get_settings().PRINCIPAL_CACHE_SECONDS)
+
+
+def invalidate_principal(role: str, user_id: Hashable):
+    """Drop a cached principal now (for writes the ORM events don't see)."""
+    principal_cache.invalidate(role, user_id)
+
+
+# =========================
+# ORM invalidation
+# =========================
+
+_PENDING = "principal_invalidations"
+
+
+def _changed_principals(session: Session) -> Set[Tuple[str, int]]:
+    keys = set()
+    for obj in session.deleted:
+        if isinstance(obj, GovernmentAccount):
+            keys.add(("government", obj.id))
+        elif isinstance(obj, Vendor):
+            keys.add(("vendor", obj.id))
+    for obj in session.dirty:
+        if isinstance(obj, Vendor):
+            attrs = inspect(obj).attrs
+            if any(attrs[field].history.has_changes() for field in VENDOR_PRINCIPAL_FIELDS):
+                keys.add(("vendor", obj.id))
+    return keys
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_invalidations(session, flush_context):
+    # Still pre-flush state here: deleted/dirty and attribute history are intact
+    keys = _changed_principals(session)
+    if keys:
+        session.info.setdefault(_PENDING, set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session):
+    # After commit, so a concurrent miss can't re-cache the old row
+    for role, user_id in session.info.pop(_PENDING, ()):
+        principal_cache.invalidate(role, user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session):
+    session.info.pop(_PENDING, None)
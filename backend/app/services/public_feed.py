@@ -0,0 +1,100 @@
+"""
+Public feed of awarded contracts.
+
+One projected query joins awards, tenders, the winning bid and its vendor
+(no technical_proposal or other wide columns) and pages with a keyset on
+(award created_at, award id), newest first, backed by ix_awards_created_at_id.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from app.db.models import Award, Bid, Tender, TenderStatus, Vendor
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+def awarded_feed(
+    db: Session,
+    limit: Optional[int] = 50,
+    cursor: Optional[str] = None,
+    category: Optional[str] = None,
+    department: Optional[str] = None
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of awarded tenders, newest award first.
+
+    Args:
+        limit: Page size (None: every awarded tender on one page)
+        cursor: next_cursor of the previous page
+        category, department: Exact-match filters
+
+    Returns:
+        (items, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    query = db.query(
+        Tender.id,
+        Award.id,
+        Tender.title,
+        Tender.category,
+        Tender.budget,
+        Tender.department,
+        Vendor.name,
+        Award.award_amount,
+        Award.contract_start,
+        Award.contract_end,
+        Award.justification,
+        Award.public_rating,
+        Award.public_feedback_count,
+        Tender.creation_tx_hash,
+        Tender.award_tx_hash,
+        Award.created_at
+    ).select_from(Award).join(
+        Tender, Tender.id == Award.tender_id
+    ).outerjoin(
+        Bid, Bid.id == Award.winning_bid_id
+    ).outerjoin(
+        Vendor, Vendor.id == Bid.vendor_id
+    ).filter(Tender.status == TenderStatus.AWARDED)
+
+    if category:
+        query = query.filter(Tender.category == category)
+    if department:
+        query = query.filter(Tender.department == department)
+    if cursor:
+        created_at, award_id = decode_cursor(cursor, 2)
+        query = query.filter(tuple_(Award.created_at, Award.id) < tuple_(created_at, award_id))
+
+    query = query.order_by(Award.created_at.desc(), Award.id.desc())
+    if limit is None:
+        rows, more = query.all(), False
+    else:
+        # One extra row tells whether another page follows
+        rows = query.limit(limit + 1).all()
+        more = len(rows) > limit
+        rows = rows[:limit]
+
+    items = [{
+        "tender_id": row[0],
+        "award_id": row[1],
+        "title": row[2],
+        "category": row[3],
+        "budget": row[4],
+        "department": row[5],
+        "winner": row[6] or "Unknown",
+        "award_amount": row[7],
+        "contract_start": row[8],
+        "contract_end": row[9],
+        "justification": row[10],
+        "public_rating": row[11],
+        "feedback_count": row[12],
+        "creation_tx": row[13],
+        "award_tx": row[14],
+        "awarded_at": row[15]
+    } for row in rows]
+    next_cursor = encode_cursor([rows[-1][15], rows[-1][1]]) if more else None
+    return items, next_cursor
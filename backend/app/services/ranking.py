@@ -0,0 +1,61 @@
+"""
+Rank selection for recommendation pages.
+
+Reviewers usually look at the top few bids of a tender, so instead of sorting
+every scored bid, select_ranked() picks only the requested rank window with
+np.argpartition and sorts just that window. Ties keep input order, exactly as
+a stable full sort on descending score would, so a bid's rank does not depend
+on which page was requested.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def rank_window(
+    total: int, offset: int = 0, limit: Optional[int] = None, top_k: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Rank positions [start, end) covered by a request.
+
+    top_k caps the ranking to the best k bids; offset/limit page through it.
+    """
+    end = total if top_k is None else min(total, top_k)
+    start = min(offset, end)
+    if limit is not None:
+        end = min(end, start + limit)
+    return start, end
+
+
+def top_positions(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first (ties in index order).
+
+    O(n) partition to find the k-th score, then a sort of only the k winners.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.zeros(0, dtype=np.int64)
+    if k >= n:
+        return np.lexsort((np.arange(n), -scores))
+
+    kth = np.partition(-scores, k - 1)[k - 1]
+    better = np.nonzero(-scores < kth)[0]
+    ties = np.nonzero(-scores == kth)[0][:k - len(better)]
+    selected = np.concatenate([better, ties])
+    return selected[np.lexsort((selected, -scores[selected]))]
+
+
+def select_ranked(
+    scores: np.ndarray, offset: int = 0, limit: Optional[int] = None, top_k: Optional[int] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    Indices of the bids on the requested page, in rank order.
+
+    Returns:
+        (indices, start) where start is the 0-based rank of the first index
+    """
+    start, end = rank_window(len(scores), offset, limit, top_k)
+    return top_positions(scores, end)[start:], start
@@ -0,0 +1,105 @@
+"""
+Write-behind ingestion of public ratings.
+
+With RATING_WRITE_BEHIND on, POST /public/ratings only inserts the rating
+with pending=True. That is one INSERT per rating and no row locks on the
+award or the vendor, so bursts of ratings on one project don't queue behind
+each other. The aggregator (app.scripts.rating_aggregator) claims pending
+rows in id order every few hundred milliseconds. For each batch it:
+- adds them to the award and vendor aggregates with one atomic UPDATE per
+  award and per vendor
+- refreshes the vendors' feature rows and queues their rescoring
+- bumps the cache versions of the rated tenders' transparency views
+- clears the flags in the same transaction
+Aggregates lag the ratings by about one poll interval. A rating is never
+counted twice, because the claim and the update commit together.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.db.models import Bid, PublicRating
+from app.services.rescoring import enqueue_vendor_rescore
+from app.services.response_cache import bump_versions, tender_key
+from app.services.vendor_features import refresh_vendor_features
+from app.services.vendor_stats import add_award_ratings, add_vendor_ratings
+
+logger = logging.getLogger(__name__)
+
+
+def apply_pending_ratings(db: Session, batch_size: int = 1000) -> int:
+    """
+    Fold one batch of pending ratings into the aggregates and commit.
+
+    Rows are claimed with SKIP LOCKED, so several aggregators can run side
+    by side. Awards and then vendors are updated in id order, so
+    concurrent batches lock rows in the same order.
+
+    Returns:
+        Number of ratings applied (0 when nothing is pending)
+    """
+    rows = db.query(PublicRating.id, PublicRating.award_id, PublicRating.rating).filter(
+        # Bare boolean, so Postgres matches the partial index predicate
+        PublicRating.pending
+    ).order_by(PublicRating.id).limit(batch_size).with_for_update(skip_locked=True).all()
+    if not rows:
+        db.rollback()
+        return 0
+
+    per_award: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+    for _, award_id, rating in rows:
+        per_award[award_id][0] += 1
+        per_award[award_id][1] += rating
+
+    winning_bids: Dict[int, int] = {}
+    tender_ids = []
+    for award_id in sorted(per_award):
+        count, total = per_award[award_id]
+        award = add_award_ratings(db, award_id, count, total)
+        if award is None:
+            logger.warning(f"Dropping {count} pending rating(s) of missing award {award_id}")
+            continue
+        winning_bids[award_id] = award.winning_bid_id
+        tender_ids.append(award.tender_id)
+
+    vendor_of_bid = dict(
+        db.query(Bid.id, Bid.vendor_id).filter(Bid.id.in_(set(winning_bids.values()))).all()
+    ) if winning_bids else {}
+    per_vendor: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+    for award_id, bid_id in winning_bids.items():
+        vendor_id = vendor_of_bid.get(bid_id)
+        if vendor_id is not None:
+            per_vendor[vendor_id][0] += per_award[award_id][0]
+            per_vendor[vendor_id][1] += per_award[award_id][1]
+
+    vendors = [add_vendor_ratings(db, vendor_id, *per_vendor[vendor_id]) for vendor_id in sorted(per_vendor)]
+    vendors = [v for v in vendors if v is not None]
+    refresh_vendor_features(db, vendors)
+    enqueue_vendor_rescore(db, [v.id for v in vendors], f"ratings on {len(per_award)} award(s)")
+
+    bump_versions(db, [tender_key(tender_id) for tender_id in tender_ids])
+
+    db.execute(
+        update(PublicRating)
+        .where(PublicRating.id.in_([row.id for row in rows]))
+        .values(pending=False)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return len(rows)
+
+
+def pending_ratings(db: Session) -> Tuple[int, float]:
+    """Backlog size and the age in seconds of its oldest rating (0 when empty)."""
+    count, oldest = db.query(func.count(PublicRating.id), func.min(PublicRating.created_at)).filter(
+        PublicRating.pending
+    ).one()
+    db.rollback()
+    if not count or oldest is None:
+        return count or 0, 0.0
+    return count, max(0.0, (datetime.utcnow() - oldest).total_seconds())
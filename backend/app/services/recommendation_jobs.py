@@ -0,0 +1,199 @@
+"""
+Background precomputation of tender recommendations.
+
+Reviewers open the recommendations tab right after closing a tender, so
+closing enqueues a job instead of leaving the scoring to that first request.
+Jobs live in the recommendation_jobs table (one row per tender) and are run
+by app.scripts.recommendation_worker in separate processes; the full ranking
+is stored with the scoring version that produced it, and the recommendations
+endpoint serves pages of it directly.
+
+A job is re-queued when the tender's stored scores go stale (vendor stats
+rescoring) or the scoring version changes, and a job left running by a dead
+worker is retried after RECOMMENDATION_JOB_TIMEOUT_SECONDS. Awarding a tender
+deletes its job: the scores are final from then on, so a job still queued
+(or one that finds the tender no longer closed) writes nothing.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import numpy as np
+from sqlalchemy import and_, delete, or_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.models import RecommendationJob, Tender, TenderStatus
+from app.services.ai_engine import AIEngine
+from app.services.bid_snapshot import load_bid_batch
+from app.services.model_registry import get_scoring_bundle
+from app.services.ranking import rank_window
+from app.services.tender_scoring import TenderScores, apply_scores, score_tender
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Keys of a stored (full) recommendation kept for detail=lean
+LEAN_KEYS = ("bid_id", "vendor_id", *AIEngine.LEAN_SCORE_KEYS, "score_version", "rank")
+
+
+def _plain(value):
+    """NumPy scalars inside a recommendation -> JSON-serialisable Python values."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def enqueue_recommendations(db: Session, tender_id: int):
+    """Queue (or re-queue) a tender's recommendations; runs in the caller's transaction."""
+    now = datetime.utcnow()
+    statement = insert(RecommendationJob).values(
+        tender_id=tender_id, status=PENDING, attempts=0, requested_at=now
+    )
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[RecommendationJob.tender_id],
+        set_={"status": PENDING, "error": None, "attempts": 0, "requested_at": now}
+    ))
+
+
+def requeue_recommendations(db: Session, tender_id: int):
+    """Mark an existing job stale (no-op for tenders that never had one)."""
+    db.query(RecommendationJob).filter(RecommendationJob.tender_id == tender_id).update(
+        {"status": PENDING, "error": None, "attempts": 0, "requested_at": datetime.utcnow()},
+        synchronize_session=False
+    )
+
+
+def cancel_recommendations(db: Session, tender_id: int):
+    """Delete a tender's job, queued or not (runs in the caller's transaction)."""
+    db.execute(delete(RecommendationJob).where(RecommendationJob.tender_id == tender_id))
+
+
+def job_stalled(job: RecommendationJob, now: Optional[datetime] = None) -> bool:
+    """True when a queued or running job has waited longer than RECOMMENDATION_JOB_TIMEOUT_SECONDS."""
+    since = job.started_at if job.status == RUNNING else job.requested_at
+    timeout = timedelta(seconds=get_settings().RECOMMENDATION_JOB_TIMEOUT_SECONDS)
+    return since is not None and (now or datetime.utcnow()) - since > timeout
+
+
+def get_job(db: Session, tender_id: int) -> Optional[RecommendationJob]:
+    return db.query(RecommendationJob).filter(RecommendationJob.tender_id == tender_id).first()
+
+
+def stored_page(
+    job: RecommendationJob,
+    detail: str = AIEngine.DETAIL_FULL,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    top_k: Optional[int] = None
+) -> TenderScores:
+    """Requested page of a finished job's ranking (scores are not returned: nothing to persist)."""
+    ranking = job.result or []
+    start, end = rank_window(len(ranking), offset, limit, top_k)
+    page = ranking[start:end]
+    if detail == AIEngine.DETAIL_LEAN:
+        page = [{key: rec[key] for key in LEAN_KEYS if key in rec} for rec in page]
+    return TenderScores(page, [], job.total or 0)
+
+
+def run_job(db: Session, tender_id: int) -> Optional[TenderScores]:
+    """
+    Score a closed tender at full detail and store its changed scores (caller commits).
+
+    Returns:
+        None, with nothing written, if the tender is no longer closed
+    """
+    tender = db.query(Tender).filter(Tender.id == tender_id).first()
+    if not tender:
+        raise ValueError(f"Tender {tender_id} not found")
+    if tender.status != TenderStatus.CLOSED:
+        return None
+
+    bids = load_bid_batch(db, tender)
+    result = score_tender(db, tender, bids, AIEngine.DETAIL_FULL) if bids else TenderScores([], [], 0)
+    # Checked again under the row lock: an award committed while scoring makes the scores final
+    status = db.query(Tender.status).filter(Tender.id == tender_id).with_for_update().scalar()
+    if status != TenderStatus.CLOSED:
+        return None
+    if bids:
+        apply_scores(db, bids, result.scores)
+    return result
+
+
+def process_recommendation_jobs(db: Session, batch_size: int = 10) -> List[int]:
+    """
+    Run up to batch_size queued jobs.
+
+    A job is claimed with FOR UPDATE SKIP LOCKED and marked running in its own
+    short transaction, so several worker processes can drain the queue without
+    holding row locks while scoring. The result is stored only if the job was
+    not re-queued in the meantime.
+
+    Returns:
+        Ids of the tenders whose recommendations were computed
+    """
+    timeout = timedelta(seconds=get_settings().RECOMMENDATION_JOB_TIMEOUT_SECONDS)
+    done = []
+    for _ in range(batch_size):
+        job = db.query(RecommendationJob).filter(or_(
+            RecommendationJob.status == PENDING,
+            and_(
+                RecommendationJob.status == RUNNING,
+                RecommendationJob.started_at < datetime.utcnow() - timeout
+            )
+        )).order_by(RecommendationJob.requested_at).with_for_update(skip_locked=True).first()
+        if job is None:
+            break
+
+        tender_id, requested_at = job.tender_id, job.requested_at
+        job.status = RUNNING
+        job.started_at = datetime.utcnow()
+        job.attempts = (job.attempts or 0) + 1
+        db.commit()
+
+        unchanged = and_(
+            RecommendationJob.tender_id == tender_id,
+            RecommendationJob.requested_at == requested_at
+        )
+        try:
+            result = run_job(db, tender_id)
+            if result is None:
+                db.rollback()
+                cancel_recommendations(db, tender_id)
+                db.commit()
+                logger.info(f"Dropped recommendation job for tender {tender_id}: no longer closed")
+                continue
+            score_version = (
+                result.scores[0]["score_version"] if result.scores
+                else AIEngine.score_version(get_scoring_bundle())
+            )
+            stored = db.execute(update(RecommendationJob).where(unchanged).values(
+                status=DONE,
+                score_version=score_version,
+                result=_plain(result.recommendations),
+                total=result.total,
+                error=None,
+                finished_at=datetime.utcnow()
+            )).rowcount
+            db.commit()
+            if stored:
+                done.append(tender_id)
+                logger.info(f"Computed recommendations for tender {tender_id} ({result.total} bids)")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Recommendation job for tender {tender_id} failed: {e}")
+            db.execute(update(RecommendationJob).where(unchanged).values(
+                status=FAILED, error=str(e)[:2000], finished_at=datetime.utcnow()
+            ))
+            db.commit()
+    return done
@@ -0,0 +1,228 @@
+"""
+Local TF-IDF relevance of technical proposals to the tender description.
+
+Keyword counting rewards generic proposals; this scorer checks whether a
+proposal actually talks about what the tender asks for. It runs entirely
+offline (no API calls):
+
+- Text is hashed into a fixed feature space (HashingVectorizer), so there is
+  no vocabulary to store and unseen words need no refit
+- The fitted state per category is an IDF vector over that space, learned
+  from past tender descriptions and proposals in the category (see
+  app.scripts.train_relevance_model); a global row covers sparse categories
+- A tender's description vector is computed once and cached; all proposals in
+  a tender are scored with a single sparse matrix-vector product
+
+Artifacts are versioned directories under MODEL_DIR/relevance_model/<version>/
+holding idf.npy (categories x features, memory-mapped) and a manifest.json.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from app.services.bid_batch import BidBatch
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_NAME = "relevance_model"
+N_FEATURES = 2 ** 18
+
+
+def _make_vectorizer(n_features: int) -> HashingVectorizer:
+    return HashingVectorizer(
+        n_features=n_features,
+        ngram_range=(1, 2),
+        stop_words="english",
+        alternate_sign=False,
+        norm=None,
+        dtype=np.float32
+    )
+
+
+class RelevanceModel:
+    """Per-category TF-IDF model with a cache of tender description vectors."""
+
+    # Tender description vectors kept per process
+    TENDER_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        version: str,
+        categories: List[str],
+        idf: np.ndarray,
+        counts: np.ndarray,
+        n_features: int = N_FEATURES,
+        trained_at: Optional[str] = None
+    ):
+        self.version = version
+        self.categories = list(categories)
+        self.idf = idf
+        self.counts = counts
+        self.n_features = n_features
+        self.trained_at = trained_at
+        self._vectorizer = _make_vectorizer(n_features)
+        self._category_index = {c: i for i, c in enumerate(self.categories)}
+        self._global_row = len(self.categories)
+        self._tender_cache: "OrderedDict[Tuple, object]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _idf_row(self, category: Optional[str]) -> np.ndarray:
+        return self.idf[self._category_index.get(category, self._global_row)]
+
+    def transform(self, texts: Iterable[str], category: Optional[str]):
+        """TF-IDF vectors (sparse CSR, L2-normalised) for texts in a category."""
+        counts = self._vectorizer.transform([t or "" for t in texts])
+        # Sublinear tf keeps long, repetitive proposals from dominating
+        counts.data = 1.0 + np.log(counts.data)
+        weighted = counts.multiply(self._idf_row(category)).tocsr()
+        return normalize(weighted, norm="l2", copy=False)
+
+    def tender_vector(self, tender):
+        """
+        Description vector for a tender, cached by id and description hash.
+
+        Returns a (features x 1) sparse column ready for the similarity product.
+        """
+        digest = hashlib.sha1((tender.description or "").encode()).hexdigest()
+        key = (tender.id, tender.category, digest)
+        with self._cache_lock:
+            vector = self._tender_cache.get(key)
+            if vector is not None:
+                self._tender_cache.move_to_end(key)
+                return vector
+
+        vector = self.transform([tender.description], tender.category).T.tocsc()
+        with self._cache_lock:
+            self._tender_cache[key] = vector
+            if len(self._tender_cache) > self.TENDER_CACHE_SIZE:
+                self._tender_cache.popitem(last=False)
+        return vector
+
+    def score_proposals(self, tender, proposals: List[str]) -> np.ndarray:
+        """
+        Cosine similarity of every proposal to the tender description.
+
+        Returns:
+            Array of similarities in [0, 1], one per proposal
+        """
+        if not proposals:
+            return np.zeros(0, dtype=np.float32)
+        matrix = self.transform(proposals, tender.category)
+        return np.asarray((matrix @ self.tender_vector(tender)).todense()).ravel()
+
+    def score_bids(self, tender, bids) -> Dict[int, float]:
+        """Similarity per bid id for all bids of a tender (list of bids or a BidBatch)."""
+        if isinstance(bids, BidBatch):
+            sims = self.score_proposals(tender, bids.proposals)
+            return dict(zip(bids.ids.tolist(), sims.tolist()))
+        sims = self.score_proposals(tender, [b.technical_proposal for b in bids])
+        return {bid.id: float(sim) for bid, sim in zip(bids, sims)}
+
+    # =========================
+    # Persistence
+    # =========================
+
+    def save(self, root: str) -> str:
+        """Write the model as a new versioned artifact directory."""
+        path = os.path.join(root, ARTIFACT_NAME, self.version)
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "idf.npy"), self.idf)
+        np.save(os.path.join(path, "counts.npy"), self.counts)
+        with open(os.path.join(path, "manifest.json"), "w") as f:
+            json.dump({
+                "name": ARTIFACT_NAME,
+                "version": self.version,
+                "trained_at": self.trained_at,
+                "categories": self.categories,
+                "n_features": self.n_features
+            }, f, indent=2)
+        return path
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = False) -> "RelevanceModel":
+        """Load a model artifact directory (idf memory-mapped when mmap=True)."""
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(path, "manifest.json")) as f:
+            manifest = json.load(f)
+        return cls(
+            version=manifest["version"],
+            categories=manifest["categories"],
+            idf=np.load(os.path.join(path, "idf.npy"), mmap_mode=mmap_mode),
+            counts=np.load(os.path.join(path, "counts.npy"), mmap_mode=mmap_mode),
+            n_features=manifest["n_features"],
+            trained_at=manifest.get("trained_at")
+        )
+
+
+def fit_relevance_model(
+    documents: Iterable[Tuple[str, str]],
+    min_documents: int = 20,
+    n_features: int = N_FEATURES
+) -> RelevanceModel:
+    """
+    Learn per-category IDF weights.
+
+    Args:
+        documents: (category, text) pairs - tender descriptions and proposals
+        min_documents: Minimum documents for a category to get its own IDF row
+        n_features: Size of the hashed feature space
+
+    Returns:
+        A fitted RelevanceModel (not yet saved)
+    """
+    by_category: Dict[str, List[str]] = {}
+    for category, text in documents:
+        if text:
+            by_category.setdefault(category, []).append(text)
+    if not by_category:
+        raise ValueError("No tender descriptions or proposals available to train on")
+
+    vectorizer = _make_vectorizer(n_features)
+
+    def document_frequency(texts: List[str]) -> np.ndarray:
+        counts = vectorizer.transform(texts)
+        counts.data[:] = 1
+        return np.asarray(counts.sum(axis=0)).ravel()
+
+    def idf(df: np.ndarray, n: int) -> np.ndarray:
+        # Smoothed IDF, as in sklearn's TfidfTransformer
+        return (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+
+    categories, rows, counts = [], [], []
+    total_df = np.zeros(n_features)
+    total_n = 0
+    for category in sorted(by_category):
+        texts = by_category[category]
+        df = document_frequency(texts)
+        total_df += df
+        total_n += len(texts)
+        if len(texts) >= min_documents:
+            categories.append(category)
+            rows.append(idf(df, len(texts)))
+            counts.append(len(texts))
+
+    rows.append(idf(total_df, total_n))
+    counts.append(total_n)
+
+    idf_matrix = np.vstack(rows)
+    digest = hashlib.sha256(idf_matrix.tobytes()).hexdigest()[:8]
+    trained_at = datetime.utcnow()
+
+    return RelevanceModel(
+        version=f"{trained_at.strftime('%Y%m%d%H%M%S')}-{digest}",
+        categories=categories,
+        idf=idf_matrix,
+        counts=np.array(counts, dtype=np.int64),
+        n_features=n_features,
+        trained_at=trained_at.isoformat()
+    )
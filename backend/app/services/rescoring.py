@@ -0,0 +1,173 @@
+"""
+Selective rescoring of tenders whose stored scores went stale.
+
+A bid's vendor score depends on the vendor's stats, so when an award or a
+public rating changes them, the stored ai_score of every tender under
+evaluation that the vendor bid on is stale. vendor_tender_deps maps each
+vendor to those tenders; a stats change copies just the affected tender ids
+into rescore_queue with a single INSERT ... SELECT, and the rescoring worker
+(app.scripts.rescore_worker) drains the queue in the background.
+
+Rescoring cost is therefore proportional to the number of tenders touched by
+the change, not to the size of the database.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Iterable, List
+
+from sqlalchemy import and_, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.models import (
+    Bid,
+    RescoreRequest,
+    Tender,
+    TenderStatus,
+    VendorTenderDependency
+)
+from app.services.recommendation_jobs import requeue_recommendations
+from app.services.tender_scoring import rescore_tender
+
+logger = logging.getLogger(__name__)
+
+# Tenders whose scores are still used for evaluation
+UNDER_EVALUATION = (TenderStatus.OPEN, TenderStatus.CLOSED)
+
+
+def record_bid_dependency(db: Session, vendor_id: int, tender_id: int):
+    """Register that a tender's scores depend on a vendor (caller commits)."""
+    db.execute(
+        insert(VendorTenderDependency)
+        .values(vendor_id=vendor_id, tender_id=tender_id, created_at=datetime.utcnow())
+        .on_conflict_do_nothing()
+    )
+
+
+def sync_tender_dependencies(db: Session, tender_id: int):
+    """Re-derive a tender's dependency entries from its final bid set (on close)."""
+    db.execute(
+        insert(VendorTenderDependency)
+        .from_select(
+            ["vendor_id", "tender_id", "created_at"],
+            select(Bid.vendor_id, Bid.tender_id, literal(datetime.utcnow()))
+            .where(Bid.tender_id == tender_id)
+            .distinct()
+        )
+        .on_conflict_do_nothing()
+    )
+
+
+def drop_tender_dependencies(db: Session, tender_id: int):
+    """Remove a tender from the index once its scores are final (on award)."""
+    db.query(VendorTenderDependency).filter(
+        VendorTenderDependency.tender_id == tender_id
+    ).delete(synchronize_session=False)
+
+
+def enqueue_vendor_rescore(db: Session, vendor_ids: Iterable[int], reason: str):
+    """
+    Queue every tender under evaluation that depends on the given vendors.
+
+    Single statement. A tender already queued gets the newer request time and
+    loses any claim, so a rescore running meanwhile (which may have read the
+    old stats) does not dequeue it. Runs in the caller's transaction, so the
+    queue entry commits with the stats change.
+    """
+    vendor_ids = list(vendor_ids)
+    if not vendor_ids:
+        return
+    statement = insert(RescoreRequest)
+    db.execute(
+        statement
+        .from_select(
+            ["tender_id", "reason", "requested_at"],
+            select(
+                VendorTenderDependency.tender_id,
+                literal(reason[:200]),
+                literal(datetime.utcnow())
+            )
+            .join(Tender, Tender.id == VendorTenderDependency.tender_id)
+            .where(
+                VendorTenderDependency.vendor_id.in_(vendor_ids),
+                Tender.status.in_(UNDER_EVALUATION)
+            )
+            .distinct()
+        )
+        .on_conflict_do_update(
+            index_elements=[RescoreRequest.tender_id],
+            set_={
+                "reason": statement.excluded.reason,
+                "requested_at": statement.excluded.requested_at,
+                "claimed_at": None
+            }
+        )
+    )
+
+
+def rebuild_dependency_index(db: Session):
+    """Backfill the index from existing bids on tenders under evaluation (caller commits)."""
+    db.execute(
+        insert(VendorTenderDependency)
+        .from_select(
+            ["vendor_id", "tender_id", "created_at"],
+            select(Bid.vendor_id, Bid.tender_id, literal(datetime.utcnow()))
+            .join(Tender, Tender.id == Bid.tender_id)
+            .where(Tender.status.in_(UNDER_EVALUATION))
+            .distinct()
+        )
+        .on_conflict_do_nothing()
+    )
+
+
+def process_rescore_queue(db: Session, batch_size: int = 20) -> List[int]:
+    """
+    Rescore up to batch_size queued tenders.
+
+    A request is claimed with FOR UPDATE SKIP LOCKED and marked claimed in its
+    own short transaction, so several workers can drain the queue without
+    holding row locks while rescoring. It is dequeued only if it was not
+    requested again in the meantime; otherwise it stays queued and the
+    tender is rescored once more with the newer stats. A claim older than
+    RESCORE_CLAIM_TIMEOUT_SECONDS (dead worker) is retried.
+
+    Returns:
+        Ids of the tenders rescored
+    """
+    timeout = timedelta(seconds=get_settings().RESCORE_CLAIM_TIMEOUT_SECONDS)
+    done = []
+    for _ in range(batch_size):
+        request = db.query(RescoreRequest).filter(or_(
+            RescoreRequest.claimed_at.is_(None),
+            RescoreRequest.claimed_at < datetime.utcnow() - timeout
+        )).order_by(RescoreRequest.requested_at).with_for_update(skip_locked=True).first()
+        if request is None:
+            break
+
+        tender_id, reason, requested_at = request.tender_id, request.reason, request.requested_at
+        request.claimed_at = datetime.utcnow()
+        db.commit()
+
+        unchanged = and_(
+            RescoreRequest.tender_id == tender_id,
+            RescoreRequest.requested_at == requested_at
+        )
+        try:
+            count = rescore_tender(db, tender_id)
+            # Precomputed recommendations of the tender are stale now
+            requeue_recommendations(db, tender_id)
+            db.query(RescoreRequest).filter(unchanged).delete(synchronize_session=False)
+            db.commit()
+            done.append(tender_id)
+            logger.info(f"Rescored {count} bid(s) for tender {tender_id} ({reason})")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Rescoring tender {tender_id} failed: {e}")
+            # Keep it queued but move it to the back so it cannot block the queue
+            db.query(RescoreRequest).filter(unchanged).update(
+                {"requested_at": datetime.utcnow(), "claimed_at": None}, synchronize_session=False
+            )
+            db.commit()
+    return done
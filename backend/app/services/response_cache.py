@@ -0,0 +1,332 @@
+"""
+Per-process cache of public JSON responses with version-counter ETags.
+
+Each cached resource has a key (the awarded feed, the open-tender list, a
+tender's transparency view) whose version counter lives in cache_versions.
+Write paths call bump_versions() in their own transaction. This process
+learns the new version when that transaction commits. Other processes
+learn it from poll_versions(), which reads the counters of their cached
+keys every CACHE_VERSION_POLL_SECONDS.
+
+A response is cached under (key, query parameters) together with the
+version it was built from. Its ETag carries that version, the wall-clock
+time the body stops being valid (a tender deadline passing,
+RESPONSE_CACHE_SECONDS elapsing), and digests of the key and parameters
+and of the body. While the version is unchanged and the entry unexpired,
+a matching If-None-Match gets 304 and other requests get the stored body.
+Neither touches the database.
+
+An If-None-Match naming the current version of the same key and
+parameters, with an expiry still in the future, also gets 304 when this
+process has no entry (evicted, or built by another worker). At most the
+version counter is read; the body is not rebuilt. After the expiry, the
+body is rebuilt and a tag with the same version and body digest still
+matches.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.models import CacheVersion
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+AWARDED_FEED = "awarded_feed"
+OPEN_TENDERS = "open_tenders"
+
+def tender_key(tender_id: int) -> str:
+    """Key of a tender's public transparency view."""
+    return f"tender:{tender_id}"
+
+_CACHE_SIZE = 1024
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    version: int
+    expires_at: float  # time.monotonic()
+
+
+class ETag(NamedTuple):
+    version: int
+    expires: int  # Unix time the body stops being valid
+    scope: str  # digest of (key, params)
+    digest: str  # digest of the body
+
+    def __str__(self) -> str:
+        return f'"{self.version}-{self.expires}-{self.scope}-{self.digest}"'
+
+    @classmethod
+    def parse(cls, tag: str) -> Optional["ETag"]:
+        """An ETag from an If-None-Match entry (weak or strong), None if it is not one of ours."""
+        parts = tag.strip().removeprefix("W/").strip('"').split("-")
+        if len(parts) != 4:
+            return None
+        try:
+            return cls(int(parts[0]), int(parts[1]), parts[2], parts[3])
+        except ValueError:
+            return None
+
+
+def etag_scope(key: str, params: Hashable) -> str:
+    """Short digest identifying a response's key and query parameters (stable across processes)."""
+    return hashlib.sha1(repr((key, params)).encode()).hexdigest()[:8]
+
+
+class ResponseCache:
+    """LRU map of (key, params) -> CachedResponse plus the latest known version per key (thread-safe)."""
+
+    def __init__(self, ttl: float, size: int = _CACHE_SIZE):
+        self.ttl = ttl
+        self.size = size
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self._entries: "OrderedDict[Tuple[str, Hashable], CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.not_modified = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def version(self, key: str) -> Optional[int]:
+        with self._lock:
+            return self._versions.get(key)
+
+    def get(self, key: str, params: Hashable) -> Optional[CachedResponse]:
+        """The cached response if it was built from the current version and has not expired."""
+        with self._lock:
+            entry = self._entries.get((key, params))
+            if entry is None:
+                return None
+            if entry.version != self._versions.get(key) or time.monotonic() >= entry.expires_at:
+                del self._entries[(key, params)]
+                return None
+            self._entries.move_to_end((key, params))
+            return entry
+
+    def put(self, key: str, params: Hashable, body: bytes, version: int, max_seconds: Optional[float] = None) -> CachedResponse:
+        """Build the ETag for a response body and cache it for at most max_seconds (default: ttl)."""
+        seconds = max(0.0, self.ttl if max_seconds is None else min(self.ttl, max_seconds))
+        etag = ETag(version, int(time.time() + seconds), etag_scope(key, params), hashlib.sha1(body).hexdigest()[:16])
+        entry = CachedResponse(body, str(etag), version, time.monotonic() + seconds)
+        with self._lock:
+            self._versions.setdefault(key, version)
+            if seconds > 0 and version == self._versions[key]:
+                self._entries[(key, params)] = entry
+                self._entries.move_to_end((key, params))
+                while len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def update_versions(self, versions: Dict[str, int]):
+        """Record newer versions (never older ones) and drop the responses they outdate."""
+        with self._lock:
+            changed = set()
+            for key, version in versions.items():
+                if version > self._versions.get(key, -1):
+                    self._versions[key] = version
+                    changed.add(key)
+            if changed:
+                for cache_key in [k for k in self._entries if k[0] in changed]:
+                    del self._entries[cache_key]
+
+    def tracked_keys(self) -> List[str]:
+        """
+        Keys with at least one cached response.
+
+        Versions of other keys are forgotten, so every version this cache
+        answers with is kept current by poll_versions().
+        """
+        with self._lock:
+            keys = {key for key, _ in self._entries}
+            for key in [k for k in self._versions if k not in keys]:
+                del self._versions[key]
+            return sorted(keys)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            "entries": entries, "hits": self.hits, "not_modified": self.not_modified,
+            "revalidated": self.revalidated, "misses": self.misses
+        }
+
+
+settings = get_settings()
+response_cache = ResponseCache(settings.RESPONSE_CACHE_SECONDS)
+
+
+# =========================
+# Version counters
+# =========================
+
+_PENDING = "cache_version_bumps"
+
+
+def bump_versions(db: Session, keys: Iterable[str]):
+    """
+    Increment the version counters of cache keys in the caller's transaction.
+
+    Single statement (upsert, in key order). This process's cache picks the
+    new versions up on commit, other processes on their next poll.
+    """
+    keys = sorted(set(keys))
+    if not keys:
+        return
+    now = datetime.utcnow()
+    stmt = insert(CacheVersion).values([{"key": key, "version": 1, "updated_at": now} for key in keys])
+    rows = db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[CacheVersion.key],
+            set_={"version": CacheVersion.version + 1, "updated_at": now}
+        ).returning(CacheVersion.key, CacheVersion.version)
+    ).all()
+    db.info.setdefault(_PENDING, {}).update({key: version for key, version in rows})
+
+
+def load_versions(db: Session, keys: List[str]) -> Dict[str, int]:
+    """Current counters of the given keys (0 for keys never bumped)."""
+    versions = dict.fromkeys(keys, 0)
+    versions.update(
+        db.query(CacheVersion.key, CacheVersion.version).filter(CacheVersion.key.in_(keys)).all()
+    )
+    return versions
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_bumps(session):
+    versions = session.info.pop(_PENDING, None)
+    if versions:
+        response_cache.update_versions(versions)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_bumps(session):
+    session.info.pop(_PENDING, None)
+
+
+async def poll_versions(interval: float):
+    """Keep this process's versions current with bumps made by other processes (runs until cancelled)."""
+    while True:
+        await asyncio.sleep(interval)
+        keys = response_cache.tracked_keys()
+        if not keys:
+            continue
+        try:
+            async with AsyncSessionLocal() as db:
+                versions = await db.run_sync(load_versions, keys)
+            response_cache.update_versions(versions)
+        except Exception as e:
+            # Entries still expire after RESPONSE_CACHE_SECONDS
+            logger.warning(f"Cache version poll failed: {e}")
+
+
+# =========================
+# Conditional GET
+# =========================
+
+def _client_etags(if_none_match: Optional[str]) -> List[Optional[ETag]]:
+    """Entries of If-None-Match ("*" as None; tags not issued by this cache are left out)."""
+    if not if_none_match:
+        return []
+    tags = []
+    for tag in if_none_match.split(","):
+        if tag.strip() == "*":
+            tags.append(None)
+        elif (etag := ETag.parse(tag)) is not None:
+            tags.append(etag)
+    return tags
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match names this response; the expiry is ignored, as the body is current."""
+    current = ETag.parse(etag)
+    return any(
+        tag is None or (tag.version, tag.scope, tag.digest) == (current.version, current.scope, current.digest)
+        for tag in _client_etags(if_none_match)
+    )
+
+
+def _unexpired_etag(if_none_match: Optional[str], version: int, scope: str) -> Optional[ETag]:
+    """A client ETag for this version, key and parameters whose body is still valid."""
+    now = time.time()
+    for tag in _client_etags(if_none_match):
+        if tag is not None and tag.version == version and tag.scope == scope and tag.expires > now:
+            return tag
+    return None
+
+
+def _headers(etag: str, private: bool) -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"{'private' if private else 'public'}, max-age={settings.RESPONSE_CACHE_MAX_AGE}"
+    }
+
+
+def _respond(request: Request, entry: CachedResponse, private: bool) -> Response:
+    headers = _headers(entry.etag, private)
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        response_cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+async def cached_json(
+    request: Request,
+    db: AsyncSession,
+    key: str,
+    params: Hashable,
+    build: Callable[[], Awaitable[Tuple[Any, Optional[float]]]],
+    private: bool = False
+) -> Response:
+    """
+    Serve a JSON response from the cache, or build and cache it.
+
+    Args:
+        key: Cache key whose version the response depends on
+        params: Hashable query parameters distinguishing responses of the key
+        build: Returns (payload, max_seconds): how long the payload stays
+            valid (None: RESPONSE_CACHE_SECONDS, 0: do not cache it)
+        private: Response depends on the caller (Cache-Control: private)
+
+    Returns:
+        304 if If-None-Match names the current version and body (or an
+        unexpired body of the current version), else the JSON body
+    """
+    entry = response_cache.get(key, params)
+    if entry is not None:
+        response_cache.hits += 1
+        return _respond(request, entry, private)
+
+    # Read the version before the data: a bump in between leaves the entry already outdated
+    version = response_cache.version(key)
+    if version is None:
+        version = (await db.run_sync(load_versions, [key]))[key]
+    # No local entry, but the client's copy is still current: nothing to rebuild
+    etag = _unexpired_etag(request.headers.get("if-none-match"), version, etag_scope(key, params))
+    if etag is not None:
+        response_cache.revalidated += 1
+        return Response(status_code=304, headers=_headers(str(etag), private))
+
+    response_cache.misses += 1
+    payload, max_seconds = await build()
+    body = JSONResponse(jsonable_encoder(payload)).body
+    entry = response_cache.put(key, params, body, version, max_seconds)
+    return _respond(request, entry, private)
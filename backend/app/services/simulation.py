@@ -0,0 +1,321 @@
+"""
+What-if weight simulation for a tender's recommendations.
+
+Only the final combination step of AIEngine scoring depends on the
+price/vendor/technical weights: the component scores, the number of success
+conditions met and the anomaly flag do not. ComponentMatrix computes those
+once per tender and caches them, so any number of weight vectors can be
+evaluated with one vectorised pass over a (scenarios x bids) score matrix:
+
+    base = W @ C.T, clipped to each bid's condition range,
+    minus the anomaly penalty, rounded as the engine rounds
+
+Nothing is written to the database; stored scores and rankings are untouched.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.models import Bid, Tender
+from app.services.ai_engine import AIEngine
+from app.services.bid_batch import BidBatch
+from app.services.bid_snapshot import load_bid_batch
+from app.services.model_registry import ScoringBundle, get_scoring_bundle
+from app.services.ranking import top_positions
+from app.services.vendor_features import load_vendor_features
+
+logger = logging.getLogger(__name__)
+
+# Column order of the component matrix and of every weight vector
+COMPONENTS = ("price", "vendor", "technical")
+
+# Cells of the (bids x scenarios) score matrix evaluated at once
+SCORE_CHUNK_CELLS = 2_000_000
+
+# Fixed score given to bids the engine fails to score (see AIEngine.score_bid)
+FALLBACK_SCORE = 50.0
+
+
+class ComponentMatrix:
+    """
+    Weight-independent scoring inputs for every scorable bid of a tender.
+
+    Columns:
+        bid_ids, vendor_ids: int64
+        components: float64 (bids x 3), unrounded price/vendor/technical scores
+        conditions_met: int8
+        anomaly, failed: bool
+    """
+
+    def __init__(
+        self,
+        tender_id: int,
+        version: str,
+        bid_ids: Sequence[int],
+        vendor_ids: Sequence[int],
+        components: Sequence[Sequence[float]],
+        conditions_met: Sequence[int],
+        anomaly: Sequence[bool],
+        failed: Sequence[bool]
+    ):
+        self.tender_id = tender_id
+        self.version = version
+        self.bid_ids = np.asarray(bid_ids, dtype=np.int64)
+        self.vendor_ids = np.asarray(vendor_ids, dtype=np.int64)
+        self.components = np.asarray(components, dtype=np.float64).reshape(-1, len(COMPONENTS))
+        self.conditions_met = np.asarray(conditions_met, dtype=np.int8)
+        self.anomaly = np.asarray(anomaly, dtype=bool)
+        self.failed = np.asarray(failed, dtype=bool)
+
+        # Contiguous per-component columns for the scenario products
+        self._columns = np.ascontiguousarray(self.components.T)
+        ranges = np.array([AIEngine.SCORE_RANGES[c] for c in range(4)], dtype=np.float64)
+        self.low = ranges[self.conditions_met, 0]
+        self.high = ranges[self.conditions_met, 1]
+
+    def __len__(self) -> int:
+        return len(self.bid_ids)
+
+    @classmethod
+    def build(cls, tender: Tender, batch: BidBatch, vendors: Dict, bundle: ScoringBundle) -> "ComponentMatrix":
+        """Score the weight-independent parts of every bid once (bids without a vendor are skipped)."""
+        params = AIEngine._params(bundle)
+        relevance = AIEngine._score_relevance(tender, batch, bundle)
+        bid_ids, vendor_ids, components, conditions, anomaly, failed = [], [], [], [], [], []
+        for bid in batch:
+            vendor = vendors.get(bid.vendor_id)
+            if not vendor:
+                logger.warning(f"Vendor {bid.vendor_id} not found for bid {bid.id}")
+                continue
+            try:
+                c = AIEngine._score_components(
+                    bid, tender, vendor, batch, bundle, params, relevance.get(bid.id)
+                )
+                row = (c["price_score"], c["vendor_score"], c["technical_score"])
+                met, flagged, error = c["conditions_met"], c["anomaly_flag"], False
+            except Exception as e:
+                logger.error(f"Error scoring bid {bid.id}: {str(e)}")
+                row, met, flagged, error = (FALLBACK_SCORE,) * 3, 0, True, True
+            bid_ids.append(bid.id)
+            vendor_ids.append(bid.vendor_id)
+            components.append(row)
+            conditions.append(met)
+            anomaly.append(flagged)
+            failed.append(error)
+        return cls(
+            tender.id, AIEngine.score_version(bundle), bid_ids, vendor_ids,
+            components, conditions, anomaly, failed
+        )
+
+    def scores(self, weights: np.ndarray, anomaly_penalty: float) -> np.ndarray:
+        """
+        Final AI scores for every bid under every weight vector.
+
+        Args:
+            weights: (scenarios x 3) price/vendor/technical weights
+            anomaly_penalty: Points subtracted from flagged bids
+
+        Returns:
+            (scenarios x bids) array, rounded to 2 decimals
+        """
+        weights = np.asarray(weights, dtype=np.float64).reshape(-1, len(COMPONENTS))
+        # Accumulated component by component, in the engine's order, so the
+        # baseline weights reproduce score_bid exactly (a BLAS product may
+        # reorder the sums)
+        scores = weights[:, :1] * self._columns[0]
+        for j in range(1, len(COMPONENTS)):
+            scores += weights[:, j:j + 1] * self._columns[j]
+
+        np.clip(scores, self.low, self.high, out=scores)
+        if self.anomaly.any():
+            scores[:, self.anomaly] = np.maximum(0, scores[:, self.anomaly] - anomaly_penalty)
+        scores[:, self.failed] = FALLBACK_SCORE
+        return np.round(scores, 2, out=scores)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (
+            self.bid_ids, self.vendor_ids, self.components, self.conditions_met,
+            self._columns, self.anomaly, self.failed, self.low, self.high
+        ))
+
+
+# =========================
+# Per-process matrix cache
+# =========================
+
+_CACHE_SIZE = 256
+_cache: "OrderedDict[Tuple, Tuple[float, ComponentMatrix]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_component_matrix(db: Session, tender: Tender, bundle: Optional[ScoringBundle] = None) -> ComponentMatrix:
+    """
+    Component matrix for a tender, cached per process.
+
+    Entries are keyed by scoring version and the tender's bid count and latest
+    bid id, so new bids or a new model rebuild the matrix; vendor feature
+    refreshes are picked up once the entry is SIMULATION_CACHE_SECONDS old.
+    """
+    bundle = bundle or get_scoring_bundle()
+    count, last_id = db.query(func.count(Bid.id), func.max(Bid.id)).filter(
+        Bid.tender_id == tender.id
+    ).one()
+    key = (tender.id, bundle.version, count, last_id)
+    ttl = get_settings().SIMULATION_CACHE_SECONDS
+
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            _cache.move_to_end(key)
+            return entry[1]
+
+    batch = load_bid_batch(db, tender)
+    vendors = load_vendor_features(db, batch.vendor_ids.tolist())
+    matrix = ComponentMatrix.build(tender, batch, vendors, bundle)
+
+    with _cache_lock:
+        _cache[key] = (time.monotonic(), matrix)
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return matrix
+
+
+# =========================
+# Scenarios
+# =========================
+
+def normalize_weights(weights: np.ndarray) -> np.ndarray:
+    """Scale each weight vector to sum to 1 (rows summing to 0 are rejected)."""
+    weights = np.asarray(weights, dtype=np.float64).reshape(-1, len(COMPONENTS))
+    totals = weights.sum(axis=1, keepdims=True)
+    if (weights < 0).any() or (totals <= 0).any():
+        raise ValueError("Weights must be non-negative with a positive sum")
+    return weights / totals
+
+
+def grid_weights(values: Dict[str, Sequence[float]]) -> np.ndarray:
+    """Cartesian product of candidate values per component (not normalized)."""
+    return np.array(list(itertools.product(*(values[name] for name in COMPONENTS))), dtype=np.float64)
+
+
+def sweep_weights(base: Sequence[float], component: str, start: float, stop: float, steps: int) -> np.ndarray:
+    """
+    Vary one component's weight from start to stop; the other two keep their
+    relative proportions from base and share the remainder.
+    """
+    base = np.asarray(base, dtype=np.float64)
+    j = COMPONENTS.index(component)
+    others = np.delete(base, j)
+    share = others / others.sum() if others.sum() > 0 else np.full(len(others), 1 / len(others))
+
+    values = np.linspace(start, stop, steps)
+    weights = np.empty((steps, len(COMPONENTS)))
+    weights[:, j] = values
+    weights[:, [i for i in range(len(COMPONENTS)) if i != j]] = np.outer(1 - values, share)
+    return weights
+
+
+def baseline_weights(bundle: ScoringBundle) -> Tuple[np.ndarray, float]:
+    """Configured weights and anomaly penalty from the scoring bundle."""
+    params = AIEngine._params(bundle)
+    weights = np.array([params["PRICE_WEIGHT"], params["VENDOR_WEIGHT"], params["TECHNICAL_WEIGHT"]])
+    return weights, params["ANOMALY_PENALTY"]
+
+
+class Simulation(NamedTuple):
+    baseline: Dict         # weights and top bids under the configured weights
+    scenarios: List[Dict]  # weights and top bids per scenario, in request order
+    summary: List[Dict]    # rank spread of the baseline top bids across scenarios
+    winners: List[Dict]    # how often each bid ranks first, most frequent first
+
+
+def simulate(
+    matrix: ComponentMatrix,
+    weights: np.ndarray,
+    baseline: np.ndarray,
+    anomaly_penalty: float,
+    top_k: int = 5
+) -> Simulation:
+    """
+    Rank a tender's bids under every weight vector in one pass.
+
+    Args:
+        matrix: The tender's cached component matrix
+        weights: (scenarios x 3) weight vectors, already normalized
+        baseline: Configured weight vector the scenarios are compared against
+        anomaly_penalty: Points subtracted from flagged bids in every scenario
+        top_k: Bids reported per scenario
+
+    Returns:
+        Simulation with the top bids per scenario and a sensitivity summary
+    """
+    weights = np.asarray(weights, dtype=np.float64).reshape(-1, len(COMPONENTS))
+    n, k = len(matrix), min(top_k, len(matrix))
+
+    def as_dict(w: np.ndarray) -> Dict:
+        return {name: round(float(v), 4) for name, v in zip(COMPONENTS, w)}
+
+    def top_bids(scores: np.ndarray) -> List[Dict]:
+        return [
+            {
+                "rank": rank,
+                "bid_id": int(matrix.bid_ids[i]),
+                "vendor_id": int(matrix.vendor_ids[i]),
+                "ai_score": float(scores[i])
+            }
+            for rank, i in enumerate(top_positions(scores, k).tolist(), start=1)
+        ]
+
+    baseline_scores = matrix.scores(baseline, anomaly_penalty)[0]
+    tracked = top_positions(baseline_scores, k).tolist()
+
+    # Scenarios are scored a chunk at a time to bound the score matrix
+    chunk = max(1, SCORE_CHUNK_CELLS // max(n, 1))
+    scenarios = []
+    first = np.zeros(len(weights), dtype=np.int64)
+    ranks = np.zeros((len(tracked), len(weights)), dtype=np.int64)
+    for lo in range(0, len(weights), chunk):
+        hi = min(lo + chunk, len(weights))
+        scores = matrix.scores(weights[lo:hi], anomaly_penalty)
+        scenarios.extend(
+            {"weights": as_dict(weights[s]), "top": top_bids(scores[s - lo])}
+            for s in range(lo, hi)
+        )
+        # argmax picks the first of equal scores, matching the ranking's tie order
+        first[lo:hi] = np.argmax(scores, axis=1)
+        # Rank of each baseline top bid: bids scoring higher, plus equal
+        # scores earlier in the tender
+        for t, i in enumerate(tracked):
+            own = scores[:, i:i + 1]
+            ranks[t, lo:hi] = (scores > own).sum(axis=1) + (scores[:, :i] == own).sum(axis=1) + 1
+
+    summary = [
+        {
+            "bid_id": int(matrix.bid_ids[i]),
+            "baseline_rank": t + 1,
+            "best_rank": int(ranks[t].min()) if len(weights) else t + 1,
+            "worst_rank": int(ranks[t].max()) if len(weights) else t + 1,
+            "in_top_k": int((ranks[t] <= k).sum())
+        }
+        for t, i in enumerate(tracked)
+    ]
+
+    bids, wins = np.unique(first, return_counts=True)
+    winners = [
+        {"bid_id": int(matrix.bid_ids[i]), "wins": int(w)}
+        for i, w in sorted(zip(bids.tolist(), wins.tolist()), key=lambda x: (-x[1], x[0]))
+    ]
+
+    baseline_result = {"weights": as_dict(baseline), "top": top_bids(baseline_scores)}
+    return Simulation(baseline_result, scenarios, summary, winners)
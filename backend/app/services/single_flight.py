@@ -0,0 +1,87 @@
+"""
+Request coalescing ("single flight") for expensive per-key computations.
+
+When several callers ask for the same key at once, the first one runs the
+computation and the others block until it finishes and receive the same
+result (or exception). Nothing is cached: once the call completes, the next
+caller for the key starts a new computation.
+
+advisory_xact_lock() extends this across worker processes with a Postgres
+transaction-level advisory lock, so only one process at a time runs the
+locked section for a key.
+"""
+
+import threading
+import zlib
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn() unless a call for key is already in flight, then share its outcome.
+
+        Returns:
+            (result, shared) where shared is True if the result came from
+            another caller's execution
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+def lock_key(name: str) -> int:
+    """Stable 31-bit advisory lock namespace for a name."""
+    return zlib.crc32(name.encode()) & 0x7FFFFFFF
+
+
+def advisory_xact_lock(db: Session, namespace: int, key: int):
+    """
+    Wait for pg_advisory_xact_lock(namespace, key) in the session's transaction.
+
+    The database releases the lock when the caller commits or rolls back.
+    A no-op on databases other than Postgres.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(:namespace, :key)"), {"namespace": namespace, "key": key})
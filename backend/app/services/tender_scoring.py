@@ -0,0 +1,271 @@
+"""
+Scoring a tender's bids and persisting the results.
+
+Shared by the recommendations endpoint and the background rescoring worker,
+so both load inputs and write scores the same way.
+"""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.config import get_settings
+from app.db.models import Bid, Tender
+from app.services.ai_engine import AIEngine
+from app.services.ai_engine_enhanced import EnhancedAIEngine
+from app.services.bid_batch import BidBatch
+from app.services.bid_snapshot import load_bid_batch
+from app.services.model_registry import ScoringBundle, get_scoring_bundle
+from app.services.single_flight import SingleFlight, advisory_xact_lock, lock_key
+from app.services.vendor_features import load_vendor_features
+
+logger = logging.getLogger(__name__)
+
+# Used only for on-demand explanations (mode from AI_ENGINE_MODE)
+_explanation_engine = EnhancedAIEngine()
+
+# Bid columns written from a recommendation
+SCORE_COLUMNS = (
+    "ai_score", "price_score", "vendor_score", "technical_score",
+    "anomaly_flag", "anomaly_reason", "score_version"
+)
+
+
+class TenderScores(NamedTuple):
+    recommendations: List[Dict]  # requested page of the ranking
+    scores: List[Dict]           # bid_id + score columns for every scored bid
+    total: int                   # number of ranked bids
+
+
+class ScoredTender(NamedTuple):
+    batch: BidBatch
+    scored: List[Tuple]          # (bid, vendor, scores) per scored bid, in batch order
+    bundle: ScoringBundle
+    detail: str                  # detail level the scores were computed with
+    scores: List[Dict]           # bid_id + score columns for every scored bid
+
+
+def score_all(
+    db: Session,
+    tender: Tender,
+    bids: Union[List[Bid], BidBatch],
+    detail: str = AIEngine.DETAIL_LEAN,
+    bundle: Optional[ScoringBundle] = None
+) -> ScoredTender:
+    """Score every bid of a tender using precomputed vendor features (one bulk query)."""
+    batch = BidBatch.coerce(bids)
+    vendor_ids = batch.vendor_ids.tolist()
+    vendors = load_vendor_features(db, vendor_ids)
+
+    missing_vendors = [vid for vid in vendor_ids if vid not in vendors]
+    if missing_vendors:
+        logger.warning(f"Missing vendors for IDs: {missing_vendors}")
+
+    # One snapshot for the whole tender
+    bundle = bundle or get_scoring_bundle()
+    score_version = AIEngine.score_version(bundle)
+    scored = AIEngine.score_bids(tender, batch, vendors, bundle, detail)
+    scores = [
+        {"bid_id": bid.id, **values, "score_version": score_version}
+        for bid, _, values in scored
+    ]
+    return ScoredTender(batch, scored, bundle, detail, scores)
+
+
+def rank_page(
+    tender: Tender,
+    result: ScoredTender,
+    detail: str = AIEngine.DETAIL_FULL,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    top_k: Optional[int] = None
+) -> TenderScores:
+    """Build the requested page of the ranking from scored bids."""
+    recommendations = AIEngine.rank_recommendations(
+        tender, result.batch, result.scored, result.bundle,
+        detail, offset, limit, top_k, result.detail
+    )
+    return TenderScores(recommendations, result.scores, len(result.scored))
+
+
+def score_tender(
+    db: Session,
+    tender: Tender,
+    bids: Union[List[Bid], BidBatch],
+    detail: str = AIEngine.DETAIL_FULL,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    top_k: Optional[int] = None
+) -> TenderScores:
+    """
+    Score all bids of a tender using precomputed vendor features (one bulk query).
+
+    Every bid is scored (for persistence and correct ranks), but response rows
+    are built only for the requested page of the ranking.
+    """
+    scored_detail = AIEngine.scoring_detail(detail, limit, top_k)
+    return rank_page(tender, score_all(db, tender, bids, scored_detail), detail, offset, limit, top_k)
+
+
+# Concurrent requests for the same tender and scoring version share one pass
+_flights = SingleFlight()
+_LOCK_NAMESPACE = lock_key("tender_scoring")
+
+
+def score_tender_shared(
+    db: Session,
+    tender: Tender,
+    bids: Union[List[Bid], BidBatch],
+    detail: str = AIEngine.DETAIL_FULL,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    top_k: Optional[int] = None,
+    persist: bool = True
+) -> TenderScores:
+    """
+    score_tender for request handlers, persisting the changed scores.
+
+    Concurrent callers for the same tender and scoring version in this process
+    wait for a single scoring pass and write, then each builds its own page
+    from the shared scores. With RECOMMENDATION_ADVISORY_LOCK, the pass also
+    holds a Postgres advisory lock on the tender, so workers in other processes
+    score it one at a time (and, as writes are diff-only, the later ones write
+    nothing). With persist=False (awarded tenders, whose stored scores are
+    final) the ranking is only computed for the response.
+    """
+    bundle = get_scoring_bundle()
+
+    def compute() -> ScoredTender:
+        if get_settings().RECOMMENDATION_ADVISORY_LOCK:
+            advisory_xact_lock(db, _LOCK_NAMESPACE, tender.id)
+        # Full detail, so unpaginated full requests need no second pass
+        result = score_all(db, tender, bids, AIEngine.DETAIL_FULL, bundle)
+        # Other callers read the vendor rows after this session commits
+        for _, vendor, _ in result.scored:
+            if vendor in db:
+                db.expunge(vendor)
+        if persist:
+            apply_scores(db, result.batch, result.scores)
+        db.commit()
+        return result
+
+    result, _ = _flights.do((tender.id, AIEngine.score_version(bundle), persist), compute)
+    return rank_page(tender, result, detail, offset, limit, top_k)
+
+
+def explain_bid(db: Session, tender: Tender, bid: Bid) -> Optional[Dict]:
+    """
+    Full explanation of one bid's score, computed on demand.
+
+    The rest of the tender is loaded as a lean BidBatch (prices and timelines
+    only) for the comparative parts; only this bid's proposal text is read.
+    The rules-engine breakdown explains the stored score; the enhanced
+    engine's insights and per-component analysis are added alongside.
+
+    Returns:
+        None if the bid's vendor no longer exists
+    """
+    context = load_bid_batch(db, tender)
+    vendor = load_vendor_features(db, [bid.vendor_id]).get(bid.vendor_id)
+    if vendor is None:
+        return None
+
+    bundle = get_scoring_bundle()
+    scores = AIEngine.score_bid(bid, tender, vendor, context, bundle, explain=True)
+    analysis = _explanation_engine.score_bid(bid, tender, vendor, context, bundle)
+
+    return {
+        "bid_id": bid.id,
+        "tender_id": tender.id,
+        "vendor_id": vendor.id,
+        "vendor_name": vendor.name,
+        "proposed_price": bid.proposed_price,
+        "delivery_timeline": bid.delivery_timeline,
+        **scores,
+        "stored_ai_score": bid.ai_score,
+        "score_version": AIEngine.score_version(bundle),
+        "analysis": {
+            "insights": analysis.get("insights"),
+            "breakdown": analysis.get("breakdown"),
+            "risk_score": analysis.get("risk_score")
+        }
+    }
+
+
+def score_values(rec: Dict) -> Dict:
+    """Stored score columns for one recommendation, as plain Python values."""
+    values = {c: rec[c] for c in SCORE_COLUMNS}
+    for key in ("ai_score", "price_score", "vendor_score", "technical_score"):
+        if values[key] is not None:
+            values[key] = float(values[key])
+    values["anomaly_flag"] = bool(values["anomaly_flag"])
+    return values
+
+
+def scores_changed(stored: Dict, values: Dict) -> bool:
+    return any(stored.get(c) != values[c] for c in SCORE_COLUMNS)
+
+
+def _stored_scores(db: Session, bids: Union[List[Bid], BidBatch]) -> Dict[int, Dict]:
+    """Currently stored score columns per bid id."""
+    if isinstance(bids, BidBatch):
+        rows = db.query(Bid.id, *[getattr(Bid, c) for c in SCORE_COLUMNS]).filter(
+            Bid.tender_id == bids.tender_id
+        )
+        return {row[0]: dict(zip(SCORE_COLUMNS, row[1:])) for row in rows}
+    return {bid.id: {c: getattr(bid, c) for c in SCORE_COLUMNS} for bid in bids}
+
+
+def apply_scores(db: Session, bids: Union[List[Bid], BidBatch], recommendations: List[Dict]) -> int:
+    """
+    Persist recommendation scores that differ from what is stored (caller commits).
+
+    Changed rows are written with a single bulk UPDATE by primary key; when
+    nothing changed, nothing is written.
+
+    Returns:
+        Number of bids updated
+    """
+    stored = _stored_scores(db, bids)
+    changed = []
+    for rec in recommendations:
+        if rec["bid_id"] not in stored:
+            logger.error(f"Recommendation for unknown bid {rec['bid_id']}")
+            continue
+        values = score_values(rec)
+        if scores_changed(stored[rec["bid_id"]], values):
+            changed.append({"id": rec["bid_id"], **values})
+
+    if not changed:
+        return 0
+
+    db.execute(update(Bid), changed)
+    if not isinstance(bids, BidBatch):
+        # Keep the loaded objects in step without marking them dirty (no second write on flush)
+        bids_by_id = {bid.id: bid for bid in bids}
+        for row in changed:
+            for key in SCORE_COLUMNS:
+                set_committed_value(bids_by_id[row["id"]], key, row[key])
+    return len(changed)
+
+
+def rescore_tender(db: Session, tender_id: int) -> int:
+    """
+    Recompute and store scores for one tender (caller commits).
+
+    Returns:
+        Number of bids rescored
+    """
+    tender = db.query(Tender).filter(Tender.id == tender_id).first()
+    if not tender:
+        return 0
+    bids = load_bid_batch(db, tender)
+    if not bids:
+        return 0
+    # Only the stored columns are needed: score lean, build no response rows
+    result = score_tender(db, tender, bids, AIEngine.DETAIL_LEAN, limit=0)
+    apply_scores(db, bids, result.scores)
+    return result.total
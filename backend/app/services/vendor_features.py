@@ -0,0 +1,137 @@
+"""
+Materialized vendor scoring features.
+
+Vendor scores only change when a vendor's stats change (award, public rating,
+registration), so they are computed at write time and stored in
+vendor_features instead of being recomputed for every bid on every
+recommendation request.
+
+Write paths call refresh_vendor_features() before committing; scoring calls
+load_vendor_features() once per tender.
+"""
+
+import logging
+from typing import Dict, Iterable, List
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Vendor, VendorFeatures
+from app.services.ai_engine import AIEngine
+from app.services.ai_engine_enhanced import EnhancedAIEngine
+
+logger = logging.getLogger(__name__)
+
+# Bump when a vendor scoring formula changes; older rows are recomputed on read
+FEATURES_VERSION = 1
+
+_enhanced_engine = EnhancedAIEngine(mode="rule_based")
+
+
+def compute_vendor_features(vendor: Vendor) -> Dict:
+    """Derive all scoring features for a vendor from its current stats."""
+    rules_score = AIEngine._calculate_vendor_score(vendor)
+    enhanced_score, insights = _enhanced_engine._calculate_vendor_score_v2(vendor)
+
+    total_wins = vendor.total_wins or 0
+    completed = vendor.completed_projects or 0
+    reputation = vendor.reputation_score or 0
+
+    return {
+        "name": vendor.name,
+        "reputation_score": reputation,
+        "completed_projects": completed,
+        "total_wins": total_wins,
+        "average_rating": vendor.average_rating or 0,
+        "rules_vendor_score": rules_score,
+        "enhanced_vendor_score": enhanced_score,
+        "reputation_points": insights["reputation_points"],
+        "track_record_points": insights["track_record_points"],
+        "rating_points": insights["rating_points"],
+        "experience_level": insights["experience_level"],
+        "good_reputation": reputation >= 3.5 or total_wins >= 3,
+        "no_track_record": total_wins == 0 and completed == 0,
+        "limited_experience": total_wins < 2,
+        "features_version": FEATURES_VERSION
+    }
+
+
+def refresh_vendor_features(db: Session, vendors: Iterable[Vendor]) -> Dict[int, VendorFeatures]:
+    """
+    Recompute and upsert feature rows for vendors whose stats changed.
+
+    Does not commit: callers run this inside the transaction that changed the
+    stats, so features and stats are always committed together.
+    """
+    vendors = [v for v in vendors if v is not None]
+    if not vendors:
+        return {}
+
+    # Make sure new vendors have ids before rows reference them
+    if any(v.id is None for v in vendors):
+        db.flush()
+
+    existing = {
+        f.vendor_id: f
+        for f in db.query(VendorFeatures).filter(
+            VendorFeatures.vendor_id.in_([v.id for v in vendors])
+        )
+    }
+
+    refreshed = {}
+    for vendor in vendors:
+        values = compute_vendor_features(vendor)
+        features = existing.get(vendor.id)
+        if features is None:
+            features = VendorFeatures(vendor_id=vendor.id, **values)
+            db.add(features)
+        else:
+            for key, value in values.items():
+                setattr(features, key, value)
+        refreshed[vendor.id] = features
+    return refreshed
+
+
+def load_vendor_features(db: Session, vendor_ids: Iterable[int]) -> Dict[int, VendorFeatures]:
+    """
+    Load feature rows for a set of vendors in one query.
+
+    Vendors without a row (created before the table existed) or with a stale
+    features_version are backfilled with one bulk Vendor query; the new rows
+    are flushed and persist with the caller's commit.
+    """
+    vendor_ids = list(set(vendor_ids))
+    if not vendor_ids:
+        return {}
+
+    features = {
+        f.vendor_id: f
+        for f in db.query(VendorFeatures).filter(VendorFeatures.vendor_id.in_(vendor_ids))
+    }
+
+    stale = [
+        vid for vid in vendor_ids
+        if vid not in features or features[vid].features_version != FEATURES_VERSION
+    ]
+    if stale:
+        logger.info(f"Backfilling vendor features for {len(stale)} vendor(s)")
+        vendors = db.query(Vendor).filter(Vendor.id.in_(stale)).all()
+        features.update(refresh_vendor_features(db, vendors))
+        db.flush()
+
+    return features
+
+
+def rebuild_all_vendor_features(db: Session, chunk_size: int = 1000) -> int:
+    """Recompute features for every vendor in chunks; returns the number refreshed."""
+    total = 0
+    last_id = 0
+    while True:
+        vendors = db.query(Vendor).filter(
+            Vendor.id > last_id
+        ).order_by(Vendor.id).limit(chunk_size).all()
+        if not vendors:
+            return total
+        refresh_vendor_features(db, vendors)
+        db.commit()
+        total += len(vendors)
+        last_id = vendors[-1].id
@@ -0,0 +1,118 @@
+"""
+A vendor's bid history for the vendor dashboard.
+
+Pages are one projected bids-tenders join (no technical_proposal) with a
+keyset on (bid created_at, bid id), newest first; the summary is one
+aggregate query joined to each bid's tender. Both read the vendor's range of
+ix_bids_vendor_id_created_at, so neither issues a query per bid.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, tuple_
+from sqlalchemy.orm import Session
+
+from app.db.models import Bid, BidStatus, Tender, TenderStatus
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+def vendor_bid_history(
+    db: Session,
+    vendor_id: int,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of a vendor's bids with their tender, newest first.
+
+    Args:
+        limit: Page size
+        cursor: next_cursor of the previous page
+
+    Returns:
+        (items, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    query = db.query(
+        Bid.id,
+        Bid.tender_id,
+        Tender.title,
+        Tender.status,
+        Tender.deadline,
+        Bid.proposed_price,
+        Bid.delivery_timeline,
+        Bid.status,
+        Bid.ai_score,
+        Bid.created_at
+    ).outerjoin(
+        Tender, Tender.id == Bid.tender_id
+    ).filter(Bid.vendor_id == vendor_id)
+
+    if cursor:
+        created_at, bid_id = decode_cursor(cursor, 2)
+        query = query.filter(tuple_(Bid.created_at, Bid.id) < tuple_(created_at, bid_id))
+
+    # One extra row tells whether another page follows
+    rows = query.order_by(Bid.created_at.desc(), Bid.id.desc()).limit(limit + 1).all()
+    more = len(rows) > limit
+    rows = rows[:limit]
+
+    items = [{
+        "bid_id": row[0],
+        "tender_id": row[1],
+        "tender_title": row[2] or "Unknown",
+        "tender_status": row[3],
+        "tender_deadline": row[4],
+        "proposed_price": row[5],
+        "delivery_timeline": row[6],
+        "status": row[7],
+        "ai_score": row[8],
+        "submitted_at": row[9]
+    } for row in rows]
+    next_cursor = encode_cursor([rows[-1][9], rows[-1][0]]) if more else None
+    return items, next_cursor
+
+
+def vendor_bid_summary(db: Session, vendor_id: int) -> Dict:
+    """
+    Aggregates over all of a vendor's bids from a single query.
+
+    Returns:
+        total, counts per BidStatus value, win_rate (bids won over bids on
+        awarded tenders; None before any of them is awarded) and
+        avg_ai_score over scored bids (None if none are scored)
+    """
+    statuses = list(BidStatus)
+    # Losing bids keep their status when a tender is awarded: a bid is decided by its tender
+    awarded = Tender.status == TenderStatus.AWARDED
+    row = db.query(
+        func.count(Bid.id),
+        *[func.sum(case((Bid.status == status, 1), else_=0)) for status in statuses],
+        func.sum(case((awarded, 1), else_=0)),
+        func.sum(case((awarded & (Bid.status == BidStatus.ACCEPTED), 1), else_=0)),
+        func.avg(Bid.ai_score)
+    ).outerjoin(
+        Tender, Tender.id == Bid.tender_id
+    ).filter(Bid.vendor_id == vendor_id).one()
+
+    counts = {status.value: int(value or 0) for status, value in zip(statuses, row[1:-3])}
+    decided, won, avg_ai_score = int(row[-3] or 0), int(row[-2] or 0), row[-1]
+    return {
+        "total": row[0],
+        "counts": counts,
+        "win_rate": round(won / decided, 4) if decided else None,
+        "avg_ai_score": round(float(avg_ai_score), 2) if avg_ai_score is not None else None
+    }
+
+
+def vendor_open_tender_ids(db: Session, vendor_id: int) -> List[int]:
+    """Ids of the open tenders a vendor has bid on (whatever the size of its history)."""
+    return [
+        tender_id for (tender_id,) in db.query(Bid.tender_id).join(
+            Tender, Tender.id == Bid.tender_id
+        ).filter(
+            Bid.vendor_id == vendor_id, Tender.status == TenderStatus.OPEN
+        ).order_by(Bid.tender_id)
+    ]
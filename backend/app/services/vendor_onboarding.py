@@ -0,0 +1,135 @@
+"""
+Bulk vendor onboarding.
+
+Replaces one /auth/vendor/register call per vendor. The whole list is
+checked against existing vendors with a few IN queries. The caller hashes
+the passwords in parallel on a process pool. Vendors and their feature
+rows are then inserted in batches, with one flush and one commit per batch.
+
+Used by POST /gov/vendors/bulk and app.scripts.onboard_vendors.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.models import Vendor
+from app.schemas.vendor import VendorOnboardRecord
+from app.services.vendor_features import refresh_vendor_features
+
+logger = logging.getLogger(__name__)
+
+# Columns a new vendor must not share with an existing one
+UNIQUE_FIELDS = ("vendor_id", "email", "company_registration")
+
+# Values per IN (...) lookup
+_LOOKUP_CHUNK = 1000
+
+STARTING_REPUTATION = 3.0
+
+
+def _existing_values(db: Session, field: str, values: Iterable[str]) -> Set[str]:
+    values = list(set(values))
+    column = getattr(Vendor, field)
+    found = set()
+    for start in range(0, len(values), _LOOKUP_CHUNK):
+        found.update(
+            value for (value,) in db.query(column).filter(column.in_(values[start:start + _LOOKUP_CHUNK]))
+        )
+    return found
+
+
+def screen_vendors(db: Session, records: Sequence[VendorOnboardRecord]) -> Tuple[List[int], List[Dict]]:
+    """
+    Split records into those that can be inserted and those to skip.
+
+    A record is skipped if its vendor_id, email or company_registration is
+    already registered or was used by an earlier record in the list.
+
+    Returns:
+        (accepted record indexes, [{"row", "vendor_id", "reason"}] for skipped ones)
+    """
+    taken = {
+        field: _existing_values(db, field, (getattr(r, field) for r in records))
+        for field in UNIQUE_FIELDS
+    }
+    seen = {field: set() for field in UNIQUE_FIELDS}
+
+    accepted, skipped = [], []
+    for row, record in enumerate(records):
+        reason = None
+        for field in UNIQUE_FIELDS:
+            value = getattr(record, field)
+            if value in taken[field]:
+                reason = f"{field} already registered"
+                break
+            if value in seen[field]:
+                reason = f"duplicate {field} in input"
+                break
+        if reason:
+            skipped.append({"row": row, "vendor_id": record.vendor_id, "reason": reason})
+            continue
+        for field in UNIQUE_FIELDS:
+            seen[field].add(getattr(record, field))
+        accepted.append(row)
+    return accepted, skipped
+
+
+def _insert_batch(db: Session, batch: Sequence[Tuple[int, VendorOnboardRecord, str]]):
+    vendors = [
+        Vendor(
+            vendor_id=record.vendor_id,
+            name=record.name,
+            email=record.email,
+            company_registration=record.company_registration,
+            phone=record.phone,
+            address=record.address,
+            password_hash=password_hash,
+            reputation_score=STARTING_REPUTATION
+        )
+        for _, record, password_hash in batch
+    ]
+    db.add_all(vendors)
+    # Flushes the vendors (one batched INSERT) before adding their feature rows
+    refresh_vendor_features(db, vendors)
+    db.commit()
+
+
+def insert_vendors(
+    db: Session,
+    rows: Sequence[Tuple[int, VendorOnboardRecord, str]],
+    batch_size: int = 500
+) -> Tuple[int, List[Dict]]:
+    """
+    Insert screened vendors with their password hashes, committing per batch.
+
+    A batch that hits a unique constraint (a vendor registered since
+    screening) is rolled back, screened again and retried without the
+    conflicting records.
+
+    Args:
+        rows: (record index, record, password hash) for each vendor
+        batch_size: Vendors per INSERT / commit
+
+    Returns:
+        (vendors created, skipped records found at insert time)
+    """
+    created, skipped = 0, []
+    for start in range(0, len(rows), batch_size):
+        batch = list(rows[start:start + batch_size])
+        try:
+            _insert_batch(db, batch)
+        except IntegrityError:
+            db.rollback()
+            accepted, late = screen_vendors(db, [record for _, record, _ in batch])
+            for entry in late:
+                entry["row"] = batch[entry["row"]][0]
+            skipped.extend(late)
+            batch = [batch[i] for i in accepted]
+            logger.info(f"Vendor onboarding: {len(late)} record(s) registered concurrently, retrying batch")
+            if batch:
+                _insert_batch(db, batch)
+        created += len(batch)
+    return created, skipped
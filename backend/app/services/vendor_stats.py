@@ -0,0 +1,90 @@
+"""
+Atomic updates of award ratings and vendor track-record stats.
+
+Every counter and average changes with a single UPDATE ... SET x = x + ...
+that reads the current values inside the statement. Concurrent ratings and
+awards therefore never overwrite each other's increments, and a rating costs
+the same no matter how many came before. Averages are derived from the
+running sums (awards.public_rating_sum, vendors.rating_sum), so nothing
+re-reads the ratings table.
+
+The updated Vendor row is returned (RETURNING) so callers can refresh its
+vendor_features row in the same transaction. Nothing here commits.
+"""
+
+from typing import Optional, Union
+
+from sqlalchemy import ColumnElement, Float, Numeric, Row, cast, func, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import Award, Bid, Vendor
+
+
+def add_award_ratings(db: Session, award_id: int, count: int, total: int) -> Optional[Row]:
+    """
+    Add `count` public ratings summing to `total` to an award's average.
+
+    Returns:
+        (winning_bid_id, tender_id) of the award, or None if it does not exist
+    """
+    ratings = func.coalesce(Award.public_feedback_count, 0) + count
+    rating_sum = Award.public_rating_sum + total
+    return db.execute(
+        update(Award)
+        .where(Award.id == award_id)
+        .values(
+            public_feedback_count=ratings,
+            public_rating_sum=rating_sum,
+            public_rating=func.round(cast(cast(rating_sum, Float) / ratings, Numeric), 2)
+        )
+        .returning(Award.winning_bid_id, Award.tender_id)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+
+def winning_vendor_id(winning_bid_id: int) -> ColumnElement:
+    """The vendor behind a bid, as a subquery usable in place of a vendor id."""
+    return select(Bid.vendor_id).where(Bid.id == winning_bid_id).scalar_subquery()
+
+
+def add_vendor_ratings(
+    db: Session, vendor_id: Union[int, ColumnElement], count: int, total: float
+) -> Optional[Vendor]:
+    """
+    Add ratings of completed projects to a vendor's stats.
+
+    Each rating counts as a completed project, and the vendor's reputation
+    follows its average rating.
+
+    Args:
+        vendor_id: Vendor id, or winning_vendor_id(bid) to resolve it in the statement
+
+    Returns:
+        The vendor with its updated stats, or None if there is no such vendor
+    """
+    completed = func.coalesce(Vendor.completed_projects, 0) + count
+    rating_sum = Vendor.rating_sum + total
+    average = cast(rating_sum, Float) / completed
+    return db.scalars(
+        update(Vendor)
+        .where(Vendor.id == vendor_id)
+        .values(
+            completed_projects=completed,
+            rating_sum=rating_sum,
+            average_rating=average,
+            reputation_score=average
+        )
+        .returning(Vendor),
+        execution_options={"populate_existing": True}
+    ).first()
+
+
+def add_vendor_win(db: Session, vendor_id: int) -> Optional[Vendor]:
+    """Count an award won by a vendor; returns the updated vendor (None if missing)."""
+    return db.scalars(
+        update(Vendor)
+        .where(Vendor.id == vendor_id)
+        .values(total_wins=func.coalesce(Vendor.total_wins, 0) + 1)
+        .returning(Vendor),
+        execution_options={"populate_existing": True}
+    ).first()
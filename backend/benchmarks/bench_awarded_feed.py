@@ -0,0 +1,150 @@
+"""
+Benchmark: public awarded-contracts feed, per-row queries vs one keyset query.
+
+Populates an in-memory SQLite database with N awarded tenders (each with a
+winning bid and vendor) and times:
+
+    legacy      the previous endpoint: all awarded tenders, then one Award,
+                Bid and Vendor query per tender (3N+1 queries, no limit)
+    first page  awarded_feed(), newest 50
+    deep page   the page after row N-100, reached through its cursor
+    offset page the same deep page with LIMIT/OFFSET, for comparison
+    filtered    first page filtered by category and department
+
+Run inside the backend container:
+    docker-compose exec backend python -m benchmarks.bench_awarded_feed
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Award, Base, Bid, Tender, TenderStatus, Vendor
+from app.services.pagination import encode_cursor
+from app.services.public_feed import awarded_feed
+from benchmarks.synthetic import CATEGORIES, DEPARTMENTS
+
+PAGE = 50
+
+
+def _populate(session_factory, rng: random.Random, count: int, vendor_count: int = 2000):
+    db = session_factory()
+    start = datetime(2020, 1, 1)
+    db.execute(Vendor.__table__.insert(), [
+        {"id": i, "name": f"Vendor {i}", "email": f"vendor{i}@example.com", "company_registration": f"REG{i}"}
+        for i in range(1, vendor_count + 1)
+    ])
+    db.execute(Tender.__table__.insert(), [{
+        "id": i,
+        "title": f"Synthetic Tender {i}",
+        "description": "Synthetic tender description",
+        "category": rng.choice(CATEGORIES),
+        "budget": float(rng.randint(50, 5000) * 1000),
+        "department": rng.choice(DEPARTMENTS),
+        "deadline": start + timedelta(minutes=i),
+        "status": TenderStatus.AWARDED.name,
+        "creation_tx_hash": f"0x{i:064x}",
+        "award_tx_hash": f"0x{i:064x}"
+    } for i in range(1, count + 1)])
+    db.execute(Bid.__table__.insert(), [{
+        "id": i,
+        "tender_id": i,
+        "vendor_id": rng.randint(1, vendor_count),
+        "proposed_price": 1000.0,
+        "technical_proposal": "Synthetic proposal text " * 20,
+        "delivery_timeline": 60
+    } for i in range(1, count + 1)])
+    db.execute(Award.__table__.insert(), [{
+        "id": i,
+        "tender_id": i,
+        "winning_bid_id": i,
+        "justification": "Synthetic award justification for benchmarking purposes only.",
+        "award_amount": 1000.0,
+        "contract_start": start,
+        "contract_end": start + timedelta(days=365),
+        "public_feedback_count": 0,
+        # Several awards share a timestamp, so the id tie-breaker matters
+        "created_at": start + timedelta(minutes=i // 3)
+    } for i in range(1, count + 1)])
+    db.commit()
+    db.close()
+
+
+def _legacy_feed(db):
+    """The endpoint as it was: 3N+1 queries, every awarded tender at once."""
+    results = []
+    for tender in db.query(Tender).filter(Tender.status == TenderStatus.AWARDED).all():
+        award = db.query(Award).filter(Award.tender_id == tender.id).first()
+        if award:
+            winning_bid = db.query(Bid).filter(Bid.id == award.winning_bid_id).first()
+            vendor = db.query(Vendor).filter(Vendor.id == winning_bid.vendor_id).first() if winning_bid else None
+            results.append((tender.id, award.id, vendor.name if vendor else "Unknown"))
+    return results
+
+
+def _offset_page(db, offset: int):
+    return db.query(Award.id).order_by(Award.created_at.desc(), Award.id.desc()).offset(offset).limit(PAGE).all()
+
+
+def _time(session_factory, fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        db = session_factory()
+        start = time.perf_counter()
+        fn(db)
+        samples.append((time.perf_counter() - start) * 1000)
+        db.close()
+    return statistics.median(samples)
+
+
+def main(sizes, repeat: int, legacy_max: int, seed: int):
+    print(f"{'awards':>8} {'legacy (ms)':>12} {'first (ms)':>11} {'deep (ms)':>10} "
+          f"{'offset (ms)':>12} {'filtered (ms)':>14}")
+    for size in sizes:
+        rng = random.Random(seed)
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine, tables=[
+            Vendor.__table__, Tender.__table__, Bid.__table__, Award.__table__
+        ])
+        session_factory = sessionmaker(bind=engine)
+        _populate(session_factory, rng, size)
+
+        # Cursor of the row just before the last 100 awards
+        db = session_factory()
+        anchor = db.query(Award.created_at, Award.id).order_by(
+            Award.created_at.desc(), Award.id.desc()
+        ).offset(max(size - 101, 0)).first()
+        db.close()
+        deep_cursor = encode_cursor([anchor[0], anchor[1]])
+
+        legacy = (
+            f"{_time(session_factory, _legacy_feed, 1):>12.1f}" if size <= legacy_max else f"{'skipped':>12}"
+        )
+        first = _time(session_factory, lambda db: awarded_feed(db, PAGE), repeat)
+        deep = _time(session_factory, lambda db: awarded_feed(db, PAGE, deep_cursor), repeat)
+        offset = _time(session_factory, lambda db: _offset_page(db, max(size - 100, 0)), repeat)
+        filtered = _time(
+            session_factory,
+            lambda db: awarded_feed(db, PAGE, category=CATEGORIES[0], department=DEPARTMENTS[0]),
+            repeat
+        )
+        print(f"{size:>8} {legacy} {first:>11.2f} {deep:>10.2f} {offset:>12.2f} {filtered:>14.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the public awarded-contracts feed")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--legacy-max", type=int, default=10000,
+                        help="Largest size to run the 3N+1 legacy feed at")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat, args.legacy_max, args.seed)
@@ -0,0 +1,123 @@
+"""
+Benchmark: BidBatch (lean column query) vs ORM Bid objects on the scoring path.
+
+Loads a synthetic tender's bids from an in-memory SQLite database both ways
+and reports load latency, scoring latency and peak Python memory (tracemalloc)
+for each. "load MB" for the batch path is what the lean query holds before
+any scorer asks for the proposal texts.
+
+Run inside the backend container:
+    docker-compose exec backend python -m benchmarks.bench_bid_batch
+"""
+import argparse
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, Bid
+from app.services.ai_engine import AIEngine
+from app.services.ai_engine_enhanced import EnhancedAIEngine
+from app.services.bid_batch import BidBatch
+from benchmarks.synthetic import make_bids, make_tender, make_vendors
+
+
+def _measure(fn, repeat: int):
+    """
+    (median wall time in ms, peak traced memory in MB) of fn().
+
+    Timings are taken without tracing; memory comes from one extra traced run.
+    """
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(samples), peak / 1e6
+
+
+def _populate(session_factory, tender, bids):
+    db = session_factory()
+    db.bulk_insert_mappings(Bid, [{
+        "id": b.id,
+        "tender_id": tender.id,
+        "vendor_id": b.vendor_id,
+        "proposed_price": b.proposed_price,
+        "technical_proposal": b.technical_proposal,
+        "delivery_timeline": b.delivery_timeline
+    } for b in bids])
+    db.commit()
+    db.close()
+
+
+def main(sizes, repeat: int, seed: int):
+    rng = random.Random(seed)
+    # One bid per vendor, as uq_bids_tender_id_vendor_id requires
+    vendors = make_vendors(rng, max(sizes))
+    enhanced = EnhancedAIEngine(mode="rule_based")
+
+    print(f"{'bids':>8} {'path':>6} {'load (ms)':>10} {'load MB':>8} "
+          f"{'rules (ms)':>11} {'enhanced (ms)':>14} {'load+score MB':>14}")
+    for size in sizes:
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine, tables=[Bid.__table__])
+        session_factory = sessionmaker(bind=engine)
+        tender = make_tender(rng, 1)
+        _populate(session_factory, tender, make_bids(rng, tender, vendors, size))
+
+        def orm_load():
+            db = session_factory()
+            bids = db.query(Bid).filter(Bid.tender_id == tender.id).all()
+            db.close()
+            return bids
+
+        def batch_load():
+            db = session_factory()
+            batch = BidBatch.load(db, tender.id)
+            return db, batch
+
+        def orm_score(score):
+            return lambda: score(orm_load())
+
+        def batch_score(score):
+            def run():
+                db, batch = batch_load()
+                score(batch)
+                db.close()
+            return run
+
+        rules = lambda bids: AIEngine.get_recommendations(tender.id, bids, vendors, tender)
+        enh = lambda bids: enhanced.get_recommendations(tender.id, bids, vendors, tender)
+
+        for name, load, wrap in (
+            ("orm", orm_load, orm_score),
+            ("batch", lambda: batch_load()[0].close(), batch_score)
+        ):
+            load_ms, load_mb = _measure(load, repeat)
+            rules_ms, rules_mb = _measure(wrap(rules), repeat)
+            enh_ms, enh_mb = _measure(wrap(enh), repeat)
+            print(f"{size:>8} {name:>6} {load_ms:>10.1f} {load_mb:>8.2f} "
+                  f"{rules_ms:>11.1f} {enh_ms:>14.1f} {max(rules_mb, enh_mb):>14.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark BidBatch against ORM bids")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat, args.seed)
@@ -0,0 +1,100 @@
+"""
+Benchmark: fair-price model inference cost on the recommendations path.
+
+Times AIEngine.get_recommendations for synthetic tenders with the price model
+disabled and enabled; the difference is the latency the model adds to
+GET /gov/tenders/{id}/recommendations. Lean detail is the pass that scores
+every bid (rescoring, paginated requests); its fair prices come from one
+predict_log_many call per tender. Full detail also builds each bid's
+fair-price band. Also reports raw per-bid and per-tender (vectorised)
+inference times.
+
+Run inside the backend container:
+    docker-compose exec backend python -m benchmarks.bench_price_model
+"""
+import argparse
+import random
+import statistics
+import time
+
+import numpy as np
+
+from app.services.ai_engine import AIEngine
+from app.services.model_registry import ScoringBundle, get_registry
+from app.services.price_model import fit_price_model
+from benchmarks.synthetic import make_award_rows, make_bids, make_tender, make_vendors
+
+
+def _time(fn, repeat: int) -> float:
+    """Median wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _time_pair(run, bundles, repeat: int):
+    """Median wall time (ms) of run() under each bundle, alternating them so drift hits both alike."""
+    registry = get_registry()
+    samples = [[] for _ in bundles]
+    for _ in range(repeat):
+        for i, bundle in enumerate(bundles):
+            registry.pin(bundle)
+            start = time.perf_counter()
+            run()
+            samples[i].append((time.perf_counter() - start) * 1000)
+    return [statistics.median(s) for s in samples]
+
+
+def main(sizes, repeat: int, seed: int):
+    rng = random.Random(seed)
+    registry = get_registry()
+
+    start = time.perf_counter()
+    model = fit_price_model(make_award_rows(rng, 20000))
+    print(f"Trained on 20000 synthetic awards in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({len(model.categories)} category models)")
+
+    tender = make_tender(rng)
+    vendors = make_vendors(rng, 200)
+
+    # Raw inference cost
+    n = 100000
+    start = time.perf_counter()
+    for _ in range(n):
+        model.predict_log(tender.category, tender.department, tender.budget, 90)
+    per_bid_us = (time.perf_counter() - start) / n * 1e6
+    timelines = np.random.default_rng(seed).integers(5, 400, 10000)
+    per_tender_ms = _time(
+        lambda: model.predict_log_many(tender.category, tender.department, tender.budget, timelines),
+        repeat
+    )
+    print(f"predict_log: {per_bid_us:.2f} µs/bid | "
+          f"predict_log_many: {per_tender_ms:.3f} ms per 10000-bid tender")
+    print()
+
+    print(f"{'detail':>6} {'bids':>8} {'no model (ms)':>14} {'with model (ms)':>16} {'delta (ms)':>11} {'delta %':>8}")
+    for detail in (AIEngine.DETAIL_LEAN, AIEngine.DETAIL_FULL):
+        for size in sizes:
+            bids = make_bids(rng, tender, vendors, size)
+            run = lambda: AIEngine.get_recommendations(tender.id, bids, vendors, tender, detail=detail)
+            baseline, with_model = _time_pair(
+                run, [ScoringBundle(), ScoringBundle(price_model=model)], repeat
+            )
+
+            delta = with_model - baseline
+            print(f"{detail:>6} {size:>8} {baseline:>14.2f} {with_model:>16.2f} {delta:>11.3f} "
+                  f"{delta / baseline * 100:>7.1f}%")
+
+    registry.unpin()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fair-price model inference")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 10, 100, 500])
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat, args.seed)
@@ -0,0 +1,66 @@
+"""
+Benchmark: TF-IDF relevance scoring cost on the recommendations path.
+
+Fits a relevance model on a synthetic corpus, then times scoring every
+proposal of a tender against its description (one sparse matrix product),
+with the description vector both cold and cached.
+
+Run inside the backend container:
+    docker-compose exec backend python -m benchmarks.bench_relevance
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.services.relevance import fit_relevance_model
+from benchmarks.synthetic import make_bids, make_tender, make_vendors
+
+
+def _time(fn, repeat: int) -> float:
+    """Median wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(sizes, repeat: int, seed: int):
+    rng = random.Random(seed)
+    vendors = make_vendors(rng, 200)
+
+    corpus = []
+    for tender_id in range(200):
+        tender = make_tender(rng, tender_id)
+        corpus.append((tender.category, tender.description))
+        corpus.extend((tender.category, b.technical_proposal) for b in make_bids(rng, tender, vendors, 10))
+
+    start = time.perf_counter()
+    model = fit_relevance_model(corpus)
+    print(f"Fitted on {len(corpus)} documents in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({len(model.categories)} category models)")
+    print()
+
+    print(f"{'bids':>8} {'cold (ms)':>10} {'cached (ms)':>12} {'per bid (µs)':>13}")
+    for size in sizes:
+        tender = make_tender(rng, 10000 + size)
+        bids = make_bids(rng, tender, vendors, size)
+
+        def cold():
+            model._tender_cache.clear()
+            model.score_bids(tender, bids)
+
+        cold_ms = _time(cold, repeat)
+        cached_ms = _time(lambda: model.score_bids(tender, bids), repeat)
+        print(f"{size:>8} {cold_ms:>10.2f} {cached_ms:>12.2f} {cached_ms / size * 1000:>13.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TF-IDF relevance scoring")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat, args.seed)
@@ -0,0 +1,303 @@
+"""
+Benchmark suite: scoring engines and their components from 10 to 1M bids.
+
+Everything is synthetic and in memory (no database). For every size, both
+engines are timed end to end (get_recommendations on a fresh BidBatch, vendor
+features precomputed as in production) and component by component (price,
+fair-price model, vendor, technical, relevance, risk, anomaly detection,
+per-batch statistics). Each measurement reports median latency, throughput
+and peak traced memory.
+
+A log-log fit of latency against bid count over the larger sizes gives a
+scaling exponent per measurement; anything above --superlinear (default 1.2)
+is flagged. Results are written as JSON to benchmarks/results/ so runs can be
+compared; pass --compare to diff against an earlier file.
+
+Run inside the backend container:
+    docker-compose exec backend python -m benchmarks.bench_scoring
+    docker-compose exec backend python -m benchmarks.bench_scoring --max-size 10000
+    docker-compose exec backend python -m benchmarks.bench_scoring --compare benchmarks/results/<file>.json
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.db.models import VendorFeatures
+from app.services.ai_engine import AIEngine
+from app.services.ai_engine_enhanced import EnhancedAIEngine
+from app.services.bid_batch import BidBatch
+from app.services.model_registry import ScoringBundle, get_registry
+from app.services.price_model import fit_price_model
+from app.services.relevance import fit_relevance_model
+from app.services.vendor_features import compute_vendor_features
+from benchmarks.synthetic import make_award_rows, make_bid_batch, make_bids, make_tender, make_vendors
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+
+# Sizes below this are dominated by fixed overhead and excluded from the scaling fit
+SCALING_MIN_SIZE = 1000
+
+
+def _fresh(batch: BidBatch) -> BidBatch:
+    """Same columns, empty caches (so per-batch statistics are recomputed)."""
+    return BidBatch(
+        batch.ids, batch.vendor_ids, batch.prices, batch.timelines, batch.proposal_lengths,
+        tender_id=batch.tender_id, proposals=batch.proposals
+    )
+
+
+def _measure(fn: Callable, repeat: int, trace_memory: bool) -> Dict:
+    """Median/min wall time in ms over `repeat` runs, plus peak memory from one traced run."""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    peak_mb = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        fn()
+        peak_mb = round(tracemalloc.get_traced_memory()[1] / 1e6, 3)
+        tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "repeat": repeat,
+        "peak_mb": peak_mb
+    }
+
+
+def _components(engine_name: str, tender, batch: BidBatch, vendors, features, bundle) -> Dict[str, Callable]:
+    """Benchmarked callables for one engine; each scores every bid of the batch."""
+    rows = batch.rows
+    prices = batch.valid_prices
+    stats = batch.price_stats
+    # Force lazy per-batch state so components measure only their own work
+    batch.price_matches(0.01)
+    batch.price_matches(1)
+
+    if engine_name == "rules":
+        params = AIEngine._params(bundle)
+        components = {
+            "total": lambda: AIEngine.get_recommendations(tender.id, _fresh(batch), features, tender),
+            "batch_stats": lambda: (lambda b: (b.price_stats, b.price_matches(0.01)))(_fresh(batch)),
+            "price": lambda: [
+                AIEngine._calculate_price_score(r.proposed_price, prices, tender.budget, None, params, stats)
+                for r in rows
+            ],
+            "vendor": lambda: [AIEngine._calculate_vendor_score(vendors[r.vendor_id]) for r in rows],
+            "technical": lambda: [
+                AIEngine._calculate_technical_score(r.technical_proposal, r.delivery_timeline) for r in rows
+            ],
+            "anomalies": lambda: [AIEngine._detect_anomalies(r, prices, batch, stats) for r in rows],
+        }
+        if bundle.price_model is not None:
+            components["fair_price"] = lambda: [
+                AIEngine._estimate_fair_price(r, tender, bundle.price_model) for r in rows
+            ]
+        return components
+
+    engine = EnhancedAIEngine(mode="rule_based")
+    params = engine._params(bundle)
+    components = {
+        "total": lambda: engine.get_recommendations(tender.id, _fresh(batch), features, tender),
+        "batch_stats": lambda: (lambda b: (b.price_stats, b.price_matches(1)))(_fresh(batch)),
+        "price": lambda: [
+            engine._calculate_price_score_v2(r.proposed_price, prices, tender.budget, None, params, stats)
+            for r in rows
+        ],
+        "vendor": lambda: [engine._calculate_vendor_score_v2(vendors[r.vendor_id]) for r in rows],
+        "technical": lambda: [
+            engine._calculate_technical_score_v2(r.technical_proposal, r.delivery_timeline, tender, None, params)
+            for r in rows
+        ],
+        "risk": lambda: [
+            engine._calculate_risk_score(r, vendors[r.vendor_id], prices, batch, stats) for r in rows
+        ],
+        "anomalies": lambda: [engine._detect_anomalies_v2(r, prices, batch, tender, stats) for r in rows],
+    }
+    if bundle.price_model is not None:
+        components["fair_price"] = lambda: [
+            engine._estimate_fair_price(r, tender, bundle.price_model) for r in rows
+        ]
+    if bundle.relevance_model is not None:
+        def relevance():
+            bundle.relevance_model._tender_cache.clear()
+            engine._score_relevance(tender, batch, bundle)
+        components["relevance"] = relevance
+    return components
+
+
+def scaling_exponent(points: List[tuple]) -> Optional[float]:
+    """Least-squares slope of log(latency) against log(bids); 1.0 is linear."""
+    points = [(n, ms) for n, ms in points if n >= SCALING_MIN_SIZE and ms > 0]
+    if len(points) < 2:
+        return None
+    x = np.log([n for n, _ in points])
+    y = np.log([ms for _, ms in points])
+    return round(float(np.polyfit(x, y, 1)[0]), 3)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: List[int], engines: List[str], repeat: int, seed: int,
+        use_models: bool, memory_max_size: int, superlinear: float) -> Dict:
+    rng = random.Random(seed)
+    registry = get_registry()
+
+    vendors = make_vendors(rng, 500)
+    features = {vid: VendorFeatures(vendor_id=vid, **compute_vendor_features(v)) for vid, v in vendors.items()}
+
+    bundle = ScoringBundle()
+    if use_models:
+        corpus = []
+        for tender_id in range(200):
+            t = make_tender(rng, tender_id)
+            corpus.append((t.category, t.description))
+            corpus.extend((t.category, b.technical_proposal) for b in make_bids(rng, t, vendors, 10))
+        bundle = ScoringBundle(
+            price_model=fit_price_model(make_award_rows(rng, 20000)),
+            relevance_model=fit_relevance_model(corpus)
+        )
+    registry.pin(bundle)
+
+    results = []
+    try:
+        for size in sizes:
+            tender = make_tender(rng, size)
+            batch = make_bid_batch(rng, tender, vendors, size)
+            runs = max(1, min(repeat, 100000 // size))
+            trace = size <= memory_max_size
+            for engine_name in engines:
+                for component, fn in _components(engine_name, tender, batch, vendors, features, bundle).items():
+                    m = _measure(fn, runs, trace)
+                    m.update({
+                        "engine": engine_name,
+                        "component": component,
+                        "bids": size,
+                        "throughput_bids_per_s": round(size / (m["median_ms"] / 1000), 1) if m["median_ms"] else None
+                    })
+                    results.append(m)
+                    peak = f"{m['peak_mb']:>9.2f}" if m["peak_mb"] is not None else f"{'-':>9}"
+                    print(f"{engine_name:>8} {component:>12} {size:>8} {m['median_ms']:>12.3f} "
+                          f"{m['throughput_bids_per_s'] or 0:>14.0f} {peak}")
+    finally:
+        registry.unpin()
+
+    scaling = []
+    for engine_name in engines:
+        for component in sorted({r["component"] for r in results if r["engine"] == engine_name}):
+            points = [(r["bids"], r["median_ms"]) for r in results
+                      if r["engine"] == engine_name and r["component"] == component]
+            exponent = scaling_exponent(points)
+            scaling.append({
+                "engine": engine_name,
+                "component": component,
+                "exponent": exponent,
+                "superlinear": exponent is not None and exponent > superlinear
+            })
+
+    return {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": seed,
+            "models": use_models,
+            "bundle_version": bundle.version,
+            "superlinear_threshold": superlinear
+        },
+        "results": results,
+        "scaling": scaling
+    }
+
+
+def compare(current: Dict, baseline_path: str, tolerance: float = 0.10):
+    """Print latency changes against an earlier results file."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    before = {(r["engine"], r["component"], r["bids"]): r for r in baseline["results"]}
+
+    print()
+    print(f"Compared with {baseline_path} ({baseline['meta'].get('git_commit')})")
+    for r in current["results"]:
+        old = before.get((r["engine"], r["component"], r["bids"]))
+        if not old or not old["median_ms"]:
+            continue
+        change = r["median_ms"] / old["median_ms"] - 1
+        marker = "  ⚠️ slower" if change > tolerance else "  ✅ faster" if change < -tolerance else ""
+        print(f"{r['engine']:>8} {r['component']:>12} {r['bids']:>8} "
+              f"{old['median_ms']:>10.3f} → {r['median_ms']:>10.3f} ms ({change:+.1%}){marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scoring engines and their components")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--max-size", type=int, default=None, help="Skip sizes above this")
+    parser.add_argument("--engines", nargs="+", choices=["rules", "enhanced"], default=["rules", "enhanced"])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (fewer for large sizes)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-models", action="store_true", help="Score without price/relevance models")
+    parser.add_argument("--memory-max-size", type=int, default=100000,
+                        help="Largest size to trace memory for (tracing is slow)")
+    parser.add_argument("--superlinear", type=float, default=1.2,
+                        help="Flag measurements whose scaling exponent exceeds this")
+    parser.add_argument("--output", default=None, help="Results file (default: benchmarks/results/scoring-<time>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    sizes = [s for s in args.sizes if args.max_size is None or s <= args.max_size]
+
+    print(f"{'engine':>8} {'component':>12} {'bids':>8} {'median (ms)':>12} {'bids/s':>14} {'peak MB':>9}")
+    report = run(sizes, args.engines, args.repeat, args.seed, not args.no_models,
+                 args.memory_max_size, args.superlinear)
+
+    print()
+    print(f"{'engine':>8} {'component':>12} {'exponent':>9}")
+    for s in report["scaling"]:
+        exponent = f"{s['exponent']:>9.2f}" if s["exponent"] is not None else f"{'-':>9}"
+        flag = "  ⚠️ superlinear" if s["superlinear"] else ""
+        print(f"{s['engine']:>8} {s['component']:>12} {exponent}{flag}")
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"scoring-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print()
+    print(f"📦 Results written to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
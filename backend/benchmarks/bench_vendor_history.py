@@ -0,0 +1,130 @@
+"""
+Benchmark: vendor bid history, per-bid queries vs one page and one aggregate.
+
+Populates an in-memory SQLite database where one vendor has N bids (spread
+over N tenders, among bids from other vendors) and times:
+
+    legacy      the previous endpoint: every bid of the vendor, then one
+                Tender query per bid (N+1 queries, no limit)
+    first page  vendor_bid_history() newest 50 plus vendor_bid_summary(),
+                i.e. the dashboard's first request
+    deep page   the page after bid N-100, reached through its cursor
+
+Run inside the backend container:
+    docker-compose exec backend python -m benchmarks.bench_vendor_history
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, Bid, BidStatus, Tender, TenderStatus, Vendor
+from app.services.pagination import encode_cursor
+from app.services.vendor_history import vendor_bid_history, vendor_bid_summary
+from benchmarks.synthetic import CATEGORIES, DEPARTMENTS
+
+PAGE = 50
+VENDOR_ID = 1
+
+
+def _populate(session_factory, rng: random.Random, count: int, other_vendors: int = 200):
+    db = session_factory()
+    start = datetime(2020, 1, 1)
+    db.execute(Vendor.__table__.insert(), [
+        {"id": i, "name": f"Vendor {i}", "email": f"vendor{i}@example.com", "company_registration": f"REG{i}"}
+        for i in range(1, other_vendors + 2)
+    ])
+    db.execute(Tender.__table__.insert(), [{
+        "id": i,
+        "title": f"Synthetic Tender {i}",
+        "description": "Synthetic tender description",
+        "category": rng.choice(CATEGORIES),
+        "budget": float(rng.randint(50, 5000) * 1000),
+        "department": rng.choice(DEPARTMENTS),
+        "deadline": start + timedelta(hours=i),
+        "status": TenderStatus.CLOSED.name
+    } for i in range(1, count + 1)])
+    # The benchmarked vendor's bids, plus three rival bids per tender
+    rows = []
+    for tender_id in range(1, count + 1):
+        for vendor_id in [VENDOR_ID] + rng.sample(range(2, other_vendors + 2), 3):
+            rows.append({
+                "tender_id": tender_id,
+                "vendor_id": vendor_id,
+                "proposed_price": float(rng.randint(40, 120) * 1000),
+                "technical_proposal": "Synthetic proposal text " * 20,
+                "delivery_timeline": rng.randint(30, 180),
+                "status": rng.choice(list(BidStatus)).name,
+                "ai_score": rng.uniform(20, 95),
+                "created_at": start + timedelta(hours=tender_id, minutes=rng.randint(0, 59))
+            })
+    db.execute(Bid.__table__.insert(), rows)
+    db.commit()
+    db.close()
+
+
+def _legacy_history(db):
+    """The endpoint as it was: N+1 queries, the whole history at once."""
+    results = []
+    for bid in db.query(Bid).filter(Bid.vendor_id == VENDOR_ID).all():
+        tender = db.query(Tender).filter(Tender.id == bid.tender_id).first()
+        results.append((bid.id, tender.title if tender else "Unknown"))
+    return results
+
+
+def _first_page(db):
+    vendor_bid_history(db, VENDOR_ID, PAGE)
+    vendor_bid_summary(db, VENDOR_ID)
+
+
+def _time(session_factory, fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        db = session_factory()
+        start = time.perf_counter()
+        fn(db)
+        samples.append((time.perf_counter() - start) * 1000)
+        db.close()
+    return statistics.median(samples)
+
+
+def main(sizes, repeat: int, seed: int):
+    print(f"{'bids':>8} {'legacy (ms)':>12} {'first (ms)':>11} {'deep (ms)':>10}")
+    for size in sizes:
+        rng = random.Random(seed)
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine, tables=[
+            Vendor.__table__, Tender.__table__, Bid.__table__
+        ])
+        session_factory = sessionmaker(bind=engine)
+        _populate(session_factory, rng, size)
+
+        # Cursor of the bid just before the vendor's oldest 100
+        db = session_factory()
+        anchor = db.query(Bid.created_at, Bid.id).filter(Bid.vendor_id == VENDOR_ID).order_by(
+            Bid.created_at.desc(), Bid.id.desc()
+        ).offset(max(size - 101, 0)).first()
+        db.close()
+        deep_cursor = encode_cursor([anchor[0], anchor[1]])
+
+        legacy = _time(session_factory, _legacy_history, 1)
+        first = _time(session_factory, _first_page, repeat)
+        deep = _time(session_factory, lambda db: vendor_bid_history(db, VENDOR_ID, PAGE, deep_cursor), repeat)
+        print(f"{size:>8} {legacy:>12.1f} {first:>11.2f} {deep:>10.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the vendor bid-history endpoint")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat, args.seed)
@@ -0,0 +1,100 @@
+"""
+Load test: concurrent request capacity and event-loop responsiveness.
+
+Drives a running API with a fixed number of concurrent clients per step, each
+sending requests back to back for --duration seconds, and meanwhile probes
+/health every --probe-interval seconds. /health does no work, so its latency
+is the time the request waited for the server's event loop: it stays flat
+while handlers await I/O and climbs when a handler blocks the loop.
+
+For each concurrency level prints throughput, request latency percentiles,
+errors and the /health probe's p99.
+
+Needs httpx (pip install httpx). Against the docker-compose stack:
+    python -m benchmarks.load_test --url http://localhost:8000 \\
+        --path /public/tenders/awarded --concurrency 10 50 200
+    python -m benchmarks.load_test --path /gov/tenders/1/bids --token <government JWT>
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _client(client: httpx.AsyncClient, path: str, deadline: float, latencies: List[float], errors: List[int]):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def _probe(client: httpx.AsyncClient, deadline: float, interval: float, latencies: List[float]):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            await client.get("/health")
+        except httpx.HTTPError:
+            pass
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+
+
+async def run_step(url: str, path: str, headers: Dict, concurrency: int, duration: float, probe_interval: float) -> Dict:
+    latencies: List[float] = []
+    errors: List[int] = []
+    probes: List[float] = []
+    limits = httpx.Limits(max_connections=concurrency + 1, max_keepalive_connections=concurrency + 1)
+    async with httpx.AsyncClient(base_url=url, headers=headers, limits=limits, timeout=60) as client, \
+            httpx.AsyncClient(base_url=url, timeout=60) as probe_client:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            _probe(probe_client, deadline, probe_interval, probes),
+            *[_client(client, path, deadline, latencies, errors) for _ in range(concurrency)]
+        )
+    return {
+        "concurrency": concurrency,
+        "rps": len(latencies) / duration,
+        "p50": statistics.median(latencies) if latencies else float("nan"),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+        "errors": len(errors),
+        "health_p99": _percentile(probes, 0.99)
+    }
+
+
+async def main(url: str, path: str, token: str, levels: List[int], duration: float, probe_interval: float):
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    print(f"GET {url}{path}, {duration:.0f}s per step")
+    print(f"{'clients':>8} {'req/s':>8} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} "
+          f"{'errors':>7} {'/health p99 (ms)':>17}")
+    for concurrency in levels:
+        step = await run_step(url, path, headers, concurrency, duration, probe_interval)
+        print(f"{step['concurrency']:>8} {step['rps']:>8.1f} {step['p50']:>9.1f} {step['p95']:>9.1f} "
+              f"{step['p99']:>9.1f} {step['errors']:>7} {step['health_p99']:>17.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test an API endpoint")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/public/tenders/awarded")
+    parser.add_argument("--token", default=None, help="Bearer token for authenticated routes")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument("--probe-interval", type=float, default=0.1)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.path, args.token, args.concurrency, args.duration, args.probe_interval))
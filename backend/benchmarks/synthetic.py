@@ -0,0 +1,130 @@
+"""
+Synthetic procurement data for benchmarks.
+
+Builds transient (never persisted) Tender, Vendor, Bid and award rows so the
+scoring engines can be exercised without a database.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.db.models import Bid, Tender, Vendor, TenderStatus
+from app.services.bid_batch import BidBatch
+
+CATEGORIES = [
+    "Web Development", "IT Services", "Smart City Solutions",
+    "Construction", "Healthcare Equipment", "Transportation"
+]
+DEPARTMENTS = [
+    "Department of Communications", "Department of Finance",
+    "Department of Transportation", "Department of Health",
+    "Department of Public Works"
+]
+PROPOSAL_PHRASES = [
+    "Our team brings proven experience and expertise in similar projects.",
+    "We follow an agile methodology with clear quality standards.",
+    "The architecture is designed for scalability, security and reliability.",
+    "Implementation includes testing, deployment, monitoring and maintenance.",
+    "We provide full documentation, support and compliance certification.",
+    "Performance optimization and integration with existing infrastructure.",
+    "Successful delivery record with best practices across the public sector."
+]
+
+
+def make_tender(rng: random.Random, tender_id: int = 1) -> Tender:
+    """Build a single open tender with a random category and budget."""
+    return Tender(
+        id=tender_id,
+        title=f"Synthetic Tender {tender_id}",
+        description=" ".join(rng.sample(PROPOSAL_PHRASES, 4)),
+        category=rng.choice(CATEGORIES),
+        budget=float(rng.randint(50, 5000) * 1000),
+        department=rng.choice(DEPARTMENTS),
+        deadline=datetime.utcnow() + timedelta(days=30),
+        status=TenderStatus.OPEN
+    )
+
+
+def make_vendors(rng: random.Random, count: int) -> Dict[int, Vendor]:
+    """Build vendors with a spread of reputation and track records."""
+    vendors = {}
+    for vendor_id in range(1, count + 1):
+        completed = rng.randint(0, 20)
+        vendors[vendor_id] = Vendor(
+            id=vendor_id,
+            name=f"Vendor {vendor_id}",
+            email=f"vendor{vendor_id}@example.com",
+            reputation_score=round(rng.uniform(0, 5), 2),
+            completed_projects=completed,
+            total_wins=rng.randint(0, completed),
+            average_rating=round(rng.uniform(0, 5), 2)
+        )
+    return vendors
+
+
+def make_bids(
+    rng: random.Random, tender: Tender, vendors: Dict[int, Vendor], count: int
+) -> List[Bid]:
+    """
+    Build `count` bids on a tender, cycling through the given vendors.
+
+    Vendors repeat once count exceeds len(vendors); bids that are written to
+    the database (one per vendor per tender) need at least count vendors.
+    """
+    vendor_ids = list(vendors)
+    bids = []
+    for bid_id in range(1, count + 1):
+        proposal = " ".join(rng.choices(PROPOSAL_PHRASES, k=rng.randint(1, 12)))
+        bids.append(Bid(
+            id=bid_id,
+            tender_id=tender.id,
+            vendor_id=vendor_ids[(bid_id - 1) % len(vendor_ids)],
+            proposed_price=round(tender.budget * rng.uniform(0.5, 1.2), 2),
+            technical_proposal=proposal,
+            delivery_timeline=rng.randint(5, 400)
+        ))
+    return bids
+
+
+def make_bid_batch(
+    rng: random.Random, tender: Tender, vendors: Dict[int, Vendor], count: int
+) -> BidBatch:
+    """
+    Build `count` bids directly as a BidBatch (same distributions as make_bids).
+
+    Avoids creating ORM objects, so batches of a million bids stay cheap.
+    """
+    np_rng = np.random.default_rng(rng.randrange(2 ** 32))
+    vendor_ids = np.array(list(vendors), dtype=np.int64)
+    phrases = np.array(PROPOSAL_PHRASES, dtype=object)
+    proposals = [
+        " ".join(phrases[np_rng.integers(0, len(phrases), k)])
+        for k in np_rng.integers(1, 13, count)
+    ]
+    return BidBatch(
+        ids=np.arange(1, count + 1),
+        vendor_ids=vendor_ids[np.arange(count) % len(vendor_ids)],
+        prices=np.round(tender.budget * np_rng.uniform(0.5, 1.2, count), 2),
+        timelines=np_rng.integers(5, 401, count),
+        proposal_lengths=[len(p) for p in proposals],
+        tender_id=tender.id,
+        proposals=proposals
+    )
+
+
+def make_award_rows(
+    rng: random.Random, count: int
+) -> List[Tuple[str, str, float, float, float]]:
+    """Build (category, department, budget, timeline, award_amount) training rows."""
+    category_factor = {c: rng.uniform(0.7, 0.95) for c in CATEGORIES}
+    rows = []
+    for _ in range(count):
+        category = rng.choice(CATEGORIES)
+        department = rng.choice(DEPARTMENTS)
+        budget = float(rng.randint(50, 5000) * 1000)
+        timeline = rng.randint(14, 365)
+        amount = budget * category_factor[category] * rng.lognormvariate(0, 0.08)
+        rows.append((category, department, budget, timeline, amount))
+    return rows
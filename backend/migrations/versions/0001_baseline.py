@@ -0,0 +1,132 @@
+"""Baseline schema (tables as originally created by create_all)
+
+Tables that already exist are left alone, so a database built by create_all
+before migrations existed upgrades in place without being stamped.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import table_exists
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+tender_status = sa.Enum("DRAFT", "OPEN", "CLOSED", "AWARDED", name="tenderstatus")
+bid_status = sa.Enum("SUBMITTED", "UNDER_REVIEW", "ACCEPTED", "REJECTED", name="bidstatus")
+
+
+def upgrade():
+    if not table_exists("tenders"):
+        op.create_table(
+            "tenders",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(500), nullable=False),
+            sa.Column("description", sa.Text(), nullable=False),
+            sa.Column("category", sa.String(100), nullable=False),
+            sa.Column("budget", sa.Float(), nullable=False),
+            sa.Column("department", sa.String(200), nullable=False),
+            sa.Column("deadline", sa.DateTime(), nullable=False),
+            sa.Column("status", tender_status, nullable=True),
+            sa.Column("creation_hash", sa.String(66), nullable=True),
+            sa.Column("creation_tx_hash", sa.String(66), nullable=True),
+            sa.Column("award_hash", sa.String(66), nullable=True),
+            sa.Column("award_tx_hash", sa.String(66), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_tenders_id", "tenders", ["id"])
+
+    if not table_exists("government_accounts"):
+        op.create_table(
+            "government_accounts",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("access_code_hash", sa.String(255), nullable=False, unique=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("last_login", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_government_accounts_id", "government_accounts", ["id"])
+
+    if not table_exists("vendors"):
+        op.create_table(
+            "vendors",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(300), nullable=False),
+            sa.Column("email", sa.String(200), nullable=False),
+            sa.Column("company_registration", sa.String(100), nullable=True, unique=True),
+            sa.Column("phone", sa.String(20), nullable=True),
+            sa.Column("address", sa.Text(), nullable=True),
+            sa.Column("password_hash", sa.String(255), nullable=True),
+            sa.Column("vendor_id", sa.String(100), nullable=True),
+            sa.Column("reputation_score", sa.Float(), nullable=True),
+            sa.Column("completed_projects", sa.Integer(), nullable=True),
+            sa.Column("total_wins", sa.Integer(), nullable=True),
+            sa.Column("average_rating", sa.Float(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("last_login", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_vendors_id", "vendors", ["id"])
+        op.create_index("ix_vendors_email", "vendors", ["email"], unique=True)
+        op.create_index("ix_vendors_vendor_id", "vendors", ["vendor_id"], unique=True)
+
+    if not table_exists("bids"):
+        op.create_table(
+            "bids",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("tender_id", sa.Integer(), sa.ForeignKey("tenders.id"), nullable=False),
+            sa.Column("vendor_id", sa.Integer(), sa.ForeignKey("vendors.id"), nullable=False),
+            sa.Column("proposed_price", sa.Float(), nullable=False),
+            sa.Column("technical_proposal", sa.Text(), nullable=False),
+            sa.Column("delivery_timeline", sa.Integer(), nullable=False),
+            sa.Column("status", bid_status, nullable=True),
+            sa.Column("ai_score", sa.Float(), nullable=True),
+            sa.Column("price_score", sa.Float(), nullable=True),
+            sa.Column("vendor_score", sa.Float(), nullable=True),
+            sa.Column("technical_score", sa.Float(), nullable=True),
+            sa.Column("anomaly_flag", sa.Boolean(), nullable=True),
+            sa.Column("anomaly_reason", sa.Text(), nullable=True),
+            sa.Column("submission_hash", sa.String(66), nullable=True),
+            sa.Column("submission_tx_hash", sa.String(66), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_bids_id", "bids", ["id"])
+
+    if not table_exists("awards"):
+        op.create_table(
+            "awards",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("tender_id", sa.Integer(), sa.ForeignKey("tenders.id"), nullable=False, unique=True),
+            sa.Column("winning_bid_id", sa.Integer(), sa.ForeignKey("bids.id"), nullable=False),
+            sa.Column("justification", sa.Text(), nullable=False),
+            sa.Column("award_amount", sa.Float(), nullable=False),
+            sa.Column("contract_start", sa.DateTime(), nullable=False),
+            sa.Column("contract_end", sa.DateTime(), nullable=False),
+            sa.Column("public_rating", sa.Float(), nullable=True),
+            sa.Column("public_feedback_count", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_awards_id", "awards", ["id"])
+
+    if not table_exists("public_ratings"):
+        op.create_table(
+            "public_ratings",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("award_id", sa.Integer(), sa.ForeignKey("awards.id"), nullable=False),
+            sa.Column("rating", sa.Integer(), nullable=False),
+            sa.Column("feedback", sa.Text(), nullable=True),
+            sa.Column("citizen_name", sa.String(200), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_public_ratings_id", "public_ratings", ["id"])
+
+
+def downgrade():
+    for table in ("public_ratings", "awards", "bids", "vendors", "government_accounts", "tenders"):
+        op.drop_table(table)
+    bid_status.drop(op.get_bind(), checkfirst=True)
+    tender_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,30 @@
+"""Scoring version stored with each bid's scores
+
+    bids.score_version    engine, config and model versions that produced
+                          the stored scores (model registry)
+
+create_all never added columns to existing tables, so the column is only
+added if missing.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import column_exists
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not column_exists("bids", "score_version"):
+        op.add_column("bids", sa.Column("score_version", sa.String(100), nullable=True))
+
+
+def downgrade():
+    op.drop_column("bids", "score_version")
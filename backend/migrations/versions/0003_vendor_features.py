@@ -0,0 +1,46 @@
+"""Materialized vendor scoring features
+
+    vendor_features    one row per vendor with the vendor-score inputs and
+                       both engines' precomputed vendor scores
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import table_exists
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not table_exists("vendor_features"):
+        op.create_table(
+            "vendor_features",
+            sa.Column("vendor_id", sa.Integer(), sa.ForeignKey("vendors.id"), primary_key=True),
+            sa.Column("name", sa.String(300), nullable=False),
+            sa.Column("reputation_score", sa.Float(), nullable=True),
+            sa.Column("completed_projects", sa.Integer(), nullable=True),
+            sa.Column("total_wins", sa.Integer(), nullable=True),
+            sa.Column("average_rating", sa.Float(), nullable=True),
+            sa.Column("rules_vendor_score", sa.Float(), nullable=False),
+            sa.Column("enhanced_vendor_score", sa.Float(), nullable=False),
+            sa.Column("reputation_points", sa.Float(), nullable=True),
+            sa.Column("track_record_points", sa.Float(), nullable=True),
+            sa.Column("rating_points", sa.Float(), nullable=True),
+            sa.Column("experience_level", sa.String(50), nullable=False),
+            sa.Column("good_reputation", sa.Boolean(), nullable=True),
+            sa.Column("no_track_record", sa.Boolean(), nullable=True),
+            sa.Column("limited_experience", sa.Boolean(), nullable=True),
+            sa.Column("features_version", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+
+
+def downgrade():
+    op.drop_table("vendor_features")
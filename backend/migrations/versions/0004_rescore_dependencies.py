@@ -0,0 +1,43 @@
+"""Vendor-to-tender score dependencies and the rescoring queue
+
+    vendor_tender_deps    which open/closed tenders hold scores computed
+                          from a vendor's stats
+    rescore_queue         tenders whose stored scores are stale
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import table_exists
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not table_exists("vendor_tender_deps"):
+        op.create_table(
+            "vendor_tender_deps",
+            sa.Column("vendor_id", sa.Integer(), sa.ForeignKey("vendors.id"), primary_key=True),
+            sa.Column("tender_id", sa.Integer(), sa.ForeignKey("tenders.id"), primary_key=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_vendor_tender_deps_tender_id", "vendor_tender_deps", ["tender_id"])
+
+    if not table_exists("rescore_queue"):
+        op.create_table(
+            "rescore_queue",
+            sa.Column("tender_id", sa.Integer(), sa.ForeignKey("tenders.id"), primary_key=True),
+            sa.Column("reason", sa.String(200), nullable=True),
+            sa.Column("requested_at", sa.DateTime(), nullable=True),
+        )
+
+
+def downgrade():
+    op.drop_table("rescore_queue")
+    op.drop_table("vendor_tender_deps")
@@ -0,0 +1,26 @@
+"""Content hash of the bid-set snapshot frozen when a tender closes
+
+    tenders.snapshot_hash    hash of the snapshot file under SNAPSHOT_DIR
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import column_exists
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not column_exists("tenders", "snapshot_hash"):
+        op.add_column("tenders", sa.Column("snapshot_hash", sa.String(66), nullable=True))
+
+
+def downgrade():
+    op.drop_column("tenders", "snapshot_hash")
@@ -0,0 +1,41 @@
+"""Background recommendation jobs
+
+    recommendation_jobs    one row per closed tender: job status and the
+                           stored ranking served by the recommendations
+                           endpoint
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import table_exists
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not table_exists("recommendation_jobs"):
+        op.create_table(
+            "recommendation_jobs",
+            sa.Column("tender_id", sa.Integer(), sa.ForeignKey("tenders.id"), primary_key=True),
+            sa.Column("status", sa.String(20), nullable=False),
+            sa.Column("score_version", sa.String(100), nullable=True),
+            sa.Column("result", sa.JSON(), nullable=True),
+            sa.Column("total", sa.Integer(), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("attempts", sa.Integer(), nullable=True),
+            sa.Column("requested_at", sa.DateTime(), nullable=True),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_recommendation_jobs_status", "recommendation_jobs", ["status"])
+
+
+def downgrade():
+    op.drop_table("recommendation_jobs")
@@ -0,0 +1,66 @@
+"""Indexes for the hot query paths, built online
+
+    uq_bids_tender_id_vendor_id    one bid per vendor per tender (backs the
+                                   duplicate-bid check); leading tender_id
+                                   serves every bids-by-tender query
+    ix_bids_vendor_id_created_at   vendor bid history; leading vendor_id
+                                   serves every bids-by-vendor query
+    ix_tenders_status_deadline     open-tender listing
+    ix_public_ratings_award_id     ratings of an award
+    ix_awards_created_at_id        public awarded feed keyset
+
+Separate single-column indexes on bids.tender_id and bids.vendor_id would
+duplicate the leading columns of the first two and only slow down writes.
+
+Every index is built with CREATE INDEX CONCURRENTLY, outside a transaction,
+so reads and writes continue during the build. The unique index fails if
+duplicate bids already exist; the revision checks first and lists them.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import create_index_concurrently, drop_index_concurrently, is_offline
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("uq_bids_tender_id_vendor_id", "bids", ["tender_id", "vendor_id"], True),
+    ("ix_bids_vendor_id_created_at", "bids", ["vendor_id", "created_at"], False),
+    ("ix_tenders_status_deadline", "tenders", ["status", "deadline"], False),
+    ("ix_public_ratings_award_id", "public_ratings", ["award_id"], False),
+    ("ix_awards_created_at_id", "awards", ["created_at", "id"], False),
+]
+
+
+def _duplicate_bids():
+    if is_offline():
+        return []
+    return op.get_bind().execute(sa.text(
+        "SELECT tender_id, vendor_id, COUNT(*) FROM bids "
+        "GROUP BY tender_id, vendor_id HAVING COUNT(*) > 1 LIMIT 20"
+    )).fetchall()
+
+
+def upgrade():
+    duplicates = _duplicate_bids()
+    if duplicates:
+        listed = ", ".join(f"tender {t} / vendor {v} ({n} bids)" for t, v, n in duplicates)
+        raise RuntimeError(
+            f"Cannot add uq_bids_tender_id_vendor_id: duplicate bids exist ({listed}). "
+            f"Resolve them and rerun the migration."
+        )
+
+    for name, table, columns, unique in INDEXES:
+        create_index_concurrently(name, table, columns, unique=unique)
+
+
+def downgrade():
+    for name, table, _, _ in reversed(INDEXES):
+        drop_index_concurrently(name, table)
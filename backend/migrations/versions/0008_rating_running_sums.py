@@ -0,0 +1,47 @@
+"""Running rating sums on awards and vendors
+
+    awards.public_rating_sum   sum of the award's public ratings
+    vendors.rating_sum         sum behind vendors.average_rating
+
+With the sums stored, a new rating updates the averages with one
+UPDATE ... SET x = x + ... per row instead of re-reading every rating.
+Award sums are backfilled from public_ratings. Vendor sums are
+average_rating * completed_projects, matching how both were maintained
+until now.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import column_exists
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Backfilled only when added: sums maintained since then must not be recomputed
+    if not column_exists("awards", "public_rating_sum"):
+        op.add_column("awards", sa.Column("public_rating_sum", sa.Integer(), nullable=False, server_default="0"))
+        op.execute(
+            "UPDATE awards SET "
+            "public_rating_sum = COALESCE((SELECT SUM(rating) FROM public_ratings "
+            "WHERE public_ratings.award_id = awards.id), 0), "
+            "public_feedback_count = (SELECT COUNT(*) FROM public_ratings "
+            "WHERE public_ratings.award_id = awards.id)"
+        )
+    if not column_exists("vendors", "rating_sum"):
+        op.add_column("vendors", sa.Column("rating_sum", sa.Float(), nullable=False, server_default="0"))
+        op.execute(
+            "UPDATE vendors SET rating_sum = COALESCE(average_rating, 0) * COALESCE(completed_projects, 0)"
+        )
+
+
+def downgrade():
+    op.drop_column("vendors", "rating_sum")
+    op.drop_column("awards", "public_rating_sum")
@@ -0,0 +1,38 @@
+"""Write-behind flag on public ratings
+
+    public_ratings.pending          rating not yet added to the aggregates
+    ix_public_ratings_pending       partial index over pending rows only
+
+With RATING_WRITE_BEHIND on, POST /public/ratings only inserts a pending
+row and app.scripts.rating_aggregator folds pending rows into the award and
+vendor aggregates in batches. Existing ratings are already aggregated, so
+the column defaults to false. The partial index stays as small as the
+backlog and is built online.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import column_exists, create_index_concurrently, drop_index_concurrently
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not column_exists("public_ratings", "pending"):
+        op.add_column(
+            "public_ratings",
+            sa.Column("pending", sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+    create_index_concurrently("ix_public_ratings_pending", "public_ratings", ["id"], where="pending")
+
+
+def downgrade():
+    drop_index_concurrently("ix_public_ratings_pending", "public_ratings")
+    op.drop_column("public_ratings", "pending")
@@ -0,0 +1,36 @@
+"""Version counters for cached public responses
+
+    cache_versions     one counter per cache key (awarded feed, open
+                       tenders, a tender's transparency view)
+
+Write paths bump the counters in their own transaction; API workers check
+them about once a second and drop cached responses built from an older
+version.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import table_exists
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not table_exists("cache_versions"):
+        op.create_table(
+            "cache_versions",
+            sa.Column("key", sa.String(200), primary_key=True),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+
+
+def downgrade():
+    op.drop_table("cache_versions")
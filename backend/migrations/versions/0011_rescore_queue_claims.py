@@ -0,0 +1,31 @@
+"""Claim time of queued rescoring requests
+
+    rescore_queue.claimed_at    when a worker took the request (NULL while
+                                it waits); claims older than
+                                RESCORE_CLAIM_TIMEOUT_SECONDS are retried
+
+Workers no longer hold the queue row locked while rescoring, so a stats
+change during a rescore can re-queue the tender instead of being dropped.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import column_exists
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not column_exists("rescore_queue", "claimed_at"):
+        op.add_column("rescore_queue", sa.Column("claimed_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("rescore_queue", "claimed_at")
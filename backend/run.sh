@@ -38,15 +38,19 @@ fi
 echo -e "${BLUE}⏳ Waiting for database to be ready...${NC}"
 sleep 5
 
-# Run database migrations (create tables)
-echo -e "${BLUE}🗄️  Creating database tables...${NC}"
-python3 -c "
-from app.db.session import engine, Base
-from app.db.models import *
-print('Creating all database tables...')
-Base.metadata.create_all(bind=engine)
-print('✅ Database tables created successfully!')
-"
+# Run database migrations
+echo -e "${BLUE}🗄️  Applying database migrations...${NC}"
+alembic upgrade head
+echo -e "${GREEN}✅ Database schema is up to date${NC}"
+
+# Start the background workers (precomputed recommendations, vendor-stats rescoring);
+# they stop with the server
+echo -e "${BLUE}⚙️  Starting background workers...${NC}"
+python -m app.scripts.recommendation_worker &
+RECOMMENDATION_WORKER_PID=$!
+python -m app.scripts.rescore_worker &
+RESCORE_WORKER_PID=$!
+trap 'kill $RECOMMENDATION_WORKER_PID $RESCORE_WORKER_PID 2>/dev/null' EXIT
 
 # Start FastAPI server
 echo -e "${GREEN}🚀 Starting FastAPI server on http://0.0.0.0:8000${NC}"
@@ -0,0 +1,78 @@
+"""
+Unit tests run without Postgres, a chain node or a .env file: settings get
+throwaway defaults, and any database goes to a temporary SQLite file.
+"""
+import itertools
+import os
+import tempfile
+
+_TMP = tempfile.mkdtemp(prefix="procurement-tests-")
+
+# Never a real database, whatever the environment says
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP}/test.db"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("CONTRACT_ADDRESS", "0x0000000000000000000000000000000000000001")
+os.environ.setdefault("ETHEREUM_RPC_URL", "http://127.0.0.1:9")
+os.environ.setdefault("PRIVATE_KEY", "0x" + "11" * 32)
+os.environ["MODEL_DIR"] = os.path.join(_TMP, "models")
+os.environ["SNAPSHOT_DIR"] = os.path.join(_TMP, "snapshots")
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.db.models import Base, Bid, Tender, TenderStatus, Vendor
+from app.db.session import SessionLocal, engine
+from app.services.vendor_features import refresh_vendor_features
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Session on a fresh SQLite schema (Postgres upserts run as SQLite upserts)."""
+    import app.services.recommendation_jobs as recommendation_jobs
+    import app.services.rescoring as rescoring
+    import app.services.response_cache as response_cache
+    for module in (recommendation_jobs, rescoring, response_cache):
+        monkeypatch.setattr(module, "insert", sqlite_insert)
+
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def make_tender(db):
+    """make_tender(prices, status=OPEN): a committed tender with one bid per price, each from its own vendor."""
+    serial = itertools.count()
+
+    def make(prices, status=TenderStatus.OPEN, budget=1_000_000.0):
+        tender = Tender(
+            title="Road resurfacing", description="Resurface and maintain city roads",
+            category="Construction", department="Department of Public Works", budget=budget,
+            deadline=datetime.utcnow() + timedelta(days=30), status=status
+        )
+        db.add(tender)
+        vendors, n = [], next(serial)
+        for i in range(len(prices)):
+            vendor = Vendor(
+                name=f"Vendor {i}", email=f"vendor{i}-{n}@example.com",
+                reputation_score=3.0 + i % 3 * 0.5, completed_projects=i, total_wins=i // 2,
+                average_rating=4.0
+            )
+            db.add(vendor)
+            vendors.append(vendor)
+        db.flush()
+        refresh_vendor_features(db, vendors)
+        for vendor, price in zip(vendors, prices):
+            db.add(Bid(
+                tender_id=tender.id, vendor_id=vendor.id, proposed_price=price, delivery_timeline=60,
+                technical_proposal="Proven experience, quality standards and a clear methodology."
+            ))
+        db.commit()
+        return tender
+    return make
@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import event
+
+from app.db.models import Bid
+from app.services.ai_engine import AIEngine
+from app.services.bid_batch import BidBatch
+from app.services.tender_scoring import apply_scores, score_tender
+
+
+class Statements:
+    """Counts UPDATE statements sent to the database."""
+
+    def __init__(self):
+        self.updates = 0
+
+    def __call__(self, conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            self.updates += 1
+
+
+@pytest.fixture
+def statements(db):
+    """statements() starts counting from zero."""
+    counters = []
+
+    def start():
+        counters.append(Statements())
+        event.listen(db.get_bind(), "before_cursor_execute", counters[-1])
+        return counters[-1]
+
+    yield start
+    for counter in counters:
+        event.remove(db.get_bind(), "before_cursor_execute", counter)
+
+
+def _scores(db, tender):
+    bids = BidBatch.load(db, tender.id)
+    return bids, score_tender(db, tender, bids, AIEngine.DETAIL_LEAN, limit=0).scores
+
+
+def test_first_pass_writes_every_bid_in_one_statement(db, make_tender, statements):
+    tender = make_tender([900000.0, 950000.0, 1000000.0])
+    bids, scores = _scores(db, tender)
+    counter = statements()
+
+    assert apply_scores(db, bids, scores) == 3
+    db.commit()
+    assert counter.updates == 1
+    stored = {bid.id: bid.ai_score for bid in db.query(Bid)}
+    assert stored == {s["bid_id"]: s["ai_score"] for s in scores}
+    assert {bid.score_version for bid in db.query(Bid)} == {scores[0]["score_version"]}
+
+
+def test_unchanged_scores_write_nothing(db, make_tender, statements):
+    tender = make_tender([900000.0, 950000.0, 1000000.0])
+    bids, scores = _scores(db, tender)
+    apply_scores(db, bids, scores)
+    db.commit()
+
+    counter = statements()
+    bids, scores = _scores(db, tender)
+    assert apply_scores(db, bids, scores) == 0
+    assert counter.updates == 0
+
+
+def test_only_changed_rows_are_written(db, make_tender):
+    tender = make_tender([900000.0, 950000.0, 1000000.0])
+    bids, scores = _scores(db, tender)
+    apply_scores(db, bids, scores)
+    db.commit()
+
+    scores[1] = {**scores[1], "ai_score": scores[1]["ai_score"] + 1}
+    assert apply_scores(db, bids, scores) == 1
+    db.commit()
+    assert db.get(Bid, scores[1]["bid_id"]).ai_score == scores[1]["ai_score"]
+
+
+def test_loaded_bids_stay_in_step_without_a_second_write(db, make_tender, statements):
+    tender = make_tender([900000.0, 950000.0])
+    bids = db.query(Bid).filter(Bid.tender_id == tender.id).order_by(Bid.id).all()
+    scores = score_tender(db, tender, bids, AIEngine.DETAIL_LEAN, limit=0).scores
+
+    assert apply_scores(db, bids, scores) == 2
+    assert [bid.ai_score for bid in bids] == [s["ai_score"] for s in scores]
+    assert not db.dirty
+    counter = statements()
+    db.commit()
+    assert counter.updates == 0
+
+
+def test_scores_for_unknown_bids_are_skipped(db, make_tender):
+    tender = make_tender([900000.0])
+    bids, scores = _scores(db, tender)
+    assert apply_scores(db, bids, scores + [{**scores[0], "bid_id": 999}]) == 1
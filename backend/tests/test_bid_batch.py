@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from app.db.models import Bid
+from app.services.bid_batch import BidBatch, BidRow, PriceStats
+
+
+def _batch(prices, timelines=None):
+    n = len(prices)
+    return BidBatch(
+        ids=list(range(1, n + 1)), vendor_ids=list(range(101, 101 + n)), prices=prices,
+        timelines=timelines or [30] * n, proposal_lengths=[0] * n, tender_id=7
+    )
+
+
+def _pairwise_matches(prices, tolerance):
+    """The per-pair comparison the engines used before BidBatch."""
+    return [sum(1 for j, q in enumerate(prices) if j != i and abs(q - p) < tolerance) for i, p in enumerate(prices)]
+
+
+def test_price_matches_counts_other_bids_within_tolerance():
+    batch = _batch([100.0, 100.005, 100.02, 250.0, 250.0, 250.0, 99.996])
+    assert batch.price_matches(0.01).tolist() == [2, 2, 0, 2, 2, 2, 2]
+    assert batch.price_matches(1).tolist() == [3, 3, 3, 2, 2, 2, 3]
+
+
+def test_price_matches_agrees_with_pairwise_comparison():
+    rng = np.random.default_rng(3)
+    # Many near-duplicates: rounded prices collide, others sit just past the tolerance
+    prices = np.concatenate([
+        np.round(rng.uniform(1000, 1010, 300), 2),
+        rng.uniform(1000, 1010, 200),
+        1005 + np.arange(20) * 0.01
+    ]).tolist()
+    batch = _batch(prices)
+    for tolerance in (0.01, 1):
+        assert batch.price_matches(tolerance).tolist() == _pairwise_matches(prices, tolerance)
+
+
+def test_price_matches_are_cached_per_tolerance():
+    batch = _batch([10.0, 10.0, 20.0])
+    first = batch.price_matches(0.01)
+    assert batch.price_matches(0.01) is first
+    assert batch.price_matches(1) is not first
+
+
+def test_price_matches_of_an_empty_batch():
+    assert _batch([]).price_matches(0.01).tolist() == []
+
+
+def test_price_stats_ignore_non_positive_prices():
+    batch = _batch([0.0, 100.0, 300.0, -5.0])
+    assert batch.valid_prices.tolist() == [100.0, 300.0]
+    assert batch.price_stats == PriceStats(200.0, 200.0, 100.0)
+    assert _batch([0.0]).price_stats == PriceStats(0.0, 0.0, 0.0)
+
+
+def test_from_bids_keeps_texts_and_rows_duck_type_bids():
+    bids = [
+        Bid(id=5, tender_id=7, vendor_id=1, proposed_price=10.0, delivery_timeline=20, technical_proposal="abc"),
+        Bid(id=9, tender_id=7, vendor_id=2, proposed_price=12.5, delivery_timeline=40, technical_proposal=None),
+    ]
+    batch = BidBatch.from_bids(bids)
+    assert BidBatch.coerce(batch) is batch
+    assert batch.tender_id == 7 and batch.proposals_loaded
+    assert batch.proposal_lengths.tolist() == [3, 0]
+
+    row = batch[1]
+    assert isinstance(row, BidRow)
+    assert (row.id, row.vendor_id, row.proposed_price, row.delivery_timeline) == (9, 2, 12.5, 40)
+    assert row.technical_proposal == ""
+    assert batch.index_of(row) == 1 and batch.index_of(bids[0]) == 0
+
+
+def test_proposals_are_loaded_once_on_first_access():
+    calls = []
+    batch = BidBatch([1, 2], [1, 2], [1.0, 2.0], [1, 1], [3, 0], tender_id=1,
+                     proposal_loader=lambda: calls.append(1) or {1: "abc"})
+    assert not batch.proposals_loaded
+    assert [row.technical_proposal for row in batch] == ["abc", ""]
+    assert batch.proposals == ["abc", ""]
+    assert len(calls) == 1
+
+
+def test_load_reads_columns_and_lengths(db, make_tender):
+    tender = make_tender([300.0, 100.0, 200.0])
+    batch = BidBatch.load(db, tender.id)
+    assert batch.prices.tolist() == [300.0, 100.0, 200.0]
+    assert batch.ids.tolist() == sorted(batch.ids.tolist())
+    assert not batch.proposals_loaded
+    assert batch.proposal_lengths.tolist() == [len(p) for p in batch.proposals]
@@ -0,0 +1,36 @@
+from app.db.models import Bid, Vendor
+from app.services.ai_engine_enhanced import EnhancedAIEngine
+
+
+def _llm_engine(monkeypatch):
+    """Engine in llm_enhanced mode whose LLM call is counted instead of made."""
+    engine = EnhancedAIEngine(mode="rule_based")
+    engine.mode, engine.llm_client = "llm_enhanced", object()
+    calls = []
+
+    def technical(proposal, timeline, tender, relevance, params):
+        calls.append(proposal)
+        return 70.0, {"assessment": "llm"}
+    monkeypatch.setattr(engine, "_calculate_technical_score_llm", technical)
+    return engine, calls
+
+
+def _inputs(db, tender):
+    bids = db.query(Bid).filter(Bid.tender_id == tender.id).order_by(Bid.id).all()
+    vendors = {v.id: v for v in db.query(Vendor).filter(Vendor.id.in_([b.vendor_id for b in bids]))}
+    return bids, vendors
+
+
+def test_page_rows_reuse_the_lean_pass(db, make_tender, monkeypatch):
+    tender = make_tender([90_000, 95_000, 100_000, 105_000, 110_000])
+    bids, vendors = _inputs(db, tender)
+    engine, calls = _llm_engine(monkeypatch)
+    full = engine.get_recommendations(tender.id, bids, vendors, tender)
+    calls.clear()
+
+    page = engine.get_recommendations(tender.id, bids, vendors, tender, offset=1, limit=2)
+    # One LLM assessment per bid, none repeated for the returned rows
+    assert len(calls) == len(bids)
+    assert page == full[1:3]
+    assert all("insights" in rec and "breakdown" in rec for rec in page)
+    assert page[0]["breakdown"]["technical"] == {"assessment": "llm"}
@@ -0,0 +1,126 @@
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.db.models import Bid, Tender, Vendor
+from app.services.ai_engine import AIEngine
+from app.services.bid_batch import BidBatch
+from app.services.model_registry import ScoringBundle
+from app.services.price_model import PriceModel, fit_price_model
+
+
+def _awards(category, department, n, scale, seed=0):
+    """Awards priced at scale * budget^0.9 with a little noise."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for _ in range(n):
+        budget = float(rng.uniform(1e5, 1e7))
+        timeline = int(rng.integers(10, 300))
+        amount = scale * budget ** 0.9 * math.exp(rng.normal(0, 0.05))
+        rows.append((category, department, budget, timeline, amount))
+    return rows
+
+
+@pytest.fixture(scope="module")
+def model():
+    return fit_price_model(
+        _awards("Roads", "Transport", 200, 1.0) + _awards("IT", "Digital", 200, 2.0, seed=1)
+        + _awards("Rare", "Transport", 3, 5.0, seed=2)
+    )
+
+
+def test_fit_keeps_categories_with_enough_history(model):
+    assert model.categories == ["IT", "Roads"]
+    assert model.coef.shape[0] == 3  # two categories + global fallback
+    assert model.counts.tolist() == [200, 200, 403]
+
+
+def test_predict_log_recovers_the_training_relationship(model):
+    budget = 2e6
+    mu, sigma = model.predict_log("Roads", "Transport", budget, 90)
+    assert math.exp(mu) == pytest.approx(budget ** 0.9, rel=0.05)
+    assert PriceModel.MIN_SIGMA <= sigma < 0.1
+
+    mu_it, _ = model.predict_log("IT", "Digital", budget, 90)
+    assert math.exp(mu_it - mu) == pytest.approx(2.0, rel=0.1)
+
+
+def test_unknown_category_uses_global_model(model):
+    global_row = len(model.categories)
+    assert model.predict_log("Rare", "Transport", 1e6, 30)[1] == model.sigma[global_row]
+    assert model.predict_log(None, "Unknown", 1e6, 30) == model.predict_log("Nope", "Unknown", 1e6, 30)
+
+
+def test_predict_log_many_matches_per_bid_predictions(model):
+    timelines = np.array([0, 1, 30, 90, 365])
+    mus, sigma = model.predict_log_many("IT", "Digital", 3e6, timelines)
+    for timeline, mu in zip(timelines.tolist(), mus.tolist()):
+        expected_mu, expected_sigma = model.predict_log("IT", "Digital", 3e6, timeline)
+        assert mu == pytest.approx(expected_mu, abs=1e-12)
+        assert sigma == expected_sigma
+
+
+def test_bands_from_log_matches_band_from_log(model):
+    mus, sigma = model.predict_log_many("Roads", "Transport", 5e6, np.array([20, 200]))
+    assert PriceModel.bands_from_log(mus, sigma) == [PriceModel.band_from_log(mu, sigma) for mu in mus.tolist()]
+
+
+def test_fair_prices_are_predicted_once_per_model_version(model, monkeypatch):
+    batch = BidBatch([1, 2, 3], [10, 11, 12], [100.0, 110.0, 120.0], [30, 60, 90], [0, 0, 0], tender_id=1)
+    calls = []
+    predict = model.predict_log_many
+    monkeypatch.setattr(model, "predict_log_many", lambda *a: calls.append(a) or predict(*a))
+
+    mus, sigma = batch.fair_prices(model, "Roads", "Transport", 1e6)
+    batch.fair_prices(model, "Roads", "Transport", 1e6)
+    batch.fair_bands(model, "Roads", "Transport", 1e6)
+    assert len(calls) == 1
+    assert mus[1] == pytest.approx(model.predict_log("Roads", "Transport", 1e6, 60)[0])
+
+    batch.fair_prices(model, "Roads", "Transport", 2e6)
+    assert len(calls) == 2
+
+
+def test_save_and_load_round_trip(model, tmp_path):
+    loaded = PriceModel.load(model.save(str(tmp_path)), mmap=True)
+    assert loaded.version == model.version
+    assert loaded.categories == model.categories
+    assert loaded.predict_log("IT", "Digital", 1e6, 45) == model.predict_log("IT", "Digital", 1e6, 45)
+
+
+def test_fair_price_score_peaks_inside_the_band():
+    mu, sigma = math.log(1000.0), 0.1
+    assert PriceModel.fair_price_score(1000.0, mu, sigma) == 100
+    assert 90 <= PriceModel.fair_price_score(1000.0 * math.exp(0.05), mu, sigma) < 100
+    assert PriceModel.fair_price_score(500.0, mu, sigma) < 50
+    assert PriceModel.fair_price_score(0, mu, sigma) == 0
+
+
+def _tender_and_bids(prices):
+    tender = Tender(id=1, title="T", description="d", category="Roads", department="Transport",
+                    budget=1e6, deadline=datetime(2030, 1, 1))
+    vendor = Vendor(id=1, name="V", email="v@example.com", reputation_score=4.0,
+                    completed_projects=5, total_wins=2, average_rating=4.0)
+    bids = [
+        Bid(id=i, tender_id=1, vendor_id=1, proposed_price=price, delivery_timeline=60,
+            technical_proposal="Proven experience and quality standards.")
+        for i, price in enumerate(prices, start=1)
+    ]
+    return tender, {1: vendor}, bids
+
+
+def test_engine_blends_the_model_only_for_few_bids(model):
+    with_model, without = ScoringBundle(price_model=model), ScoringBundle()
+
+    tender, vendors, bids = _tender_and_bids([700000.0, 900000.0])
+    blended = AIEngine.score_bids(tender, bids, vendors, with_model, AIEngine.DETAIL_FULL)
+    plain = AIEngine.score_bids(tender, bids, vendors, without, AIEngine.DETAIL_FULL)
+    assert [s["price_score"] for _, _, s in blended] != [s["price_score"] for _, _, s in plain]
+    assert blended[0][2]["fair_price"] == model.predict_band("Roads", "Transport", 1e6, 60)
+    assert plain[0][2]["fair_price"] is None
+
+    tender, vendors, bids = _tender_and_bids([600000.0 + 10000 * i for i in range(AIEngine.FAIR_PRICE_MIN_BIDS)])
+    many = AIEngine.score_bids(tender, bids, vendors, with_model, AIEngine.DETAIL_LEAN)
+    assert [s for _, _, s in many] == [s for _, _, s in AIEngine.score_bids(tender, bids, vendors, without)]
@@ -0,0 +1,92 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.requests import Request
+
+import app.services.response_cache as cache_module
+from app.db.models import Award, Bid, TenderStatus
+from app.db.session import AsyncSessionLocal
+from app.routes.public import get_awarded_tenders
+from app.services.public_feed import awarded_feed
+from app.services.response_cache import AWARDED_FEED, ResponseCache
+
+
+@pytest.fixture
+def awarded(db, make_tender):
+    """awarded(n): n awarded tenders, each won by its first bid."""
+    def make(n):
+        for _ in range(n):
+            tender = make_tender([100_000, 120_000], status=TenderStatus.AWARDED)
+            bid = db.query(Bid).filter(Bid.tender_id == tender.id).order_by(Bid.id).first()
+            db.add(Award(
+                tender_id=tender.id, winning_bid_id=bid.id, justification="Best value",
+                award_amount=bid.proposed_price, contract_start=datetime.utcnow(),
+                contract_end=datetime.utcnow() + timedelta(days=90)
+            ))
+        db.commit()
+    return make
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """serve(**query) -> decoded body of GET /public/tenders/awarded."""
+    cache = ResponseCache(ttl=60)
+    cache.update_versions({AWARDED_FEED: 1})
+    monkeypatch.setattr(cache_module, "response_cache", cache)
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""})
+
+    async def call(query):
+        async with AsyncSessionLocal() as session:
+            params = {"limit": None, "cursor": None, "category": None, "department": None, **query}
+            response = await get_awarded_tenders(request, db=session, **params)
+        return json.loads(response.body)
+    return lambda **query: asyncio.run(call(query))
+
+
+def test_feed_pages_with_a_keyset_cursor(db, awarded):
+    awarded(5)
+    items, cursor = awarded_feed(db, 2)
+    pages = [items]
+    while cursor:
+        items, cursor = awarded_feed(db, 2, cursor)
+        pages.append(items)
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [item["award_id"] for page in pages for item in page] == [item["award_id"] for item in awarded_feed(db, None)[0]]
+
+
+def test_awarded_endpoint_keeps_the_list_shape_by_default(awarded, serve):
+    awarded(3)
+    everything = serve()
+    assert isinstance(everything, list) and len(everything) == 3
+
+    page = serve(limit=2)
+    assert [item["award_id"] for item in page["items"]] == [item["award_id"] for item in everything[:2]]
+    assert page["limit"] == 2 and page["next_cursor"]
+    rest = serve(cursor=page["next_cursor"])
+    assert rest["limit"] == 50 and rest["next_cursor"] is None
+    assert rest["items"] == everything[2:]
+
+
+def test_transparency_lists_every_bid_unless_paged(db, make_tender, monkeypatch):
+    import app.routes.public as public
+    monkeypatch.setattr(public.blockchain_service, "verify_audit_trail", lambda tender_id: None)
+    monkeypatch.setattr(cache_module, "response_cache", ResponseCache(ttl=60))
+    tender = make_tender([100_000 + 1_000 * i for i in range(60)], status=TenderStatus.AWARDED)
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""})
+
+    async def call(**query):
+        params = {"sort": "price", "order": None, "anomaly": None, "limit": None, "cursor": None, **query}
+        async with AsyncSessionLocal() as session:
+            response = await public.get_tender_transparency(request, tender.id, db=session, **params)
+        return json.loads(response.body)
+
+    everything = asyncio.run(call())
+    assert len(everything["all_bids"]) == 60 and everything["next_cursor"] is None
+    assert everything["bid_set"]["bid_count"] == 60
+
+    page = asyncio.run(call(limit=25))
+    assert page["all_bids"] == everything["all_bids"][:25]
+    rest = asyncio.run(call(cursor=page["next_cursor"]))
+    assert rest["all_bids"] == everything["all_bids"][25:]
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from app.services.ranking import rank_window, select_ranked, top_positions
+
+
+def _full_ranking(scores):
+    """Stable sort on descending score: the order every page must agree with."""
+    return sorted(range(len(scores)), key=lambda i: -scores[i])
+
+
+@pytest.mark.parametrize("total, offset, limit, top_k, expected", [
+    (10, 0, None, None, (0, 10)),
+    (10, 2, 3, None, (2, 5)),
+    (10, 0, None, 4, (0, 4)),
+    (10, 3, 5, 4, (3, 4)),
+    (10, 12, 5, None, (10, 10)),
+    (3, 0, None, 10, (0, 3)),
+    (10, 0, 0, None, (0, 0)),
+])
+def test_rank_window(total, offset, limit, top_k, expected):
+    assert rank_window(total, offset, limit, top_k) == expected
+
+
+def test_top_positions_breaks_ties_by_input_order():
+    scores = np.array([50.0, 80.0, 80.0, 10.0, 80.0, 50.0])
+    assert top_positions(scores, 2).tolist() == [1, 2]
+    assert top_positions(scores, 4).tolist() == [1, 2, 4, 0]
+    assert top_positions(scores, 10).tolist() == [1, 2, 4, 0, 5, 3]
+    assert top_positions(scores, 0).tolist() == []
+    assert top_positions(np.array([]), 3).tolist() == []
+
+
+def test_pages_match_a_stable_full_sort():
+    rng = np.random.default_rng(11)
+    # Heavy ties: scores are rounded like stored ai_scores
+    scores = np.round(rng.uniform(40, 90, 500), 0)
+    ranking = _full_ranking(scores.tolist())
+
+    pages = []
+    for offset in range(0, 500, 37):
+        indices, start = select_ranked(scores, offset, 37)
+        assert start == offset
+        pages.extend(indices.tolist())
+    assert pages == ranking
+
+    for k in (1, 5, 64, 499, 500, 800):
+        indices, start = select_ranked(scores, top_k=k)
+        assert start == 0
+        assert indices.tolist() == ranking[:k]
+
+
+def test_top_k_and_paging_combine():
+    scores = np.array([5.0, 9.0, 7.0, 3.0, 8.0, 1.0])
+    indices, start = select_ranked(scores, offset=1, limit=2, top_k=3)
+    assert (indices.tolist(), start) == ([4, 2], 1)
+    indices, start = select_ranked(scores, offset=2, limit=5, top_k=3)
+    assert (indices.tolist(), start) == ([2], 2)
+    indices, start = select_ranked(scores, offset=4, top_k=3)
+    assert (indices.tolist(), start) == ([], 3)
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+
+from app.config import get_settings
+from app.db.models import Bid, RecommendationJob, TenderStatus
+from app.routes.gov import _recommendations as recommendations_endpoint
+from app.services.recommendation_jobs import (
+    DONE, PENDING, RUNNING, cancel_recommendations, enqueue_recommendations, get_job,
+    job_stalled, process_recommendation_jobs, requeue_recommendations
+)
+
+
+def _bid_scores(db, tender_id):
+    db.expire_all()
+    return [
+        (bid.id, bid.ai_score, bid.score_version)
+        for bid in db.query(Bid).filter(Bid.tender_id == tender_id).order_by(Bid.id)
+    ]
+
+
+def test_closed_tender_job_stores_the_ranking(db, make_tender):
+    tender = make_tender([90_000, 100_000, 110_000], status=TenderStatus.CLOSED)
+    enqueue_recommendations(db, tender.id)
+    db.commit()
+
+    assert process_recommendation_jobs(db) == [tender.id]
+    job = get_job(db, tender.id)
+    assert job.status == DONE
+    assert job.total == 3
+    assert [rec["rank"] for rec in job.result] == [1, 2, 3]
+    assert all(score is not None for _, score, _ in _bid_scores(db, tender.id))
+
+
+def test_job_queued_before_award_does_not_rewrite_final_scores(db, make_tender):
+    tender = make_tender([90_000, 100_000, 110_000], status=TenderStatus.CLOSED)
+    enqueue_recommendations(db, tender.id)
+    db.commit()
+    process_recommendation_jobs(db)
+    final = _bid_scores(db, tender.id)
+
+    # Re-queued (e.g. by vendor rescoring) and then awarded before a worker picks it up
+    enqueue_recommendations(db, tender.id)
+    db.query(Bid).filter(Bid.tender_id == tender.id).update({"ai_score": 1.0})
+    tender.status = TenderStatus.AWARDED
+    db.commit()
+    awarded = _bid_scores(db, tender.id)
+
+    assert process_recommendation_jobs(db) == []
+    assert get_job(db, tender.id) is None
+    assert _bid_scores(db, tender.id) == awarded != final
+
+
+def test_cancel_recommendations_deletes_the_job(db, make_tender):
+    tender = make_tender([100_000], status=TenderStatus.CLOSED)
+    enqueue_recommendations(db, tender.id)
+    db.commit()
+
+    cancel_recommendations(db, tender.id)
+    db.commit()
+    assert get_job(db, tender.id) is None
+    cancel_recommendations(db, tender.id)  # no job: no-op
+
+
+def test_job_stalled_times_out_pending_and_running_jobs():
+    timeout = timedelta(seconds=get_settings().RECOMMENDATION_JOB_TIMEOUT_SECONDS)
+    now = datetime.utcnow()
+    fresh, old = now - timeout / 2, now - timeout * 2
+
+    assert not job_stalled(RecommendationJob(status=PENDING, requested_at=fresh), now)
+    assert job_stalled(RecommendationJob(status=PENDING, requested_at=old), now)
+    # A running job is timed from when it started, not when it was queued
+    assert not job_stalled(RecommendationJob(status=RUNNING, requested_at=old, started_at=fresh), now)
+    assert job_stalled(RecommendationJob(status=RUNNING, requested_at=old, started_at=old), now)
+    assert not job_stalled(RecommendationJob(status=DONE, requested_at=None), now)
+
+
+def _recommendations(db, tender_id):
+    return recommendations_endpoint(db, tender_id, "lean", 0, None, None)
+
+
+def test_queued_job_without_a_ranking_serves_a_live_one(db, make_tender):
+    tender = make_tender([90_000, 100_000, 110_000], status=TenderStatus.CLOSED)
+    enqueue_recommendations(db, tender.id)
+    db.commit()
+
+    response = _recommendations(db, tender.id)
+    assert response["status"] == PENDING
+    assert [rec["rank"] for rec in response["recommendations"]] == [1, 2, 3]
+
+
+def test_requeued_job_serves_the_previous_ranking(db, make_tender):
+    tender = make_tender([90_000, 100_000, 110_000], status=TenderStatus.CLOSED)
+    enqueue_recommendations(db, tender.id)
+    db.commit()
+    process_recommendation_jobs(db)
+    finished_at = get_job(db, tender.id).finished_at
+
+    requeue_recommendations(db, tender.id)
+    db.commit()
+    response = _recommendations(db, tender.id)
+    assert response["status"] == PENDING
+    assert response["computed_at"] == finished_at
+    assert len(response["recommendations"]) == 3
+
+
+def test_ranking_of_an_old_scoring_version_is_replaced_live(db, make_tender):
+    tender = make_tender([90_000, 100_000, 110_000], status=TenderStatus.CLOSED)
+    enqueue_recommendations(db, tender.id)
+    db.commit()
+    process_recommendation_jobs(db)
+    get_job(db, tender.id).score_version = "outdated"
+    db.commit()
+
+    response = _recommendations(db, tender.id)
+    assert response["status"] == PENDING
+    assert response["score_version"] != "outdated"
+    assert len(response["recommendations"]) == 3
+    # The next request still gets a ranking while the job is queued
+    assert len(_recommendations(db, tender.id)["recommendations"]) == 3
+    assert get_job(db, tender.id).status == PENDING
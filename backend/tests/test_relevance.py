@@ -0,0 +1,42 @@
+from datetime import datetime
+
+from app.db.models import Bid, Tender, Vendor
+from app.services.ai_engine import AIEngine
+from app.services.model_registry import ScoringBundle
+from app.services.relevance import fit_relevance_model
+
+ON_TOPIC = "We resurface and maintain city roads with proven asphalt paving methods."
+OFF_TOPIC = "We deliver cloud hosting and software licences with proven support methods."
+
+
+def _tender_and_bids():
+    tender = Tender(id=1, title="T", description="Resurface and maintain city roads", category="Roads",
+                    department="Transport", budget=1e6, deadline=datetime(2030, 1, 1))
+    vendor = Vendor(id=1, name="V", email="v@example.com", reputation_score=4.0,
+                    completed_projects=5, total_wins=2, average_rating=4.0)
+    bids = [
+        Bid(id=i, tender_id=1, vendor_id=1, proposed_price=900000.0, delivery_timeline=60,
+            technical_proposal=proposal)
+        for i, proposal in enumerate([ON_TOPIC, OFF_TOPIC], start=1)
+    ]
+    return tender, {1: vendor}, bids
+
+
+def test_rules_engine_scores_relevance_when_a_model_is_published():
+    model = fit_relevance_model(
+        [("Roads", ON_TOPIC), ("Roads", OFF_TOPIC), ("Roads", "Bridge repair and inspection")],
+        min_documents=1, n_features=2 ** 12
+    )
+    with_model, without = ScoringBundle(relevance_model=model), ScoringBundle()
+    tender, vendors, bids = _tender_and_bids()
+
+    plain = [s["technical_score"] for _, _, s in AIEngine.score_bids(tender, bids, vendors, without)]
+    scored = AIEngine.score_bids(tender, bids, vendors, with_model, AIEngine.DETAIL_FULL)
+    on_topic, off_topic = (s["technical_score"] for _, _, s in scored)
+    assert on_topic > off_topic
+    assert on_topic > plain[0]
+
+    # Scoring one bid alone computes its relevance itself and agrees with the batch
+    alone = AIEngine.score_bid(bids[0], tender, vendors[1], bids, with_model, explain=True)
+    assert alone["technical_score"] == on_topic
+    assert alone["breakdown"]["relevance"] > 0
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import app.services.rescoring as rescoring
+from app.config import get_settings
+from app.db.models import Bid, RescoreRequest
+from app.db.session import SessionLocal
+from app.services.rescoring import enqueue_vendor_rescore, process_rescore_queue, rebuild_dependency_index
+
+
+@pytest.fixture
+def queued(db, make_tender):
+    """An open tender queued for rescoring by a stats change of its first bidder."""
+    tender = make_tender([90_000, 100_000, 110_000])
+    rebuild_dependency_index(db)
+    vendor_id = db.query(Bid.vendor_id).filter(Bid.tender_id == tender.id).order_by(Bid.id).first()[0]
+    enqueue_vendor_rescore(db, [vendor_id], "rating")
+    db.commit()
+    return tender, vendor_id
+
+
+def _queue(db):
+    db.expire_all()
+    return db.query(RescoreRequest).all()
+
+
+def test_rescored_tender_is_dequeued(db, queued):
+    tender, _ = queued
+    assert process_rescore_queue(db) == [tender.id]
+    assert _queue(db) == []
+    db.expire_all()
+    assert all(bid.ai_score is not None for bid in db.query(Bid).filter(Bid.tender_id == tender.id))
+
+
+def test_request_arriving_during_a_rescore_is_kept(db, queued, monkeypatch):
+    tender, vendor_id = queued
+    rescore_tender = rescoring.rescore_tender
+
+    def stats_change_while_rescoring(session, tender_id):
+        # Another request commits a stats change after this worker claimed the tender
+        other = SessionLocal()
+        try:
+            enqueue_vendor_rescore(other, [vendor_id], "award")
+            other.commit()
+        finally:
+            other.close()
+        return rescore_tender(session, tender_id)
+
+    monkeypatch.setattr(rescoring, "rescore_tender", stats_change_while_rescoring)
+    assert process_rescore_queue(db, batch_size=1) == [tender.id]
+    [request] = _queue(db)
+    assert (request.reason, request.claimed_at) == ("award", None)
+
+    monkeypatch.setattr(rescoring, "rescore_tender", rescore_tender)
+    assert process_rescore_queue(db) == [tender.id]
+    assert _queue(db) == []
+
+
+def test_claimed_requests_wait_until_the_claim_times_out(db, queued):
+    tender, _ = queued
+    timeout = timedelta(seconds=get_settings().RESCORE_CLAIM_TIMEOUT_SECONDS)
+    [request] = _queue(db)
+    request.claimed_at = datetime.utcnow()
+    db.commit()
+    assert process_rescore_queue(db) == []
+
+    request.claimed_at = datetime.utcnow() - 2 * timeout
+    db.commit()
+    assert process_rescore_queue(db) == [tender.id]
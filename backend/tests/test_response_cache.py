@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+from starlette.requests import Request
+
+import app.services.response_cache as cache_module
+from app.services.response_cache import ETag, ResponseCache, cached_json
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "query_string": b""})
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """A fresh process cache behind cached_json, with key "feed" at version 3."""
+    cache = ResponseCache(ttl=60)
+    cache.update_versions({"feed": 3})
+    monkeypatch.setattr(cache_module, "response_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def serve(cache):
+    """serve(if_none_match=None, params=()) -> (response, number of builds so far)."""
+    builds = []
+
+    async def build():
+        builds.append(1)
+        return {"items": [1, 2, 3]}, None
+
+    def call(if_none_match=None, params=()):
+        response = asyncio.run(cached_json(_request(if_none_match), None, "feed", params, build))
+        return response, len(builds)
+    return call
+
+
+def test_put_and_get_follow_the_version(cache):
+    entry = cache.put("feed", (), b"{}", 3)
+    assert cache.get("feed", ()) == entry
+    assert ETag.parse(entry.etag).version == 3
+
+    cache.update_versions({"feed": 4})
+    assert cache.get("feed", ()) is None
+    # A body built from an outdated version is not cached
+    cache.put("feed", (), b"{}", 3)
+    assert cache.get("feed", ()) is None
+
+
+def test_entries_expire(cache):
+    cache.put("feed", (), b"{}", 3, max_seconds=0)
+    assert cache.get("feed", ()) is None
+    entry = cache.put("feed", (), b"{}", 3, max_seconds=30)
+    assert time.time() + 25 < ETag.parse(entry.etag).expires <= time.time() + 30
+
+
+def test_update_versions_never_goes_back(cache):
+    cache.update_versions({"feed": 2})
+    assert cache.version("feed") == 3
+
+
+def test_tracked_keys_forget_versions_without_entries(cache):
+    cache.update_versions({"other": 7})
+    cache.put("feed", (), b"{}", 3)
+    assert cache.tracked_keys() == ["feed"]
+    assert cache.version("other") is None
+
+
+def test_etag_parse_rejects_foreign_tags():
+    tag = ETag(3, 1700000000, "abcd1234", "0123456789abcdef")
+    assert ETag.parse(str(tag)) == tag
+    assert ETag.parse("W/" + str(tag)) == tag
+    assert ETag.parse('"3-0123456789abcdef"') is None
+    assert ETag.parse('"x-1-a-b"') is None
+
+
+def test_matching_etag_gets_304_from_the_entry(serve, cache):
+    first, builds = serve()
+    assert first.status_code == 200 and builds == 1
+
+    again, builds = serve(first.headers["etag"])
+    assert again.status_code == 304 and builds == 1
+    assert cache.not_modified == 1
+
+
+def test_unexpired_etag_gets_304_without_an_entry(serve, cache):
+    etag = serve()[0].headers["etag"]
+    cache._entries.clear()  # evicted, or built by another worker
+
+    response, builds = serve(etag)
+    assert response.status_code == 304 and builds == 1
+    assert response.headers["etag"] == etag
+    assert cache.revalidated == 1
+
+
+def test_expired_etag_rebuilds_and_still_matches_the_same_body(serve, cache):
+    etag = ETag.parse(serve()[0].headers["etag"])
+    cache._entries.clear()
+
+    response, builds = serve(str(etag._replace(expires=int(time.time()) - 1)))
+    assert response.status_code == 304 and builds == 2
+    assert ETag.parse(response.headers["etag"]).expires > time.time()
+
+
+def test_bumped_version_or_other_params_get_the_body(serve, cache):
+    etag = serve()[0].headers["etag"]
+
+    response, _ = serve(etag, params=("page", 2))
+    assert response.status_code == 200
+
+    cache.update_versions({"feed": 4})
+    response, builds = serve(etag)
+    assert response.status_code == 200 and builds == 3
+    assert ETag.parse(response.headers["etag"]).version == 4
@@ -0,0 +1,19 @@
+from app.db.session import async_database_url, split_pool
+
+
+def test_split_pool_keeps_the_process_total():
+    assert split_pool(10, 0.5, minimum=1) == (5, 5)
+    assert split_pool(20, 0.25) == (5, 15)
+    assert split_pool(0, 0.5) == (0, 0)
+
+
+def test_split_pool_leaves_each_engine_its_minimum():
+    assert split_pool(10, 0.0, minimum=1) == (1, 9)
+    assert split_pool(10, 1.0, minimum=1) == (9, 1)
+    assert split_pool(1, 0.5, minimum=1) == (1, 1)
+
+
+def test_async_database_url_swaps_the_driver():
+    assert async_database_url("postgresql://u:p@db/x") == "postgresql+asyncpg://u:p@db/x"
+    assert async_database_url("sqlite:////tmp/x.db") == "sqlite+aiosqlite:////tmp/x.db"
+    assert async_database_url("mysql+aiomysql://db/x") == "mysql+aiomysql://db/x"
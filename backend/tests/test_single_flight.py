@@ -0,0 +1,69 @@
+import threading
+import time
+
+from app.services.single_flight import SingleFlight
+
+
+def _concurrently(n, target):
+    threads = [threading.Thread(target=target) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_concurrent_callers_share_one_execution():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls, outcomes = [], []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "scores"
+
+    leader = _concurrently(1, lambda: outcomes.append(flights.do("tender-1", compute)))
+    started.wait(5)
+    followers = _concurrently(4, lambda: outcomes.append(flights.do("tender-1", compute)))
+    time.sleep(0.1)  # followers are waiting on the leader's call
+    release.set()
+    for thread in leader + followers:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(outcomes, key=lambda o: o[1]) == [("scores", False)] + [("scores", True)] * 4
+    assert flights.in_flight() == 0
+
+
+def test_nothing_is_cached_after_a_call():
+    flights = SingleFlight()
+    assert flights.do("k", lambda: 1) == (1, False)
+    assert flights.do("k", lambda: 2) == (2, False)
+
+
+def test_errors_reach_every_waiting_caller():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def compute():
+        started.set()
+        release.wait(5)
+        raise ValueError("scoring failed")
+
+    def call():
+        try:
+            flights.do("k", compute)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = _concurrently(1, call)
+    started.wait(5)
+    threads += _concurrently(2, call)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ["scoring failed"] * 3
+    assert flights.in_flight() == 0
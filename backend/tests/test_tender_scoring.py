@@ -0,0 +1,53 @@
+from app.db.models import Bid
+from app.services.ai_engine import AIEngine
+from app.services.bid_batch import BidBatch
+from app.services.tender_scoring import score_tender_shared
+
+
+def _count_score_bid(monkeypatch):
+    calls = []
+    score_bid = AIEngine.score_bid
+
+    def counted(*args, **kwargs):
+        calls.append(1)
+        return score_bid(*args, **kwargs)
+
+    monkeypatch.setattr(AIEngine, "score_bid", staticmethod(counted))
+    return calls
+
+
+def test_lean_page_of_shared_full_scores_is_not_rescored(db, make_tender, monkeypatch):
+    tender = make_tender([90_000, 95_000, 100_000, 105_000, 110_000])
+    calls = _count_score_bid(monkeypatch)
+
+    result = score_tender_shared(db, tender, BidBatch.load(db, tender.id), AIEngine.DETAIL_LEAN, limit=2)
+
+    assert len(calls) == 5  # the shared full pass only
+    assert result.total == 5
+    assert [rec["rank"] for rec in result.recommendations] == [1, 2]
+    for rec in result.recommendations:
+        assert "fair_price" not in rec and "vendor_name" not in rec
+        assert set(AIEngine.LEAN_SCORE_KEYS) <= rec.keys()
+
+
+def test_lean_and_full_pages_rank_alike(db, make_tender):
+    tender = make_tender([90_000, 95_000, 100_000, 105_000, 110_000])
+    lean = score_tender_shared(db, tender, BidBatch.load(db, tender.id), AIEngine.DETAIL_LEAN)
+    full = score_tender_shared(db, tender, BidBatch.load(db, tender.id), AIEngine.DETAIL_FULL)
+
+    assert [(r["bid_id"], r["ai_score"]) for r in lean.recommendations] == \
+        [(r["bid_id"], r["ai_score"]) for r in full.recommendations]
+    assert "fair_price" in full.recommendations[0]
+
+
+def test_scores_are_persisted_unless_disabled(db, make_tender):
+    persisted = make_tender([90_000, 110_000])
+    final = make_tender([90_000, 110_000])
+    score_tender_shared(db, persisted, BidBatch.load(db, persisted.id))
+    score_tender_shared(db, final, BidBatch.load(db, final.id), persist=False)
+
+    db.expire_all()
+    scores = {tender.id: [bid.ai_score for bid in db.query(Bid).filter(Bid.tender_id == tender.id)]
+              for tender in (persisted, final)}
+    assert all(score is not None for score in scores[persisted.id])
+    assert scores[final.id] == [None, None]
@@ -0,0 +1,63 @@
+from app.db.models import Bid, BidStatus, TenderStatus, Vendor
+from app.services.vendor_history import vendor_bid_history, vendor_bid_summary, vendor_open_tender_ids
+
+
+def _bid_as(db, vendor, tender, status=BidStatus.SUBMITTED, ai_score=None):
+    db.add(Bid(
+        tender_id=tender.id, vendor_id=vendor.id, proposed_price=100_000, delivery_timeline=60,
+        technical_proposal="Proposal", status=status, ai_score=ai_score
+    ))
+
+
+def test_win_rate_counts_bids_on_awarded_tenders(db, make_tender):
+    vendor = Vendor(name="Bidder", email="bidder@example.com")
+    db.add(vendor)
+    won = make_tender([90_000], status=TenderStatus.AWARDED)
+    lost = make_tender([80_000], status=TenderStatus.AWARDED)
+    open_tender = make_tender([95_000])
+    _bid_as(db, vendor, won, BidStatus.ACCEPTED, ai_score=80.0)
+    _bid_as(db, vendor, lost, ai_score=60.0)  # losing bids are never marked rejected
+    _bid_as(db, vendor, open_tender)
+    db.commit()
+
+    summary = vendor_bid_summary(db, vendor.id)
+    assert summary["total"] == 3
+    assert summary["counts"][BidStatus.ACCEPTED.value] == 1
+    assert summary["win_rate"] == 0.5
+    assert summary["avg_ai_score"] == 70.0
+
+
+def test_win_rate_is_none_before_any_award(db, make_tender):
+    vendor = Vendor(name="Bidder", email="bidder@example.com")
+    db.add(vendor)
+    _bid_as(db, vendor, make_tender([90_000], status=TenderStatus.CLOSED))
+    db.commit()
+
+    assert vendor_bid_summary(db, vendor.id)["win_rate"] is None
+
+
+def test_history_pages_newest_first(db, make_tender):
+    vendor = Vendor(name="Bidder", email="bidder@example.com")
+    db.add(vendor)
+    for _ in range(3):
+        _bid_as(db, vendor, make_tender([90_000]))
+    db.commit()
+
+    first, cursor = vendor_bid_history(db, vendor.id, limit=2)
+    rest, end = vendor_bid_history(db, vendor.id, limit=2, cursor=cursor)
+    ids = [item["bid_id"] for item in first + rest]
+    assert len(first) == 2 and end is None
+    assert ids == sorted(ids, reverse=True)
+
+
+def test_open_tender_ids_cover_the_whole_history(db, make_tender):
+    vendor = Vendor(name="Bidder", email="bidder@example.com")
+    db.add(vendor)
+    open_tenders = [make_tender([90_000]) for _ in range(3)]
+    for tender in open_tenders:
+        _bid_as(db, vendor, tender)
+    _bid_as(db, vendor, make_tender([90_000], status=TenderStatus.CLOSED))
+    make_tender([90_000])  # not bid on
+    db.commit()
+
+    assert vendor_open_tender_ids(db, vendor.id) == [tender.id for tender in open_tenders]
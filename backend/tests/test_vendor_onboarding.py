@@ -0,0 +1,69 @@
+import pytest
+
+from app.db.models import Vendor, VendorFeatures
+from app.schemas.vendor import VendorOnboardRecord
+from app.services.vendor_onboarding import STARTING_REPUTATION, insert_vendors, screen_vendors
+
+
+def _record(n, **overrides):
+    fields = dict(
+        vendor_id=f"V{n}", password="pw", name=f"Vendor {n}",
+        email=f"v{n}@example.com", company_registration=f"REG-{n}"
+    )
+    return VendorOnboardRecord(**{**fields, **overrides})
+
+
+@pytest.fixture
+def registered(db):
+    db.add(Vendor(vendor_id="V0", name="Vendor 0", email="v0@example.com", company_registration="REG-0"))
+    db.commit()
+
+
+@pytest.mark.parametrize("field, value", [
+    ("vendor_id", "V0"), ("email", "v0@example.com"), ("company_registration", "REG-0")
+])
+def test_skips_values_already_registered(db, registered, field, value):
+    accepted, skipped = screen_vendors(db, [_record(1), _record(2, **{field: value})])
+
+    assert accepted == [0]
+    assert skipped == [{"row": 1, "vendor_id": _record(2, **{field: value}).vendor_id,
+                        "reason": f"{field} already registered"}]
+
+
+@pytest.mark.parametrize("field", ["vendor_id", "email", "company_registration"])
+def test_skips_duplicates_within_the_input(db, field):
+    duplicate = _record(2, **{field: getattr(_record(1), field)})
+    accepted, skipped = screen_vendors(db, [_record(1), duplicate, _record(3)])
+
+    assert accepted == [0, 2]
+    assert skipped == [{"row": 1, "vendor_id": duplicate.vendor_id, "reason": f"duplicate {field} in input"}]
+
+
+def test_skipped_records_do_not_claim_their_values(db, registered):
+    # Row 0 is skipped for its vendor_id, so row 1 may still use its email
+    records = [_record(1, vendor_id="V0"), _record(2, email="v1@example.com")]
+    accepted, skipped = screen_vendors(db, records)
+
+    assert accepted == [1]
+    assert [entry["row"] for entry in skipped] == [0]
+
+
+def test_insert_vendors_creates_vendors_with_features(db):
+    rows = [(i, _record(i), f"hash-{i}") for i in range(5)]
+    created, skipped = insert_vendors(db, rows, batch_size=2)
+
+    assert (created, skipped) == (5, [])
+    vendors = db.query(Vendor).order_by(Vendor.vendor_id).all()
+    assert [v.password_hash for v in vendors] == [f"hash-{i}" for i in range(5)]
+    assert all(v.reputation_score == STARTING_REPUTATION for v in vendors)
+    assert db.query(VendorFeatures).count() == 5
+
+
+def test_insert_vendors_retries_a_batch_without_late_registrations(db, registered):
+    # Row 11 was registered by someone else after screening
+    rows = [(10, _record(1), "h1"), (11, _record(2, email="v0@example.com"), "h2"), (12, _record(3), "h3")]
+    created, skipped = insert_vendors(db, rows, batch_size=2)
+
+    assert created == 2
+    assert skipped == [{"row": 11, "vendor_id": "V2", "reason": "email already registered"}]
+    assert {v.vendor_id for v in db.query(Vendor)} == {"V0", "V1", "V3"}
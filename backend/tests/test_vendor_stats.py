@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db.models import Award, Bid, TenderStatus, Vendor
+from app.services.vendor_stats import add_award_ratings, add_vendor_ratings, add_vendor_win, winning_vendor_id
+
+
+@pytest.fixture
+def award(db, make_tender):
+    tender = make_tender([90_000, 110_000], status=TenderStatus.AWARDED)
+    bid = db.query(Bid).filter(Bid.tender_id == tender.id).order_by(Bid.id).first()
+    award = Award(
+        tender_id=tender.id, winning_bid_id=bid.id, justification="Best value", award_amount=90_000,
+        contract_start=datetime.utcnow(), contract_end=datetime.utcnow() + timedelta(days=365)
+    )
+    db.add(award)
+    db.commit()
+    return award
+
+
+def test_award_ratings_accumulate(db, award):
+    assert tuple(add_award_ratings(db, award.id, 1, 5)) == (award.winning_bid_id, award.tender_id)
+    add_award_ratings(db, award.id, 2, 5)  # a 2 and a 3
+    db.commit()
+
+    db.refresh(award)
+    assert (award.public_feedback_count, award.public_rating_sum) == (3, 10)
+    assert award.public_rating == pytest.approx(3.33)
+
+
+def test_award_ratings_for_a_missing_award(db):
+    assert add_award_ratings(db, 999, 1, 5) is None
+
+
+def test_vendor_ratings_extend_the_running_average(db):
+    vendor = Vendor(name="V", email="v@example.com", completed_projects=2, rating_sum=8.0, average_rating=4.0)
+    db.add(vendor)
+    db.commit()
+
+    updated = add_vendor_ratings(db, vendor.id, 2, 3.0)  # a 1 and a 2
+    assert updated is vendor
+    assert (vendor.completed_projects, vendor.rating_sum) == (4, 11.0)
+    assert vendor.average_rating == vendor.reputation_score == pytest.approx(2.75)
+
+    add_vendor_ratings(db, vendor.id, 1, 5.0)
+    assert vendor.average_rating == pytest.approx(16 / 5)
+
+
+def test_vendor_ratings_resolve_the_winner_in_the_statement(db, award):
+    winner = db.get(Bid, award.winning_bid_id).vendor_id
+    vendor = add_vendor_ratings(db, winning_vendor_id(award.winning_bid_id), 1, 5.0)
+
+    assert vendor.id == winner
+    assert vendor.rating_sum == 5.0
+
+
+def test_vendor_win_counts_from_null(db):
+    vendor = Vendor(name="V", email="v@example.com", total_wins=None)
+    db.add(vendor)
+    db.commit()
+
+    assert add_vendor_win(db, vendor.id).total_wins == 1
+    assert add_vendor_win(db, vendor.id).total_wins == 2
+    assert add_vendor_win(db, 999) is None
@@ -10,7 +10,7 @@ const TransparencyTable = ({ data }) => {
     );
   }
 
-  const { tender, all_bids, award, blockchain_proof } = data;
+  const { tender, all_bids, award, blockchain_proof, bid_set } = data;
 
   return (
     <div className="space-y-6">
@@ -117,7 +117,7 @@ const TransparencyTable = ({ data }) => {
       {/* All Bids Comparison */}
       <div className="card">
         <h3 className="text-xl font-bold text-gray-800 mb-4">
-          All Submitted Bids ({all_bids?.length || 0})
+          All Submitted Bids ({bid_set?.bid_count ?? (all_bids?.length || 0)})
         </h3>
 
         <div className="overflow-x-auto">
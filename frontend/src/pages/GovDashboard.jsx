@@ -13,7 +13,9 @@ const GovDashboard = () => {
   const [tenders, setTenders] = useState([]);
   const [selectedTender, setSelectedTender] = useState(null);
   const [recommendations, setRecommendations] = useState([]);
+  const [recommendationStatus, setRecommendationStatus] = useState(null);
   const [bids, setBids] = useState([]);
+  const [bidsCursor, setBidsCursor] = useState(null);
   const [loading, setLoading] = useState(false);
   const [selectedWinner, setSelectedWinner] = useState(null);
   const [awardForm, setAwardForm] = useState({
@@ -33,6 +35,22 @@ const GovDashboard = () => {
     loadTenders();
   }, []);
 
+  // Background scoring in progress: refresh until the new ranking is stored
+  useEffect(() => {
+    if (view !== "recommendations" || !selectedTender) return;
+    if (recommendationStatus !== "pending" && recommendationStatus !== "running") return;
+    const timer = setTimeout(async () => {
+      try {
+        const response = await govAPI.getRecommendations(selectedTender.id);
+        setRecommendations(response.data.recommendations);
+        setRecommendationStatus(response.data.status);
+      } catch (error) {
+        console.error("Failed to refresh recommendations:", error);
+      }
+    }, 5000);
+    return () => clearTimeout(timer);
+  }, [view, selectedTender, recommendationStatus, recommendations]);
+
   const loadTenders = async () => {
     try {
       const response = await govAPI.getTenders();
@@ -74,7 +92,8 @@ const GovDashboard = () => {
       setLoading(true);
       setSelectedTender(tender);
       const response = await govAPI.getTenderBids(tender.id);
-      setBids(response.data);
+      setBids(response.data.items);
+      setBidsCursor(response.data.next_cursor);
       setView("bids");
     } catch (error) {
       alert("❌ Failed to load bids");
@@ -83,12 +102,28 @@ const GovDashboard = () => {
     }
   };
 
+  const handleLoadMoreBids = async () => {
+    try {
+      setLoading(true);
+      const response = await govAPI.getTenderBids(selectedTender.id, {
+        cursor: bidsCursor,
+      });
+      setBids((current) => [...current, ...response.data.items]);
+      setBidsCursor(response.data.next_cursor);
+    } catch (error) {
+      alert("❌ Failed to load bids");
+    } finally {
+      setLoading(false);
+    }
+  };
+
   const handleGetRecommendations = async (tender) => {
     try {
       setLoading(true);
       setSelectedTender(tender);
       const response = await govAPI.getRecommendations(tender.id);
       setRecommendations(response.data.recommendations);
+      setRecommendationStatus(response.data.status);
       setView("recommendations");
     } catch (error) {
       alert("❌ Failed to get recommendations");
@@ -207,6 +242,14 @@ const GovDashboard = () => {
             </div>
           )}
 
+          {bidsCursor && !loading && (
+            <div className="mt-4 text-center">
+              <button onClick={handleLoadMoreBids} className="btn-secondary">
+                Load More
+              </button>
+            </div>
+          )}
+
           <button
             onClick={() => handleGetRecommendations(selectedTender)}
             className="btn-primary mt-6"
@@ -227,6 +270,15 @@ const GovDashboard = () => {
         >
           ← Back to Dashboard
         </button>
+        {(recommendationStatus === "pending" || recommendationStatus === "running") && (
+          <div className="mb-4 p-4 bg-yellow-50 text-yellow-800 rounded-lg flex items-center">
+            <AlertCircle className="w-5 h-5 mr-2 flex-shrink-0" />
+            <span>
+              Recommendations are being updated in the background. Showing the
+              latest available ranking; this page refreshes automatically.
+            </span>
+          </div>
+        )}
         <AIRecommendationTable
           recommendations={recommendations}
           onSelectWinner={handleSelectWinner}
@@ -5,6 +5,9 @@ import TransparencyTable from "../components/TransparencyTable";
 import RatingForm from "../components/RatingForm";
 import { publicAPI } from "../services/api";
 
+// Awarded tenders and transparency bids fetched per request
+const PAGE_SIZE = 50;
+
 const PublicDashboard = () => {
   const navigate = useNavigate();
   const [view, setView] = useState("list"); // list, transparency, rate
@@ -14,16 +17,22 @@ const PublicDashboard = () => {
   const [loading, setLoading] = useState(false);
   const [searchQuery, setSearchQuery] = useState("");
   const [filterCategory, setFilterCategory] = useState("all");
+  const [nextCursor, setNextCursor] = useState(null);
 
   useEffect(() => {
     loadAwardedTenders();
   }, []);
 
-  const loadAwardedTenders = async () => {
+  const loadAwardedTenders = async (cursor = null) => {
     try {
       setLoading(true);
-      const response = await publicAPI.getAwardedTenders();
-      setAwardedTenders(response.data);
+      const response = await publicAPI.getAwardedTenders(
+        cursor ? { limit: PAGE_SIZE, cursor } : { limit: PAGE_SIZE }
+      );
+      setAwardedTenders((current) =>
+        cursor ? [...current, ...response.data.items] : response.data.items
+      );
+      setNextCursor(response.data.next_cursor);
     } catch (error) {
       console.error("Failed to load awarded tenders:", error);
     } finally {
@@ -35,7 +44,9 @@ const PublicDashboard = () => {
     try {
       setLoading(true);
       setSelectedTender(tender);
-      const response = await publicAPI.getTenderTransparency(tender.tender_id);
+      const response = await publicAPI.getTenderTransparency(tender.tender_id, {
+        limit: PAGE_SIZE,
+      });
       setTransparencyData(response.data);
       setView("transparency");
     } catch (error) {
@@ -45,6 +56,25 @@ const PublicDashboard = () => {
     }
   };
 
+  const handleLoadMoreBids = async () => {
+    try {
+      setLoading(true);
+      const response = await publicAPI.getTenderTransparency(
+        selectedTender.tender_id,
+        { limit: PAGE_SIZE, cursor: transparencyData.next_cursor }
+      );
+      setTransparencyData((current) => ({
+        ...current,
+        all_bids: [...current.all_bids, ...response.data.all_bids],
+        next_cursor: response.data.next_cursor,
+      }));
+    } catch (error) {
+      alert("❌ Failed to load bids");
+    } finally {
+      setLoading(false);
+    }
+  };
+
   const handleSubmitRating = async (ratingData) => {
     try {
       await publicAPI.submitRating(ratingData);
@@ -87,6 +117,14 @@ const PublicDashboard = () => {
           <>
             <TransparencyTable data={transparencyData} />
 
+            {transparencyData?.next_cursor && (
+              <div className="mt-4 text-center">
+                <button onClick={handleLoadMoreBids} className="btn-secondary">
+                  Load More Bids
+                </button>
+              </div>
+            )}
+
             <div className="mt-6 text-center">
               <button
                 onClick={() => setView("rate")}
@@ -208,7 +246,7 @@ const PublicDashboard = () => {
             </select>
           </div>
           <button
-            onClick={loadAwardedTenders}
+            onClick={() => loadAwardedTenders()}
             className="btn-secondary flex items-center justify-center"
           >
             <RefreshCw className="w-4 h-4 mr-2" />
@@ -330,6 +368,17 @@ const PublicDashboard = () => {
             ))}
           </div>
         )}
+
+        {nextCursor && !loading && (
+          <div className="mt-4 text-center">
+            <button
+              onClick={() => loadAwardedTenders(nextCursor)}
+              className="btn-secondary"
+            >
+              Load More
+            </button>
+          </div>
+        )}
       </div>
 
       {/* Info Box */}
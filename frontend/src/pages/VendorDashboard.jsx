@@ -19,6 +19,9 @@ const VendorDashboard = () => {
   const [view, setView] = useState("tenders"); // tenders, submit-bid, my-bids
   const [openTenders, setOpenTenders] = useState([]);
   const [myBids, setMyBids] = useState([]);
+  const [submittedTenderIds, setSubmittedTenderIds] = useState(new Set());
+  const [bidSummary, setBidSummary] = useState(null);
+  const [bidsCursor, setBidsCursor] = useState(null);
   const [selectedTender, setSelectedTender] = useState(null);
   const [loading, setLoading] = useState(false);
 
@@ -26,6 +29,7 @@ const VendorDashboard = () => {
     if (user && user.role === "vendor") {
       loadOpenTenders();
       loadMyBids(user.user_id);
+      loadSubmittedTenderIds(user.user_id);
     }
   }, [user]);
 
@@ -38,10 +42,29 @@ const VendorDashboard = () => {
     }
   };
 
-  const loadMyBids = async (vendorId) => {
+  // Bid history is paged: which tenders already have a bid comes from its own lookup
+  const loadSubmittedTenderIds = async (vendorId) => {
     try {
-      const response = await vendorAPI.getVendorBids(vendorId);
-      setMyBids(response.data);
+      const response = await vendorAPI.getBidTenderIds(vendorId);
+      setSubmittedTenderIds(new Set(response.data.tender_ids));
+    } catch (error) {
+      console.error("Failed to load submitted tenders:", error);
+    }
+  };
+
+  const loadMyBids = async (vendorId, cursor = null) => {
+    try {
+      const response = await vendorAPI.getVendorBids(
+        vendorId,
+        cursor ? { cursor } : {}
+      );
+      setMyBids((current) =>
+        cursor ? [...current, ...response.data.items] : response.data.items
+      );
+      if (response.data.summary) {
+        setBidSummary(response.data.summary);
+      }
+      setBidsCursor(response.data.next_cursor);
     } catch (error) {
       console.error("Failed to load bids:", error);
     }
@@ -54,6 +77,7 @@ const VendorDashboard = () => {
       setView("my-bids");
       if (user) {
         loadMyBids(user.user_id);
+        loadSubmittedTenderIds(user.user_id);
       }
       loadOpenTenders();
     } catch (error) {
@@ -114,7 +138,7 @@ const VendorDashboard = () => {
 
         <div className="card">
           <h2 className="text-xl font-bold mb-4">
-            Bid History ({myBids.length})
+            Bid History ({bidSummary ? bidSummary.total : myBids.length})
           </h2>
 
           {myBids.length === 0 ? (
@@ -188,6 +212,17 @@ const VendorDashboard = () => {
               ))}
             </div>
           )}
+
+          {bidsCursor && (
+            <div className="mt-4 text-center">
+              <button
+                onClick={() => loadMyBids(user.user_id, bidsCursor)}
+                className="btn-secondary"
+              >
+                Load More
+              </button>
+            </div>
+          )}
         </div>
       </div>
     );
@@ -259,13 +294,17 @@ const VendorDashboard = () => {
         </div>
         <div className="card bg-gradient-to-br from-green-500 to-green-600 text-white">
           <FileText className="w-8 h-8 mb-2" />
-          <p className="text-3xl font-bold">{myBids.length}</p>
+          <p className="text-3xl font-bold">
+            {bidSummary ? bidSummary.total : myBids.length}
+          </p>
           <p className="text-sm">Bids Submitted</p>
         </div>
         <div className="card bg-gradient-to-br from-purple-500 to-purple-600 text-white">
           <Clock className="w-8 h-8 mb-2" />
           <p className="text-3xl font-bold">
-            {myBids.filter((b) => b.status === "under_review").length}
+            {bidSummary
+              ? bidSummary.counts.under_review
+              : myBids.filter((b) => b.status === "under_review").length}
           </p>
           <p className="text-sm">Under Review</p>
         </div>
@@ -285,9 +324,7 @@ const VendorDashboard = () => {
         ) : (
           <div className="space-y-4">
             {openTenders.map((tender) => {
-              const hasSubmitted = myBids.some(
-                (bid) => bid.tender_title === tender.title
-              );
+              const hasSubmitted = submittedTenderIds.has(tender.id);
               const deadline = new Date(tender.deadline);
               const timeLeft = Math.ceil(
                 (deadline - new Date()) / (1000 * 60 * 60 * 24)
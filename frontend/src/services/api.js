@@ -74,7 +74,8 @@ export const govAPI = {
   getTender: (tenderId) => api.get(`/gov/tenders/${tenderId}`),
 
   // Get bids for a tender
-  getTenderBids: (tenderId) => api.get(`/gov/tenders/${tenderId}/bids`),
+  getTenderBids: (tenderId, params = {}) =>
+    api.get(`/gov/tenders/${tenderId}/bids`, { params }),
 
   // Close tender for bidding
   closeTender: (tenderId) => api.post(`/gov/tenders/${tenderId}/close`),
@@ -115,7 +116,12 @@ export const vendorAPI = {
   submitBid: (data) => api.post("/vendor/bids", data),
 
   // Get vendor's bids
-  getVendorBids: (vendorId) => api.get(`/vendor/bids/${vendorId}`),
+  getVendorBids: (vendorId, params = {}) =>
+    api.get(`/vendor/bids/${vendorId}`, { params }),
+
+  // Get ids of the open tenders the vendor has bid on
+  getBidTenderIds: (vendorId) =>
+    api.get(`/vendor/bids/${vendorId}/open-tenders`),
 
   // Get vendor profile
   getVendorProfile: (vendorId) => api.get(`/vendor/profile/${vendorId}`),
@@ -123,12 +129,13 @@ export const vendorAPI = {
 
 // ==================== PUBLIC APIs ====================
 export const publicAPI = {
-  // Get all awarded tenders
-  getAwardedTenders: () => api.get("/public/tenders/awarded"),
+  // Get awarded tenders (pass limit to page, then next_cursor to continue)
+  getAwardedTenders: (params = {}) =>
+    api.get("/public/tenders/awarded", { params }),
 
   // Get transparency view for a tender
-  getTenderTransparency: (tenderId) =>
-    api.get(`/public/tenders/${tenderId}/transparency`),
+  getTenderTransparency: (tenderId, params = {}) =>
+    api.get(`/public/tenders/${tenderId}/transparency`, { params }),
 
   // Submit public rating
   submitRating: (data) => api.post("/public/ratings", data),
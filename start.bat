@@ -89,8 +89,8 @@ if exist "blockchain\ProcurementAudit_ABI.json" (
 )
 echo.
 
-echo Step 5/5: Starting backend and frontend...
-docker-compose up -d backend frontend
+echo Step 5/5: Starting backend, workers and frontend...
+docker-compose up -d backend recommendation_worker rescore_worker rating_aggregator frontend
 echo.
 
 echo ===============================================
@@ -76,8 +76,8 @@ else
 fi
 echo ""
 
-echo -e "${BLUE}Step 5/5: Starting backend and frontend...${NC}"
-docker-compose up -d backend frontend
+echo -e "${BLUE}Step 5/5: Starting backend, workers and frontend...${NC}"
+docker-compose up -d backend recommendation_worker rescore_worker rating_aggregator frontend
 echo ""
 
 echo -e "${GREEN}=====================================================${NC}"